@@ -33,6 +33,12 @@ from core.base.analyzer_registry import register_analyzer
 class CouplingAnalyzer(BaseAnalyzer):
     """Analyzes code coupling patterns and dependency relationships."""
 
+    # Coupling metrics need every module's imports
+    shardable = False
+    # Watch mode re-extracts edges only for changed modules
+    supports_incremental = True
+    expensive = True
+
     def __init__(self, config: AnalyzerConfig | None = None):
         # Create architecture-specific configuration
         architecture_config = config or AnalyzerConfig(
@@ -88,6 +94,8 @@ class CouplingAnalyzer(BaseAnalyzer):
         self.dependency_graph = defaultdict(set)
         self.reverse_graph = defaultdict(set)
         self.module_info = {}
+        # Root whose graph analyze_incremental keeps up to date
+        self._incremental_root: Path | None = None
 
         # Initialize patterns and mappings
         self._init_import_patterns()
@@ -259,27 +267,94 @@ class CouplingAnalyzer(BaseAnalyzer):
 
         # Convert to standardized finding format
         for finding in coupling_findings:
-            standardized = {
-                "title": f"{finding['description']} ({finding['pattern_type'].replace('_', ' ').title()})",
-                "description": finding["description"],
-                "severity": finding["severity"],
-                "file_path": finding.get("file_path", str(project_root)),
-                "line_number": 1,  # Architecture issues don't have specific line numbers
-                "recommendation": self._get_recommendation(finding["pattern_type"]),
-                "metadata": {
-                    "pattern_type": finding["pattern_type"],
-                    "module": finding.get("module"),
-                    "metric_value": finding.get("metric_value"),
-                    "dependencies": finding.get("dependencies"),
-                    "dependents": finding.get("dependents"),
-                    "cycle": finding.get("cycle"),
-                    "confidence": "high",
-                },
-            }
-            all_findings.append(standardized)
+            all_findings.append(self._standardize_finding(finding, project_root))
 
         return all_findings
 
+    def analyze_incremental(
+        self, root: Path, changed: set[Path], removed: set[Path]
+    ) -> list[dict[str, Any]]:
+        """
+        Re-extract import edges for changed modules only, then re-evaluate.
+
+        The first call for ``root`` builds the whole graph; afterwards only
+        ``changed`` files are re-read and ``removed`` files dropped. Module
+        names are relative to ``root``. Metrics and cycles are recomputed on
+        the in-memory graph, which needs no file reads.
+        """
+        root = Path(root)
+        if self._incremental_root != root:
+            self.dependency_graph = defaultdict(set)
+            self.reverse_graph = defaultdict(set)
+            self.module_info = {}
+            self._incremental_root = root
+            changed = set(root.rglob("*"))
+            removed = set()
+
+        for file_path in removed:
+            self._drop_module(self._module_name_under(file_path, root))
+        for file_path in changed:
+            if not (
+                file_path.is_file()
+                and file_path.suffix.lower() in self.extension_language_map
+                and self._should_analyze_file(file_path)
+            ):
+                continue
+            module_name = self._module_name_under(file_path, root)
+            self._drop_module(module_name)
+            dependencies = self._extract_dependencies(file_path)
+            self.dependency_graph[module_name] = set(dependencies)
+            self.module_info[module_name] = {
+                "file_path": str(file_path),
+                "dependencies": dependencies,
+                "language": self.extension_language_map.get(file_path.suffix.lower()),
+            }
+            for dep in dependencies:
+                self.reverse_graph[dep].add(module_name)
+
+        findings = [
+            self._standardize_finding(finding, root)
+            for finding in self._analyze_coupling_patterns()
+        ]
+        return self.filter_findings_by_severity(findings)
+
+    def _module_name_under(self, file_path: Path, root: Path) -> str:
+        try:
+            return str(file_path.relative_to(root).with_suffix(""))
+        except ValueError:
+            return str(file_path.with_suffix(""))
+
+    def _drop_module(self, module_name: str) -> None:
+        """Remove a module and its outgoing edges from both graphs."""
+        for dep in self.dependency_graph.pop(module_name, set()):
+            dependents = self.reverse_graph.get(dep)
+            if dependents is not None:
+                dependents.discard(module_name)
+                if not dependents:
+                    del self.reverse_graph[dep]
+        self.module_info.pop(module_name, None)
+
+    def _standardize_finding(
+        self, finding: dict[str, Any], project_root: Path
+    ) -> dict[str, Any]:
+        return {
+            "title": f"{finding['description']} ({finding['pattern_type'].replace('_', ' ').title()})",
+            "description": finding["description"],
+            "severity": finding["severity"],
+            "file_path": finding.get("file_path", str(project_root)),
+            "line_number": 1,  # Architecture issues don't have specific line numbers
+            "recommendation": self._get_recommendation(finding["pattern_type"]),
+            "metadata": {
+                "pattern_type": finding["pattern_type"],
+                "module": finding.get("module"),
+                "metric_value": finding.get("metric_value"),
+                "dependencies": finding.get("dependencies"),
+                "dependents": finding.get("dependents"),
+                "cycle": finding.get("cycle"),
+                "confidence": "high",
+            },
+        }
+
     def _find_project_root(self, file_path: Path) -> Path:
         """Find the project root directory."""
         current = file_path.parent if file_path.is_file() else file_path
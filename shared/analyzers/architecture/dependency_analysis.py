@@ -225,6 +225,12 @@ class DependencyAnalyzer(BaseAnalyzer):
             "^": "compatible_caret",
         }
 
+    def forget_file(self, file_path: Path) -> None:
+        path = str(file_path)
+        self.dependencies.pop(path, None)
+        for users in self.dependency_usage.values():
+            users.discard(path)
+
     def get_analyzer_metadata(self) -> dict[str, Any]:
         """Return metadata about this analyzer."""
         return {
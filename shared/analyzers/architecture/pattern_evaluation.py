@@ -12,6 +12,8 @@ APPROACH:
 - Architectural pattern analysis (MVC, Repository, Service Layer)
 - Code complexity analysis (method length, parameter count)
 - Pattern density and recommendations
+- Regex indicators run under a per-pattern time budget in a killable worker
+  process (thread safe), over bounded chunks for large files
 
 EXTENDS: BaseAnalyzer for common analyzer infrastructure
 - Inherits file scanning, CLI, configuration, and result formatting
@@ -21,12 +23,16 @@ EXTENDS: BaseAnalyzer for common analyzer infrastructure
 
 import re
 import subprocess
+import threading
 from pathlib import Path
 from typing import Any
 
 # Import base analyzer (package root must be on PYTHONPATH)
 from core.base.analyzer_base import AnalyzerConfig, BaseAnalyzer
 from core.base.analyzer_registry import register_analyzer
+from core.utils.regex_budget import RegexTimeBudget
+
+_INDICATOR_FLAGS = re.MULTILINE | re.IGNORECASE
 
 
 @register_analyzer("architecture:patterns")
@@ -90,6 +96,11 @@ class PatternEvaluationAnalyzer(BaseAnalyzer):
         self._init_config_file_patterns()
         # Cache to reduce repeated Lizard CLI invocations per file
         self._lizard_cache: dict[str, dict[str, Any]] = {}
+        # One regex worker per thread so concurrent files don't serialize
+        self._regex_budgets = threading.local()
+
+    def forget_file(self, file_path: Path) -> None:
+        self._lizard_cache.pop(str(file_path), None)
 
     def get_analyzer_metadata(self) -> dict[str, Any]:
         """Return metadata about this analyzer."""
@@ -143,10 +154,6 @@ class PatternEvaluationAnalyzer(BaseAnalyzer):
                 content = f.read()
                 lines = content.split("\n")
 
-            # Early exit for files that are too large or complex
-            if len(content) > 50000 or len(lines) > 1000:
-                return all_findings
-
             # Detect programming language
             language = self._detect_language(file_path)
 
@@ -372,20 +379,34 @@ class PatternEvaluationAnalyzer(BaseAnalyzer):
             },
         }
 
+    def _regex_budget(self) -> RegexTimeBudget:
+        """Return this thread's budgeted regex evaluator."""
+        budget = getattr(self._regex_budgets, "runner", None)
+        if budget is None:
+            budget = RegexTimeBudget()
+            self._regex_budgets.runner = budget
+        return budget
+
     def _find_indicator_matches(
-        self, indicator: str, content: str
-    ) -> list[re.Match] | None:
-        """Find matches for a single indicator pattern in content."""
-        try:
-            compiled_pattern = re.compile(indicator, re.MULTILINE | re.IGNORECASE)
-            matches = list(compiled_pattern.finditer(content))
-            return matches[:10] if len(matches) > 10 else matches
-        except re.error:
-            return None
+        self, indicators: list[str], content: str
+    ) -> list[list[int] | None]:
+        """
+        Find match start offsets for each indicator pattern in content.
+
+        Returns
+        -------
+            Per indicator, up to 10 match offsets in file order, or None if the
+            pattern is invalid or exceeded its time budget
+        """
+        return self._regex_budget().find_starts_windowed(
+            [(indicator, _INDICATOR_FLAGS) for indicator in indicators],
+            content,
+            max_matches=10,
+        )
 
     def _create_pattern_finding(
         self,
-        match: re.Match,
+        match_start: int,
         content: str,
         lines: list[str],
         file_path: str,
@@ -395,7 +416,7 @@ class PatternEvaluationAnalyzer(BaseAnalyzer):
         language: str,
     ) -> dict[str, Any]:
         """Create a finding dict for a pattern match."""
-        line_num = content[: match.start()].count("\n") + 1
+        line_num = content.count("\n", 0, match_start) + 1
         context = lines[line_num - 1].strip() if line_num <= len(lines) else ""
 
         return {
@@ -426,49 +447,38 @@ class PatternEvaluationAnalyzer(BaseAnalyzer):
         language: str = "unknown",
     ) -> list[dict[str, Any]]:
         """Check for specific patterns in file content."""
-        import signal
-
-        if len(content) > 10000:
-            return []
-
-        def timeout_handler(signum, frame):
-            raise TimeoutError("Pattern analysis timeout")
-
-        signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(10)
-
-        findings = []
-        try:
+        selected = [
+            (pattern_name, pattern_info, indicator)
             for pattern_idx, (pattern_name, pattern_info) in enumerate(
                 pattern_dict.items()
-            ):
-                if pattern_idx > 5:
-                    break
-
-                for _indicator_idx, indicator in enumerate(
-                    pattern_info["indicators"][:4]
-                ):
-                    matches = self._find_indicator_matches(indicator, content)
-                    if matches is None:
-                        continue
-
-                    for match in matches[:6]:
-                        findings.append(
-                            self._create_pattern_finding(
-                                match,
-                                content,
-                                lines,
-                                file_path,
-                                pattern_type,
-                                pattern_name,
-                                pattern_info,
-                                language,
-                            )
-                        )
-        except TimeoutError:
-            pass
-        finally:
-            signal.alarm(0)
+            )
+            if pattern_idx <= 5
+            for indicator in pattern_info["indicators"][:4]
+        ]
+        indicator_matches = self._find_indicator_matches(
+            [indicator for _, _, indicator in selected], content
+        )
+
+        findings = []
+        for (pattern_name, pattern_info, _indicator), match_starts in zip(
+            selected, indicator_matches, strict=True
+        ):
+            if match_starts is None:
+                continue
+
+            for match_start in match_starts[:6]:
+                findings.append(
+                    self._create_pattern_finding(
+                        match_start,
+                        content,
+                        lines,
+                        file_path,
+                        pattern_type,
+                        pattern_name,
+                        pattern_info,
+                        language,
+                    )
+                )
 
         return findings
 
@@ -514,10 +524,9 @@ class PatternEvaluationAnalyzer(BaseAnalyzer):
         }
 
         try:
-            result = subprocess.run(
+            result = self.run_tool(
                 ["lizard", "-C", "999", "-L", "999", "-a", "999", file_path],
-                capture_output=True,
-                text=True,
+                tool="lizard",
                 timeout=10,
             )
 
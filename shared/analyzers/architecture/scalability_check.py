@@ -19,7 +19,6 @@ EXTENDS: BaseAnalyzer for common analyzer infrastructure
 """
 
 import ast
-import json
 import re
 import subprocess
 from collections.abc import Callable
@@ -31,6 +30,9 @@ from typing import Any
 # Import base analyzer (package root must be on PYTHONPATH)
 from core.base.analyzer_base import AnalyzerConfig, BaseAnalyzer
 from core.base.analyzer_registry import register_analyzer
+from core.base.content_cache import package_version
+from core.config.pattern_packs import compiled_regex, load_config_json
+from core.utils.tool_probe import probe_tool
 
 _SCALABILITY_PATTERN_DIR = (
     Path(__file__).resolve().parents[2] / "config" / "patterns" / "scalability"
@@ -85,7 +87,7 @@ def _validate_pattern_spec(pattern_name: str, spec: Any, category: str) -> None:
 def _load_category_config(category: str, path: Path) -> dict[str, Any]:
     """Load and validate a single category configuration file."""
     try:
-        raw_data = json.loads(path.read_text(encoding="utf-8"))
+        raw_data = load_config_json(path)
     except FileNotFoundError as exc:
         raise ScalabilityPatternConfigError(
             f"Scalability pattern config not found: {path}"
@@ -167,6 +169,9 @@ class PatternMatchContext:
 class ScalabilityAnalyzer(BaseAnalyzer):
     """Analyzes code for scalability bottlenecks and architectural constraints."""
 
+    supports_chunked_scan = True
+    result_cacheable = True
+
     def __init__(self, config: AnalyzerConfig | None = None):
         # Create scalability-specific configuration
         scalability_config = config or AnalyzerConfig(
@@ -247,6 +252,33 @@ class ScalabilityAnalyzer(BaseAnalyzer):
         self._pattern_evaluators = self._build_pattern_evaluators()
         # Cache for lizard metrics to avoid repeated CLI calls per file
         self._lizard_cache: dict[str, dict[str, Any]] = {}
+        # Files whose lizard call failed; their degraded findings are not cached
+        self._lizard_failed: set[str] = set()
+
+    def _active_pattern_sets(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Return pattern sets limited to patterns that pass the severity threshold."""
+        active = {
+            category: {
+                name: spec
+                for name, spec in patterns.items()
+                if self.severity_enabled(spec["severity"])
+            }
+            for category, patterns in self.pattern_sets.items()
+        }
+        return {category: patterns for category, patterns in active.items() if patterns}
+
+    def cache_signature(self) -> dict[str, Any]:
+        return {
+            "lizard": package_version("lizard"),
+            "lizard_available": probe_tool("lizard").available,
+        }
+
+    def cache_result(self, file_path: Path) -> bool:
+        return str(file_path) not in self._lizard_failed
+
+    def forget_file(self, file_path: Path) -> None:
+        self._lizard_cache.pop(str(file_path), None)
+        self._lizard_failed.discard(str(file_path))
 
     def get_analyzer_metadata(self) -> dict[str, Any]:
         """Return metadata about this analyzer."""
@@ -289,26 +321,34 @@ class ScalabilityAnalyzer(BaseAnalyzer):
         file_path = Path(target_path)
 
         try:
+            active_sets = self._active_pattern_sets()
+            # Lizard metrics only gate pattern matches; skip the CLI call when
+            # severity pushdown leaves no pattern able to report
+            lizard_metrics = (
+                self._get_lizard_metrics(str(file_path)) if active_sets else {}
+            )
+            if self.uses_chunked_scan(file_path):
+                # Oversized file: indicators run window by window (lizard runs
+                # out of process); the AST pass needs the whole file in memory
+                return self.scan_in_windows(
+                    file_path,
+                    lambda window: self._scan_pattern_sets(
+                        window.text, str(file_path), active_sets, lizard_metrics
+                    ),
+                )
+
             with open(file_path, encoding="utf-8", errors="ignore") as f:
                 content = f.read()
                 lines = content.split("\n")
 
-            lizard_metrics = self._get_lizard_metrics(str(file_path))
-
-            for category, patterns in self.pattern_sets.items():
-                scan_context = PatternScanContext(
-                    content=content,
-                    lines=lines,
-                    file_path=str(file_path),
-                    category=category,
-                    patterns=patterns,
-                    lizard_metrics=lizard_metrics,
+            all_findings.extend(
+                self._scan_pattern_sets(
+                    content, str(file_path), active_sets, lizard_metrics, lines
                 )
-                findings = self._check_scalability_patterns(scan_context)
-                all_findings.extend(findings)
+            )
 
-            # Additional Python complexity analysis
-            if file_path.suffix == ".py":
+            # Additional Python complexity analysis (reports at most high)
+            if file_path.suffix == ".py" and self.severity_enabled("high"):
                 complexity_findings = self._analyze_python_complexity(
                     content, lines, str(file_path)
                 )
@@ -329,6 +369,29 @@ class ScalabilityAnalyzer(BaseAnalyzer):
 
         return all_findings
 
+    def _scan_pattern_sets(
+        self,
+        content: str,
+        file_path: str,
+        pattern_sets: dict[str, dict[str, dict[str, Any]]],
+        lizard_metrics: dict[str, Any],
+        lines: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Check every pattern category against content."""
+        lines = content.split("\n") if lines is None else lines
+        findings: list[dict[str, Any]] = []
+        for category, patterns in pattern_sets.items():
+            scan_context = PatternScanContext(
+                content=content,
+                lines=lines,
+                file_path=file_path,
+                category=category,
+                patterns=patterns,
+                lizard_metrics=lizard_metrics,
+            )
+            findings.extend(self._check_scalability_patterns(scan_context))
+        return findings
+
     def _check_scalability_patterns(
         self, scan: PatternScanContext
     ) -> list[dict[str, Any]]:
@@ -337,9 +400,9 @@ class ScalabilityAnalyzer(BaseAnalyzer):
 
         for pattern_name, pattern_info in scan.patterns.items():
             for indicator in pattern_info["indicators"]:
-                matches = re.finditer(
-                    indicator, scan.content, re.MULTILINE | re.IGNORECASE
-                )
+                matches = compiled_regex(
+                    indicator, re.MULTILINE | re.IGNORECASE
+                ).finditer(scan.content)
                 for match in matches:
                     line_num = scan.content[: match.start()].count("\n") + 1
                     context_line = (
@@ -384,10 +447,9 @@ class ScalabilityAnalyzer(BaseAnalyzer):
         if file_path in self._lizard_cache:
             return self._lizard_cache[file_path]
         try:
-            result = subprocess.run(
+            result = self.run_tool(
                 ["lizard", "-C", "999", "-L", "999", "-a", "999", file_path],
-                capture_output=True,
-                text=True,
+                tool="lizard",
                 timeout=10,
             )
 
@@ -435,6 +497,7 @@ class ScalabilityAnalyzer(BaseAnalyzer):
         ):
             pass
 
+        self._lizard_failed.add(file_path)
         metrics = {"functions": [], "avg_ccn": 0, "max_ccn": 0, "total_functions": 0}
         self._lizard_cache[file_path] = metrics
         return metrics
@@ -568,11 +631,12 @@ class ScalabilityAnalyzer(BaseAnalyzer):
 
         try:
             tree = ast.parse(content)
+            loop_levels = self._loop_nesting_levels(tree)
 
             for node in ast.walk(tree):
                 # Check for deeply nested loops
                 if isinstance(node, ast.For | ast.While):
-                    nesting_level = self._count_nesting_level(node, tree)
+                    nesting_level = loop_levels[node]
                     if nesting_level >= 3:
                         line_num = getattr(node, "lineno", 0)
                         context = (
@@ -600,7 +664,11 @@ class ScalabilityAnalyzer(BaseAnalyzer):
                         )
 
                 # Check for large list comprehensions
-                if isinstance(node, ast.ListComp) and len(node.generators) > 2:
+                if (
+                    isinstance(node, ast.ListComp)
+                    and len(node.generators) > 2
+                    and self.severity_enabled("medium")
+                ):
                     line_num = getattr(node, "lineno", 0)
                     context = (
                         lines[line_num - 1].strip() if line_num <= len(lines) else ""
@@ -647,26 +715,29 @@ class ScalabilityAnalyzer(BaseAnalyzer):
 
         return findings
 
-    def _count_nesting_level(self, target_node, tree) -> int:
-        """Count the nesting level of loops."""
-        level = 0
+    @staticmethod
+    def _loop_nesting_levels(tree: ast.AST) -> dict[ast.AST, int]:
+        """
+        Map every loop node to the number of enclosing loops.
 
-        def count_parent_loops(node):
-            nonlocal level
+        Computed in a single traversal that carries the current loop depth,
+        rather than re-walking the module from the root for each loop.
+
+        Returns
+        -------
+            Dictionary of For/While node -> count of For/While ancestors
+        """
+        levels: dict[ast.AST, int] = {}
+        stack: list[tuple[ast.AST, int]] = [(tree, 0)]
+        while stack:
+            node, depth = stack.pop()
             for child in ast.iter_child_nodes(node):
-                if child == target_node:
-                    return True
                 if isinstance(child, ast.For | ast.While):
-                    level += 1
-                    if count_parent_loops(child):
-                        return True
-                    level -= 1
-                elif count_parent_loops(child):
-                    return True
-            return False
-
-        count_parent_loops(tree)
-        return level
+                    levels[child] = depth
+                    stack.append((child, depth + 1))
+                else:
+                    stack.append((child, depth))
+        return levels
 
     def _get_recommendation(self, pattern_name: str, category: str) -> str:
         """Get specific recommendations for scalability issues."""
@@ -23,6 +23,7 @@ EXTENDS: BaseAnalyzer for common analyzer infrastructure
 import contextlib
 import json
 import re
+import shutil
 import subprocess
 import sys
 from pathlib import Path
@@ -31,6 +32,7 @@ from typing import Any
 # Import base analyzer (package root must be on PYTHONPATH)
 from core.base.analyzer_base import AnalyzerConfig, BaseAnalyzer
 from core.base.analyzer_registry import register_analyzer
+from core.utils.tool_probe import probe_tool
 from core.utils.tooling import auto_install_npm_packages
 
 
@@ -38,6 +40,8 @@ from core.utils.tooling import auto_install_npm_packages
 class FrontendPerformanceAnalyzer(BaseAnalyzer):
     """Analyzes frontend performance issues and optimization opportunities."""
 
+    supports_chunked_scan = True
+
     def __init__(self, config: AnalyzerConfig | None = None):
         # Create frontend-specific configuration
         frontend_config = config or AnalyzerConfig(
@@ -111,92 +115,27 @@ class FrontendPerformanceAnalyzer(BaseAnalyzer):
         self._eslint_config_path = None
 
     def _check_eslint_availability(self):
-        """Check if ESLint is available. Exit if not found."""
-        try:
-            # Check if ESLint is available via npx
-            result = subprocess.run(
-                ["npx", "eslint", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            if result.returncode != 0:
-                auto_install_npm_packages(
-                    [
-                        "eslint",
-                        "@typescript-eslint/parser",
-                        "eslint-plugin-react",
-                        "eslint-plugin-import",
-                        "eslint-plugin-vue",
-                    ],
-                    "AAW_AUTO_INSTALL_ESLINT",
-                )
-                result = subprocess.run(
-                    ["npx", "eslint", "--version"],
-                    capture_output=True,
-                    text=True,
-                    timeout=10,
-                )
+        """Check if ESLint is available (cached probes). Exit if not found."""
+        eslint_packages = [
+            "eslint",
+            "@typescript-eslint/parser",
+            "eslint-plugin-react",
+            "eslint-plugin-import",
+            "eslint-plugin-vue",
+        ]
 
-            if result.returncode != 0:
-                print(
-                    "ERROR: ESLint is required for accurate frontend analysis but not found.",
-                    file=sys.stderr,
-                )
-                print(
-                    "Install with: npm install -g eslint @typescript-eslint/parser eslint-plugin-react eslint-plugin-vue",
-                    file=sys.stderr,
-                )
-                sys.exit(1)
-
-            # Check for required plugins
-            required_plugins = [
-                "@typescript-eslint/parser",
-                "eslint-plugin-react",
-                "eslint-plugin-import",
-                "eslint-plugin-vue",
-            ]
+        # Check if ESLint is available via npx
+        probe = probe_tool("eslint")
+        if not probe.available and auto_install_npm_packages(
+            eslint_packages, "AAW_AUTO_INSTALL_ESLINT"
+        ):
+            probe = probe_tool("eslint", refresh=True)
 
-            for plugin in required_plugins:
-                try:
-                    # Try to verify plugin is available
-                    plugin_check = subprocess.run(
-                        ["npm", "list", "-g", plugin],
-                        capture_output=True,
-                        text=True,
-                        timeout=5,
-                    )
-                    if plugin_check.returncode != 0:
-                        print(
-                            f"WARNING: ESLint plugin {plugin} not found globally. Analysis may be limited.",
-                            file=sys.stderr,
-                        )
-                except (subprocess.TimeoutExpired, FileNotFoundError):
-                    pass  # npm might not be available, continue anyway
-
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            if auto_install_npm_packages(
-                [
-                    "eslint",
-                    "@typescript-eslint/parser",
-                    "eslint-plugin-react",
-                    "eslint-plugin-import",
-                    "eslint-plugin-vue",
-                ],
-                "AAW_AUTO_INSTALL_ESLINT",
-            ):
-                try:
-                    result = subprocess.run(
-                        ["npx", "eslint", "--version"],
-                        capture_output=True,
-                        text=True,
-                        timeout=10,
-                    )
-                    if result.returncode == 0:
-                        return
-                except (subprocess.TimeoutExpired, FileNotFoundError):
-                    pass
-            print("ERROR: ESLint is required but not available.", file=sys.stderr)
+        if not probe.available:
+            print(
+                "ERROR: ESLint is required for accurate frontend analysis but not found.",
+                file=sys.stderr,
+            )
             print("Ensure Node.js and npm are installed, then run:", file=sys.stderr)
             print(
                 "  npm install -g eslint @typescript-eslint/parser eslint-plugin-react eslint-plugin-vue eslint-plugin-import",
@@ -204,6 +143,15 @@ class FrontendPerformanceAnalyzer(BaseAnalyzer):
             )
             sys.exit(1)
 
+        # Check for required plugins (npm might not be available; continue anyway)
+        for plugin in eslint_packages[1:]:
+            plugin_probe = probe_tool(f"npm:{plugin}", ["npm", "list", "-g", plugin])
+            if shutil.which("npm") and not plugin_probe.available:
+                print(
+                    f"WARNING: ESLint plugin {plugin} not found globally. Analysis may be limited.",
+                    file=sys.stderr,
+                )
+
     def _init_bundle_patterns(self):
         """Initialize bundle size and import patterns."""
         self.bundle_patterns = {
@@ -463,6 +411,9 @@ class FrontendPerformanceAnalyzer(BaseAnalyzer):
                     for pattern in config["indicators"]
                 ]
 
+    def forget_file(self, file_path: Path) -> None:
+        self._eslint_results_cache.pop(str(Path(file_path).resolve()), None)
+
     def get_analyzer_metadata(self) -> dict[str, Any]:
         """Return metadata about this analyzer."""
         return {
@@ -509,55 +460,70 @@ class FrontendPerformanceAnalyzer(BaseAnalyzer):
 
         return [("asset", self.asset_patterns)]
 
+    def _scan_content_for_issues(
+        self, content: str, file_path: Path
+    ) -> list[dict[str, Any]]:
+        """Match the regex pattern groups for this file type against content."""
+        findings = []
+        lines = content.split("\n")
+
+        file_ext = file_path.suffix.lower()
+        pattern_groups = self._get_pattern_groups_for_extension(file_ext)
+
+        for category, patterns in pattern_groups:
+            for perf_type, config in patterns.items():
+                compiled_patterns = self._compiled_patterns.get(perf_type, [])
+
+                for pattern in compiled_patterns:
+                    for match in pattern.finditer(content):
+                        # Calculate line number
+                        line_number = content[: match.start()].count("\n") + 1
+
+                        # Get the matched line
+                        line_content = (
+                            lines[line_number - 1].strip()
+                            if line_number <= len(lines)
+                            else ""
+                        )
+
+                        # Skip false positives
+                        if self._is_false_positive(line_content, perf_type, category):
+                            continue
+
+                        findings.append(
+                            {
+                                "perf_type": perf_type,
+                                "category": category,
+                                "file_path": str(file_path),
+                                "line_number": line_number,
+                                "line_content": line_content[
+                                    :150
+                                ],  # Truncate long lines
+                                "severity": config["severity"],
+                                "description": config["description"],
+                                "recommendation": config["recommendation"],
+                                "pattern_matched": pattern.pattern[:80],
+                            }
+                        )
+
+        return findings
+
     def _scan_file_for_issues(self, file_path: Path) -> list[dict[str, Any]]:
         """Scan a single file for frontend performance issues."""
         findings = []
 
         try:
-            with open(file_path, encoding="utf-8", errors="ignore") as f:
-                content = f.read()
-                lines = content.split("\n")
-
-                file_ext = file_path.suffix.lower()
-                pattern_groups = self._get_pattern_groups_for_extension(file_ext)
-
-                for category, patterns in pattern_groups:
-                    for perf_type, config in patterns.items():
-                        compiled_patterns = self._compiled_patterns.get(perf_type, [])
-
-                        for pattern in compiled_patterns:
-                            for match in pattern.finditer(content):
-                                # Calculate line number
-                                line_number = content[: match.start()].count("\n") + 1
-
-                                # Get the matched line
-                                line_content = (
-                                    lines[line_number - 1].strip()
-                                    if line_number <= len(lines)
-                                    else ""
-                                )
-
-                                # Skip false positives
-                                if self._is_false_positive(
-                                    line_content, perf_type, category
-                                ):
-                                    continue
-
-                                findings.append(
-                                    {
-                                        "perf_type": perf_type,
-                                        "category": category,
-                                        "file_path": str(file_path),
-                                        "line_number": line_number,
-                                        "line_content": line_content[
-                                            :150
-                                        ],  # Truncate long lines
-                                        "severity": config["severity"],
-                                        "description": config["description"],
-                                        "recommendation": config["recommendation"],
-                                        "pattern_matched": pattern.pattern[:80],
-                                    }
-                                )
+            if self.uses_chunked_scan(file_path):
+                findings = self.scan_in_windows(
+                    file_path,
+                    lambda window: self._scan_content_for_issues(
+                        window.text, file_path
+                    ),
+                )
+            else:
+                with open(file_path, encoding="utf-8", errors="ignore") as f:
+                    content = f.read()
+                findings = self._scan_content_for_issues(content, file_path)
 
         except Exception as e:
             # Log but continue - file might be binary or inaccessible
@@ -603,6 +569,7 @@ class FrontendPerformanceAnalyzer(BaseAnalyzer):
                 file_findings = self.analyze_target(str(file_path))
                 batch_findings.extend(file_findings)
                 self.files_processed += 1
+                self._record_bytes(file_path)
             except Exception as e:
                 self.processing_errors += 1
                 self.logger.warning(f"Error processing {file_path}: {e}")
@@ -637,7 +604,7 @@ class FrontendPerformanceAnalyzer(BaseAnalyzer):
             ]
             cmd.extend(str(f) for f in js_files)
 
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            result = self.run_tool(cmd, timeout=60)
 
             # Parse and cache results
             if result.stdout:
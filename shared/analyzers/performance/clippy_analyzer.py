@@ -22,6 +22,10 @@ from core.base.analyzer_registry import register_analyzer
 class ClippyPerformanceAnalyzer(BaseAnalyzer):
     """Analyze Rust code with Clippy performance lints."""
 
+    # Clippy builds the whole crate
+    shardable = False
+    expensive = True
+
     def __init__(self, config: AnalyzerConfig | None = None):
         perf_cfg = config or AnalyzerConfig(code_extensions={".rs"})
         super().__init__("performance", perf_cfg)
@@ -63,12 +67,8 @@ class ClippyPerformanceAnalyzer(BaseAnalyzer):
 
         try:
             timeout = self.config.timeout_seconds or 900
-            completed = subprocess.run(
-                cmd,
-                cwd=cargo_root,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
+            completed = self.run_tool(
+                cmd, tool="cargo-clippy", cwd=cargo_root, timeout=timeout
             )
         except subprocess.TimeoutExpired as exc:
             result.set_error(f"cargo clippy timed out: {exc}")
@@ -46,6 +46,10 @@ _WARNING_PATTERN = re.compile(
 class DotnetPerformanceAnalyzer(BaseAnalyzer):
     """Analyze C# code with dotnet build analyzers for performance issues."""
 
+    # dotnet build analyzes the whole project
+    shardable = False
+    expensive = True
+
     def __init__(self, config: AnalyzerConfig | None = None):
         perf_cfg = config or AnalyzerConfig(code_extensions={".cs"})
         super().__init__("performance", perf_cfg)
@@ -89,12 +93,7 @@ class DotnetPerformanceAnalyzer(BaseAnalyzer):
 
         try:
             timeout = self.config.timeout_seconds or 900
-            completed = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-            )
+            completed = self.run_tool(cmd, timeout=timeout)
         except subprocess.TimeoutExpired as exc:
             result.set_error(f"dotnet build timed out: {exc}")
             return self.complete_analysis(result)
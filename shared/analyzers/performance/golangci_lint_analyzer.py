@@ -22,6 +22,10 @@ from core.base.analyzer_registry import register_analyzer
 class GolangCILintAnalyzer(BaseAnalyzer):
     """Analyze Go code with golangci-lint and surface performance findings."""
 
+    # golangci-lint type-checks whole packages
+    shardable = False
+    expensive = True
+
     def __init__(
         self,
         config: AnalyzerConfig | None = None,
@@ -81,12 +85,7 @@ class GolangCILintAnalyzer(BaseAnalyzer):
 
         try:
             timeout = self.config.timeout_seconds or 600
-            completed = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-            )
+            completed = self.run_tool(cmd, timeout=timeout)
         except subprocess.TimeoutExpired as exc:
             result.set_error(f"golangci-lint timed out: {exc}")
             return self.complete_analysis(result)
@@ -64,7 +64,7 @@ class RuffPerformanceAnalyzer(BaseAnalyzer):
             target_path,
         ]
         try:
-            p = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+            p = self.run_tool(cmd, timeout=300)
         except subprocess.TimeoutExpired:
             return []
 
@@ -31,6 +31,9 @@ def _auto_install_semgrep() -> bool:
 class SemgrepPerformanceAnalyzer(BaseAnalyzer):
     """Universal performance heuristics using Semgrep rules."""
 
+    # Semgrep startup and rule compilation dominate small targets
+    expensive = True
+
     def __init__(
         self, config: AnalyzerConfig | None = None, *, config_ref: str | None = None
     ):
@@ -64,7 +67,7 @@ class SemgrepPerformanceAnalyzer(BaseAnalyzer):
             target_path,
         ]
         try:
-            p = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
+            p = self.run_tool(cmd, timeout=600)
         except subprocess.TimeoutExpired:
             return []
 
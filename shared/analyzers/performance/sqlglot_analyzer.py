@@ -15,6 +15,7 @@ from typing import Any
 
 from core.base.analyzer_base import AnalyzerConfig, BaseAnalyzer
 from core.base.analyzer_registry import register_analyzer
+from core.base.content_cache import package_version
 
 try:
     import sqlglot  # type: ignore[import-not-found]
@@ -28,12 +29,18 @@ except Exception:  # pragma: no cover - optional import validated at runtime
 class SQLGlotAnalyzer(BaseAnalyzer):
     """Analyze SQL files for common performance issues."""
 
+    supports_chunked_scan = True
+    result_cacheable = True
+
     def __init__(self, config: AnalyzerConfig | None = None):
         perf_cfg = config or AnalyzerConfig(code_extensions={".sql"})
         super().__init__("performance", perf_cfg)
 
         self.patterns = self._load_db_patterns()
 
+    def cache_signature(self) -> dict[str, Any]:
+        return {"sqlglot": package_version("sqlglot")}
+
     def get_analyzer_metadata(self) -> dict[str, Any]:
         return {
             "name": "SQLGlot Database Analyzer",
@@ -49,6 +56,16 @@ class SQLGlotAnalyzer(BaseAnalyzer):
         if not target.is_file():
             return []
 
+        if self.uses_chunked_scan(target):
+            # SQL dumps over the size cap: line indicators window by window;
+            # the AST heuristics need whole statements in memory
+            return self.scan_in_windows(
+                target,
+                lambda window: self._check_pattern_indicators(
+                    window.text.split("\n"), target
+                ),
+            )
+
         content = target.read_text(encoding="utf-8", errors="ignore")
         lines = content.splitlines() or [""]
         findings: list[dict[str, Any]] = []
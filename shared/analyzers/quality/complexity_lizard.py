@@ -20,7 +20,6 @@ Supports: C/C++/C#, Java, JavaScript, Python, Ruby, PHP, Swift, Go, Rust, TypeSc
 """
 
 import re
-import subprocess
 import sys
 from pathlib import Path
 from typing import Any
@@ -28,6 +27,8 @@ from typing import Any
 # Import base analyzer (package root must be on PYTHONPATH)
 from core.base.analyzer_base import AnalyzerConfig, BaseAnalyzer
 from core.base.analyzer_registry import register_analyzer
+from core.base.content_cache import package_version
+from core.utils.tool_probe import probe_tool
 from core.utils.tooling import auto_install_python_package
 
 
@@ -35,6 +36,8 @@ from core.utils.tooling import auto_install_python_package
 class LizardComplexityAnalyzer(BaseAnalyzer):
     """Wrapper around Lizard for code complexity analysis using BaseAnalyzer infrastructure."""
 
+    result_cacheable = True
+
     def __init__(self, config: AnalyzerConfig | None = None):
         # Create quality-specific configuration
         quality_config = config or AnalyzerConfig(
@@ -108,18 +111,16 @@ class LizardComplexityAnalyzer(BaseAnalyzer):
             ]
         )
 
-    def check_lizard_installed(self) -> bool:
-        """Check if lizard is installed."""
-        try:
-            subprocess.run(["lizard", "--version"], capture_output=True, check=True)
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+    def check_lizard_installed(self, refresh: bool = False) -> bool:
+        """Check if lizard is installed (cached probe)."""
+        return probe_tool("lizard", refresh=refresh).available
 
     def _check_lizard_availability(self):
         """Check if Lizard is available."""
-        if not self.check_lizard_installed():
-            auto_install_python_package("lizard", "AAW_AUTO_INSTALL_LIZARD")
+        if not self.check_lizard_installed() and auto_install_python_package(
+            "lizard", "AAW_AUTO_INSTALL_LIZARD"
+        ):
+            self.check_lizard_installed(refresh=True)
 
         if not self.check_lizard_installed():
             print(
@@ -176,6 +177,13 @@ class LizardComplexityAnalyzer(BaseAnalyzer):
 
         return findings
 
+    def cache_signature(self) -> dict[str, Any]:
+        return {
+            "lizard": package_version("lizard"),
+            "lizard_available": self.lizard_available,
+            "thresholds": self.thresholds,
+        }
+
     def get_analyzer_metadata(self) -> dict[str, Any]:
         """
         Get complexity analyzer-specific metadata.
@@ -228,7 +236,7 @@ class LizardComplexityAnalyzer(BaseAnalyzer):
                 "999",  # Set high to get all results
                 file_path,
             ]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = self.run_tool(cmd, timeout=self.config.timeout_seconds)
             if result.returncode == 0:
                 return result.stdout
             return ""
@@ -376,7 +384,9 @@ class LizardComplexityAnalyzer(BaseAnalyzer):
                 cmd = ["lizard", "-C", "999", "-L", "999", "-a", "999"] + batch_paths
 
                 try:
-                    result_output = subprocess.run(cmd, capture_output=True, text=True)
+                    result_output = self.run_tool(
+                        cmd, timeout=self.config.timeout_seconds
+                    )
                     if result_output.returncode == 0:
                         # Parse output for all files in batch
                         for file_path in batch_paths:
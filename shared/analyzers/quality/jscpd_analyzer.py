@@ -62,6 +62,10 @@ def _auto_install_jscpd() -> bool:
 class JSCPDAnalyzer(BaseAnalyzer):
     """Analyzer that shells out to jscpd and converts results to findings."""
 
+    # Duplicates span files, so jscpd needs the whole tree
+    shardable = False
+    expensive = True
+
     def __init__(
         self,
         config: AnalyzerConfig | None = None,
@@ -130,13 +134,7 @@ class JSCPDAnalyzer(BaseAnalyzer):
 
             try:
                 timeout = self.config.timeout_seconds or 300
-                p = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=timeout,
-                    cwd=run_dir,
-                )
+                p = self.run_tool(cmd, tool="jscpd", timeout=timeout, cwd=run_dir)
             except subprocess.TimeoutExpired as e:
                 result.set_error(f"jscpd timed out: {e}")
                 return self.complete_analysis(result)
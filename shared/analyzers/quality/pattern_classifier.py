@@ -8,6 +8,8 @@ Part of the analyzers/quality suite for pattern-based quality assessment.
 
 APPROACH:
 - Multi-detector orchestration (anti-patterns, code smells, security patterns)
+- Single parse and single traversal per file: detectors register node-type
+  callbacks on a shared ASTDispatcher that tracks class/function scope
 - AST-based pattern matching with confidence scoring
 - Comprehensive pattern taxonomy with severity classification
 - Detailed reporting with recommendations
@@ -31,8 +33,11 @@ import logging
 import os
 import re
 from abc import ABC, abstractmethod
+from collections import Counter, defaultdict
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
@@ -87,6 +92,150 @@ class PatternMatch:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
+_SCOPE_NODES = (ast.Module, ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)
+_FUNCTION_NODES = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+NodeCallback = Callable[[ast.AST, "Scope"], None]
+
+
+@dataclass(eq=False)
+class Scope:
+    """Lexical scope frame (module, class or function) tracked during a walk."""
+
+    node: ast.AST
+    parent: "Scope | None" = None
+    function: "Scope | None" = None
+    class_scope: "Scope | None" = None
+
+    @property
+    def name(self) -> str:
+        return getattr(self.node, "name", "")
+
+    @property
+    def qualname(self) -> str:
+        """Dotted name of the enclosing symbol, e.g. ``Outer.method``."""
+        names = []
+        scope: Scope | None = self
+        while scope is not None:
+            if scope.name:
+                names.append(scope.name)
+            scope = scope.parent
+        return ".".join(reversed(names))
+
+
+class ASTDispatcher:
+    """
+    Walk a parsed tree once and fan each node out to registered callbacks.
+
+    Detectors subscribe to the node types they care about instead of running
+    their own ``ast.walk``/``NodeVisitor`` passes. Callbacks receive the node
+    and the active ``Scope``; for scope-creating nodes (classes, functions)
+    that is the node's own scope, whose ``parent`` is the enclosing one.
+    """
+
+    def __init__(self) -> None:
+        self._enter: dict[type, list[NodeCallback]] = defaultdict(list)
+        self._exit: dict[type, list[NodeCallback]] = defaultdict(list)
+        self._finish: list[Callable[[], None]] = []
+        self._resolved: dict[
+            type, tuple[tuple[NodeCallback, ...], tuple[NodeCallback, ...]]
+        ] = {}
+
+    def on(
+        self,
+        node_type: type | tuple[type, ...],
+        callback: NodeCallback,
+        *,
+        on_exit: bool = False,
+    ) -> None:
+        """Subscribe to nodes of the given type(s) on entry (or exit)."""
+        table = self._exit if on_exit else self._enter
+        for kind in node_type if isinstance(node_type, tuple) else (node_type,):
+            table[kind].append(callback)
+        self._resolved.clear()
+
+    def on_finish(self, callback: Callable[[], None]) -> None:
+        """Run a callback once the whole tree has been walked."""
+        self._finish.append(callback)
+
+    def walk(self, tree: ast.AST) -> None:
+        """Traverse the tree once in source (pre-)order, dispatching callbacks."""
+        stack: list[tuple[ast.AST, Scope | None, bool]] = [(tree, None, False)]
+        while stack:
+            node, scope, leaving = stack.pop()
+            on_enter, on_exit = self._handlers(type(node))
+            if leaving:
+                self._dispatch(on_exit, node, scope)
+                continue
+
+            if scope is None or isinstance(node, _SCOPE_NODES):
+                scope = self._open_scope(node, scope)
+            if on_enter:
+                self._dispatch(on_enter, node, scope)
+            if on_exit:
+                stack.append((node, scope, True))
+            children = list(ast.iter_child_nodes(node))
+            children.reverse()
+            stack.extend((child, scope, False) for child in children)
+
+        for callback in self._finish:
+            try:
+                callback()
+            except Exception as e:
+                logger.debug(f"Error finishing {callback.__qualname__}: {e}")
+
+    def _handlers(
+        self, node_type: type
+    ) -> tuple[tuple[NodeCallback, ...], tuple[NodeCallback, ...]]:
+        cached = self._resolved.get(node_type)
+        if cached is None:
+            mro = node_type.__mro__
+            cached = (
+                tuple(cb for kind in mro for cb in self._enter.get(kind, ())),
+                tuple(cb for kind in mro for cb in self._exit.get(kind, ())),
+            )
+            self._resolved[node_type] = cached
+        return cached
+
+    @staticmethod
+    def _open_scope(node: ast.AST, parent: Scope | None) -> Scope:
+        scope = Scope(node=node, parent=parent)
+        if parent is not None:
+            scope.function = parent.function
+            scope.class_scope = parent.class_scope
+        if isinstance(node, _FUNCTION_NODES):
+            scope.function = scope
+        elif isinstance(node, ast.ClassDef):
+            scope.class_scope = scope
+        return scope
+
+    @staticmethod
+    def _dispatch(
+        callbacks: tuple[NodeCallback, ...], node: ast.AST, scope: Scope | None
+    ) -> None:
+        for callback in callbacks:
+            try:
+                callback(node, scope)
+            except Exception as e:
+                logger.debug(f"Error in {callback.__qualname__}: {e}")
+
+
+@dataclass
+class DetectionContext:
+    """Per-file inputs and match sink shared by one detector's callbacks."""
+
+    code: str
+    file_path: str
+    matches: list[PatternMatch] = field(default_factory=list)
+
+    @cached_property
+    def lines(self) -> list[str]:
+        return self.code.split("\n")
+
+
+PatternRegistrar = Callable[[ASTDispatcher, DetectionContext], None]
+
+
 class PatternDetector(ABC):
     """Abstract base class for pattern detectors."""
 
@@ -101,38 +250,67 @@ class PatternDetector(ABC):
         pass
 
 
-class AntiPatternDetector(PatternDetector):
-    """Detects common anti-patterns in code."""
+class ASTPatternDetector(PatternDetector):
+    """
+    Detector whose patterns subscribe to a shared ``ASTDispatcher``.
 
-    def __init__(self):
-        self.patterns = {
-            "god_class": self._detect_god_class,
-            "long_method": self._detect_long_method,
-            "feature_envy": self._detect_feature_envy,
-            "data_clumps": self._detect_data_clumps,
-            "primitive_obsession": self._detect_primitive_obsession,
-            "shotgun_surgery": self._detect_shotgun_surgery,
-            "refused_bequest": self._detect_refused_bequest,
-        }
+    Subclasses fill ``self.patterns`` with registrars that hook node-type
+    callbacks onto the dispatcher and append into the ``DetectionContext``.
+    ``CompositePatternClassifier`` registers every such detector on one
+    dispatcher so the file is parsed and walked exactly once.
+    """
 
-    def detect_patterns(self, code: str, file_path: str) -> list[PatternMatch]:
-        """Detect anti-patterns in code."""
-        matches = []
+    patterns: dict[str, PatternRegistrar]
 
+    def register(
+        self, dispatcher: ASTDispatcher, code: str, file_path: str
+    ) -> DetectionContext:
+        """Register all patterns on the dispatcher; matches fill in during the walk."""
+        context = DetectionContext(code=code, file_path=file_path)
+        for pattern_name, registrar in self.patterns.items():
+            try:
+                registrar(dispatcher, context)
+            except Exception as e:
+                logger.debug(f"Error registering {pattern_name}: {e}")
+        return context
+
+    def detect_patterns(self, code: str, file_path: str) -> list[PatternMatch]:
+        """Detect patterns with a private single-pass walk over the code."""
         try:
             tree = ast.parse(code)
-
-            for pattern_name, detector_func in self.patterns.items():
-                try:
-                    pattern_matches = detector_func(tree, code, file_path)
-                    matches.extend(pattern_matches)
-                except Exception as e:
-                    logger.debug(f"Error detecting {pattern_name}: {e}")
-
         except SyntaxError:
             logger.debug(f"Syntax error in {file_path}")
+            return []
+
+        dispatcher = ASTDispatcher()
+        context = self.register(dispatcher, code, file_path)
+        dispatcher.walk(tree)
+        return context.matches
+
+    def _run_pattern(
+        self, pattern_name: str, tree: ast.AST, code: str, file_path: str
+    ) -> list[PatternMatch]:
+        """Run a single registered pattern over an already-parsed tree."""
+        dispatcher = ASTDispatcher()
+        context = DetectionContext(code=code, file_path=file_path)
+        self.patterns[pattern_name](dispatcher, context)
+        dispatcher.walk(tree)
+        return context.matches
 
-        return matches
+
+class AntiPatternDetector(ASTPatternDetector):
+    """Detects common anti-patterns in code."""
+
+    def __init__(self):
+        self.patterns = {
+            "god_class": self._register_god_class,
+            "long_method": self._register_long_method,
+            "feature_envy": self._register_feature_envy,
+            "data_clumps": self._register_data_clumps,
+            "primitive_obsession": self._register_primitive_obsession,
+            "shotgun_surgery": self._register_shotgun_surgery,
+            "refused_bequest": self._register_refused_bequest,
+        }
 
     def get_pattern_types(self) -> list[PatternType]:
         return [PatternType.ANTI_PATTERN]
@@ -141,67 +319,98 @@ class AntiPatternDetector(PatternDetector):
         self, tree: ast.AST, code: str, file_path: str
     ) -> list[PatternMatch]:
         """Detect god class anti-pattern (classes with too many responsibilities)."""
-        matches = []
+        return self._run_pattern("god_class", tree, code, file_path)
 
-        class GodClassVisitor(ast.NodeVisitor):
-            def visit_ClassDef(self, node):
-                method_count = AntiPatternDetector._count_class_methods(node)
-                attr_count = AntiPatternDetector._count_init_attributes(node)
-                lines = AntiPatternDetector._estimate_class_length(node)
-
-                (
-                    triggered,
-                    severity,
-                    confidence,
-                ) = AntiPatternDetector._assess_god_class_thresholds(
-                    method_count, attr_count, lines
-                )
+    def _detect_long_method(
+        self, tree: ast.AST, code: str, file_path: str
+    ) -> list[PatternMatch]:
+        """Detect long method anti-pattern."""
+        return self._run_pattern("long_method", tree, code, file_path)
 
-                if triggered:
-                    matches.append(
-                        PatternMatch(
-                            pattern_name="God Class",
-                            pattern_type=PatternType.ANTI_PATTERN,
-                            severity=severity,
-                            file_path=file_path,
-                            start_line=node.lineno,
-                            end_line=getattr(node, "end_lineno", node.lineno),
-                            confidence=confidence,
-                            description=f"Class '{node.name}' has too many responsibilities "
-                            f"({method_count} methods, {attr_count} attributes)",
-                            recommendation="Consider breaking this class into smaller, more focused classes using Single Responsibility Principle",
-                            code_snippet=f"class {node.name}:",
-                            metadata={
-                                "methods": method_count,
-                                "attributes": attr_count,
-                                "lines": lines,
-                            },
-                        )
-                    )
+    def _detect_feature_envy(
+        self, tree: ast.AST, code: str, file_path: str
+    ) -> list[PatternMatch]:
+        """Detect feature envy anti-pattern (method uses another class more than its own)."""
+        return self._run_pattern("feature_envy", tree, code, file_path)
+
+    def _detect_data_clumps(
+        self, tree: ast.AST, code: str, file_path: str
+    ) -> list[PatternMatch]:
+        """Detect data clumps (same set of parameters appearing together frequently)."""
+        return self._run_pattern("data_clumps", tree, code, file_path)
+
+    def _register_god_class(
+        self, dispatcher: ASTDispatcher, context: DetectionContext
+    ) -> None:
+        # Attributes stored anywhere under a class's first __init__, keyed by
+        # that __init__ node; filled while the walk passes through it.
+        init_attributes: dict[ast.AST, set[str]] = {}
+
+        def enter_class(node: ast.ClassDef, scope: Scope) -> None:
+            init = AntiPatternDetector._find_init(node)
+            if init is not None:
+                init_attributes[init] = set()
+
+        def record_store(node: ast.Attribute, scope: Scope) -> None:
+            if not init_attributes or not isinstance(node.ctx, ast.Store):
+                return
+            frame = scope.function
+            while frame is not None:
+                stored = init_attributes.get(frame.node)
+                if stored is not None:
+                    stored.add(node.attr)
+                frame = frame.parent.function if frame.parent else None
+
+        def leave_class(node: ast.ClassDef, scope: Scope) -> None:
+            method_count = AntiPatternDetector._count_class_methods(node)
+            init = AntiPatternDetector._find_init(node)
+            attr_count = len(init_attributes.pop(init, ()))
+            lines = AntiPatternDetector._estimate_class_length(node)
+
+            (
+                triggered,
+                severity,
+                confidence,
+            ) = AntiPatternDetector._assess_god_class_thresholds(
+                method_count, attr_count, lines
+            )
 
-                self.generic_visit(node)
+            if triggered:
+                context.matches.append(
+                    PatternMatch(
+                        pattern_name="God Class",
+                        pattern_type=PatternType.ANTI_PATTERN,
+                        severity=severity,
+                        file_path=context.file_path,
+                        start_line=node.lineno,
+                        end_line=getattr(node, "end_lineno", node.lineno),
+                        confidence=confidence,
+                        description=f"Class '{node.name}' has too many responsibilities "
+                        f"({method_count} methods, {attr_count} attributes)",
+                        recommendation="Consider breaking this class into smaller, more focused classes using Single Responsibility Principle",
+                        code_snippet=f"class {node.name}:",
+                        metadata={
+                            "methods": method_count,
+                            "attributes": attr_count,
+                            "lines": lines,
+                        },
+                    )
+                )
 
-        visitor = GodClassVisitor()
-        visitor.visit(tree)
-        return matches
+        dispatcher.on(ast.ClassDef, enter_class)
+        dispatcher.on(ast.Attribute, record_store)
+        dispatcher.on(ast.ClassDef, leave_class, on_exit=True)
 
     @staticmethod
     def _count_class_methods(node: ast.ClassDef) -> int:
         return sum(1 for child in node.body if isinstance(child, ast.FunctionDef))
 
     @staticmethod
-    def _count_init_attributes(node: ast.ClassDef) -> int:
+    def _find_init(node: ast.ClassDef) -> ast.FunctionDef | None:
         for child in node.body:
             if isinstance(child, ast.FunctionDef) and child.name == "__init__":
-                return len(
-                    {
-                        stmt.attr
-                        for stmt in ast.walk(child)
-                        if isinstance(stmt, ast.Attribute)
-                        and isinstance(stmt.ctx, ast.Store)
-                    }
-                )
-        return 0
+                return child
+        return None
 
     @staticmethod
     def _estimate_class_length(node: ast.ClassDef) -> int:
@@ -221,153 +430,122 @@ class AntiPatternDetector(PatternDetector):
         confidence = min(0.9, (method_count + attr_count) / 50)
         return True, severity, confidence
 
-    def _detect_long_method(
-        self, tree: ast.AST, code: str, file_path: str
-    ) -> list[PatternMatch]:
-        """Detect long method anti-pattern."""
-        matches = []
+    def _register_long_method(
+        self, dispatcher: ASTDispatcher, context: DetectionContext
+    ) -> None:
+        def visit_function(node: ast.FunctionDef, scope: Scope) -> None:
+            lines = getattr(node, "end_lineno", node.lineno) - node.lineno
 
-        class LongMethodVisitor(ast.NodeVisitor):
-            def visit_FunctionDef(self, node):
-                lines = getattr(node, "end_lineno", node.lineno) - node.lineno
-
-                if lines > 50:  # Threshold for long method
-                    severity = (
-                        PatternSeverity.HIGH if lines > 100 else PatternSeverity.MEDIUM
+            if lines > 50:  # Threshold for long method
+                severity = (
+                    PatternSeverity.HIGH if lines > 100 else PatternSeverity.MEDIUM
+                )
+                confidence = min(0.95, lines / 150)
+
+                context.matches.append(
+                    PatternMatch(
+                        pattern_name="Long Method",
+                        pattern_type=PatternType.ANTI_PATTERN,
+                        severity=severity,
+                        file_path=context.file_path,
+                        start_line=node.lineno,
+                        end_line=getattr(node, "end_lineno", node.lineno),
+                        confidence=confidence,
+                        description=f"Method '{node.name}' is too long ({lines} lines)",
+                        recommendation="Break this method into smaller, more focused methods",
+                        code_snippet=f"def {node.name}({', '.join([arg.arg for arg in node.args.args])}):",
+                        metadata={"lines": lines},
                     )
-                    confidence = min(0.95, lines / 150)
+                )
 
-                    matches.append(
-                        PatternMatch(
-                            pattern_name="Long Method",
-                            pattern_type=PatternType.ANTI_PATTERN,
-                            severity=severity,
-                            file_path=file_path,
-                            start_line=node.lineno,
-                            end_line=getattr(node, "end_lineno", node.lineno),
-                            confidence=confidence,
-                            description=f"Method '{node.name}' is too long ({lines} lines)",
-                            recommendation="Break this method into smaller, more focused methods",
-                            code_snippet=f"def {node.name}({', '.join([arg.arg for arg in node.args.args])}):",
-                            metadata={"lines": lines},
-                        )
+        dispatcher.on(ast.FunctionDef, visit_function)
+
+    def _register_feature_envy(
+        self, dispatcher: ASTDispatcher, context: DetectionContext
+    ) -> None:
+        # Attribute accesses per function body (nested bodies included): the
+        # counts are accumulated once and folded into the enclosing function
+        # on exit instead of re-walking every method subtree.
+        accesses: dict[ast.AST, tuple[Counter, list[int]]] = {}
+
+        def enter_function(node: ast.AST, scope: Scope) -> None:
+            accesses[node] = (Counter(), [0])
+
+        def record_access(node: ast.Attribute, scope: Scope) -> None:
+            if scope.function is None or not isinstance(node.value, ast.Name):
+                return
+            external, self_accesses = accesses[scope.function.node]
+            if node.value.id == "self":
+                self_accesses[0] += 1
+            else:
+                external[node.value.id] += 1
+
+        def leave_function(node: ast.AST, scope: Scope) -> None:
+            external, self_count = accesses.pop(node)
+            self_accesses = self_count[0]
+            outer = scope.parent.function if scope.parent else None
+            if outer is not None:
+                outer_external, outer_self = accesses[outer.node]
+                outer_external.update(external)
+                outer_self[0] += self_accesses
+
+            # Only check methods, not standalone functions
+            if not isinstance(node, ast.FunctionDef) or scope.class_scope is None:
+                return
+
+            external_total = sum(external.values())
+            if external_total and external_total > self_accesses * 2:
+                most_used, usage_count = external.most_common(1)[0]
+
+                context.matches.append(
+                    PatternMatch(
+                        pattern_name="Feature Envy",
+                        pattern_type=PatternType.ANTI_PATTERN,
+                        severity=PatternSeverity.MEDIUM,
+                        file_path=context.file_path,
+                        start_line=node.lineno,
+                        end_line=getattr(node, "end_lineno", node.lineno),
+                        confidence=min(0.8, usage_count / 10),
+                        description=f"Method '{node.name}' seems more interested in class '{most_used}' than its own class",
+                        recommendation=f"Consider moving this method to the '{most_used}' class or refactoring the design",
+                        code_snippet=f"def {node.name}():",
+                        metadata={
+                            "external_accesses": external_total,
+                            "self_accesses": self_accesses,
+                        },
                     )
+                )
 
-                self.generic_visit(node)
-
-        visitor = LongMethodVisitor()
-        visitor.visit(tree)
-        return matches
-
-    def _detect_feature_envy(
-        self, tree: ast.AST, code: str, file_path: str
-    ) -> list[PatternMatch]:
-        """Detect feature envy anti-pattern (method uses another class more than its own)."""
-        matches = []
-
-        class FeatureEnvyVisitor(ast.NodeVisitor):
-            def __init__(self):
-                self.current_class = None
-                self.current_method = None
-
-            def visit_ClassDef(self, node):
-                old_class = self.current_class
-                self.current_class = node.name
-                self.generic_visit(node)
-                self.current_class = old_class
-
-            def visit_FunctionDef(self, node):
-                if self.current_class:  # Only check methods, not standalone functions
-                    old_method = self.current_method
-                    self.current_method = node
-
-                    # Count attribute accesses
-                    external_accesses = []
-                    self_accesses = 0
-
-                    for child in ast.walk(node):
-                        if isinstance(child, ast.Attribute) and isinstance(
-                            child.value, ast.Name
-                        ):
-                            if child.value.id == "self":
-                                self_accesses += 1
-                            else:
-                                external_accesses.append(child.value.id)
-
-                    # Feature envy heuristic
-                    if external_accesses and len(external_accesses) > self_accesses * 2:
-                        most_used = max(
-                            set(external_accesses), key=external_accesses.count
-                        )
-                        usage_count = external_accesses.count(most_used)
-
-                        matches.append(
-                            PatternMatch(
-                                pattern_name="Feature Envy",
-                                pattern_type=PatternType.ANTI_PATTERN,
-                                severity=PatternSeverity.MEDIUM,
-                                file_path=file_path,
-                                start_line=node.lineno,
-                                end_line=getattr(node, "end_lineno", node.lineno),
-                                confidence=min(0.8, usage_count / 10),
-                                description=f"Method '{node.name}' seems more interested in class '{most_used}' than its own class",
-                                recommendation=f"Consider moving this method to the '{most_used}' class or refactoring the design",
-                                code_snippet=f"def {node.name}():",
-                                metadata={
-                                    "external_accesses": len(external_accesses),
-                                    "self_accesses": self_accesses,
-                                },
-                            )
-                        )
-
-                    self.current_method = old_method
-
-                self.generic_visit(node)
-
-        visitor = FeatureEnvyVisitor()
-        visitor.visit(tree)
-        return matches
-
-    def _detect_data_clumps(
-        self, tree: ast.AST, code: str, file_path: str
-    ) -> list[PatternMatch]:
-        """Detect data clumps (same set of parameters appearing together frequently)."""
-        matches = []
+        dispatcher.on(_FUNCTION_NODES, enter_function)
+        dispatcher.on(ast.Attribute, record_access)
+        dispatcher.on(_FUNCTION_NODES, leave_function, on_exit=True)
 
+    def _register_data_clumps(
+        self, dispatcher: ASTDispatcher, context: DetectionContext
+    ) -> None:
         # Track parameter groups
-        parameter_groups = []
-
-        class DataClumpVisitor(ast.NodeVisitor):
-            def visit_FunctionDef(self, node):
-                if (
-                    len(node.args.args) >= 3
-                ):  # Only consider functions with multiple parameters
-                    params = [arg.arg for arg in node.args.args if arg.arg != "self"]
-                    if len(params) >= 3:
-                        parameter_groups.append((tuple(sorted(params)), node))
-                self.generic_visit(node)
-
-        visitor = DataClumpVisitor()
-        visitor.visit(tree)
-
-        # Find common parameter groups
-        param_counts = {}
-        for params, node in parameter_groups:
-            if params in param_counts:
-                param_counts[params].append(node)
-            else:
-                param_counts[params] = [node]
-
-        # Report data clumps
-        for params, nodes in param_counts.items():
-            if len(nodes) >= 2:  # Same parameter group appears in multiple functions
+        param_counts: dict[tuple[str, ...], list[ast.FunctionDef]] = {}
+
+        def visit_function(node: ast.FunctionDef, scope: Scope) -> None:
+            if (
+                len(node.args.args) >= 3
+            ):  # Only consider functions with multiple parameters
+                params = [arg.arg for arg in node.args.args if arg.arg != "self"]
+                if len(params) >= 3:
+                    param_counts.setdefault(tuple(sorted(params)), []).append(node)
+
+        def report() -> None:
+            for params, nodes in param_counts.items():
+                if len(nodes) < 2:
+                    continue
+                # Same parameter group appears in multiple functions
                 for node in nodes:
-                    matches.append(
+                    context.matches.append(
                         PatternMatch(
                             pattern_name="Data Clumps",
                             pattern_type=PatternType.ANTI_PATTERN,
                             severity=PatternSeverity.MEDIUM,
-                            file_path=file_path,
+                            file_path=context.file_path,
                             start_line=node.lineno,
                             end_line=getattr(node, "end_lineno", node.lineno),
                             confidence=0.7,
@@ -381,66 +559,45 @@ class AntiPatternDetector(PatternDetector):
                         )
                     )
 
-        return matches
+        dispatcher.on(ast.FunctionDef, visit_function)
+        dispatcher.on_finish(report)
 
-    def _detect_primitive_obsession(
-        self, tree: ast.AST, code: str, file_path: str
-    ) -> list[PatternMatch]:
+    def _register_primitive_obsession(
+        self, dispatcher: ASTDispatcher, context: DetectionContext
+    ) -> None:
         """Detect primitive obsession (overuse of primitive types instead of small objects)."""
-        matches = []
         # This is a complex pattern that would require more sophisticated analysis
-        # For now, we'll implement a basic version
-        return matches
 
-    def _detect_shotgun_surgery(
-        self, tree: ast.AST, code: str, file_path: str
-    ) -> list[PatternMatch]:
+    def _register_shotgun_surgery(
+        self, dispatcher: ASTDispatcher, context: DetectionContext
+    ) -> None:
         """Detect shotgun surgery (making a change requires modifications in many places)."""
-        matches = []
         # This requires cross-file analysis, which would be implemented at a higher level
-        return matches
 
-    def _detect_refused_bequest(
-        self, tree: ast.AST, code: str, file_path: str
-    ) -> list[PatternMatch]:
+    def _register_refused_bequest(
+        self, dispatcher: ASTDispatcher, context: DetectionContext
+    ) -> None:
         """Detect refused bequest (subclass doesn't use inherited functionality)."""
-        matches = []
         # This requires inheritance analysis across multiple files
-        return matches
 
 
-class CodeSmellDetector(PatternDetector):
+class CodeSmellDetector(ASTPatternDetector):
     """Detects various code smells."""
 
     def __init__(self):
-        self.smells = {
-            "dead_code": self._detect_dead_code,
-            "duplicate_code": self._detect_duplicate_code,
-            "large_class": self._detect_large_class,
-            "long_parameter_list": self._detect_long_parameter_list,
-            "switch_statements": self._detect_switch_statements,
-            "temporary_field": self._detect_temporary_field,
-            "inappropriate_intimacy": self._detect_inappropriate_intimacy,
+        self.patterns = {
+            "dead_code": self._register_dead_code,
+            "duplicate_code": self._register_duplicate_code,
+            "large_class": self._register_large_class,
+            "long_parameter_list": self._register_long_parameter_list,
+            "switch_statements": self._register_switch_statements,
+            "temporary_field": self._register_temporary_field,
+            "inappropriate_intimacy": self._register_inappropriate_intimacy,
         }
 
-    def detect_patterns(self, code: str, file_path: str) -> list[PatternMatch]:
-        """Detect code smells in code."""
-        matches = []
-
-        try:
-            tree = ast.parse(code)
-
-            for smell_name, detector_func in self.smells.items():
-                try:
-                    smell_matches = detector_func(tree, code, file_path)
-                    matches.extend(smell_matches)
-                except Exception as e:
-                    logger.debug(f"Error detecting {smell_name}: {e}")
-
-        except SyntaxError:
-            logger.debug(f"Syntax error in {file_path}")
-
-        return matches
+    @property
+    def smells(self) -> dict[str, PatternRegistrar]:
+        return self.patterns
 
     def get_pattern_types(self) -> list[PatternType]:
         return [PatternType.CODE_SMELL]
@@ -449,204 +606,189 @@ class CodeSmellDetector(PatternDetector):
         self, tree: ast.AST, code: str, file_path: str
     ) -> list[PatternMatch]:
         """Detect potentially dead/unreachable code."""
-        matches = []
-
-        class DeadCodeVisitor(ast.NodeVisitor):
-            def visit_FunctionDef(self, node):
-                # Look for unreachable code after return statements
-                found_return = False
-                for _i, stmt in enumerate(node.body):
-                    if isinstance(stmt, ast.Return):
-                        found_return = True
-                    elif found_return and not isinstance(stmt, ast.Pass):
-                        matches.append(
-                            PatternMatch(
-                                pattern_name="Dead Code",
-                                pattern_type=PatternType.CODE_SMELL,
-                                severity=PatternSeverity.MEDIUM,
-                                file_path=file_path,
-                                start_line=stmt.lineno,
-                                end_line=getattr(stmt, "end_lineno", stmt.lineno),
-                                confidence=0.8,
-                                description="Code after return statement is unreachable",
-                                recommendation="Remove unreachable code or restructure the function logic",
-                                code_snippet="# Code after return statement",
-                                metadata={"function": node.name},
-                            )
-                        )
-                        break
-
-                self.generic_visit(node)
-
-        visitor = DeadCodeVisitor()
-        visitor.visit(tree)
-        return matches
-
-    def _detect_duplicate_code(
-        self, tree: ast.AST, code: str, file_path: str
-    ) -> list[PatternMatch]:
-        """Detect duplicate code blocks within the same file."""
-        # This would integrate with the duplicate detection system
-        return []
+        return self._run_pattern("dead_code", tree, code, file_path)
 
     def _detect_large_class(
         self, tree: ast.AST, code: str, file_path: str
     ) -> list[PatternMatch]:
         """Detect excessively large classes."""
-        # Similar to god class but focused on size metrics
-        matches = []
-
-        class LargeClassVisitor(ast.NodeVisitor):
-            def visit_ClassDef(self, node):
-                lines = getattr(node, "end_lineno", node.lineno) - node.lineno
-
-                if lines > 300:  # Large class threshold
-                    matches.append(
-                        PatternMatch(
-                            pattern_name="Large Class",
-                            pattern_type=PatternType.CODE_SMELL,
-                            severity=PatternSeverity.MEDIUM,
-                            file_path=file_path,
-                            start_line=node.lineno,
-                            end_line=getattr(node, "end_lineno", node.lineno),
-                            confidence=min(0.9, lines / 500),
-                            description=f"Class '{node.name}' is very large ({lines} lines)",
-                            recommendation="Consider breaking this class into smaller, more cohesive classes",
-                            code_snippet=f"class {node.name}:",
-                            metadata={"lines": lines},
-                        )
-                    )
-
-                self.generic_visit(node)
-
-        visitor = LargeClassVisitor()
-        visitor.visit(tree)
-        return matches
+        return self._run_pattern("large_class", tree, code, file_path)
 
     def _detect_long_parameter_list(
         self, tree: ast.AST, code: str, file_path: str
     ) -> list[PatternMatch]:
         """Detect functions with too many parameters."""
-        matches = []
-
-        class LongParameterVisitor(ast.NodeVisitor):
-            def visit_FunctionDef(self, node):
-                param_count = len(node.args.args)
+        return self._run_pattern("long_parameter_list", tree, code, file_path)
 
-                if param_count > 5:  # Long parameter list threshold
-                    matches.append(
+    def _detect_switch_statements(
+        self, tree: ast.AST, code: str, file_path: str
+    ) -> list[PatternMatch]:
+        """Detect complex switch-like statements that could benefit from polymorphism."""
+        return self._run_pattern("switch_statements", tree, code, file_path)
+
+    def _register_dead_code(
+        self, dispatcher: ASTDispatcher, context: DetectionContext
+    ) -> None:
+        def visit_function(node: ast.FunctionDef, scope: Scope) -> None:
+            # Look for unreachable code after return statements
+            found_return = False
+            for stmt in node.body:
+                if isinstance(stmt, ast.Return):
+                    found_return = True
+                elif found_return and not isinstance(stmt, ast.Pass):
+                    context.matches.append(
                         PatternMatch(
-                            pattern_name="Long Parameter List",
+                            pattern_name="Dead Code",
                             pattern_type=PatternType.CODE_SMELL,
                             severity=PatternSeverity.MEDIUM,
-                            file_path=file_path,
-                            start_line=node.lineno,
-                            end_line=node.lineno,
-                            confidence=min(0.9, param_count / 10),
-                            description=f"Function '{node.name}' has too many parameters ({param_count})",
-                            recommendation="Consider using parameter objects, introducing a parameter object, or preserving whole object",
-                            code_snippet=f"def {node.name}({', '.join([arg.arg for arg in node.args.args])}):",
-                            metadata={"parameter_count": param_count},
+                            file_path=context.file_path,
+                            start_line=stmt.lineno,
+                            end_line=getattr(stmt, "end_lineno", stmt.lineno),
+                            confidence=0.8,
+                            description="Code after return statement is unreachable",
+                            recommendation="Remove unreachable code or restructure the function logic",
+                            code_snippet="# Code after return statement",
+                            metadata={"function": node.name},
                         )
                     )
+                    break
 
-                self.generic_visit(node)
-
-        visitor = LongParameterVisitor()
-        visitor.visit(tree)
-        return matches
+        dispatcher.on(ast.FunctionDef, visit_function)
 
-    def _detect_switch_statements(
-        self, tree: ast.AST, code: str, file_path: str
-    ) -> list[PatternMatch]:
-        """Detect complex switch-like statements that could benefit from polymorphism."""
-        matches = []
-
-        class SwitchStatementVisitor(ast.NodeVisitor):
-            def visit_If(self, node):
-                # Count chained if-elif statements
-                elif_count = 0
-                current = node
+    def _register_duplicate_code(
+        self, dispatcher: ASTDispatcher, context: DetectionContext
+    ) -> None:
+        """Detect duplicate code blocks within the same file."""
+        # This would integrate with the duplicate detection system
 
-                while hasattr(current, "orelse") and current.orelse:
-                    if isinstance(current.orelse[0], ast.If):
-                        elif_count += 1
-                        current = current.orelse[0]
-                    else:
-                        break
+    def _register_large_class(
+        self, dispatcher: ASTDispatcher, context: DetectionContext
+    ) -> None:
+        # Similar to god class but focused on size metrics
+        def visit_class(node: ast.ClassDef, scope: Scope) -> None:
+            lines = getattr(node, "end_lineno", node.lineno) - node.lineno
+
+            if lines > 300:  # Large class threshold
+                context.matches.append(
+                    PatternMatch(
+                        pattern_name="Large Class",
+                        pattern_type=PatternType.CODE_SMELL,
+                        severity=PatternSeverity.MEDIUM,
+                        file_path=context.file_path,
+                        start_line=node.lineno,
+                        end_line=getattr(node, "end_lineno", node.lineno),
+                        confidence=min(0.9, lines / 500),
+                        description=f"Class '{node.name}' is very large ({lines} lines)",
+                        recommendation="Consider breaking this class into smaller, more cohesive classes",
+                        code_snippet=f"class {node.name}:",
+                        metadata={"lines": lines},
+                    )
+                )
 
-                if elif_count > 3:  # Complex if-elif chain
-                    matches.append(
-                        PatternMatch(
-                            pattern_name="Complex Switch Statement",
-                            pattern_type=PatternType.CODE_SMELL,
-                            severity=PatternSeverity.MEDIUM,
-                            file_path=file_path,
-                            start_line=node.lineno,
-                            end_line=getattr(current, "end_lineno", node.lineno),
-                            confidence=min(0.8, elif_count / 8),
-                            description=f"Complex if-elif chain with {elif_count + 1} branches",
-                            recommendation="Consider using polymorphism, strategy pattern, or lookup tables",
-                            code_snippet="if ... elif ... elif ...",
-                            metadata={"branches": elif_count + 1},
-                        )
+        dispatcher.on(ast.ClassDef, visit_class)
+
+    def _register_long_parameter_list(
+        self, dispatcher: ASTDispatcher, context: DetectionContext
+    ) -> None:
+        def visit_function(node: ast.FunctionDef, scope: Scope) -> None:
+            param_count = len(node.args.args)
+
+            if param_count > 5:  # Long parameter list threshold
+                context.matches.append(
+                    PatternMatch(
+                        pattern_name="Long Parameter List",
+                        pattern_type=PatternType.CODE_SMELL,
+                        severity=PatternSeverity.MEDIUM,
+                        file_path=context.file_path,
+                        start_line=node.lineno,
+                        end_line=node.lineno,
+                        confidence=min(0.9, param_count / 10),
+                        description=f"Function '{node.name}' has too many parameters ({param_count})",
+                        recommendation="Consider using parameter objects, introducing a parameter object, or preserving whole object",
+                        code_snippet=f"def {node.name}({', '.join([arg.arg for arg in node.args.args])}):",
+                        metadata={"parameter_count": param_count},
                     )
+                )
 
-                self.generic_visit(node)
+        dispatcher.on(ast.FunctionDef, visit_function)
+
+    def _register_switch_statements(
+        self, dispatcher: ASTDispatcher, context: DetectionContext
+    ) -> None:
+        def visit_if(node: ast.If, scope: Scope) -> None:
+            # Count chained if-elif statements
+            elif_count = 0
+            current = node
+
+            while current.orelse and isinstance(current.orelse[0], ast.If):
+                elif_count += 1
+                current = current.orelse[0]
+
+            if elif_count > 3:  # Complex if-elif chain
+                context.matches.append(
+                    PatternMatch(
+                        pattern_name="Complex Switch Statement",
+                        pattern_type=PatternType.CODE_SMELL,
+                        severity=PatternSeverity.MEDIUM,
+                        file_path=context.file_path,
+                        start_line=node.lineno,
+                        end_line=getattr(current, "end_lineno", node.lineno),
+                        confidence=min(0.8, elif_count / 8),
+                        description=f"Complex if-elif chain with {elif_count + 1} branches",
+                        recommendation="Consider using polymorphism, strategy pattern, or lookup tables",
+                        code_snippet="if ... elif ... elif ...",
+                        metadata={"branches": elif_count + 1},
+                    )
+                )
 
-        visitor = SwitchStatementVisitor()
-        visitor.visit(tree)
-        return matches
+        dispatcher.on(ast.If, visit_if)
 
-    def _detect_temporary_field(
-        self, tree: ast.AST, code: str, file_path: str
-    ) -> list[PatternMatch]:
+    def _register_temporary_field(
+        self, dispatcher: ASTDispatcher, context: DetectionContext
+    ) -> None:
         """Detect temporary fields (instance variables set only in certain circumstances)."""
         # This requires more sophisticated analysis
-        return []
 
-    def _detect_inappropriate_intimacy(
-        self, tree: ast.AST, code: str, file_path: str
-    ) -> list[PatternMatch]:
+    def _register_inappropriate_intimacy(
+        self, dispatcher: ASTDispatcher, context: DetectionContext
+    ) -> None:
         """Detect classes that know too much about each other's internal details."""
         # This requires cross-class analysis
-        return []
 
 
-class SecurityPatternDetector(PatternDetector):
+_SECRET_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE), description)
+    for pattern, description in (
+        (r'password\s*=\s*["\'][^"\']+["\']', "hardcoded password"),
+        (r'api_key\s*=\s*["\'][^"\']+["\']', "hardcoded API key"),
+        (r'secret\s*=\s*["\'][^"\']+["\']', "hardcoded secret"),
+        (r'token\s*=\s*["\'][^"\']+["\']', "hardcoded token"),
+    )
+]
+
+_DANGEROUS_STRING_PATTERNS = [
+    (re.compile(pattern), description)
+    for pattern, description in (
+        (r'subprocess\.call\(["\'][^"\']*\s*\+', "command injection risk"),
+        (r'os\.system\(["\'][^"\']*\s*\+', "command injection risk"),
+        (r"shell=True", "shell injection risk"),
+    )
+]
+
+
+class SecurityPatternDetector(ASTPatternDetector):
     """Detects security-related patterns and vulnerabilities."""
 
     def __init__(self):
         self.patterns = {
-            "sql_injection": self._detect_sql_injection,
-            "hardcoded_secrets": self._detect_hardcoded_secrets,
-            "insecure_random": self._detect_insecure_random,
-            "path_traversal": self._detect_path_traversal,
-            "eval_usage": self._detect_eval_usage,
+            "sql_injection": self._register_sql_injection,
+            "hardcoded_secrets": self._register_hardcoded_secrets,
+            "insecure_random": self._register_insecure_random,
+            "path_traversal": self._register_path_traversal,
+            "eval_usage": self._register_eval_usage,
+            "string_patterns": self._register_string_patterns,
         }
 
-    def detect_patterns(self, code: str, file_path: str) -> list[PatternMatch]:
-        """Detect security patterns in code."""
-        matches = []
-
-        try:
-            tree = ast.parse(code)
-
-            for pattern_name, detector_func in self.patterns.items():
-                try:
-                    security_matches = detector_func(tree, code, file_path)
-                    matches.extend(security_matches)
-                except Exception as e:
-                    logger.debug(f"Error detecting {pattern_name}: {e}")
-
-            # Also check string patterns
-            matches.extend(self._detect_string_patterns(code, file_path))
-
-        except SyntaxError:
-            logger.debug(f"Syntax error in {file_path}")
-
-        return matches
-
     def get_pattern_types(self) -> list[PatternType]:
         return [PatternType.SECURITY_ISSUE]
 
@@ -654,194 +796,185 @@ class SecurityPatternDetector(PatternDetector):
         self, tree: ast.AST, code: str, file_path: str
     ) -> list[PatternMatch]:
         """Detect potential SQL injection vulnerabilities."""
-        matches = []
-
-        class SqlInjectionVisitor(ast.NodeVisitor):
-            def visit_Call(self, node):
-                # Look for execute() calls with string formatting
-                if (
-                    isinstance(node.func, ast.Attribute)
-                    and node.func.attr == "execute"
-                    and node.args
-                ):
-                    arg = node.args[0]
-                    if isinstance(arg, ast.BinOp | ast.JoinedStr | ast.FormattedValue):
-                        matches.append(
-                            PatternMatch(
-                                pattern_name="SQL Injection Risk",
-                                pattern_type=PatternType.SECURITY_ISSUE,
-                                severity=PatternSeverity.HIGH,
-                                file_path=file_path,
-                                start_line=node.lineno,
-                                end_line=getattr(node, "end_lineno", node.lineno),
-                                confidence=0.7,
-                                description="SQL query construction using string formatting/concatenation",
-                                recommendation="Use parameterized queries or prepared statements",
-                                code_snippet="execute(...)",
-                                metadata={"call_type": "execute"},
-                            )
-                        )
-
-                self.generic_visit(node)
-
-        visitor = SqlInjectionVisitor()
-        visitor.visit(tree)
-        return matches
+        return self._run_pattern("sql_injection", tree, code, file_path)
 
     def _detect_hardcoded_secrets(
         self, tree: ast.AST, code: str, file_path: str
     ) -> list[PatternMatch]:
         """Detect hardcoded passwords, API keys, etc."""
-        matches = []
-
-        secret_patterns = [
-            (r'password\s*=\s*["\'][^"\']+["\']', "hardcoded password"),
-            (r'api_key\s*=\s*["\'][^"\']+["\']', "hardcoded API key"),
-            (r'secret\s*=\s*["\'][^"\']+["\']', "hardcoded secret"),
-            (r'token\s*=\s*["\'][^"\']+["\']', "hardcoded token"),
-        ]
-
-        lines = code.split("\n")
-        for i, line in enumerate(lines, 1):
-            for pattern, description in secret_patterns:
-                if re.search(pattern, line, re.IGNORECASE):
-                    matches.append(
-                        PatternMatch(
-                            pattern_name="Hardcoded Secrets",
-                            pattern_type=PatternType.SECURITY_ISSUE,
-                            severity=PatternSeverity.CRITICAL,
-                            file_path=file_path,
-                            start_line=i,
-                            end_line=i,
-                            confidence=0.8,
-                            description=f"Found {description} in code",
-                            recommendation="Use environment variables or secure configuration management",
-                            code_snippet=line.strip(),
-                            metadata={"secret_type": description},
-                        )
-                    )
-
-        return matches
+        return self._run_pattern("hardcoded_secrets", tree, code, file_path)
 
     def _detect_insecure_random(
         self, tree: ast.AST, code: str, file_path: str
     ) -> list[PatternMatch]:
         """Detect use of insecure random number generation."""
-        matches = []
+        return self._run_pattern("insecure_random", tree, code, file_path)
 
-        class InsecureRandomVisitor(ast.NodeVisitor):
-            def visit_Call(self, node):
-                if (
-                    isinstance(node.func, ast.Attribute)
-                    and isinstance(node.func.value, ast.Name)
-                    and node.func.value.id == "random"
-                ):
-                    matches.append(
+    def _detect_path_traversal(
+        self, tree: ast.AST, code: str, file_path: str
+    ) -> list[PatternMatch]:
+        """Detect potential path traversal vulnerabilities."""
+        return self._run_pattern("path_traversal", tree, code, file_path)
+
+    def _detect_eval_usage(
+        self, tree: ast.AST, code: str, file_path: str
+    ) -> list[PatternMatch]:
+        """Detect dangerous use of eval() and exec()."""
+        return self._run_pattern("eval_usage", tree, code, file_path)
+
+    def _register_sql_injection(
+        self, dispatcher: ASTDispatcher, context: DetectionContext
+    ) -> None:
+        def visit_call(node: ast.Call, scope: Scope) -> None:
+            # Look for execute() calls with string formatting
+            if (
+                isinstance(node.func, ast.Attribute)
+                and node.func.attr == "execute"
+                and node.args
+            ):
+                arg = node.args[0]
+                if isinstance(arg, ast.BinOp | ast.JoinedStr | ast.FormattedValue):
+                    context.matches.append(
                         PatternMatch(
-                            pattern_name="Insecure Random",
+                            pattern_name="SQL Injection Risk",
                             pattern_type=PatternType.SECURITY_ISSUE,
-                            severity=PatternSeverity.MEDIUM,
-                            file_path=file_path,
+                            severity=PatternSeverity.HIGH,
+                            file_path=context.file_path,
                             start_line=node.lineno,
                             end_line=getattr(node, "end_lineno", node.lineno),
-                            confidence=0.6,
-                            description="Using insecure random number generation",
-                            recommendation="Use secrets module for cryptographically secure random numbers",
-                            code_snippet=f"random.{node.func.attr}()",
-                            metadata={"method": node.func.attr},
+                            confidence=0.7,
+                            description="SQL query construction using string formatting/concatenation",
+                            recommendation="Use parameterized queries or prepared statements",
+                            code_snippet="execute(...)",
+                            metadata={"call_type": "execute"},
                         )
                     )
 
-                self.generic_visit(node)
-
-        visitor = InsecureRandomVisitor()
-        visitor.visit(tree)
-        return matches
-
-    def _detect_path_traversal(
-        self, tree: ast.AST, code: str, file_path: str
-    ) -> list[PatternMatch]:
-        """Detect potential path traversal vulnerabilities."""
-        matches = []
+        dispatcher.on(ast.Call, visit_call)
 
-        class PathTraversalVisitor(ast.NodeVisitor):
-            def visit_Call(self, node):
-                # Look for file operations with user input
-                if (
-                    isinstance(node.func, ast.Name)
-                    and node.func.id in ["open", "file"]
-                    and node.args
-                ):
-                    # This is a simplified check - real implementation would be more sophisticated
-                    arg = node.args[0]
-                    if isinstance(arg, ast.BinOp | ast.JoinedStr):
-                        matches.append(
+    def _register_hardcoded_secrets(
+        self, dispatcher: ASTDispatcher, context: DetectionContext
+    ) -> None:
+        def scan_lines() -> None:
+            for i, line in enumerate(context.lines, 1):
+                for pattern, description in _SECRET_PATTERNS:
+                    if pattern.search(line):
+                        context.matches.append(
                             PatternMatch(
-                                pattern_name="Path Traversal Risk",
+                                pattern_name="Hardcoded Secrets",
                                 pattern_type=PatternType.SECURITY_ISSUE,
-                                severity=PatternSeverity.MEDIUM,
-                                file_path=file_path,
-                                start_line=node.lineno,
-                                end_line=getattr(node, "end_lineno", node.lineno),
-                                confidence=0.5,
-                                description="File path constructed from user input without validation",
-                                recommendation="Validate and sanitize file paths, use allowlists",
-                                code_snippet="open(...)",
-                                metadata={"function": node.func.id},
+                                severity=PatternSeverity.CRITICAL,
+                                file_path=context.file_path,
+                                start_line=i,
+                                end_line=i,
+                                confidence=0.8,
+                                description=f"Found {description} in code",
+                                recommendation="Use environment variables or secure configuration management",
+                                code_snippet=line.strip(),
+                                metadata={"secret_type": description},
                             )
                         )
 
-                self.generic_visit(node)
-
-        visitor = PathTraversalVisitor()
-        visitor.visit(tree)
-        return matches
-
-    def _detect_eval_usage(
-        self, tree: ast.AST, code: str, file_path: str
-    ) -> list[PatternMatch]:
-        """Detect dangerous use of eval() and exec()."""
-        matches = []
+        dispatcher.on_finish(scan_lines)
+
+    def _register_insecure_random(
+        self, dispatcher: ASTDispatcher, context: DetectionContext
+    ) -> None:
+        def visit_call(node: ast.Call, scope: Scope) -> None:
+            if (
+                isinstance(node.func, ast.Attribute)
+                and isinstance(node.func.value, ast.Name)
+                and node.func.value.id == "random"
+            ):
+                context.matches.append(
+                    PatternMatch(
+                        pattern_name="Insecure Random",
+                        pattern_type=PatternType.SECURITY_ISSUE,
+                        severity=PatternSeverity.MEDIUM,
+                        file_path=context.file_path,
+                        start_line=node.lineno,
+                        end_line=getattr(node, "end_lineno", node.lineno),
+                        confidence=0.6,
+                        description="Using insecure random number generation",
+                        recommendation="Use secrets module for cryptographically secure random numbers",
+                        code_snippet=f"random.{node.func.attr}()",
+                        metadata={"method": node.func.attr},
+                    )
+                )
 
-        class EvalUsageVisitor(ast.NodeVisitor):
-            def visit_Call(self, node):
-                if isinstance(node.func, ast.Name) and node.func.id in ["eval", "exec"]:
-                    matches.append(
+        dispatcher.on(ast.Call, visit_call)
+
+    def _register_path_traversal(
+        self, dispatcher: ASTDispatcher, context: DetectionContext
+    ) -> None:
+        def visit_call(node: ast.Call, scope: Scope) -> None:
+            # Look for file operations with user input
+            if (
+                isinstance(node.func, ast.Name)
+                and node.func.id in ["open", "file"]
+                and node.args
+            ):
+                # This is a simplified check - real implementation would be more sophisticated
+                arg = node.args[0]
+                if isinstance(arg, ast.BinOp | ast.JoinedStr):
+                    context.matches.append(
                         PatternMatch(
-                            pattern_name="Dangerous Code Execution",
+                            pattern_name="Path Traversal Risk",
                             pattern_type=PatternType.SECURITY_ISSUE,
-                            severity=PatternSeverity.CRITICAL,
-                            file_path=file_path,
+                            severity=PatternSeverity.MEDIUM,
+                            file_path=context.file_path,
                             start_line=node.lineno,
                             end_line=getattr(node, "end_lineno", node.lineno),
-                            confidence=0.9,
-                            description=f"Use of {node.func.id}() function for code execution",
-                            recommendation="Avoid eval/exec, use safer alternatives like ast.literal_eval or specific parsing",
-                            code_snippet=f"{node.func.id}(...)",
+                            confidence=0.5,
+                            description="File path constructed from user input without validation",
+                            recommendation="Validate and sanitize file paths, use allowlists",
+                            code_snippet="open(...)",
                             metadata={"function": node.func.id},
                         )
                     )
 
-                self.generic_visit(node)
+        dispatcher.on(ast.Call, visit_call)
+
+    def _register_eval_usage(
+        self, dispatcher: ASTDispatcher, context: DetectionContext
+    ) -> None:
+        def visit_call(node: ast.Call, scope: Scope) -> None:
+            if isinstance(node.func, ast.Name) and node.func.id in ["eval", "exec"]:
+                context.matches.append(
+                    PatternMatch(
+                        pattern_name="Dangerous Code Execution",
+                        pattern_type=PatternType.SECURITY_ISSUE,
+                        severity=PatternSeverity.CRITICAL,
+                        file_path=context.file_path,
+                        start_line=node.lineno,
+                        end_line=getattr(node, "end_lineno", node.lineno),
+                        confidence=0.9,
+                        description=f"Use of {node.func.id}() function for code execution",
+                        recommendation="Avoid eval/exec, use safer alternatives like ast.literal_eval or specific parsing",
+                        code_snippet=f"{node.func.id}(...)",
+                        metadata={"function": node.func.id},
+                    )
+                )
 
-        visitor = EvalUsageVisitor()
-        visitor.visit(tree)
-        return matches
+        dispatcher.on(ast.Call, visit_call)
+
+    def _register_string_patterns(
+        self, dispatcher: ASTDispatcher, context: DetectionContext
+    ) -> None:
+        dispatcher.on_finish(
+            lambda: context.matches.extend(
+                self._detect_string_patterns(context.code, context.file_path)
+            )
+        )
 
     def _detect_string_patterns(self, code: str, file_path: str) -> list[PatternMatch]:
         """Detect security issues through string pattern matching."""
         matches = []
 
-        dangerous_patterns = [
-            (r'subprocess\.call\(["\'][^"\']*\s*\+', "command injection risk"),
-            (r'os\.system\(["\'][^"\']*\s*\+', "command injection risk"),
-            (r"shell=True", "shell injection risk"),
-        ]
-
         lines = code.split("\n")
         for i, line in enumerate(lines, 1):
-            for pattern, description in dangerous_patterns:
-                if re.search(pattern, line):
+            for pattern, description in _DANGEROUS_STRING_PATTERNS:
+                if pattern.search(line):
                     matches.append(
                         PatternMatch(
                             pattern_name="Command Injection Risk",
@@ -1102,16 +1235,44 @@ class CompositePatternClassifier(BaseAnalyzer):
 
     def classify_patterns(self, code: str, file_path: str) -> list[PatternMatch]:
         """Run all pattern detectors and combine results."""
-        all_matches = []
+        # AST detectors share one parse and one walk; others run standalone.
+        # Results are collected per detector so output order is unchanged.
+        dispatcher = ASTDispatcher()
+        results: list[tuple[PatternDetector, DetectionContext]] = []
+        walk_needed = False
 
         for detector in self.detectors:
             try:
-                matches = detector.detect_patterns(code, file_path)
-                all_matches.extend(matches)
-                logger.info(f"{type(detector).__name__} found {len(matches)} patterns")
+                if isinstance(detector, ASTPatternDetector):
+                    context = detector.register(dispatcher, code, file_path)
+                    walk_needed = True
+                else:
+                    context = DetectionContext(code=code, file_path=file_path)
+                    context.matches = detector.detect_patterns(code, file_path)
+                results.append((detector, context))
             except Exception as e:
                 logger.error(f"Error in {type(detector).__name__}: {e}")
 
+        parsed = True
+        if walk_needed:
+            try:
+                dispatcher.walk(ast.parse(code))
+            except SyntaxError:
+                logger.debug(f"Syntax error in {file_path}")
+                parsed = False
+            except Exception as e:
+                logger.error(f"Error walking {file_path}: {e}")
+                parsed = False
+
+        all_matches = []
+        for detector, context in results:
+            if not parsed and isinstance(detector, ASTPatternDetector):
+                continue
+            all_matches.extend(context.matches)
+            logger.info(
+                f"{type(detector).__name__} found {len(context.matches)} patterns"
+            )
+
         # Remove duplicates and sort by severity/confidence
         unique_matches = self._deduplicate_matches(all_matches)
         return self._sort_matches(unique_matches)
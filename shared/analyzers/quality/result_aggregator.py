@@ -31,6 +31,7 @@ EXTENDS: BaseAnalyzer for common analyzer infrastructure
 - Uses shared timing, logging, and error handling patterns
 """
 
+import heapq
 import json
 import logging
 import os
@@ -728,12 +729,13 @@ class AnalysisAggregator(BaseAnalyzer):
         """Get top issues sorted by priority and confidence."""
         priority_order = {p: i for i, p in enumerate(Priority)}
 
-        sorted_results = sorted(
-            self.results, key=lambda r: (priority_order[r.priority], -r.confidence)
+        # Bounded selection: equivalent to sorted(...)[:limit] without a full sort
+        return heapq.nsmallest(
+            limit,
+            self.results,
+            key=lambda r: (priority_order[r.priority], -r.confidence),
         )
 
-        return sorted_results[:limit]
-
     def export_results(
         self, output_format: str = "json", output_path: str | None = None
     ) -> str:
@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""
+Blame Service - Batched, range-restricted and cached git blame.
+
+PURPOSE: Attribute only the lines that findings actually reference, without
+re-running whole-file `git blame --line-porcelain` for every lookup.
+Part of the shared/analyzers/root_cause suite.
+
+APPROACH:
+- `git blame --incremental` restricted with `-L start,end` to the requested ranges;
+  commit headers are emitted once per commit instead of once per line
+- Multiple files blamed concurrently on a bounded thread pool
+- Results cached per (file blob SHA, HEAD) in memory and under the framework
+  cache dir; later requests only blame lines not already attributed
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import subprocess
+import threading
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from core.base.fs_utils import atomic_write
+
+LineRange = tuple[int, int]
+
+_UNCOMMITTED_SHA = "0" * 40
+_BLAME_TIMEOUT_SECONDS = 60
+
+
+@dataclass
+class BlameResult:
+    """Line attribution for one file at one (blob, HEAD) pair."""
+
+    file_path: str
+    blob_sha: str
+    head: str
+    commits: dict[str, dict[str, Any]] = field(default_factory=dict)
+    lines: dict[int, str] = field(default_factory=dict)
+    code: dict[int, str] = field(default_factory=dict)
+
+    def line_info(self, line_number: int) -> dict[str, Any] | None:
+        """Return porcelain-style fields for a blamed line."""
+        sha = self.lines.get(line_number)
+        if sha is None:
+            return None
+        info = dict(self.commits.get(sha, {}))
+        info["commit"] = sha
+        info["line_number"] = line_number
+        info["code"] = self.code.get(line_number, "")
+        return info
+
+    def iter_lines(self) -> Iterable[dict[str, Any]]:
+        """Yield line info in line-number order."""
+        for line_number in sorted(self.lines):
+            info = self.line_info(line_number)
+            if info is not None:
+                yield info
+
+    def to_cache_dict(self) -> dict[str, Any]:
+        return {
+            "file_path": self.file_path,
+            "blob_sha": self.blob_sha,
+            "head": self.head,
+            "commits": self.commits,
+            "lines": {str(k): v for k, v in self.lines.items()},
+        }
+
+
+def git_blob_sha(content: bytes) -> str:
+    """Compute the git blob SHA for content without spawning git."""
+    header = f"blob {len(content)}\0".encode()
+    return hashlib.sha1(header + content, usedforsecurity=False).hexdigest()
+
+
+def normalize_ranges(ranges: Iterable[LineRange], max_line: int) -> list[LineRange]:
+    """Clamp ranges to [1, max_line] and merge overlapping or adjacent spans."""
+    clamped = sorted(
+        (max(1, start), min(max_line, end))
+        for start, end in ranges
+        if end >= 1 and start <= max_line and start <= end
+    )
+    merged: list[LineRange] = []
+    for start, end in clamped:
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def ranges_around(line_numbers: Iterable[int], context: int = 0) -> list[LineRange]:
+    """Build line ranges covering each line number plus surrounding context."""
+    return [(line - context, line + context) for line in line_numbers if line > 0]
+
+
+class BlameService:
+    """Range-restricted, concurrent and cached git blame for one repository."""
+
+    def __init__(
+        self,
+        repo_root: Path,
+        max_workers: int = 4,
+        cache_dir: Path | None = None,
+        persist: bool = True,
+    ):
+        self.repo_root = Path(repo_root).resolve()
+        self.max_workers = max(1, max_workers)
+        self.cache_dir = cache_dir or (
+            self.repo_root / ".cache" / "ci-framework" / "blame"
+        )
+        self.persist = persist
+        self._memory: dict[tuple[str, str, str], BlameResult] = {}
+        self._lock = threading.Lock()
+        self._head: str | None = None
+        self.stats = {"cache_hits": 0, "blame_runs": 0, "lines_blamed": 0}
+
+    # ------------------------------------------------------------------ #
+    # Public API
+    # ------------------------------------------------------------------ #
+
+    @property
+    def head(self) -> str:
+        """Return the HEAD SHA blames are resolved against (resolved once)."""
+        if self._head is None:
+            try:
+                result = subprocess.run(
+                    ["git", "rev-parse", "--verify", "HEAD"],
+                    cwd=self.repo_root,
+                    capture_output=True,
+                    text=True,
+                    timeout=30,
+                )
+                self._head = result.stdout.strip() if result.returncode == 0 else ""
+            except (subprocess.TimeoutExpired, OSError):
+                self._head = ""
+        return self._head
+
+    def blame(
+        self, file_path: Path | str, line_ranges: Iterable[LineRange] | None = None
+    ) -> BlameResult | None:
+        """
+        Blame the requested line ranges of a file (whole file when None).
+
+        Returns
+        -------
+            BlameResult covering at least the requested lines, or None if the
+            file cannot be read or blamed.
+        """
+        path = self._resolve(file_path)
+        try:
+            relative = path.relative_to(self.repo_root).as_posix()
+            content = path.read_bytes()
+        except (OSError, ValueError):
+            return None
+
+        text_lines = content.decode("utf-8", errors="replace").splitlines()
+        if not text_lines:
+            return None
+
+        requested = [(1, len(text_lines))] if line_ranges is None else list(line_ranges)
+        ranges = normalize_ranges(requested, len(text_lines))
+        if not ranges:
+            return None
+
+        result = self._cached_result(relative, git_blob_sha(content))
+        missing = self._missing_ranges(result, ranges)
+        if not missing:
+            with self._lock:
+                self.stats["cache_hits"] += 1
+        else:
+            if not self._run_incremental_blame(result, missing):
+                return None
+            self._store(result)
+
+        for start, end in ranges:
+            for line_number in range(start, end + 1):
+                result.code[line_number] = text_lines[line_number - 1]
+        return result
+
+    def blame_many(
+        self, requests: Mapping[Path | str, Iterable[LineRange] | None]
+    ) -> dict[str, BlameResult]:
+        """Blame several files concurrently on a bounded worker pool."""
+        items = list(requests.items())
+        if not items:
+            return {}
+
+        # Resolve HEAD before fanning out so workers don't race on it
+        _ = self.head
+        results: dict[str, BlameResult] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {
+                str(path): pool.submit(
+                    self.blame, path, None if ranges is None else list(ranges)
+                )
+                for path, ranges in items
+            }
+            for key, future in futures.items():
+                blamed = future.result()
+                if blamed is not None:
+                    results[key] = blamed
+        return results
+
+    # ------------------------------------------------------------------ #
+    # Cache management
+    # ------------------------------------------------------------------ #
+
+    def _resolve(self, file_path: Path | str) -> Path:
+        path = Path(file_path)
+        if not path.is_absolute():
+            path = self.repo_root / path
+        return path.resolve()
+
+    def _cache_file(self, relative: str, blob_sha: str) -> Path:
+        # Blame is path-sensitive (rename tracking), so identical blobs at
+        # different paths get separate entries under the same HEAD.
+        path_digest = hashlib.sha1(
+            relative.encode("utf-8"), usedforsecurity=False
+        ).hexdigest()[:10]
+        return self.cache_dir / self.head[:12] / f"{blob_sha}-{path_digest}.json"
+
+    def _cached_result(self, relative: str, blob_sha: str) -> BlameResult:
+        key = (blob_sha, self.head, relative)
+        with self._lock:
+            cached = self._memory.get(key)
+            if cached is not None:
+                return cached
+
+        result = self._load_persisted(relative, blob_sha) or BlameResult(
+            file_path=relative, blob_sha=blob_sha, head=self.head
+        )
+        with self._lock:
+            return self._memory.setdefault(key, result)
+
+    def _load_persisted(self, relative: str, blob_sha: str) -> BlameResult | None:
+        if not self.persist:
+            return None
+        cache_file = self._cache_file(relative, blob_sha)
+        try:
+            data = json.loads(cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if (
+            data.get("head") != self.head
+            or data.get("blob_sha") != blob_sha
+            or data.get("file_path") != relative
+        ):
+            return None
+        return BlameResult(
+            file_path=relative,
+            blob_sha=blob_sha,
+            head=self.head,
+            commits=data.get("commits", {}),
+            lines={int(k): v for k, v in data.get("lines", {}).items()},
+        )
+
+    def _store(self, result: BlameResult) -> None:
+        if not self.persist:
+            return
+        cache_file = self._cache_file(result.file_path, result.blob_sha)
+        with self._lock:
+            payload = json.dumps(result.to_cache_dict())
+        try:
+            with atomic_write(cache_file) as handle:
+                handle.write(payload)
+        except OSError:
+            # Cache persistence is best effort; in-memory results remain valid
+            pass
+
+    @staticmethod
+    def _missing_ranges(
+        result: BlameResult, ranges: list[LineRange]
+    ) -> list[LineRange]:
+        missing: list[LineRange] = []
+        for start, end in ranges:
+            run_start: int | None = None
+            for line_number in range(start, end + 1):
+                if line_number in result.lines:
+                    if run_start is not None:
+                        missing.append((run_start, line_number - 1))
+                        run_start = None
+                elif run_start is None:
+                    run_start = line_number
+            if run_start is not None:
+                missing.append((run_start, end))
+        return missing
+
+    # ------------------------------------------------------------------ #
+    # git blame --incremental
+    # ------------------------------------------------------------------ #
+
+    def _run_incremental_blame(
+        self, result: BlameResult, ranges: list[LineRange]
+    ) -> bool:
+        command = ["git", "blame", "--incremental"]
+        for start, end in ranges:
+            command.extend(["-L", f"{start},{end}"])
+        command.extend(["--", result.file_path])
+        try:
+            completed = subprocess.run(
+                command,
+                cwd=self.repo_root,
+                capture_output=True,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                timeout=_BLAME_TIMEOUT_SECONDS,
+            )
+        except (subprocess.TimeoutExpired, OSError):
+            return False
+        if completed.returncode != 0:
+            return False
+
+        commits, lines = parse_incremental_blame(completed.stdout)
+        with self._lock:
+            self.stats["blame_runs"] += 1
+            self.stats["lines_blamed"] += len(lines)
+            for sha, header in commits.items():
+                result.commits.setdefault(sha, {}).update(header)
+            result.lines.update(lines)
+        return True
+
+
+def parse_incremental_blame(
+    output: str,
+) -> tuple[dict[str, dict[str, Any]], dict[int, str]]:
+    """
+    Parse `git blame --incremental` output.
+
+    Returns
+    -------
+        (commit headers keyed by SHA, final line number -> SHA)
+    """
+    commits: dict[str, dict[str, Any]] = {}
+    lines: dict[int, str] = {}
+    current_sha: str | None = None
+
+    for line in output.splitlines():
+        if current_sha is None:
+            parts = line.split()
+            if len(parts) == 4 and len(parts[0]) == 40:
+                current_sha = parts[0]
+                final_line, count = int(parts[2]), int(parts[3])
+                for offset in range(count):
+                    lines[final_line + offset] = current_sha
+                commits.setdefault(current_sha, {})
+            continue
+
+        key, _, value = line.partition(" ")
+        if key == "filename":
+            # Every group ends with the filename line
+            current_sha = None
+        elif key in {"boundary"}:
+            commits[current_sha]["boundary"] = True
+        elif key != "previous":
+            commits[current_sha][key] = value
+
+    if _UNCOMMITTED_SHA in commits:
+        commits[_UNCOMMITTED_SHA]["uncommitted"] = True
+    return commits, lines
@@ -0,0 +1,595 @@
+#!/usr/bin/env python3
+"""
+Commit Index - Persistent, incremental git history index for root cause analysis.
+
+PURPOSE: Avoid re-parsing `git log` on every root cause invocation.
+Part of the shared/analyzers/root_cause suite.
+
+APPROACH:
+- SQLite database keyed by commit SHA with per-file change rows
+- Records authorship, timestamps, change type and line churn (numstat)
+- Incremental refresh from the last indexed HEAD; full rebuild when history is rewritten
+- Hotspot, churn and recent-change queries served from indexed tables
+
+NOTE: Standard library only so the module can be imported both as
+`analyzers.root_cause.commit_index` and `shared.analyzers.root_cause.commit_index`.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import subprocess
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import suppress
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+COMMIT_INDEX_SCHEMA_VERSION = 1
+DEFAULT_INDEX_NAME = "commit_index.sqlite3"
+
+# ASCII record/unit separators keep commit subjects with "|" intact.
+_RECORD_SEP = "\x1e"
+_FIELD_SEP = "\x1f"
+_LOG_FORMAT = f"{_RECORD_SEP}%H{_FIELD_SEP}%an{_FIELD_SEP}%ae{_FIELD_SEP}%at{_FIELD_SEP}%ct{_FIELD_SEP}%ai{_FIELD_SEP}%s"
+_INSERT_BATCH_SIZE = 2000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS commits (
+    sha TEXT PRIMARY KEY,
+    seq INTEGER NOT NULL,
+    author TEXT NOT NULL,
+    email TEXT NOT NULL,
+    author_time INTEGER NOT NULL,
+    commit_time INTEGER NOT NULL,
+    author_date TEXT NOT NULL,
+    subject TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS file_changes (
+    sha TEXT NOT NULL,
+    path TEXT NOT NULL,
+    change_type TEXT NOT NULL,
+    additions INTEGER NOT NULL,
+    deletions INTEGER NOT NULL,
+    commit_time INTEGER NOT NULL,
+    PRIMARY KEY (sha, path)
+);
+CREATE INDEX IF NOT EXISTS idx_commits_time ON commits (commit_time);
+CREATE INDEX IF NOT EXISTS idx_commits_seq ON commits (seq);
+CREATE INDEX IF NOT EXISTS idx_file_changes_time ON file_changes (commit_time);
+CREATE INDEX IF NOT EXISTS idx_file_changes_path ON file_changes (path, commit_time);
+"""
+
+
+class CommitIndexError(RuntimeError):
+    """Raised when the commit index cannot be built or queried."""
+
+
+@dataclass
+class _ParsedCommit:
+    """Commit header plus file changes collected while streaming `git log`."""
+
+    sha: str
+    author: str
+    email: str
+    author_time: int
+    commit_time: int
+    author_date: str
+    subject: str
+    change_types: dict[str, str]
+    numstat: dict[str, tuple[int, int]]
+
+
+def find_git_root(path: Path) -> Path | None:
+    """Find the git repository root directory for a path."""
+    current = path.resolve()
+    if current.is_file():
+        current = current.parent
+    while True:
+        if (current / ".git").exists():
+            return current
+        if current == current.parent:
+            return None
+        current = current.parent
+
+
+def default_index_path(repo_root: Path) -> Path:
+    """Return the default on-disk index location inside the framework cache dir."""
+    return repo_root / ".cache" / "ci-framework" / DEFAULT_INDEX_NAME
+
+
+class CommitIndex:
+    """Persistent commit index for a single git repository."""
+
+    def __init__(self, repo_root: Path, db_path: Path | None = None):
+        self.repo_root = Path(repo_root).resolve()
+        self.db_path = Path(db_path) if db_path else default_index_path(self.repo_root)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._ensure_schema()
+
+    # ------------------------------------------------------------------ #
+    # Lifecycle
+    # ------------------------------------------------------------------ #
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> CommitIndex:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _ensure_schema(self) -> None:
+        """Create tables, discarding an index written with another schema version."""
+        version = self._read_meta_raw("schema_version")
+        if version is not None and version != str(COMMIT_INDEX_SCHEMA_VERSION):
+            with self._conn:
+                self._conn.executescript(
+                    "DROP TABLE IF EXISTS file_changes;"
+                    "DROP TABLE IF EXISTS commits;"
+                    "DROP TABLE IF EXISTS meta;"
+                )
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+            self._write_meta("schema_version", str(COMMIT_INDEX_SCHEMA_VERSION))
+
+    def _read_meta_raw(self, key: str) -> str | None:
+        try:
+            row = self._conn.execute(
+                "SELECT value FROM meta WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.OperationalError:
+            return None
+        return row[0] if row else None
+
+    def _write_meta(self, key: str, value: str) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value)
+        )
+
+    @property
+    def indexed_head(self) -> str | None:
+        """Return the HEAD SHA the index was last refreshed at."""
+        return self._read_meta_raw("head")
+
+    # ------------------------------------------------------------------ #
+    # Refresh
+    # ------------------------------------------------------------------ #
+
+    def update(self) -> int:
+        """
+        Bring the index up to date with the repository HEAD.
+
+        Returns
+        -------
+            Number of newly indexed commits
+        """
+        head = self._git_output(["rev-parse", "--verify", "HEAD"])
+        if head is None:
+            # Empty repository or not a git checkout: nothing to index
+            return 0
+        head = head.strip()
+
+        last_head = self.indexed_head
+        if last_head == head:
+            return 0
+
+        if last_head and self._is_ancestor(last_head, head):
+            revision_range = f"{last_head}..{head}"
+        else:
+            # First run or rewritten history: rebuild from scratch
+            with self._conn:
+                self._conn.execute("DELETE FROM file_changes")
+                self._conn.execute("DELETE FROM commits")
+            revision_range = head
+
+        indexed = self._ingest(revision_range)
+        with self._conn:
+            self._write_meta("head", head)
+        return indexed
+
+    def _is_ancestor(self, ancestor: str, descendant: str) -> bool:
+        try:
+            result = subprocess.run(
+                ["git", "merge-base", "--is-ancestor", ancestor, descendant],
+                cwd=self.repo_root,
+                capture_output=True,
+                text=True,
+                timeout=30,
+            )
+        except (subprocess.TimeoutExpired, OSError):
+            return False
+        return result.returncode == 0
+
+    def _git_output(self, args: list[str]) -> str | None:
+        try:
+            result = subprocess.run(
+                ["git", *args],
+                cwd=self.repo_root,
+                capture_output=True,
+                text=True,
+                timeout=30,
+            )
+        except (subprocess.TimeoutExpired, OSError):
+            return None
+        return result.stdout if result.returncode == 0 else None
+
+    def _ingest(self, revision_range: str) -> int:
+        """Stream `git log` for the range and insert commits in batches."""
+        command = [
+            "git",
+            "-c",
+            "core.quotepath=off",
+            "log",
+            "--no-renames",
+            "--raw",
+            "--numstat",
+            f"--format={_LOG_FORMAT}",
+            revision_range,
+        ]
+        try:
+            process = subprocess.Popen(
+                command,
+                cwd=self.repo_root,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+            )
+        except OSError as exc:
+            raise CommitIndexError(f"Unable to run git log: {exc}") from exc
+
+        # git log streams newest first; rows get provisional negative sequence
+        # numbers and are shifted above existing rows once the batch completes,
+        # so "ORDER BY seq DESC" reproduces git log order across refreshes.
+        base_seq = self._conn.execute(
+            "SELECT COALESCE(MAX(seq), 0) FROM commits"
+        ).fetchone()[0]
+        count = 0
+        commit_rows: list[tuple[Any, ...]] = []
+        change_rows: list[tuple[Any, ...]] = []
+        assert process.stdout is not None
+        try:
+            for commit in _parse_log_stream(process.stdout):
+                commit_rows.append(
+                    (
+                        commit.sha,
+                        -(count + 1),
+                        commit.author,
+                        commit.email,
+                        commit.author_time,
+                        commit.commit_time,
+                        commit.author_date,
+                        commit.subject,
+                    )
+                )
+                for path, change_type in commit.change_types.items():
+                    additions, deletions = commit.numstat.get(path, (0, 0))
+                    change_rows.append(
+                        (
+                            commit.sha,
+                            path,
+                            change_type,
+                            additions,
+                            deletions,
+                            commit.commit_time,
+                        )
+                    )
+                count += 1
+                if len(commit_rows) >= _INSERT_BATCH_SIZE:
+                    self._flush(commit_rows, change_rows)
+            self._flush(commit_rows, change_rows)
+        finally:
+            process.stdout.close()
+            return_code = process.wait()
+
+        if return_code != 0:
+            raise CommitIndexError(
+                f"git log exited with status {return_code} for {revision_range}"
+            )
+        with self._conn:
+            self._conn.execute(
+                "UPDATE commits SET seq = seq + ? WHERE seq < 0",
+                (base_seq + count + 1,),
+            )
+        return count
+
+    def _flush(
+        self, commit_rows: list[tuple[Any, ...]], change_rows: list[tuple[Any, ...]]
+    ) -> None:
+        if not commit_rows and not change_rows:
+            return
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO commits VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                commit_rows,
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO file_changes VALUES (?, ?, ?, ?, ?, ?)",
+                change_rows,
+            )
+        commit_rows.clear()
+        change_rows.clear()
+
+    # ------------------------------------------------------------------ #
+    # Queries
+    # ------------------------------------------------------------------ #
+
+    def commit_count(self) -> int:
+        """Return the number of indexed commits."""
+        return self._conn.execute("SELECT COUNT(*) FROM commits").fetchone()[0]
+
+    def recent_commits(
+        self,
+        since: datetime | None = None,
+        limit: int | None = None,
+        path: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Return commits newest first, optionally restricted to a window and a path.
+
+        Each entry mirrors the structure produced by RecentChangesAnalyzer:
+        hash, author, email, date, timestamp, message and files_changed.
+        """
+        clauses: list[str] = []
+        params: list[Any] = []
+        if since is not None:
+            clauses.append("c.commit_time >= ?")
+            params.append(int(since.timestamp()))
+        if path is not None:
+            candidates = self._path_candidates(path)
+            placeholders = ",".join("?" * len(candidates))
+            clauses.append(
+                f"c.sha IN (SELECT sha FROM file_changes WHERE path IN ({placeholders}))"
+            )
+            params.extend(candidates)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        limit_sql = "LIMIT ?" if limit is not None else ""
+        if limit is not None:
+            params.append(limit)
+
+        rows = self._conn.execute(
+            f"""
+            SELECT c.sha, c.author, c.email, c.author_date, c.author_time, c.subject
+            FROM commits c
+            {where}
+            ORDER BY c.seq DESC
+            {limit_sql}
+            """,
+            params,
+        ).fetchall()
+
+        files_by_sha = self._files_for_commits([row[0] for row in rows])
+        return [
+            {
+                "hash": sha,
+                "author": author,
+                "email": email,
+                "date": author_date,
+                "timestamp": author_time,
+                "message": subject,
+                "files_changed": files_by_sha.get(sha, []),
+            }
+            for sha, author, email, author_date, author_time, subject in rows
+        ]
+
+    def _path_candidates(self, path: str) -> list[str]:
+        """
+        Return the repo-relative spellings a stored path may have for ``path``.
+
+        Error reports often carry absolute or "./"-prefixed paths. A path inside
+        the repository maps to its one repo-relative form; any other path may
+        name a stored path by one of its trailing suffixes, so every suffix is
+        matched by (indexed) equality rather than a wildcard pattern.
+        """
+        candidate = Path(path)
+        if candidate.is_absolute():
+            with suppress(ValueError):
+                return [candidate.resolve().relative_to(self.repo_root).as_posix()]
+        parts = [
+            part for part in path.replace("\\", "/").split("/") if part not in ("", ".")
+        ]
+        return ["/".join(parts[i:]) for i in range(len(parts))] or [path]
+
+    def _files_for_commits(self, shas: list[str]) -> dict[str, list[str]]:
+        files: dict[str, list[str]] = defaultdict(list)
+        # Stay below SQLite's bound-parameter limit
+        for start in range(0, len(shas), 500):
+            chunk = shas[start : start + 500]
+            placeholders = ",".join("?" for _ in chunk)
+            for sha, path in self._conn.execute(
+                f"SELECT sha, path FROM file_changes WHERE sha IN ({placeholders}) ORDER BY path",
+                chunk,
+            ):
+                files[sha].append(path)
+        return files
+
+    def changed_files(
+        self, since: datetime | None = None
+    ) -> dict[str, list[dict[str, str]]]:
+        """Return {path: [{"commit", "change_type"}, ...]} newest first."""
+        params: list[Any] = []
+        where = ""
+        if since is not None:
+            where = "WHERE f.commit_time >= ?"
+            params.append(int(since.timestamp()))
+        changed: dict[str, list[dict[str, str]]] = defaultdict(list)
+        for path, sha, change_type in self._conn.execute(
+            f"""
+            SELECT f.path, f.sha, f.change_type
+            FROM file_changes f
+            JOIN commits c ON c.sha = f.sha
+            {where}
+            ORDER BY c.seq DESC
+            """,
+            params,
+        ):
+            changed[path].append({"commit": sha, "change_type": change_type})
+        return dict(changed)
+
+    def file_touch_counts(self, since: datetime | None = None) -> dict[str, int]:
+        """Return the number of commits touching each path."""
+        params: list[Any] = []
+        where = ""
+        if since is not None:
+            where = "WHERE commit_time >= ?"
+            params.append(int(since.timestamp()))
+        return dict(
+            self._conn.execute(
+                f"SELECT path, COUNT(*) FROM file_changes {where} GROUP BY path",
+                params,
+            ).fetchall()
+        )
+
+    def hotspots(
+        self,
+        since: datetime | None = None,
+        min_changes: int = 1,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return the most frequently changed files with churn and author counts."""
+        params: list[Any] = []
+        where = ""
+        if since is not None:
+            where = "WHERE f.commit_time >= ?"
+            params.append(int(since.timestamp()))
+        params.append(min_changes)
+        limit_sql = ""
+        if limit is not None:
+            limit_sql = "LIMIT ?"
+            params.append(limit)
+        rows = self._conn.execute(
+            f"""
+            SELECT f.path,
+                   COUNT(*) AS change_count,
+                   SUM(f.additions) AS additions,
+                   SUM(f.deletions) AS deletions,
+                   COUNT(DISTINCT c.author) AS authors,
+                   MAX(f.commit_time) AS last_changed
+            FROM file_changes f
+            JOIN commits c ON c.sha = f.sha
+            {where}
+            GROUP BY f.path
+            HAVING change_count >= ?
+            ORDER BY change_count DESC, f.path
+            {limit_sql}
+            """,
+            params,
+        ).fetchall()
+        return [
+            {
+                "file_path": path,
+                "change_count": change_count,
+                "additions": additions,
+                "deletions": deletions,
+                "churn": additions + deletions,
+                "authors": authors,
+                "last_changed": last_changed,
+            }
+            for path, change_count, additions, deletions, authors, last_changed in rows
+        ]
+
+    def churn(self, path: str, since: datetime | None = None) -> dict[str, Any]:
+        """Return aggregate churn and authorship for a single path."""
+        params: list[Any] = [path]
+        where = "WHERE f.path = ?"
+        if since is not None:
+            where += " AND f.commit_time >= ?"
+            params.append(int(since.timestamp()))
+        rows = self._conn.execute(
+            f"""
+            SELECT c.author, COUNT(*), SUM(f.additions), SUM(f.deletions),
+                   MIN(f.commit_time), MAX(f.commit_time)
+            FROM file_changes f
+            JOIN commits c ON c.sha = f.sha
+            {where}
+            GROUP BY c.author
+            """,
+            params,
+        ).fetchall()
+        authors = {author: count for author, count, *_ in rows}
+        additions = sum(row[2] for row in rows)
+        deletions = sum(row[3] for row in rows)
+        return {
+            "file_path": path,
+            "change_count": sum(authors.values()),
+            "additions": additions,
+            "deletions": deletions,
+            "churn": additions + deletions,
+            "authors": authors,
+            "first_changed": min((row[4] for row in rows), default=None),
+            "last_changed": max((row[5] for row in rows), default=None),
+        }
+
+
+def _parse_log_stream(lines: Iterator[str]) -> Iterator[_ParsedCommit]:
+    """Parse `git log --raw --numstat` output produced with _LOG_FORMAT."""
+    current: _ParsedCommit | None = None
+    for raw_line in lines:
+        line = raw_line.rstrip("\n")
+        if line.startswith(_RECORD_SEP):
+            if current is not None:
+                yield current
+            current = _parse_header(line[1:])
+            continue
+        if current is None or not line:
+            continue
+        if line.startswith(":"):
+            # :<mode> <mode> <blob> <blob> <status>\t<path>
+            meta, _, path = line.partition("\t")
+            status = meta.split()[-1][:1] if meta.split() else "M"
+            if path:
+                current.change_types[path] = status
+            continue
+        parts = line.split("\t", 2)
+        if len(parts) == 3:
+            additions = int(parts[0]) if parts[0].isdigit() else 0
+            deletions = int(parts[1]) if parts[1].isdigit() else 0
+            current.numstat[parts[2]] = (additions, deletions)
+            current.change_types.setdefault(parts[2], "M")
+    if current is not None:
+        yield current
+
+
+def _parse_header(header: str) -> _ParsedCommit | None:
+    fields = header.split(_FIELD_SEP, 6)
+    if len(fields) < 7:
+        return None
+    sha, author, email, author_time, commit_time, author_date, subject = fields
+    return _ParsedCommit(
+        sha=sha,
+        author=author,
+        email=email,
+        author_time=int(author_time or 0),
+        commit_time=int(commit_time or 0),
+        author_date=author_date,
+        subject=subject,
+        change_types={},
+        numstat={},
+    )
+
+
+def open_commit_index(path: Path, db_path: Path | None = None) -> CommitIndex | None:
+    """Open and refresh the commit index for the repository containing path."""
+    git_root = find_git_root(path)
+    if git_root is None:
+        return None
+    index = CommitIndex(git_root, db_path)
+    try:
+        index.update()
+    except Exception:
+        index.close()
+        raise
+    return index
@@ -17,7 +17,6 @@ EXTENDS: BaseAnalyzer for common analyzer infrastructure
 - Uses shared timing, logging, and error handling patterns
 """
 
-import json
 import re
 import sys
 from collections import defaultdict
@@ -30,6 +29,7 @@ from typing import Any
 # Import base analyzer (package root must be on PYTHONPATH)
 from core.base.analyzer_base import AnalyzerConfig, BaseAnalyzer
 from core.base.analyzer_registry import register_analyzer
+from core.config.pattern_packs import compiled_regex, load_config_json
 
 _ERROR_PATTERN_DIR = (
     Path(__file__).resolve().parents[2] / "config" / "patterns" / "error"
@@ -66,7 +66,7 @@ def _load_error_pattern_bundle() -> tuple[
 def _load_config_json(path: Path, description: str) -> dict[str, Any]:
     """Load JSON config file with error handling."""
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return load_config_json(path)
     except FileNotFoundError as exc:  # pragma: no cover - configuration must exist
         raise ErrorPatternConfigError(f"{description} not found: {path}") from exc
 
@@ -199,7 +199,7 @@ def _validate_language_pattern_entry(extension: str, spec: Any) -> None:
 def _load_error_type_map() -> tuple[dict[str, Any], list[str]]:
     """Load mapping of runtime error types to relevant pattern names."""
     try:
-        raw_data = json.loads(_ERROR_TYPE_MAP_PATH.read_text(encoding="utf-8"))
+        raw_data = load_config_json(_ERROR_TYPE_MAP_PATH)
     except FileNotFoundError as exc:  # pragma: no cover - configuration must exist
         raise ErrorPatternConfigError(
             f"Error type mapping config not found: {_ERROR_TYPE_MAP_PATH}"
@@ -253,6 +253,8 @@ class ErrorScanContext:
     file_path: str
     relevant_patterns: list[str]
     error_context: dict[str, Any]
+    # Global line of content's first line minus one (non-zero when chunked)
+    line_offset: int = 0
     content_lower: str = field(init=False)
 
     def __post_init__(self) -> None:
@@ -263,6 +265,9 @@ class ErrorScanContext:
 class ErrorPatternAnalyzer(BaseAnalyzer):
     """Analyze code for known error patterns and failure modes to assist with root cause analysis."""
 
+    supports_chunked_scan = True
+    result_cacheable = True
+
     def __init__(self, config: AnalyzerConfig | None = None, error_info: str = ""):
         # Store error information for targeted analysis
         self.error_info = error_info
@@ -346,6 +351,9 @@ class ErrorPatternAnalyzer(BaseAnalyzer):
         self.error_type_map = error_type_map
         self.default_error_patterns = default_patterns
 
+    def cache_signature(self) -> dict[str, Any]:
+        return {"error_info": self.error_info}
+
     def get_analyzer_metadata(self) -> dict[str, Any]:
         """Return metadata about this analyzer."""
         return {
@@ -421,37 +429,29 @@ class ErrorPatternAnalyzer(BaseAnalyzer):
 
         all_findings = []
 
-        try:
-            with open(file_path, encoding="utf-8", errors="ignore") as f:
-                content = f.read()
-                lines = content.split("\n")
-
-            # Get patterns relevant to this error type
-            relevant_patterns = self.get_patterns_for_error_type(
-                error_context.get("error_type", "unknown")
-            )
-
-            # Check only relevant error patterns
-            targeted_context = ErrorScanContext(
-                content=content,
-                lines=lines,
-                file_path=str(file_path),
-                relevant_patterns=relevant_patterns,
-                error_context=error_context,
-            )
-            findings = self._check_targeted_error_patterns(targeted_context)
-            all_findings.extend(findings)
+        # Get patterns relevant to this error type
+        relevant_patterns = self.get_patterns_for_error_type(
+            error_context.get("error_type", "unknown")
+        )
 
-            # Check for error keywords around the error line if known
-            if error_context.get("line"):
-                findings = self._check_error_keywords_targeted(
-                    lines, str(file_path), error_context["line"]
+        try:
+            if self.uses_chunked_scan(file_path):
+                all_findings = self.scan_in_windows(
+                    file_path,
+                    lambda window: self._scan_content(
+                        window.text,
+                        str(file_path),
+                        relevant_patterns,
+                        error_context,
+                        window.line_offset,
+                    ),
                 )
-                all_findings.extend(findings)
             else:
-                # Check all error keywords if no specific line
-                findings = self._check_error_keywords(lines, str(file_path))
-                all_findings.extend(findings)
+                with open(file_path, encoding="utf-8", errors="ignore") as f:
+                    content = f.read()
+                all_findings = self._scan_content(
+                    content, str(file_path), relevant_patterns, error_context
+                )
 
         except Exception as e:
             all_findings.append(
@@ -473,6 +473,38 @@ class ErrorPatternAnalyzer(BaseAnalyzer):
 
         return all_findings
 
+    def _scan_content(
+        self,
+        content: str,
+        file_path: str,
+        relevant_patterns: list[str],
+        error_context: dict[str, Any],
+        line_offset: int = 0,
+    ) -> list[dict[str, Any]]:
+        """Run the targeted checks on content; line numbers are content-relative."""
+        lines = content.split("\n")
+        targeted_context = ErrorScanContext(
+            content=content,
+            lines=lines,
+            file_path=file_path,
+            relevant_patterns=relevant_patterns,
+            error_context=error_context,
+            line_offset=line_offset,
+        )
+        findings = self._check_targeted_error_patterns(targeted_context)
+
+        # Check for error keywords around the error line if known
+        if error_context.get("line"):
+            findings.extend(
+                self._check_error_keywords_targeted(
+                    lines, file_path, error_context["line"] - line_offset
+                )
+            )
+        else:
+            # Check all error keywords if no specific line
+            findings.extend(self._check_error_keywords(lines, file_path))
+        return findings
+
     def _check_targeted_error_patterns(
         self, scan: ErrorScanContext
     ) -> list[dict[str, Any]]:
@@ -484,13 +516,15 @@ class ErrorPatternAnalyzer(BaseAnalyzer):
                 continue
 
             pattern_info = self.error_patterns[pattern_name]
+            if not self.severity_enabled(pattern_info["severity"]):
+                continue
 
             for regex_pattern in pattern_info["patterns"]:
                 try:
                     matches = list(
-                        re.finditer(
-                            regex_pattern, scan.content, re.MULTILINE | re.IGNORECASE
-                        )
+                        compiled_regex(
+                            regex_pattern, re.MULTILINE | re.IGNORECASE
+                        ).finditer(scan.content)
                     )
 
                     for match in matches:
@@ -504,7 +538,9 @@ class ErrorPatternAnalyzer(BaseAnalyzer):
                         # If we have a specific error line, prioritize findings near it
                         proximity_weight = "medium"
                         if scan.error_context.get("line"):
-                            distance = abs(line_num - scan.error_context["line"])
+                            distance = abs(
+                                line_num + scan.line_offset - scan.error_context["line"]
+                            )
                             if distance <= 3:
                                 proximity_weight = "high"
                             elif distance <= 10:
@@ -545,6 +581,8 @@ class ErrorPatternAnalyzer(BaseAnalyzer):
     ) -> list[dict[str, Any]]:
         """Check for error keywords near the specific error line."""
         findings = []
+        if not self.severity_enabled("medium"):
+            return findings
 
         # Check lines around the error (±5 lines)
         start_line = max(1, error_line - 5)
@@ -615,8 +653,12 @@ class ErrorPatternAnalyzer(BaseAnalyzer):
         findings = []
 
         for pattern_name, pattern_info in self.error_patterns.items():
+            if not self.severity_enabled(pattern_info["severity"]):
+                continue
             for pattern in pattern_info["patterns"]:
-                matches = re.finditer(pattern, content, re.IGNORECASE | re.MULTILINE)
+                matches = compiled_regex(
+                    pattern, re.IGNORECASE | re.MULTILINE
+                ).finditer(content)
 
                 for match in matches:
                     line_num = content[: match.start()].count("\n") + 1
@@ -653,11 +695,12 @@ class ErrorPatternAnalyzer(BaseAnalyzer):
         findings = []
 
         file_ext = Path(file_path).suffix.lower()
-        if file_ext in self.language_patterns:
-            lang_config = self.language_patterns[file_ext]
-
+        lang_config = self.language_patterns.get(file_ext)
+        if lang_config and self.severity_enabled(lang_config["severity"]):
             for pattern in lang_config["patterns"]:
-                matches = re.finditer(pattern, content, re.IGNORECASE | re.MULTILINE)
+                matches = compiled_regex(
+                    pattern, re.IGNORECASE | re.MULTILINE
+                ).finditer(content)
 
                 for match in matches:
                     line_num = content[: match.start()].count("\n") + 1
@@ -692,6 +735,8 @@ class ErrorPatternAnalyzer(BaseAnalyzer):
     ) -> list[dict[str, Any]]:
         """Check for error-related keywords in comments."""
         findings = []
+        if not self.severity_enabled("low"):
+            return findings
         comment_patterns = [
             r"#.*",  # Python, shell comments
             r"//.*",  # C++, Java, JavaScript comments
@@ -763,8 +808,9 @@ class ErrorPatternAnalyzer(BaseAnalyzer):
             ],
             ".js": [
                 (
-                    lambda text: "==" in text
-                    and ("null" in text or "undefined" in text),
+                    lambda text: (
+                        "==" in text and ("null" in text or "undefined" in text)
+                    ),
                     "Use strict equality (===) instead of loose equality (==)",
                 ),
                 (
@@ -10,6 +10,8 @@ APPROACH:
 - File change frequency analysis to identify hotspots
 - Commit timing pattern analysis (weekend/late night commits indicating emergencies)
 - Authentication, database, API, and critical file change detection
+- History queries served from a persistent, incremental commit index (commit_index.py)
+- Range-restricted, concurrent and cached blame via BlameService (blame_service.py)
 
 EXTENDS: BaseAnalyzer for common analyzer infrastructure
 - Inherits file scanning, CLI, configuration, and result formatting
@@ -21,11 +23,18 @@ import re
 import subprocess
 import sys
 from collections import defaultdict
+from collections.abc import Iterable
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
 # Import base analyzer (package root must be on PYTHONPATH)
+from analyzers.root_cause.blame_service import (
+    BlameService,
+    LineRange,
+    ranges_around,
+)
+from analyzers.root_cause.commit_index import CommitIndex
 from core.base.analyzer_base import AnalyzerConfig, BaseAnalyzer
 from core.base.analyzer_registry import register_analyzer
 
@@ -34,12 +43,16 @@ from core.base.analyzer_registry import register_analyzer
 class RecentChangesAnalyzer(BaseAnalyzer):
     """Analyze recent code changes using git history to identify potential root causes."""
 
+    # Git history is repository-wide
+    shardable = False
+
     def __init__(
         self,
         config: AnalyzerConfig | None = None,
         days_back: int = 30,
         max_commits: int = 100,
         error_info: str = "",
+        use_commit_index: bool = True,
     ):
         # Create recent changes specific configuration
         # Git analysis doesn't use file extensions - we analyze repos directly
@@ -65,6 +78,11 @@ class RecentChangesAnalyzer(BaseAnalyzer):
         self.days_back = days_back
         self.max_commits = max_commits
 
+        # Persistent commit index (one per git root, opened lazily)
+        self.use_commit_index = use_commit_index
+        self._commit_indexes: dict[Path, CommitIndex | None] = {}
+        self._blame_services: dict[Path, BlameService] = {}
+
         # Initialize change pattern definitions
         self._init_change_patterns()
 
@@ -240,18 +258,24 @@ class RecentChangesAnalyzer(BaseAnalyzer):
                 finding = self._create_risky_commit_finding(risk_commit)
                 all_findings.append(finding)
 
-            # Analyze timing patterns
-            timing_issues = self.analyze_commit_timing_patterns(commits)
-            for timing_issue in timing_issues:
-                finding = self._create_timing_issue_finding(timing_issue)
-                all_findings.append(finding)
-
-            # Analyze changed files and hotspots
-            changed_files = self.get_changed_files(git_root)
-            hotspots = self.analyze_file_change_frequency(changed_files)
-            for hotspot in hotspots:
-                finding = self._create_hotspot_finding(hotspot)
-                all_findings.append(finding)
+            # Blame just the lines around the reported error location
+            all_findings.extend(self._blame_error_location(git_root, error_context))
+
+            # Timing issues and hotspots are at most high severity; with a
+            # critical threshold pushed down, skip them and the git log walk
+            if self.severity_enabled("high"):
+                # Analyze timing patterns
+                timing_issues = self.analyze_commit_timing_patterns(commits)
+                for timing_issue in timing_issues:
+                    finding = self._create_timing_issue_finding(timing_issue)
+                    all_findings.append(finding)
+
+                # Analyze changed files and hotspots
+                changed_files = self.get_changed_files(git_root)
+                hotspots = self.analyze_file_change_frequency(changed_files)
+                for hotspot in hotspots:
+                    finding = self._create_hotspot_finding(hotspot)
+                    all_findings.append(finding)
 
         except Exception as e:
             all_findings.append(
@@ -285,7 +309,9 @@ class RecentChangesAnalyzer(BaseAnalyzer):
 
         try:
             # Analyze the git repository directly
-            all_findings = self.analyze_target(analyze_path)
+            all_findings = self.filter_findings_by_severity(
+                self.analyze_target(analyze_path)
+            )
 
             # Convert findings to Finding objects
             self._add_findings_to_result(result, all_findings)
@@ -342,6 +368,35 @@ class RecentChangesAnalyzer(BaseAnalyzer):
             },
         }
 
+    def _blame_error_location(
+        self, git_root: Path, error_context: dict[str, Any]
+    ) -> list[dict[str, Any]]:
+        """Flag recent edits to the lines around the error's file:line."""
+        file_path, line = error_context.get("file"), error_context.get("line")
+        if not file_path or not line or not self.severity_enabled("medium"):
+            return []
+        blamed = self.get_blame_info_for_locations({file_path: [line]}, git_root)
+        recent = blamed.get(file_path, {}).get("recent_changes", [])
+        if not recent:
+            return []
+        commits = sorted({change["commit"] for change in recent})
+        return [
+            {
+                "title": "Recently Changed Error Location",
+                "description": f"{len(recent)} line(s) around {file_path}:{line} changed in the last {self.days_back} days ({len(commits)} commit(s))",
+                "severity": "medium",
+                "file_path": file_path,
+                "line_number": line,
+                "recommendation": "Review the commits that last touched the failing lines first",
+                "metadata": {
+                    "commits": commits,
+                    "authors": sorted({c.get("author", "") for c in recent} - {""}),
+                    "changed_lines": [change["line_number"] for change in recent],
+                    "confidence": "high",
+                },
+            }
+        ]
+
     def _create_timing_issue_finding(
         self, timing_issue: dict[str, Any]
     ) -> dict[str, Any]:
@@ -431,6 +486,33 @@ class RecentChangesAnalyzer(BaseAnalyzer):
             concern, "Review commit timing context for emergency fix patterns"
         )
 
+    def _since_datetime(self) -> datetime:
+        """Return the start of the analysis window (midnight, matching git --since)."""
+        since = datetime.now() - timedelta(days=self.days_back)
+        return since.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    def get_commit_index(self, repo_path: Path) -> CommitIndex | None:
+        """Return a refreshed commit index for repo_path, or None to fall back to git log."""
+        if not self.use_commit_index:
+            return None
+        key = repo_path.resolve()
+        if key not in self._commit_indexes:
+            index: CommitIndex | None = None
+            try:
+                index = CommitIndex(key)
+                new_commits = index.update()
+                self.log_operation(
+                    "commit_index_updated",
+                    {"repo": str(key), "new_commits": new_commits},
+                )
+            except Exception as exc:
+                self.logger.warning(f"Commit index unavailable for {key}: {exc}")
+                if index is not None:
+                    index.close()
+                index = None
+            self._commit_indexes[key] = index
+        return self._commit_indexes[key]
+
     def run_git_command(
         self, command: list[str], cwd: Path | None = None
     ) -> str | None:
@@ -451,6 +533,12 @@ class RecentChangesAnalyzer(BaseAnalyzer):
 
     def get_recent_commits(self, repo_path: Path) -> list[dict[str, Any]]:
         """Get recent commits with details and file changes."""
+        index = self.get_commit_index(repo_path)
+        if index is not None:
+            return index.recent_commits(
+                since=self._since_datetime(), limit=self.max_commits
+            )
+
         since_date = (datetime.now() - timedelta(days=self.days_back)).strftime(
             "%Y-%m-%d"
         )
@@ -502,51 +590,79 @@ class RecentChangesAnalyzer(BaseAnalyzer):
 
         return commits
 
-    def get_file_blame_info(self, file_path: Path, repo_path: Path) -> dict[str, Any]:
-        """Get git blame information for a file."""
-        relative_path = file_path.relative_to(repo_path)
+    def get_blame_service(self, repo_path: Path) -> BlameService:
+        """Return the (cached) blame service for a repository root."""
+        key = repo_path.resolve()
+        if key not in self._blame_services:
+            self._blame_services[key] = BlameService(key)
+        return self._blame_services[key]
 
-        command = ["git", "blame", "--line-porcelain", str(relative_path)]
-        output = self.run_git_command(command, repo_path)
-
-        if not output:
+    def get_file_blame_info(
+        self,
+        file_path: Path,
+        repo_path: Path,
+        line_ranges: list[LineRange] | None = None,
+    ) -> dict[str, Any]:
+        """Get git blame information for a file, optionally limited to line ranges."""
+        blamed = self.get_blame_service(repo_path).blame(file_path, line_ranges)
+        if blamed is None:
             return {}
+        return self._summarize_blame(blamed.iter_lines(), line_ranges)
 
+    def get_blame_info_for_locations(
+        self,
+        locations: dict[str, list[int]],
+        repo_path: Path,
+        context_lines: int = 3,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Blame only the lines referenced by findings, across files concurrently.
+
+        Args:
+            locations: Mapping of file path to referenced line numbers
+            repo_path: Git repository root
+            context_lines: Lines of surrounding context to include per reference
+
+        Returns
+        -------
+            Mapping of file path to blame summary (see get_file_blame_info)
+        """
+        requests = {
+            path: ranges_around(lines, context_lines)
+            for path, lines in locations.items()
+            if lines
+        }
+        results = self.get_blame_service(repo_path).blame_many(requests)
+        return {
+            path: self._summarize_blame(blamed.iter_lines(), requests[path])
+            for path, blamed in results.items()
+        }
+
+    def _summarize_blame(
+        self,
+        blamed_lines: Iterable[dict[str, Any]],
+        line_ranges: list[LineRange] | None,
+    ) -> dict[str, Any]:
+        """Build the recent_changes/authors/commit_dates summary for blamed lines."""
         blame_info = {
             "recent_changes": [],
             "authors": defaultdict(int),
             "commit_dates": [],
         }
+        window_start = datetime.now() - timedelta(days=self.days_back)
 
-        current_commit = {}
-        line_number = 0
-
-        for line in output.split("\n"):
-            if line.startswith("\t"):
-                # This is the actual code line
-                line_number += 1
-                if current_commit:
-                    current_commit["line_number"] = line_number
-                    current_commit["code"] = line[1:]  # Remove tab
-
-                    # Check if this is a recent change
-                    if "author-time" in current_commit:
-                        commit_date = datetime.fromtimestamp(
-                            int(current_commit["author-time"])
-                        )
-                        if commit_date > datetime.now() - timedelta(
-                            days=self.days_back
-                        ):
-                            blame_info["recent_changes"].append(current_commit.copy())
-                        blame_info["commit_dates"].append(commit_date)
-
-                    if "author" in current_commit:
-                        blame_info["authors"][current_commit["author"]] += 1
-
-                current_commit = {}
-            elif " " in line:
-                key, value = line.split(" ", 1)
-                current_commit[key] = value
+        for line in blamed_lines:
+            if line_ranges is not None and not any(
+                start <= line["line_number"] <= end for start, end in line_ranges
+            ):
+                continue
+            if "author-time" in line:
+                commit_date = datetime.fromtimestamp(int(line["author-time"]))
+                if commit_date > window_start:
+                    blame_info["recent_changes"].append(line)
+                blame_info["commit_dates"].append(commit_date)
+            if "author" in line:
+                blame_info["authors"][line["author"]] += 1
 
         return blame_info
 
@@ -612,6 +728,10 @@ class RecentChangesAnalyzer(BaseAnalyzer):
 
     def get_changed_files(self, repo_path: Path) -> list[dict[str, Any]]:
         """Get files changed in recent commits."""
+        index = self.get_commit_index(repo_path)
+        if index is not None:
+            return index.changed_files(since=self._since_datetime())
+
         since_date = (datetime.now() - timedelta(days=self.days_back)).strftime(
             "%Y-%m-%d"
         )
@@ -769,10 +889,25 @@ class RecentChangesAnalyzer(BaseAnalyzer):
 
         return error_context
 
+    def _indexed_commits_for_file(
+        self, index: CommitIndex, target_file: str
+    ) -> list[dict[str, Any]]:
+        """Serve the per-file commit history from the commit index."""
+        commits = index.recent_commits(
+            since=self._since_datetime(), limit=self.max_commits, path=target_file
+        )
+        for commit in commits:
+            commit["target_file"] = target_file
+        return commits
+
     def get_recent_commits_for_file(
         self, git_root: Path, target_file: str
     ) -> list[dict[str, Any]]:
         """Get recent commits that modified a specific file."""
+        index = self.get_commit_index(git_root)
+        if index is not None:
+            return self._indexed_commits_for_file(index, target_file)
+
         try:
             # Git command to get commits for specific file
             result = self.run_git_command(
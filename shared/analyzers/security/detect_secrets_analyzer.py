@@ -23,7 +23,6 @@ REPLACES: detect_secrets.py with bespoke regex patterns
 """
 
 import json
-import shutil
 import subprocess
 import sys
 from functools import lru_cache
@@ -33,6 +32,8 @@ from typing import Any
 # Import base analyzer (package root must be on PYTHONPATH)
 from core.base.analyzer_base import AnalyzerConfig, BaseAnalyzer
 from core.base.analyzer_registry import register_analyzer
+from core.config.pattern_packs import load_config_json
+from core.utils.tool_probe import probe_tool
 from core.utils.tooling import auto_install_python_package
 
 _DETECT_SECRETS_CONFIG_PATH = (
@@ -59,9 +60,7 @@ class DetectSecretsToolNotAvailable(RuntimeError):
 def _load_detect_secrets_config() -> dict[str, Any]:
     """Load and validate detect-secrets configuration from JSON."""
     try:
-        config_data = json.loads(
-            _DETECT_SECRETS_CONFIG_PATH.read_text(encoding="utf-8")
-        )
+        config_data = load_config_json(_DETECT_SECRETS_CONFIG_PATH)
     except FileNotFoundError as exc:  # pragma: no cover - configuration must exist
         raise DetectSecretsConfigError(
             f"Detect-secrets config not found: {_DETECT_SECRETS_CONFIG_PATH}"
@@ -133,30 +132,19 @@ class DetectSecretsAnalyzer(BaseAnalyzer):
 
     def _check_detect_secrets_availability(self):
         """Ensure detect-secrets CLI is available."""
-        if not shutil.which("detect-secrets"):
-            auto_install_python_package(
-                "detect-secrets", "AAW_AUTO_INSTALL_DETECT_SECRETS"
-            )
-        try:
-            result = subprocess.run(
-                ["detect-secrets", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-        except (subprocess.TimeoutExpired, FileNotFoundError) as exc:
-            raise DetectSecretsToolNotAvailable(
-                "detect-secrets CLI is required but could not be executed."
-            ) from exc
+        probe = probe_tool("detect-secrets")
+        if not probe.available and auto_install_python_package(
+            "detect-secrets", "AAW_AUTO_INSTALL_DETECT_SECRETS"
+        ):
+            probe = probe_tool("detect-secrets", refresh=True)
 
-        if result.returncode != 0:
+        if not probe.available:
             raise DetectSecretsToolNotAvailable(
-                f"detect-secrets returned non-zero exit code: {result.returncode}"
+                "detect-secrets CLI is required but could not be executed."
             )
 
-        version = result.stdout.strip()
-        if version:
-            print(f"Found detect-secrets {version}", file=sys.stderr)
+        if probe.version and not probe.cached:
+            print(f"Found detect-secrets {probe.version}", file=sys.stderr)
 
     def _run_detect_secrets_scan(self, target_path: str) -> list[dict[str, Any]]:
         """Run detect-secrets scan on target path."""
@@ -172,7 +160,7 @@ class DetectSecretsAnalyzer(BaseAnalyzer):
                 target_path,
             ]
 
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+            result = self.run_tool(cmd, timeout=120)
 
             if result.stdout:
                 secrets_output = json.loads(result.stdout)
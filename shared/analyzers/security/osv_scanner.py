@@ -22,6 +22,10 @@ from core.base.analyzer_registry import register_analyzer
 class OsvScannerAnalyzer(BaseAnalyzer):
     """Analyze dependencies for known vulnerabilities using osv-scanner."""
 
+    # Lockfiles describe the whole project
+    shardable = False
+    expensive = True
+
     def __init__(self, config: AnalyzerConfig | None = None):
         security_cfg = config or AnalyzerConfig()
         super().__init__("security", security_cfg)
@@ -59,12 +63,7 @@ class OsvScannerAnalyzer(BaseAnalyzer):
 
         try:
             timeout = self.config.timeout_seconds or 600
-            completed = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-            )
+            completed = self.run_tool(cmd, timeout=timeout)
         except subprocess.TimeoutExpired as exc:
             result.set_error(f"osv-scanner timed out: {exc}")
             return self.complete_analysis(result)
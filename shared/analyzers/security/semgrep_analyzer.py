@@ -25,7 +25,6 @@ REPLACES: Multiple bespoke analyzers with regex patterns
 import json
 import os
 import re
-import shutil
 import subprocess
 import sys
 from pathlib import Path
@@ -34,6 +33,7 @@ from typing import Any
 # Import base analyzer (package root must be on PYTHONPATH)
 from core.base.analyzer_base import AnalyzerConfig, BaseAnalyzer
 from core.base.analyzer_registry import register_analyzer
+from core.utils.tool_probe import probe_tool
 from core.utils.tooling import auto_install_python_package
 
 
@@ -41,6 +41,10 @@ from core.utils.tooling import auto_install_python_package
 class SemgrepAnalyzer(BaseAnalyzer):
     """Semantic security analysis using Semgrep instead of regex patterns."""
 
+    # Semgrep discovers files in the whole directory itself
+    shardable = False
+    expensive = True
+
     def __init__(self, config: AnalyzerConfig | None = None):
         # Create security-specific configuration
         security_config = config or AnalyzerConfig(
@@ -155,58 +159,39 @@ class SemgrepAnalyzer(BaseAnalyzer):
         )
 
     def _check_semgrep_availability(self):
-        """Check if Semgrep is available."""
-        if not shutil.which("semgrep"):
-            auto_install_python_package("semgrep", "AAW_AUTO_INSTALL_SEMGREP")
-        try:
-            result = subprocess.run(
-                ["semgrep", "--version"], capture_output=True, text=True, timeout=10
-            )
-            if result.returncode != 0:
-                print(
-                    "WARNING: Semgrep is required for semantic security analysis but not found.",
-                    file=sys.stderr,
-                )
-                print("Install with: pip install semgrep", file=sys.stderr)
-
-                # In testing environments, this should fail hard
-                if self._is_testing_environment():
-                    print(
-                        "ERROR: In testing environment - all tools must be available",
-                        file=sys.stderr,
-                    )
-                    sys.exit(1)
-                else:
-                    # In production, warn but continue with degraded functionality
-                    print(
-                        "Continuing with degraded security analysis capabilities",
-                        file=sys.stderr,
-                    )
-                    self.semgrep_available = False
-                    return
-
-            version = result.stdout.strip()
-            print(f"Found Semgrep {version}", file=sys.stderr)
+        """Check if Semgrep is available (cached probe)."""
+        probe = probe_tool("semgrep")
+        if not probe.available and auto_install_python_package(
+            "semgrep", "AAW_AUTO_INSTALL_SEMGREP"
+        ):
+            probe = probe_tool("semgrep", refresh=True)
+
+        if probe.available:
+            if not probe.cached:
+                print(f"Found Semgrep {probe.version or ''}".rstrip(), file=sys.stderr)
             self.semgrep_available = True
+            return
 
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            print("WARNING: Semgrep is required but not available.", file=sys.stderr)
-            print("Install with: pip install semgrep", file=sys.stderr)
+        print(
+            "WARNING: Semgrep is required for semantic security analysis but not found.",
+            file=sys.stderr,
+        )
+        print("Install with: pip install semgrep", file=sys.stderr)
 
-            # In testing environments, this should fail hard
-            if self._is_testing_environment():
-                print(
-                    "ERROR: In testing environment - all tools must be available",
-                    file=sys.stderr,
-                )
-                sys.exit(1)
-            else:
-                # In production, warn but continue with degraded functionality
-                print(
-                    "Continuing with degraded security analysis capabilities",
-                    file=sys.stderr,
-                )
-                self.semgrep_available = False
+        # In testing environments, this should fail hard
+        if self._is_testing_environment():
+            print(
+                "ERROR: In testing environment - all tools must be available",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+
+        # In production, warn but continue with degraded functionality
+        print(
+            "Continuing with degraded security analysis capabilities",
+            file=sys.stderr,
+        )
+        self.semgrep_available = False
 
     def _run_semgrep_batch_analysis(
         self, file_paths: list[str]
@@ -216,7 +201,7 @@ class SemgrepAnalyzer(BaseAnalyzer):
         try:
             cmd = self._build_semgrep_batch_command(file_paths)
             self.logger.info(f"Running semgrep on {len(file_paths)} files in batch")
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            result = self.run_tool(cmd, timeout=60)
             if result.stdout:
                 findings = self._parse_semgrep_results(result.stdout)
         except (
@@ -247,6 +232,7 @@ class SemgrepAnalyzer(BaseAnalyzer):
         ]
         self._add_semgrep_configs(cmd)
         self._add_semgrep_oss_flag(cmd)
+        self._add_severity_filter(cmd)
         self._add_rust_rules_if_needed(cmd, file_paths)
         cmd.extend(file_paths)
         return cmd
@@ -271,6 +257,22 @@ class SemgrepAnalyzer(BaseAnalyzer):
         if oss_only:
             cmd.append("--oss-only")
 
+    def _add_severity_filter(self, cmd: list[str]) -> None:
+        """Let Semgrep skip rules whose severity is below a pushed-down threshold."""
+        if not self.config.severity_pushdown:
+            return
+        enabled = [
+            semgrep_severity
+            for semgrep_severity, ours in self.severity_mapping.items()
+            if self.severity_enabled(ours)
+        ]
+        # Filtering by name would also drop rules using other severity names
+        # (e.g. LOW/HIGH), which map to "medium"; only filter when it prunes
+        if len(enabled) == len(self.severity_mapping):
+            return
+        for semgrep_severity in enabled:
+            cmd.extend(["--severity", semgrep_severity])
+
     def _add_rust_rules_if_needed(self, cmd: list[str], file_paths: list[str]) -> None:
         """Add custom Rust rules if analyzing Rust files."""
         rust_files = [fp for fp in file_paths if fp.endswith(".rs")]
@@ -331,12 +333,7 @@ class SemgrepAnalyzer(BaseAnalyzer):
                     target_path,
                 ]
 
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=30,  # Reduced timeout
-                )
+                result = self.run_tool(cmd, timeout=30)  # Reduced timeout
 
                 if result.stdout:
                     semgrep_output = json.loads(result.stdout)
@@ -432,7 +429,7 @@ class SemgrepAnalyzer(BaseAnalyzer):
         try:
             cmd = self._build_semgrep_directory_command(directory_path)
             self.logger.info(f"Running Semgrep on directory: {directory_path}")
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+            result = self.run_tool(cmd, timeout=300)
             findings = self._process_directory_results(result)
             if result.stderr:
                 self.logger.warning(f"Semgrep warnings: {result.stderr[:500]}")
@@ -464,6 +461,7 @@ class SemgrepAnalyzer(BaseAnalyzer):
         ]
         self._add_semgrep_configs(cmd)
         self._add_semgrep_oss_flag(cmd)
+        self._add_severity_filter(cmd)
         self._add_exclusion_patterns(cmd)
         cmd.append(directory_path)
         return cmd
@@ -573,6 +571,10 @@ class SemgrepAnalyzer(BaseAnalyzer):
                 }
                 standardized_findings.append(standardized)
 
+            standardized_findings = self.filter_findings_by_severity(
+                standardized_findings
+            )
+
             # Convert findings to Finding objects
             self._add_findings_to_result(result, standardized_findings)
 
@@ -630,6 +632,7 @@ class SemgrepAnalyzer(BaseAnalyzer):
 
         # Update file processing counts
         self.files_processed += len(batch)
+        self._record_bytes(*batch)
 
         # Convert to standardized format for BaseAnalyzer
         standardized_findings = []
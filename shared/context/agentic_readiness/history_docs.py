@@ -5,9 +5,10 @@ import argparse
 import json
 import subprocess
 from collections import Counter
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
+from shared.analyzers.root_cause.commit_index import CommitIndex, find_git_root
 from shared.context.agentic_readiness.timing import log_phase
 
 
@@ -19,7 +20,36 @@ def run_git_command(args: list[str]) -> list[str]:
     return output.splitlines()
 
 
+def _indexed_file_touches(root: Path, days: int) -> Counter | None:
+    """Return per-file touch counts from the persistent commit index, if usable."""
+    git_root = find_git_root(root)
+    if git_root is None:
+        return None
+    try:
+        with CommitIndex(git_root) as index:
+            index.update()
+            since = datetime.now() - timedelta(days=days)
+            return Counter(index.file_touch_counts(since=since))
+    except Exception:
+        return None
+
+
 def history_concentration(root: Path, days: int) -> dict:
+    counts = _indexed_file_touches(root, days)
+    if counts is None:
+        counts = _git_log_file_touches(root, days)
+    total = sum(counts.values())
+    top10 = sum(c for _, c in counts.most_common(10))
+    concentration = round(top10 / total, 4) if total else 0.0
+    return {
+        "window_days": days,
+        "total_file_touches": total,
+        "top10_file_touches": top10,
+        "concentration_ratio": concentration,
+    }
+
+
+def _git_log_file_touches(root: Path, days: int) -> Counter:
     log_cmd = [
         "git",
         "-C",
@@ -30,16 +60,7 @@ def history_concentration(root: Path, days: int) -> dict:
         "--pretty=format:",
     ]
     files = [line for line in run_git_command(log_cmd) if line.strip()]
-    counts = Counter(files)
-    total = sum(counts.values())
-    top10 = sum(c for _, c in counts.most_common(10))
-    concentration = round(top10 / total, 4) if total else 0.0
-    return {
-        "window_days": days,
-        "total_file_touches": total,
-        "top10_file_touches": top10,
-        "concentration_ratio": concentration,
-    }
+    return Counter(files)
 
 
 def docs_freshness(root: Path) -> dict:
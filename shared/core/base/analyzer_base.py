@@ -27,13 +27,32 @@ EXTENDS: Similar to BaseProfiler but for general analysis tools
 - Abstract interface for specific analysis implementations
 """
 
+import contextlib
 import fnmatch
+import subprocess
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from core.utils.chunked_scan import FileWindow, scan_file_windows
+
+from .batch_planner import get_throughput_estimate, iter_adaptive_batches
+from .content_cache import (
+    ContentAddressedCache,
+    file_digest,
+    make_key,
+    pattern_pack_digest,
+    resolve_cache_root,
+    source_digest,
+)
+from .discovery import SharedDiscovery
 from .module_base import CIAnalysisModule
+from .resource_usage import ResourceTracker
+from .sharding import ShardSpec, select_shard
+from .top_findings import SEVERITY_ORDER, SUMMARY_TOP_N, TopFindingsCollector
 from .vendor_detector import VendorDetector
 
 
@@ -112,10 +131,32 @@ class AnalyzerConfig:
     # Analysis settings
     max_files: int | None = None
     max_file_size_mb: int = 5
+    # Scan files above max_file_size_mb in memory-mapped windows instead of
+    # skipping them (only analyzers with supports_chunked_scan)
+    chunked_scan: bool = False
+    # Analyze only shard "i/n" of the files (see core.base.sharding)
+    shard: str | None = None
+    shard_strategy: str = "hash"
     batch_size: int = 200
+    # Size batches by predicted cost (batch_size becomes the per-batch cap)
+    adaptive_batching: bool = True
+    target_batch_seconds: float = 5.0
     timeout_seconds: int | None = None
+    # Opt-in resource accounting in result metadata (peak RSS, files/bytes);
+    # memory_profile adds tracemalloc peak and top allocation sites
+    resource_accounting: bool = False
+    memory_profile: bool = False
+    # Reuse per-file findings from the content-addressed cache (only
+    # analyzers with result_cacheable); cache_dir defaults to $CI_CACHE_DIR
+    # or the checkout's .cache/ci-framework
+    result_cache: bool = False
+    cache_dir: str | None = None
+    cache_max_mb: int = 512
 
     # Severity filtering
+    # Apply min_severity during analysis: findings below it are dropped per
+    # file and analyzers may skip rules that cannot reach it
+    severity_pushdown: bool = False
     severity_thresholds: dict[str, float] = field(
         default_factory=lambda: {
             "critical": 0.9,
@@ -137,8 +178,14 @@ class AnalyzerConfig:
             raise ValueError("max_file_size_mb must be positive")
         if self.batch_size <= 0:
             raise ValueError("batch_size must be positive")
+        if self.target_batch_seconds <= 0:
+            raise ValueError("target_batch_seconds must be positive")
         if self.timeout_seconds is not None and self.timeout_seconds <= 0:
             raise ValueError("timeout_seconds must be positive")
+        if self.shard is not None:
+            ShardSpec.parse(self.shard, self.shard_strategy)
+        if self.cache_max_mb <= 0:
+            raise ValueError("cache_max_mb must be positive")
 
         valid_formats = {"json", "console", "summary"}
         if self.output_format not in valid_formats:
@@ -162,6 +209,20 @@ class BaseAnalyzer(CIAnalysisModule, ABC):
     - Error handling
     """
 
+    # Pattern analyzers that can scan oversized files via scan_in_windows
+    supports_chunked_scan = False
+    # False for cross-file analyzers: they see every file on every shard
+    shardable = True
+    # Pure per-file analyzers whose analyze_target findings depend only on
+    # file content, config and cache_signature() can share cached results
+    result_cacheable = False
+    # Slow analyzers (external tools, whole-project passes); priority runs
+    # start them in the background until runtime history says otherwise
+    expensive = False
+    # Project-level analyzers that can refresh their findings from a set of
+    # changed files implement analyze_incremental (watch mode)
+    supports_incremental = False
+
     def __init__(self, analyzer_type: str, config: AnalyzerConfig | None = None):
         super().__init__(f"{analyzer_type}_analyzer")
 
@@ -183,7 +244,31 @@ class BaseAnalyzer(CIAnalysisModule, ABC):
         # Analysis tracking
         self.files_processed = 0
         self.files_skipped = 0
+        self.files_chunked = 0
+        self._shard = (
+            ShardSpec.parse(self.config.shard, self.config.shard_strategy)
+            if self.config.shard
+            else None
+        )
+        self._shard_files: tuple[int, int] | None = None
         self.processing_errors = 0
+        self.tool_invocations: list[dict[str, Any]] = []
+        self.bytes_processed = 0
+        self._resource_tracker: ResourceTracker | None = None
+        # Set while collecting a summary-mode run (see _collect_top_findings)
+        self._finding_collector: TopFindingsCollector | None = None
+        self._file_rank: dict[str, int] = {}
+        self._result_cache = (
+            ContentAddressedCache(
+                resolve_cache_root(self.project_root, self.config.cache_dir),
+                self.config.cache_max_mb << 20,
+            )
+            if self.config.result_cache and self.result_cacheable
+            else None
+        )
+        self._cache_identity: list[Any] | None = None
+        # Set when several analyzers share one walk of the target
+        self._discovery: SharedDiscovery | None = None
 
         self.log_operation(
             "analyzer_initialized",
@@ -273,8 +358,7 @@ class BaseAnalyzer(CIAnalysisModule, ABC):
         for skip_pattern in skip_path_patterns:
             if skip_pattern in path_str or skip_pattern in path_parts:
                 self.log_operation(
-                    "file_skipped_pattern",
-                    {"file": str(file_path), "pattern": skip_pattern},
+                    "file_skipped_pattern", file=file_path, pattern=skip_pattern
                 )
                 return True
         return False
@@ -286,31 +370,67 @@ class BaseAnalyzer(CIAnalysisModule, ABC):
     def _within_size_limit(self, file_path: Path) -> bool:
         """Return True if file size is within configured limits."""
         try:
-            file_size_mb = file_path.stat().st_size / (1024 * 1024)
+            size = (
+                self._discovery.size(file_path)
+                if self._discovery is not None
+                else file_path.stat().st_size
+            )
         except (OSError, FileNotFoundError):
             return False
+        file_size_mb = size / (1024 * 1024)
         if file_size_mb > self.config.max_file_size_mb:
+            if self.config.chunked_scan and self.supports_chunked_scan:
+                self.log_operation(
+                    "file_chunked", file=file_path, size_mb=round(file_size_mb, 2)
+                )
+                return True
             self.log_operation(
-                "file_skipped_size",
-                {"file": str(file_path), "size_mb": round(file_size_mb, 2)},
+                "file_skipped_size", file=file_path, size_mb=round(file_size_mb, 2)
             )
             return False
         return True
 
+    def uses_chunked_scan(self, file_path: Path) -> bool:
+        """Return True if ``file_path`` is over the size cap and must be windowed."""
+        if not (self.config.chunked_scan and self.supports_chunked_scan):
+            return False
+        try:
+            size = file_path.stat().st_size
+        except OSError:
+            return False
+        return size > self.config.max_file_size_mb * 1024 * 1024
+
+    def scan_in_windows(
+        self, file_path: Path, check: Callable[[FileWindow], list[dict[str, Any]]]
+    ) -> list[dict[str, Any]]:
+        """
+        Run a content check over ``file_path`` window by window.
+
+        ``check`` sees one decoded window at a time and reports window-local
+        line numbers; the returned findings carry global line numbers.
+        """
+        self.files_chunked += 1
+        return scan_file_windows(file_path, check)
+
     def _is_vendor_file(self, file_path: Path) -> bool:
         """Return True if vendor detector excludes the file."""
-        if not self.vendor_detector.should_exclude_file(file_path):
-            return False
-        vendor_detection = self.vendor_detector.detect_vendor_code(file_path)
-        self.log_operation(
-            "file_skipped_vendor",
-            {
-                "file": str(file_path),
-                "confidence": vendor_detection.confidence,
-                "reasons": vendor_detection.reasons[:2],
-                "detected_library": vendor_detection.detected_library,
-            },
+        excluded = (
+            self._discovery.is_vendor(file_path, self.vendor_detector)
+            if self._discovery is not None
+            else self.vendor_detector.should_exclude_file(file_path)
         )
+        if not excluded:
+            return False
+        # Full vendor detection only feeds the log event; skip it when unlogged
+        if self.log_enabled("file_skipped_vendor"):
+            vendor_detection = self.vendor_detector.detect_vendor_code(file_path)
+            self.log_operation(
+                "file_skipped_vendor",
+                file=file_path,
+                confidence=vendor_detection.confidence,
+                reasons=vendor_detection.reasons[:2],
+                detected_library=vendor_detection.detected_library,
+            )
         return True
 
     def _matches_exclude_globs(self, file_path: Path) -> bool:
@@ -324,8 +444,7 @@ class BaseAnalyzer(CIAnalysisModule, ABC):
                 file_path.name, pattern
             ):
                 self.log_operation(
-                    "file_skipped_pattern",
-                    {"file": str(file_path), "pattern": pattern},
+                    "file_skipped_pattern", file=file_path, pattern=pattern
                 )
                 return True
         return False
@@ -338,8 +457,7 @@ class BaseAnalyzer(CIAnalysisModule, ABC):
         relative_path = self._relative_path_str(file_path)
         if self._gitignore_spec.match_file(relative_path):
             self.log_operation(
-                "file_skipped_gitignore",
-                {"file": str(file_path), "relative_path": relative_path},
+                "file_skipped_gitignore", file=file_path, relative_path=relative_path
             )
             return True
         return False
@@ -403,14 +521,23 @@ class BaseAnalyzer(CIAnalysisModule, ABC):
         """
         target = Path(target_path)
         files_to_scan = []
+        # Every shard must see the full list before taking its share
+        shard = self._shard if self.shardable else None
+        sharded = shard is not None
 
         if target.is_file():
             if self.should_scan_file(target):
                 files_to_scan.append(target)
         elif target.is_dir():
-            for file_path in target.rglob("*"):
+            discovery = self._discovery
+            if discovery is not None and not discovery.covers(target):
+                discovery = None
+            shared = discovery is not None
+            candidates = discovery.files if discovery is not None else target.rglob("*")
+            for file_path in candidates:
                 if (
-                    self.config.max_files is not None
+                    not sharded
+                    and self.config.max_files is not None
                     and len(files_to_scan) >= self.config.max_files
                 ):
                     self.log_operation(
@@ -418,9 +545,16 @@ class BaseAnalyzer(CIAnalysisModule, ABC):
                     )
                     break
 
-                if file_path.is_file() and self.should_scan_file(file_path):
+                if (shared or file_path.is_file()) and self.should_scan_file(file_path):
                     files_to_scan.append(file_path)
 
+        if shard is not None:
+            total = len(files_to_scan)
+            files_to_scan = select_shard(files_to_scan, shard, self.analysis_root)[
+                : self.config.max_files
+            ]
+            self._shard_files = (len(files_to_scan), total)
+
         self.log_operation(
             "directory_scanned",
             {"target": target_path, "files_found": len(files_to_scan)},
@@ -432,6 +566,11 @@ class BaseAnalyzer(CIAnalysisModule, ABC):
         """
         Process files in batches for memory efficiency.
 
+        With adaptive batching, batches are sized from file sizes and this
+        analyzer's observed throughput to take about ``target_batch_seconds``
+        each, and the largest files are scheduled first. Findings are returned
+        in the original file order either way.
+
         Args:
             files: List of files to process
 
@@ -439,12 +578,15 @@ class BaseAnalyzer(CIAnalysisModule, ABC):
         -------
             Combined findings from all files
         """
-        all_findings = []
+        if self.config.adaptive_batching and len(files) > 1:
+            return self._process_files_adaptive(files)
+
+        all_findings: list[dict[str, Any]] = []
 
         for i in range(0, len(files), self.config.batch_size):
             batch = files[i : i + self.config.batch_size]
             batch_findings = self._process_batch(batch)
-            all_findings.extend(batch_findings)
+            self._absorb_batch_findings(all_findings, batch_findings)
 
             self.log_operation(
                 "batch_processed",
@@ -457,16 +599,205 @@ class BaseAnalyzer(CIAnalysisModule, ABC):
 
         return all_findings
 
+    def run_tool(
+        self, cmd: Sequence[str], *, timeout: float | None = None, **kwargs: Any
+    ) -> subprocess.CompletedProcess:
+        """
+        Run an external tool through the shared tool runner.
+
+        Accepts the runner's keyword arguments (tool, cwd, env, stdin_text, check)
+        and raises what ``subprocess.run`` would. The invocation's timing and
+        exit status are added to this analyzer's result metadata.
+        """
+        from core.utils.tool_runner import get_tool_runner
+
+        records: list[Any] = []
+        try:
+            return get_tool_runner().run(cmd, timeout=timeout, sink=records, **kwargs)
+        finally:
+            self.tool_invocations.extend(record.to_dict() for record in records)
+
+    def start_analysis(self) -> None:
+        """Start timing and, when enabled, resource accounting."""
+        # A reused analyzer reports only this run's tool invocations
+        self.tool_invocations = []
+        if self.config.resource_accounting or self.config.memory_profile:
+            self._resource_tracker = ResourceTracker(self.config.memory_profile)
+            self._resource_tracker.start()
+        super().start_analysis()
+
+    def _record_bytes(self, *paths: Path) -> None:
+        """Add file sizes to bytes_processed while resource accounting runs."""
+        if self._resource_tracker is None:
+            return
+        for path in paths:
+            with contextlib.suppress(OSError):
+                self.bytes_processed += path.stat().st_size
+
+    def complete_analysis(self, result: Any) -> Any:
+        """Attach tool invocation and resource records, then finish timing."""
+        invocations = getattr(self, "tool_invocations", None)
+        has_metadata = isinstance(getattr(result, "metadata", None), dict)
+        if invocations and has_metadata:
+            result.metadata["tool_invocations"] = list(invocations)
+
+        shard = getattr(self, "_shard", None)
+        if shard is not None and has_metadata:
+            result.metadata["shard"] = {
+                **shard.to_dict(),
+                "shardable": self.shardable,
+                **(
+                    {
+                        "files_assigned": self._shard_files[0],
+                        "files_total": self._shard_files[1],
+                    }
+                    if self._shard_files
+                    else {}
+                ),
+            }
+
+        cache = getattr(self, "_result_cache", None)
+        if cache is not None:
+            gc = cache.maybe_gc()
+            if has_metadata:
+                result.metadata["result_cache"] = {
+                    **cache.stats,
+                    "cache_dir": str(cache.root),
+                    **({"gc": gc} if gc else {}),
+                }
+
+        tracker = getattr(self, "_resource_tracker", None)
+        if tracker is not None:
+            self._resource_tracker = None
+            usage = tracker.stop()
+            usage["files_processed"] = self.files_processed
+            usage["bytes_processed"] = self.bytes_processed
+            if has_metadata:
+                result.metadata["resource_usage"] = usage
+        return super().complete_analysis(result)
+
+    def _process_files_adaptive(self, files: list[Path]) -> list[dict[str, Any]]:
+        """Process files in cost-sized batches, largest first."""
+        estimate = get_throughput_estimate(self.analyzer_type)
+        all_findings: list[dict[str, Any]] = []
+
+        batches = iter_adaptive_batches(
+            files,
+            estimate,
+            target_seconds=self.config.target_batch_seconds,
+            max_batch_files=self.config.batch_size,
+        )
+        for batch_number, batch in enumerate(batches, 1):
+            predicted = estimate.predict(batch.cost_units)
+            started = time.perf_counter()
+            batch_findings = self._process_batch(batch.files)
+            elapsed = time.perf_counter() - started
+            estimate.observe(batch.cost_units, elapsed)
+            self._absorb_batch_findings(all_findings, batch_findings)
+
+            self.log_operation(
+                "batch_processed",
+                {
+                    "batch_number": batch_number,
+                    "files_in_batch": len(batch.files),
+                    "findings": len(batch_findings),
+                    "predicted_seconds": None
+                    if predicted is None
+                    else round(predicted, 3),
+                    "elapsed_seconds": round(elapsed, 3),
+                },
+            )
+
+        return self._restore_file_order(all_findings, files)
+
+    def _restore_file_order(
+        self, findings: list[dict[str, Any]], files: list[Path]
+    ) -> list[dict[str, Any]]:
+        """Stable-sort findings into the order their files were given in."""
+        rank: dict[str, int] = {}
+        for index, file_path in enumerate(files):
+            rank.setdefault(str(file_path), index)
+            rank.setdefault(self._relative_path_str(Path(file_path)), index)
+        unknown = len(files)
+        return sorted(
+            findings, key=lambda f: rank.get(str(f.get("file_path", "")), unknown)
+        )
+
+    def severity_enabled(self, severity: str) -> bool:
+        """
+        Return True if findings of ``severity`` can reach the output.
+
+        Always True unless ``config.severity_pushdown`` is set; analyzers use
+        this to skip rules (and their supporting work) below the threshold.
+        """
+        if not self.config.severity_pushdown:
+            return True
+        threshold = SEVERITY_ORDER[self.config.min_severity]
+        return SEVERITY_ORDER.get(severity, len(SEVERITY_ORDER)) <= threshold
+
+    def filter_findings_by_severity(
+        self, findings: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Drop findings below the pushed-down severity threshold."""
+        if not self.config.severity_pushdown:
+            return findings
+        return [f for f in findings if self.severity_enabled(f.get("severity", ""))]
+
+    def _collect_top_findings(self, files: list[Path]) -> TopFindingsCollector:
+        """
+        Process files feeding a bounded top-K collector instead of a list.
+
+        Only the SUMMARY_TOP_N most important findings are kept (ties go to
+        the earlier file, as in a stable sort), while exact severity counts
+        cover every finding.
+        """
+        collector = TopFindingsCollector(SUMMARY_TOP_N)
+        self._finding_collector = collector
+        self._file_rank = {}
+        for index, file_path in enumerate(files):
+            self._file_rank.setdefault(str(file_path), index)
+            self._file_rank.setdefault(self._relative_path_str(Path(file_path)), index)
+        try:
+            self.process_files_batch(files)
+        finally:
+            self._finding_collector = None
+            self._file_rank = {}
+        return collector
+
+    def _absorb_batch_findings(
+        self, all_findings: list[dict[str, Any]], batch_findings: list[dict[str, Any]]
+    ) -> None:
+        """Append a batch's findings, or feed them to the active top-K collector."""
+        collector = self._finding_collector
+        if collector is None:
+            all_findings.extend(batch_findings)
+            return
+        unknown = len(self._file_rank)
+        for finding in self.filter_findings_by_severity(batch_findings):
+            order = self._file_rank.get(str(finding.get("file_path", "")), unknown)
+            collector.add(finding, order)
+
     def _process_batch(self, batch: list[Path]) -> list[dict[str, Any]]:
         """Process a single batch of files."""
         batch_findings = []
+        # Per-file events are debug-only; decide once per batch
+        log_files = self.log_enabled("file_analyzed")
 
         for file_path in batch:
             try:
+                started = time.perf_counter() if log_files else 0.0
                 # Call the specific analyzer implementation
-                file_findings = self.analyze_target(str(file_path))
-                batch_findings.extend(file_findings)
+                file_findings = self._analyze_file(file_path)
+                batch_findings.extend(self.filter_findings_by_severity(file_findings))
                 self.files_processed += 1
+                self._record_bytes(file_path)
+                if log_files:
+                    self.log_operation(
+                        "file_analyzed",
+                        file=file_path,
+                        findings=len(file_findings),
+                        seconds=round(time.perf_counter() - started, 6),
+                    )
 
             except Exception as e:
                 self.processing_errors += 1
@@ -474,6 +805,97 @@ class BaseAnalyzer(CIAnalysisModule, ABC):
 
         return batch_findings
 
+    def use_discovery(self, discovery: SharedDiscovery) -> None:
+        """Take candidate files, sizes and vendor verdicts from a shared walk."""
+        self._discovery = discovery
+
+    def analyze_files(self, files: list[Path]) -> list[dict[str, Any]]:
+        """Analyze exactly ``files``, skipping discovery (e.g. edited files)."""
+        return self._process_batch(files)
+
+    def forget_file(self, file_path: Path) -> None:
+        """Drop state kept about ``file_path`` before it is re-analyzed or deleted."""
+
+    def analyze_incremental(
+        self, root: Path, changed: set[Path], removed: set[Path]
+    ) -> list[dict[str, Any]]:
+        """
+        Return project-level findings for ``root`` after applying file changes.
+
+        Only analyzers with ``supports_incremental`` implement this; the
+        first call builds the full project state.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support incremental analysis"
+        )
+
+    def cache_signature(self) -> dict[str, Any]:
+        """Return analyzer options outside AnalyzerConfig that change findings."""
+        return {}
+
+    def cache_result(self, file_path: Path) -> bool:
+        """
+        Return whether ``file_path``'s findings may be stored in the result cache.
+
+        Analyzers return False for degraded runs (e.g. a tool timed out), so a
+        transient failure is not reused under the file's content key.
+        """
+        return True
+
+    def _result_cache_key(self, file_path: Path) -> str:
+        if self._cache_identity is None:
+            config = self.config
+            self._cache_identity = [
+                f"{type(self).__module__}.{type(self).__qualname__}",
+                source_digest(type(self)),
+                source_digest(BaseAnalyzer),
+                pattern_pack_digest(),
+                {
+                    "min_severity": config.min_severity,
+                    "severity_pushdown": config.severity_pushdown,
+                    "chunked_scan": config.chunked_scan,
+                    "max_file_size_mb": config.max_file_size_mb,
+                },
+                self.cache_signature(),
+            ]
+        return make_key(
+            self._cache_identity,
+            Path(self._relative_path_str(file_path)).as_posix(),
+            file_digest(file_path),
+        )
+
+    def _analyze_file(self, file_path: Path) -> list[dict[str, Any]]:
+        """Run analyze_target, reusing cached findings for identical content."""
+        cache = self._result_cache
+        path_text = str(file_path)
+        if cache is None:
+            return self.analyze_target(path_text)
+
+        key = self._result_cache_key(file_path)
+        cached = cache.get(key)
+        if cached is not None:
+            return [
+                {**finding, "file_path": path_text}
+                if finding.get("file_path") is None
+                else finding
+                for finding in cached
+            ]
+
+        findings = self.analyze_target(path_text)
+        if not self.cache_result(file_path):
+            return findings
+        # Entries must not embed this checkout's location
+        cache.put(
+            key,
+            [
+                {**finding, "file_path": None}
+                if finding.get("file_path") == path_text
+                else finding
+                for finding in findings
+            ],
+        )
+        return findings
+
     def analyze(self, target_path: str | None = None) -> Any:
         """
         Run main analysis entry point with full analysis pipeline.
@@ -499,8 +921,13 @@ class BaseAnalyzer(CIAnalysisModule, ABC):
                 result.metadata["info"] = "No files found matching analyzer criteria"
                 return self.complete_analysis(result)
 
-            # Process files in batches
-            all_findings = self.process_files_batch(files_to_analyze)
+            # Process files in batches (summary mode keeps only the top findings)
+            collector = None
+            if self.config.summary_mode:
+                collector = self._collect_top_findings(files_to_analyze)
+                all_findings = collector.top()
+            else:
+                all_findings = self.process_files_batch(files_to_analyze)
 
             # Convert findings to Finding objects
             self._add_findings_to_result(result, all_findings)
@@ -509,6 +936,10 @@ class BaseAnalyzer(CIAnalysisModule, ABC):
             self._add_metadata_to_result(
                 result, analyze_path, files_to_analyze, all_findings
             )
+            if collector is not None:
+                result.set_severity_counts(collector.counts)
+                result.metadata["total_findings"] = collector.total
+                result.metadata["severity_breakdown"] = dict(collector.counts)
 
         except Exception as e:
             result.set_error(f"{self.analyzer_type} analysis failed: {str(e)}")
@@ -522,7 +953,7 @@ class BaseAnalyzer(CIAnalysisModule, ABC):
         """Convert raw findings to Finding objects and add to result."""
         finding_id = 1
 
-        for finding_data in findings:
+        for finding_data in self.filter_findings_by_severity(findings):
             try:
                 # Create Finding object - require all fields to be present
                 finding = self.ResultFormatter.create_finding(
@@ -580,6 +1011,10 @@ class BaseAnalyzer(CIAnalysisModule, ABC):
             },
             **analyzer_metadata,
         }
+        if self.config.severity_pushdown:
+            result.metadata["severity_pushdown"] = self.config.min_severity
+        if self.files_chunked:
+            result.metadata["files_chunked"] = self.files_chunked
 
     def _calculate_severity_breakdown(
         self, findings: list[dict[str, Any]]
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Finding Fingerprints and Baselines for Continuous Improvement Framework.
+
+PURPOSE: Let CI gates act only on findings a change introduced, by matching
+this run's findings against a previous run without relying on line numbers.
+
+APPROACH:
+- A fingerprint hashes the analyzer key, the rule (an explicit rule id from
+  the evidence, else the title with standalone numbers masked), the file path relative
+  to the analysis root, the enclosing symbol (e.g. ``Outer.method``) and the
+  whitespace-normalized snippet - never the line number, so edits elsewhere
+  in the file do not change it
+- Identical fingerprints within one run get an ordinal suffix in line order,
+  so repeated findings in the same symbol stay distinct
+- Enclosing symbols come from one indentation-based pass per file with
+  findings, recognizing common declaration keywords across languages
+- A baseline is a previous ``enaible analyzers run`` payload; its stored
+  fingerprints are loaded into a dict, so labelling findings as new or
+  existing (and listing fixed ones) is a hash lookup per finding
+
+USAGE:
+    enaible analyzers run quality:lizard --out baseline.json
+    enaible analyzers run quality:lizard --baseline baseline.json
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import re
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+FINGERPRINT_LENGTH = 24
+# Evidence keys that name the exact rule that fired, most specific first
+RULE_KEYS = (
+    "rule_id",
+    "check_id",
+    "rule",
+    "ruff_code",
+    "vulnerability_id",
+    "pattern_name",
+)
+SNIPPET_KEYS = ("code_snippet", "snippet", "line_content", "matched_text")
+
+_MODIFIERS = (
+    r"export|default|public|private|protected|internal|static|abstract|final|"
+    r"async|override|virtual|unsafe|sealed|partial|pub(?:\([^)]*\))?"
+)
+_DECLARATION = re.compile(
+    rf"^\s*(?:(?:{_MODIFIERS})\s+)*"
+    r"(?:def|class|function|func|fn|interface|struct|enum|trait|impl|module|"
+    r"namespace|object|record|type)\s+(?:\([^)]*\)\s*)?\*?\s*([A-Za-z_$][\w$]*)"
+)
+# Standalone numbers (counts, line refs) but not rule codes such as F841
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+
+
+def _normalize(text: Any) -> str:
+    return " ".join(str(text).split())
+
+
+def _indent(line: str) -> int:
+    return len(line) - len(line.lstrip())
+
+
+def enclosing_symbols(lines: list[str]) -> list[str]:
+    """
+    Return the dotted enclosing symbol for every line of a file.
+
+    Returns
+    -------
+        One qualname per line (``""`` at top level); a declaration line maps
+        to its parent's symbol, not its own
+    """
+    symbols: list[str] = []
+    stack: list[tuple[int, str | None]] = []
+    current = ""
+    for line in lines:
+        if line.strip():
+            indent = _indent(line)
+            while stack and stack[-1][0] >= indent:
+                stack.pop()
+            current = ".".join(name for _, name in stack if name)
+            match = _DECLARATION.match(line)
+            stack.append((indent, match.group(1) if match else None))
+        symbols.append(current)
+    return symbols
+
+
+def finding_rule(title: str, evidence: dict[str, Any] | None) -> str:
+    """Return the rule a finding reports, ignoring per-occurrence numbers."""
+    evidence = evidence or {}
+    rule = next((evidence[k] for k in RULE_KEYS if evidence.get(k)), None)
+    if rule is None:
+        rule = _NUMBER.sub("#", title or "")
+    return _normalize(rule)
+
+
+class Fingerprinter:
+    """Compute line-number-free fingerprints for findings under ``root``."""
+
+    def __init__(self, root: Path | str):
+        self.root = Path(root).resolve()
+        self._paths: dict[str, tuple[str, Path | None]] = {}
+        self._lines: dict[Path, list[str]] = {}
+        self._symbols: dict[Path, list[str]] = {}
+
+    def _locate(self, file_path: str) -> tuple[str, Path | None]:
+        """Return the root-relative key and readable path for ``file_path``."""
+        located = self._paths.get(file_path)
+        if located is None:
+            path = Path(file_path)
+            candidates = [path] if path.is_absolute() else [path, self.root / path]
+            readable = next((c for c in candidates if c.is_file()), None)
+            key = path.as_posix()
+            if readable is not None:
+                with contextlib.suppress(ValueError):
+                    key = readable.resolve().relative_to(self.root).as_posix()
+            located = self._paths[file_path] = (key, readable)
+        return located
+
+    def _read(self, path: Path) -> list[str]:
+        lines = self._lines.get(path)
+        if lines is None:
+            try:
+                text = path.read_text(encoding="utf-8", errors="replace")
+            except OSError:
+                text = ""
+            lines = self._lines[path] = text.splitlines()
+        return lines
+
+    def _symbol(self, path: Path, line_number: int) -> str:
+        symbols = self._symbols.get(path)
+        if symbols is None:
+            symbols = self._symbols[path] = enclosing_symbols(self._read(path))
+        return symbols[line_number - 1] if 0 < line_number <= len(symbols) else ""
+
+    def fingerprint(
+        self,
+        tool: str,
+        title: str,
+        file_path: str | None,
+        line_number: int | None,
+        evidence: dict[str, Any] | None = None,
+    ) -> str:
+        """Return the fingerprint of one finding (without an ordinal suffix)."""
+        evidence = evidence or {}
+        rule = finding_rule(title, evidence)
+        snippet = next((evidence[k] for k in SNIPPET_KEYS if evidence.get(k)), "")
+        relative, symbol = "", ""
+        if file_path:
+            relative, readable = self._locate(str(file_path))
+            if readable is not None and isinstance(line_number, int):
+                symbol = self._symbol(readable, line_number)
+                if not snippet:
+                    lines = self._read(readable)
+                    if 0 < line_number <= len(lines):
+                        snippet = lines[line_number - 1]
+        parts = (tool, rule, relative, symbol, _normalize(snippet))
+        digest = hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+        return digest[:FINGERPRINT_LENGTH]
+
+    def stamp(self, tool: str, findings: Iterable[Any]) -> None:
+        """Set ``fingerprint`` on each ``Finding``, numbering repeats by line."""
+        groups: dict[str, list[Any]] = {}
+        for finding in findings:
+            digest = self.fingerprint(
+                tool,
+                finding.title,
+                finding.file_path,
+                finding.line_number,
+                finding.evidence,
+            )
+            groups.setdefault(digest, []).append(finding)
+        for digest, group in groups.items():
+            group.sort(key=lambda finding: finding.line_number or 0)
+            for ordinal, finding in enumerate(group):
+                finding.fingerprint = f"{digest}:{ordinal}" if ordinal else digest
+
+
+def iter_payload_findings(
+    payload: dict[str, Any],
+) -> Iterator[tuple[str, list[dict[str, Any]]]]:
+    """Yield ``(tool, findings)`` for single, multi-analyzer and streamed reports."""
+    if payload.get("event") == "report":
+        payload = payload.get("report") or {}
+    if isinstance(payload.get("results"), list):
+        for section in payload["results"]:
+            yield str(section.get("tool", "")), section.get("findings") or []
+    elif isinstance(payload.get("findings"), list):
+        yield str(payload.get("tool", "")), payload["findings"]
+    else:
+        raise ValueError("not an analyzer result payload")
+
+
+class Baseline:
+    """Fingerprint index of a previous run, used to label the current one."""
+
+    def __init__(self, findings: dict[str, tuple[str, dict[str, Any]]]):
+        self.findings = findings
+        self._seen: set[str] = set()
+        self.counts = {"new": 0, "existing": 0}
+
+    @classmethod
+    def load(cls, path: Path | str) -> Baseline:
+        """
+        Index the fingerprinted findings of a saved run.
+
+        Raises
+        ------
+            ValueError: If the file is not a run payload or predates fingerprints
+        """
+        try:
+            payload = json.loads(Path(path).read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            raise ValueError(f"cannot read baseline {path}: {exc}") from exc
+        if not isinstance(payload, dict):
+            raise ValueError(f"{path}: not an analyzer result payload")
+        index: dict[str, tuple[str, dict[str, Any]]] = {}
+        try:
+            for tool, findings in iter_payload_findings(payload):
+                for finding in findings:
+                    fingerprint = finding.get("fingerprint")
+                    if not fingerprint:
+                        raise ValueError(
+                            "findings have no fingerprints; regenerate the baseline"
+                        )
+                    index[fingerprint] = (tool, finding)
+        except ValueError as exc:
+            raise ValueError(f"{path}: {exc}") from exc
+        return cls(index)
+
+    def status(self, fingerprint: str | None) -> str:
+        """Return ``existing`` or ``new`` for a current finding."""
+        if fingerprint and fingerprint in self.findings:
+            self._seen.add(fingerprint)
+            label = "existing"
+        else:
+            label = "new"
+        self.counts[label] += 1
+        return label
+
+    def fixed(self) -> list[dict[str, Any]]:
+        """Baseline findings not matched by any ``status`` call."""
+        return [
+            {"tool": tool, **finding}
+            for fingerprint, (tool, finding) in self.findings.items()
+            if fingerprint not in self._seen
+        ]
+
+    def summary(self) -> dict[str, Any]:
+        fixed = self.fixed()
+        return {**self.counts, "fixed": len(fixed), "fixed_findings": fixed}
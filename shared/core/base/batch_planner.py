@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Adaptive Batch Planning for Continuous Improvement Framework.
+
+PURPOSE: Size analyzer file batches by predicted cost instead of a fixed file
+count, so a batch of config files and a batch of multi-megabyte generated
+files take roughly the same wall time.
+
+APPROACH:
+- Each file costs `1 + size / REFERENCE_FILE_BYTES` units: a fixed per-file
+  overhead plus a size-proportional part
+- A per-analyzer running estimate of seconds per unit (exponentially
+  smoothed over observed batches) converts a target wall time into a unit
+  budget for the next batch
+- Files are scheduled largest first so the slowest work starts early and
+  the tail is made of small, cheap batches
+- Until the first batch has been observed, a small probe batch is used
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+REFERENCE_FILE_BYTES = 4096
+DEFAULT_PROBE_BATCH_FILES = 16
+DEFAULT_SMOOTHING = 0.3
+
+
+def file_cost_units(size_bytes: int) -> float:
+    """Return the relative processing cost of a file of the given size."""
+    return 1.0 + max(0, size_bytes) / REFERENCE_FILE_BYTES
+
+
+class ThroughputEstimate:
+    """Thread-safe, exponentially smoothed seconds-per-cost-unit estimate."""
+
+    def __init__(self, smoothing: float = DEFAULT_SMOOTHING):
+        self.smoothing = smoothing
+        self.seconds_per_unit: float | None = None
+        self.samples = 0
+        self._lock = threading.Lock()
+
+    def observe(self, cost_units: float, elapsed_seconds: float) -> None:
+        """Fold one processed batch into the estimate."""
+        if cost_units <= 0 or elapsed_seconds < 0:
+            return
+        observed = elapsed_seconds / cost_units
+        with self._lock:
+            if self.seconds_per_unit is None:
+                self.seconds_per_unit = observed
+            else:
+                self.seconds_per_unit += self.smoothing * (
+                    observed - self.seconds_per_unit
+                )
+            self.samples += 1
+
+    def predict(self, cost_units: float) -> float | None:
+        """Return predicted seconds for the given cost, or None before any sample."""
+        spu = self.seconds_per_unit
+        return None if spu is None else spu * cost_units
+
+
+_estimates: dict[str, ThroughputEstimate] = {}
+_estimates_lock = threading.Lock()
+
+
+def get_throughput_estimate(key: str) -> ThroughputEstimate:
+    """Return the process-wide throughput estimate for an analyzer type."""
+    with _estimates_lock:
+        estimate = _estimates.get(key)
+        if estimate is None:
+            estimate = _estimates[key] = ThroughputEstimate()
+        return estimate
+
+
+@dataclass
+class PlannedBatch:
+    """A batch of files plus its total predicted cost in units."""
+
+    files: list[Path]
+    cost_units: float
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def iter_adaptive_batches(
+    files: Sequence[Path],
+    estimate: ThroughputEstimate,
+    target_seconds: float,
+    max_batch_files: int,
+    probe_batch_files: int = DEFAULT_PROBE_BATCH_FILES,
+) -> Iterator[PlannedBatch]:
+    """
+    Yield batches of ``files`` (largest first) sized to ``target_seconds``.
+
+    The estimate is read lazily before each batch, so callers that call
+    ``estimate.observe`` between iterations steer the remaining batches.
+    Every batch holds at least one file and at most ``max_batch_files``.
+    """
+    costs = [file_cost_units(_file_size(Path(f))) for f in files]
+    order = sorted(range(len(files)), key=lambda i: (-costs[i], i))
+    probe_limit = max(1, min(probe_batch_files, max_batch_files))
+
+    position = 0
+    while position < len(order):
+        spu = estimate.seconds_per_unit
+        budget = target_seconds / spu if spu else None
+        limit = max_batch_files if budget is not None else probe_limit
+
+        batch: list[Path] = []
+        units = 0.0
+        while position < len(order) and len(batch) < limit:
+            cost = costs[order[position]]
+            if batch and budget is not None and units + cost > budget:
+                break
+            batch.append(Path(files[order[position]]))
+            units += cost
+            position += 1
+        yield PlannedBatch(batch, units)
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Content-Addressed Result Cache for Continuous Improvement Framework.
+
+PURPOSE: Let every checkout, worktree and CI job share per-file analysis
+results, so identical file contents analyzed with an identical analyzer and
+config are computed once per team instead of once per directory.
+
+APPROACH:
+- Keys hash the analyzer identity (class, source digest, version, pattern
+  pack digest), the result-affecting config, the file content digest and the
+  file path relative to the analysis root - never an absolute path - so a
+  cache directory can be moved, mounted (NFS) or restored from a CI cache
+- The directory comes from ``--cache-dir`` / ``CI_CACHE_DIR`` and defaults to
+  the per-checkout ``.cache/ci-framework``; entries live under a versioned
+  ``results/`` tree fanned out by the first key byte
+- Writes go to a unique temp file in the entry's directory and are renamed
+  into place, so concurrent writers never interleave and readers only ever
+  see complete entries; unreadable entries are treated as misses
+- Hits refresh the entry mtime; garbage collection deletes least recently
+  used entries once the tree exceeds its size budget, at most once per
+  ``GC_INTERVAL_SECONDS`` per cache directory
+
+USAGE:
+    enaible analyzers cache --stats
+    enaible analyzers cache --gc --max-mb 256 --cache-dir /mnt/ci-cache
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+import time
+from functools import cache, lru_cache
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+CACHE_ENV_VAR = "CI_CACHE_DIR"
+CACHE_FORMAT_VERSION = 1
+DEFAULT_MAX_MB = 512
+GC_INTERVAL_SECONDS = 3600
+# GC trims to this fraction of the budget so it does not rerun on every write
+GC_LOW_WATER = 0.8
+_TEMP_PREFIX = ".tmp-"
+_GC_STAMP = ".gc-stamp"
+
+
+def resolve_cache_root(
+    project_root: Path | str | None = None, cache_dir: Path | str | None = None
+) -> Path:
+    """Return ``cache_dir``, else ``$CI_CACHE_DIR``, else the checkout cache dir."""
+    explicit = cache_dir or os.environ.get(CACHE_ENV_VAR)
+    if explicit:
+        return Path(explicit).expanduser()
+    return Path(project_root or Path.cwd()) / ".cache" / "ci-framework"
+
+
+def make_key(*parts: Any) -> str:
+    """Hash JSON-serializable ``parts`` into a cache key."""
+    material = json.dumps([CACHE_FORMAT_VERSION, *parts], sort_keys=True, default=str)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+_digest_memo: dict[tuple[str, int, int], str] = {}
+
+
+def file_digest(path: Path | str) -> str:
+    """
+    Return the sha256 of a file's bytes.
+
+    Memoized per process by path, size and mtime, so a file analyzed by
+    several analyzers in one run is read for hashing once.
+    """
+    stat = os.stat(path)
+    memo_key = (str(path), stat.st_size, stat.st_mtime_ns)
+    cached = _digest_memo.get(memo_key)
+    if cached is not None:
+        return cached
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    _digest_memo[memo_key] = digest.hexdigest()
+    return _digest_memo[memo_key]
+
+
+@cache
+def source_digest(cls: type) -> str:
+    """Digest the source file defining ``cls`` (falls back to its qualified name)."""
+    try:
+        return hashlib.sha256(Path(inspect.getfile(cls)).read_bytes()).hexdigest()
+    except (OSError, TypeError):
+        return f"{cls.__module__}.{cls.__qualname__}"
+
+
+@cache
+def package_version(distribution: str) -> str:
+    """Return an installed distribution's version ("" when not installed)."""
+    try:
+        return metadata.version(distribution)
+    except metadata.PackageNotFoundError:
+        return ""
+
+
+@lru_cache(maxsize=1)
+def pattern_pack_digest() -> str:
+    """Digest the shipped config packs that drive pattern analyzers."""
+    try:
+        from core.config.pattern_packs import config_digest
+
+        return config_digest()
+    except (ImportError, OSError):
+        return ""
+
+
+class ContentAddressedCache:
+    """JSON entries under ``root/results`` keyed by content hashes."""
+
+    def __init__(self, root: Path | str, max_bytes: int = DEFAULT_MAX_MB << 20):
+        self.root = Path(root)
+        self.entries_dir = self.root / "results" / f"v{CACHE_FORMAT_VERSION}"
+        self.max_bytes = max_bytes
+        self.stats = {"hits": 0, "misses": 0, "writes": 0}
+
+    def _entry_path(self, key: str) -> Path:
+        return self.entries_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value for ``key``, or None on a miss."""
+        path = self._entry_path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+            if entry.get("key") == key:
+                self.stats["hits"] += 1
+                # Refresh recency for LRU garbage collection
+                with contextlib.suppress(OSError):
+                    os.utime(path)
+                return entry["value"]
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, AttributeError):
+            # Corrupt or foreign entry: drop it so it is rewritten
+            with contextlib.suppress(OSError):
+                path.unlink()
+        self.stats["misses"] += 1
+        return None
+
+    def put(self, key: str, value: Any) -> bool:
+        """
+        Store ``value`` under ``key`` atomically.
+
+        Returns
+        -------
+            False when the value is not JSON-serializable or the write failed
+            (caching is best effort; the caller keeps its computed value)
+        """
+        try:
+            payload = json.dumps({"key": key, "value": value})
+        except (TypeError, ValueError):
+            return False
+        path = self._entry_path(key)
+        temp_name = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_name = tempfile.mkstemp(
+                dir=path.parent, prefix=_TEMP_PREFIX, suffix=".json"
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                handle.write(payload)
+            # mkstemp creates 0600; shared cache dirs need group access
+            os.chmod(temp_name, 0o664)
+            os.replace(temp_name, path)
+        except OSError:
+            if temp_name is not None:
+                with contextlib.suppress(OSError):
+                    os.unlink(temp_name)
+            return False
+        self.stats["writes"] += 1
+        return True
+
+    def usage(self) -> dict[str, int]:
+        """Return the number of entries and their total size in bytes."""
+        entries = list(self._iter_entries())
+        return {"entries": len(entries), "bytes": sum(e[1] for e in entries)}
+
+    def _iter_entries(self):
+        """Yield ``(mtime, size, path)`` for entries and stale temp files."""
+        try:
+            shards = list(os.scandir(self.entries_dir))
+        except OSError:
+            return
+        for shard in shards:
+            if not shard.is_dir(follow_symlinks=False):
+                continue
+            with contextlib.suppress(OSError), os.scandir(shard.path) as entries:
+                for entry in entries:
+                    with contextlib.suppress(OSError):
+                        stat = entry.stat(follow_symlinks=False)
+                        yield stat.st_mtime, stat.st_size, Path(entry.path)
+
+    def gc(self, max_bytes: int | None = None) -> dict[str, int]:
+        """
+        Delete least recently used entries until the tree fits the budget.
+
+        Safe to run while other processes read and write: entries that
+        vanish mid-scan are ignored, and a reader racing a deletion sees a
+        miss. Temp files abandoned by crashed writers are removed too.
+        """
+        budget = self.max_bytes if max_bytes is None else max_bytes
+        now = time.time()
+        entries = []
+        removed = freed = 0
+        for mtime, size, path in self._iter_entries():
+            if path.name.startswith(_TEMP_PREFIX):
+                if now - mtime > GC_INTERVAL_SECONDS and _unlink(path):
+                    removed += 1
+                    freed += size
+                continue
+            entries.append((mtime, size, path))
+
+        total = sum(size for _, size, _ in entries)
+        if total > budget:
+            target = int(budget * GC_LOW_WATER)
+            for _mtime, size, path in sorted(entries, key=lambda e: e[0]):
+                if total <= target:
+                    break
+                if _unlink(path):
+                    removed += 1
+                    freed += size
+                total -= size
+        return {"removed": removed, "freed_bytes": freed, "remaining_bytes": total}
+
+    def maybe_gc(self) -> dict[str, int] | None:
+        """Run ``gc`` if no process has run it in the last GC interval."""
+        stamp = self.root / _GC_STAMP
+        try:
+            if time.time() - stamp.stat().st_mtime < GC_INTERVAL_SECONDS:
+                return None
+        except FileNotFoundError:
+            pass
+        except OSError:
+            return None
+        try:
+            stamp.parent.mkdir(parents=True, exist_ok=True)
+            stamp.touch()
+        except OSError:
+            return None
+        return self.gc()
+
+
+def _unlink(path: Path) -> bool:
+    try:
+        path.unlink()
+    except OSError:
+        return False
+    return True
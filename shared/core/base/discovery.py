@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Shared File Discovery for Continuous Improvement Framework.
+
+PURPOSE: Let several analyzers run over the same target in one process
+without each of them walking the tree and re-checking the same files.
+
+APPROACH:
+- The tree is walked once (in ``rglob`` order, so each analyzer sees the
+  files it would have found on its own) and file sizes are kept from that
+  walk for the size-limit check
+- Vendor detection, which may read file content, is memoized per file and
+  shared by every analyzer attached to the pass
+- Analyzers still apply their own filters (extensions, skip patterns,
+  excludes, gitignore, size) to the shared list, so results match separate
+  runs
+"""
+
+from __future__ import annotations
+
+import stat
+from pathlib import Path
+
+from .vendor_detector import VendorDetector
+
+
+class SharedDiscovery:
+    """One walk of ``target`` shared by the analyzers attached to it."""
+
+    def __init__(self, target: Path | str):
+        self.target = Path(target)
+        self.root = self.target.resolve()
+        self._files: list[Path] | None = None
+        self._sizes: dict[Path, int] = {}
+        self._vendor: dict[Path, bool] = {}
+        self.stats = {"walks": 0, "vendor_checks": 0, "vendor_reuses": 0}
+
+    def covers(self, target: Path | str) -> bool:
+        """Return True if ``target`` is the tree this pass walked."""
+        return Path(target).resolve() == self.root
+
+    @property
+    def files(self) -> list[Path]:
+        """Regular files under the target, walked on first use."""
+        if self._files is None:
+            self.stats["walks"] += 1
+            self._files = []
+            for path in self.target.rglob("*"):
+                try:
+                    info = path.stat()
+                except OSError:
+                    continue
+                if stat.S_ISREG(info.st_mode):
+                    self._files.append(path)
+                    self._sizes[path] = info.st_size
+        return self._files
+
+    def size(self, path: Path) -> int:
+        """Return the size recorded by the walk (stat on a miss)."""
+        size = self._sizes.get(path)
+        if size is None:
+            size = self._sizes[path] = path.stat().st_size
+        return size
+
+    def is_vendor(self, path: Path, detector: VendorDetector) -> bool:
+        """Return the memoized vendor verdict for ``path``."""
+        verdict = self._vendor.get(path)
+        if verdict is None:
+            self.stats["vendor_checks"] += 1
+            verdict = self._vendor[path] = detector.should_exclude_file(path)
+        else:
+            self.stats["vendor_reuses"] += 1
+        return verdict
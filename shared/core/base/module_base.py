@@ -11,7 +11,9 @@ import os
 from pathlib import Path
 from typing import Any
 
+from .content_cache import resolve_cache_root
 from .error_handler import CIErrorHandler
+from .structured_log import Fields, StructuredLogger
 
 
 class CIModuleBase:
@@ -22,6 +24,9 @@ class CIModuleBase:
         "file_skipped_vendor",
         "file_skipped_pattern",
         "file_skipped_size",
+        "file_chunked",
+        "file_skipped_gitignore",
+        "file_analyzed",
         "batch_processed",
     }
 
@@ -30,6 +35,7 @@ class CIModuleBase:
         self.project_root = Path(project_root) if project_root else Path.cwd()
         # Initialize logger early to satisfy type checkers
         self.logger: logging.Logger = logging.getLogger(f"ci.{module_name}")
+        self.events = StructuredLogger(self.logger, module_name)
 
         # Setup common logging and common utilities
         self._setup_logging()
@@ -50,6 +56,7 @@ class CIModuleBase:
             log_level_name = os.getenv("CI_LOG_LEVEL", "WARNING").upper()
             log_level = getattr(logging, log_level_name, logging.WARNING)
             self.logger.setLevel(log_level)
+        self.events = StructuredLogger(self.logger, self.module_name)
 
     def _import_common_utilities(self) -> None:
         """Import commonly used utilities with error handling."""
@@ -73,8 +80,8 @@ class CIModuleBase:
         return self.project_root / ".ci-registry" / config_name
 
     def get_cache_path(self, cache_name: str) -> Path:
-        """Get path to cache file."""
-        cache_dir = self.project_root / ".cache" / "ci-framework"
+        """Get path to cache file ($CI_CACHE_DIR relocates the cache directory)."""
+        cache_dir = resolve_cache_root(self.project_root)
         cache_dir.mkdir(parents=True, exist_ok=True)
         return cache_dir / cache_name
 
@@ -150,20 +157,25 @@ class CIModuleBase:
         except PermissionError as e:
             CIErrorHandler.permission_error("write file", file_path, e)
 
+    def _operation_level(self, operation: str) -> int:
+        # Log high-volume operations at DEBUG level, others at INFO
+        return logging.DEBUG if operation in self._LOW_LEVEL_OPS else logging.INFO
+
+    def log_enabled(self, operation: str) -> bool:
+        """Return True if ``operation`` would be recorded (guard for costly fields)."""
+        return self.events.enabled_for(self._operation_level(operation))
+
     def log_operation(
-        self, operation: str, details: dict[str, Any] | None = None
+        self, operation: str, details: Fields = None, **fields: Any
     ) -> None:
-        """Log operation with consistent format."""
-        message = f"{operation}"
-        if details:
-            detail_str = ", ".join(f"{k}={v}" for k, v in details.items())
-            message += f" ({detail_str})"
-
-        # Log high-volume operations at DEBUG level, others at INFO
-        if operation in self._LOW_LEVEL_OPS:
-            self.logger.debug(message)
-        else:
-            self.logger.info(message)
+        """
+        Log operation with consistent format.
+
+        Details can be a dict, a zero-argument callable returning one, or
+        keyword fields; nothing is formatted unless the operation's level is
+        enabled on the logger or the JSONL sink.
+        """
+        self.events.log(self._operation_level(operation), operation, details, **fields)
 
 
 class CIAnalysisModule(CIModuleBase):
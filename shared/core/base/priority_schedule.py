@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Priority Scheduling for Continuous Improvement Framework.
+
+PURPOSE: Get useful findings back to an interactive caller (an agent or a
+developer) while slow analyzers are still running, instead of after the
+whole suite finishes.
+
+APPROACH:
+- A small per-checkout history records each analyzer's smoothed runtime and
+  how many critical/high findings it tends to produce
+- Analyzers are ordered by predicted seconds per unit of signal, so cheap,
+  high-signal analyzers run first; without history an analyzer's
+  ``expensive`` flag supplies the prior
+- Analyzers predicted to take longer than ``BACKGROUND_SECONDS`` start
+  immediately on background threads (they mostly wait on external tools)
+  while the cheap ones run in order on the calling thread
+- Every analyzer's result is handed to a callback the moment it completes,
+  so callers can flush it before the rest are done
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from .content_cache import resolve_cache_root
+from .fs_utils import atomic_write
+
+HISTORY_FILE = "runtime-history.json"
+HISTORY_VERSION = 1
+HISTORY_SMOOTHING = 0.3
+# Priors used until an analyzer has run once in this checkout
+DEFAULT_SECONDS = 2.0
+EXPENSIVE_SECONDS = 30.0
+BACKGROUND_SECONDS = 10.0
+DEFAULT_BACKGROUND_WORKERS = 2
+
+
+def severity_signal(summary: dict[str, Any]) -> int:
+    """Return the number of critical and high findings in a severity summary."""
+    return sum(
+        count
+        for severity, count in (summary or {}).items()
+        if severity in ("critical", "high") and isinstance(count, int)
+    )
+
+
+def tool_queue_seconds(metadata: dict[str, Any]) -> float:
+    """Return the time an analyzer spent waiting for a tool slot (not its cost)."""
+    return sum(
+        float(invocation.get("queued_seconds") or 0.0)
+        for invocation in (metadata or {}).get("tool_invocations", [])
+    )
+
+
+class RuntimeHistory:
+    """Smoothed runtime and signal per analyzer key, persisted as JSON."""
+
+    def __init__(self, path: Path | None):
+        self.path = Path(path) if path is not None else None
+        self._lock = threading.Lock()
+        self.entries: dict[str, dict[str, float]] = {}
+        if self.path is not None:
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                if data.get("version") == HISTORY_VERSION:
+                    self.entries = dict(data.get("analyzers", {}))
+            except (OSError, ValueError, AttributeError):
+                pass
+
+    @classmethod
+    def for_workspace(
+        cls, workspace_root: Path | str, cache_dir: Path | str | None = None
+    ) -> RuntimeHistory:
+        """Use ``HISTORY_FILE`` under the shared cache root (see resolve_cache_root)."""
+        return cls(resolve_cache_root(workspace_root, cache_dir) / HISTORY_FILE)
+
+    def predict(self, key: str, expensive: bool = False) -> float:
+        entry = self.entries.get(key)
+        if entry:
+            return float(entry["seconds"])
+        return EXPENSIVE_SECONDS if expensive else DEFAULT_SECONDS
+
+    def signal(self, key: str) -> float:
+        return float(self.entries.get(key, {}).get("signal", 0.0))
+
+    def record(self, key: str, seconds: float, signal: int) -> None:
+        """Fold one completed run into the smoothed history."""
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.entries[key] = {
+                    "seconds": round(seconds, 3),
+                    "signal": float(signal),
+                    "runs": 1,
+                }
+                return
+            for field_name, observed in (("seconds", seconds), ("signal", signal)):
+                entry[field_name] = round(
+                    entry[field_name]
+                    + HISTORY_SMOOTHING * (observed - entry[field_name]),
+                    3,
+                )
+            entry["runs"] = entry.get("runs", 0) + 1
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        payload = {"version": HISTORY_VERSION, "analyzers": self.entries}
+        try:
+            with atomic_write(self.path) as handle:
+                handle.write(json.dumps(payload, indent=2, sort_keys=True))
+        except OSError:
+            # Best effort: the next run falls back to the priors
+            pass
+
+
+@dataclass
+class ScheduledAnalyzer:
+    """One analyzer's place in a priority run."""
+
+    name: str
+    key: str
+    predicted_seconds: float
+    signal: float
+    background: bool
+
+    @property
+    def priority(self) -> float:
+        return self.predicted_seconds / (1.0 + self.signal)
+
+
+def plan_priority(
+    entries: Iterable[tuple[str, str, bool]],
+    history: RuntimeHistory,
+    background_seconds: float = BACKGROUND_SECONDS,
+) -> list[ScheduledAnalyzer]:
+    """
+    Order ``(name, registry key, expensive)`` entries for a priority run.
+
+    Returns
+    -------
+        Scheduled analyzers, cheapest per unit of signal first (ties keep
+        the given order)
+    """
+    planned = []
+    for name, key, expensive in entries:
+        seconds = history.predict(key, expensive)
+        planned.append(
+            ScheduledAnalyzer(
+                name=name,
+                key=key,
+                predicted_seconds=seconds,
+                signal=history.signal(key),
+                background=seconds >= background_seconds,
+            )
+        )
+    return sorted(planned, key=lambda entry: entry.priority)
+
+
+def run_prioritized(
+    schedule: list[ScheduledAnalyzer],
+    run_one: Callable[[ScheduledAnalyzer], Any],
+    on_result: Callable[[ScheduledAnalyzer, Any, float], None],
+    background_workers: int = DEFAULT_BACKGROUND_WORKERS,
+) -> None:
+    """
+    Run ``schedule`` and call ``on_result(entry, result, seconds)`` per analyzer.
+
+    Background entries start first on ``background_workers`` threads; the
+    rest run in order on this thread. With no workers (e.g. when measuring
+    process-wide memory), background entries run last on this thread.
+    ``on_result`` calls are serialized. An exception from a background
+    ``run_one`` is re-raised once the other analyzers have finished.
+    """
+    flush_lock = threading.Lock()
+    errors: list[BaseException] = []
+
+    def timed(entry: ScheduledAnalyzer) -> tuple[Any, float]:
+        started = time.perf_counter()
+        result = run_one(entry)
+        return result, time.perf_counter() - started
+
+    def finish(entry: ScheduledAnalyzer, outcome: tuple[Any, float]) -> None:
+        with flush_lock:
+            on_result(entry, *outcome)
+
+    def finish_background(entry: ScheduledAnalyzer, future: Future) -> None:
+        error = future.exception()
+        if error is not None:
+            errors.append(error)
+            return
+        try:
+            finish(entry, future.result())
+        except Exception as exc:
+            errors.append(exc)
+
+    background = [entry for entry in schedule if entry.background]
+    foreground = [entry for entry in schedule if not entry.background]
+    if background_workers <= 0:
+        foreground, background = foreground + background, []
+
+    with ThreadPoolExecutor(max_workers=max(1, background_workers)) as pool:
+        for entry in background:
+            # Flush from the worker as soon as it is done, even mid-foreground
+            pool.submit(timed, entry).add_done_callback(
+                partial(finish_background, entry)
+            )
+        for entry in foreground:
+            finish(entry, timed(entry))
+    if errors:
+        raise errors[0]
@@ -214,8 +214,7 @@ class BaseProfiler(CIAnalysisModule, ABC):
             file_size_mb = file_path.stat().st_size / (1024 * 1024)
             if file_size_mb > self.config.max_file_size_mb:
                 self.log_operation(
-                    "file_skipped_size",
-                    {"file": str(file_path), "size_mb": round(file_size_mb, 2)},
+                    "file_skipped_size", file=file_path, size_mb=round(file_size_mb, 2)
                 )
                 return False
         except (OSError, FileNotFoundError):
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Resource Accounting for Continuous Improvement Framework.
+
+PURPOSE: Give each analyzer run an opt-in record of the memory it used, so
+runner OOMs can be traced to an analyzer and memory regressions tracked
+alongside execution time.
+
+APPROACH:
+- Peak RSS comes from `resource.getrusage` (a process-wide high-water
+  mark); each run reports the peak at its end and how far the run raised
+  it, which attributes growth to the analyzer that caused it
+- External tools (semgrep, jscpd, lizard, ...) run as child processes, so
+  the peak of the largest finished child is reported the same way; a run
+  whose tool outgrew every earlier one shows a non-zero child delta
+- In memory-profile mode `tracemalloc` is started (or its peak reset) for
+  the run, and the peak traced size plus the top allocation sites (by
+  line, for memory still held when the run ends) are reported
+- Unsupported platforms (no `resource` module) report None, not an error
+"""
+
+from __future__ import annotations
+
+import sys
+import tracemalloc
+from typing import Any
+
+try:  # pragma: no cover - platform dependent
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None  # type: ignore[assignment]
+
+DEFAULT_TOP_ALLOCATIONS = 10
+_MB = 1024 * 1024
+
+
+def peak_rss_mb(children: bool = False) -> float | None:
+    """
+    Return a peak resident set size in MiB, if available.
+
+    With ``children``, the peak of the largest waited-for child process
+    instead of this process's own.
+    """
+    if resource is None:
+        return None
+    who = resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF
+    peak = resource.getrusage(who).ru_maxrss
+    # ru_maxrss is bytes on macOS and KiB on Linux/BSD
+    divisor = _MB if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 2)
+
+
+def _delta(start: float | None, end: float | None) -> float | None:
+    if start is None or end is None:
+        return None
+    return round(end - start, 2)
+
+
+class ResourceTracker:
+    """Measure peak memory (and optionally allocation sites) for one run."""
+
+    def __init__(
+        self, memory_profile: bool = False, top_n: int = DEFAULT_TOP_ALLOCATIONS
+    ):
+        self.memory_profile = memory_profile
+        self.top_n = top_n
+        self._start_peak_rss: float | None = None
+        self._start_child_peak_rss: float | None = None
+        self._started_tracing = False
+
+    def start(self) -> None:
+        self._start_peak_rss = peak_rss_mb()
+        self._start_child_peak_rss = peak_rss_mb(children=True)
+        if self.memory_profile:
+            if tracemalloc.is_tracing():
+                tracemalloc.reset_peak()
+            else:
+                tracemalloc.start()
+                self._started_tracing = True
+
+    def stop(self) -> dict[str, Any]:
+        """Return the run's resource usage and stop tracing if we started it."""
+        peak = peak_rss_mb()
+        child_peak = peak_rss_mb(children=True)
+        usage: dict[str, Any] = {
+            "peak_rss_mb": peak,
+            "peak_rss_delta_mb": _delta(self._start_peak_rss, peak),
+            "child_peak_rss_mb": child_peak,
+            "child_peak_rss_delta_mb": _delta(self._start_child_peak_rss, child_peak),
+        }
+        if self.memory_profile and tracemalloc.is_tracing():
+            usage["tracemalloc"] = self._tracemalloc_report()
+            if self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+        return usage
+
+    def _tracemalloc_report(self) -> dict[str, Any]:
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            (
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+                tracemalloc.Filter(False, "<unknown>"),
+            )
+        )
+        top = snapshot.statistics("lineno")[: self.top_n]
+        return {
+            "current_mb": round(current / _MB, 3),
+            "peak_mb": round(peak / _MB, 3),
+            "top_allocations": [
+                {
+                    "location": f"{stat.traceback[0].filename}:"
+                    f"{stat.traceback[0].lineno}",
+                    "size_kb": round(stat.size / 1024, 1),
+                    "count": stat.count,
+                }
+                for stat in top
+            ],
+        }
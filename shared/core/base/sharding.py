@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Deterministic Sharding for Continuous Improvement Framework.
+
+PURPOSE: Split one analysis across N CI runners with no coordinating
+service, then merge the per-shard results back into one.
+
+APPROACH:
+- Shards are named ``i/n`` (1-based). Every runner lists the same files,
+  so each can compute its own share locally
+- ``hash`` assigns a file by a stable hash of its path relative to the
+  analysis root (independent of checkout location and file order); ``size``
+  balances bytes with a greedy largest-first assignment over the full list
+- Cross-file (project-level) analyzers are not shardable: they see every
+  file on every shard, and merging keeps one copy of their result
+- Merging sums shard summaries, drops duplicate findings and renumbers ids
+  so the merged result reads like an unsharded run
+"""
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from core.utils.output_formatter import AnalysisResult, Severity
+
+SHARD_STRATEGIES = ("hash", "size")
+
+
+@dataclass(frozen=True)
+class ShardSpec:
+    """Shard ``index`` of ``count`` (1-based) and how files are assigned."""
+
+    index: int
+    count: int
+    strategy: str = "hash"
+
+    @classmethod
+    def parse(cls, text: str, strategy: str = "hash") -> ShardSpec:
+        """Parse ``"i/n"``; raises ValueError for malformed or out-of-range specs."""
+        match = re.fullmatch(r"\s*(\d+)\s*/\s*(\d+)\s*", text or "")
+        if not match:
+            raise ValueError(f"shard must look like 'i/n', got {text!r}")
+        index, count = int(match.group(1)), int(match.group(2))
+        if count < 1 or not 1 <= index <= count:
+            raise ValueError(f"shard index must be in 1..{count}, got {text!r}")
+        if strategy not in SHARD_STRATEGIES:
+            raise ValueError(f"shard strategy must be one of {SHARD_STRATEGIES}")
+        return cls(index, count, strategy)
+
+    def __str__(self) -> str:
+        return f"{self.index}/{self.count}"
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"index": self.index, "count": self.count, "strategy": self.strategy}
+
+
+def stable_shard(key: str, count: int) -> int:
+    """Return the 1-based shard owning ``key`` (stable across processes)."""
+    digest = hashlib.sha1(key.encode("utf-8"), usedforsecurity=False).digest()
+    return int.from_bytes(digest[:8], "big") % count + 1
+
+
+def owner_shard(analyzer_key: str, count: int) -> int:
+    """Return the shard that runs a non-shardable analyzer in a multi-analyzer pass."""
+    return stable_shard(f"analyzer:{analyzer_key}", count)
+
+
+def _relative_key(path: Path, root: Path) -> str:
+    try:
+        return path.resolve().relative_to(root).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def select_shard(files: Iterable[Path], spec: ShardSpec, root: Path) -> list[Path]:
+    """Return the files assigned to ``spec``, in their original order."""
+    files = list(files)
+    root = root.resolve()
+    keys = [_relative_key(path, root) for path in files]
+    if spec.strategy == "hash":
+        return [
+            path
+            for path, key in zip(files, keys, strict=True)
+            if stable_shard(key, spec.count) == spec.index
+        ]
+
+    sizes = []
+    for path in files:
+        try:
+            sizes.append(path.stat().st_size)
+        except OSError:
+            sizes.append(0)
+    order = sorted(range(len(files)), key=lambda i: (-sizes[i], keys[i]))
+    # Largest first onto the least-loaded shard (ties to the lowest index)
+    loads = [(0, shard) for shard in range(1, spec.count + 1)]
+    assigned: set[int] = set()
+    for position in order:
+        load, shard = heapq.heappop(loads)
+        if shard == spec.index:
+            assigned.add(position)
+        heapq.heappush(loads, (load + sizes[position], shard))
+    return [path for position, path in enumerate(files) if position in assigned]
+
+
+def _finding_key(finding: Any) -> tuple:
+    return (
+        finding.file_path,
+        finding.line_number,
+        finding.title,
+        finding.severity.value,
+        finding.description,
+    )
+
+
+def _unique_shards(
+    results: list[AnalysisResult],
+) -> tuple[list[AnalysisResult], list[dict[str, Any]], int | None]:
+    """
+    Drop repeated shard indexes and check all shards share one shard count.
+
+    Returns
+    -------
+        (one result per shard, their shard metadata, the shard count)
+    """
+    unique: dict[Any, AnalysisResult] = {}
+    for position, result in enumerate(results):
+        shard = result.metadata.get("shard") or {}
+        unique.setdefault(shard.get("index", f"unsharded-{position}"), result)
+    shards = list(unique.values())
+    shard_meta = [r.metadata.get("shard") or {} for r in shards]
+    counts = {meta.get("count") for meta in shard_meta if meta.get("count")}
+    if len(counts) > 1:
+        raise ValueError(f"shard results come from different shard counts: {counts}")
+    return shards, shard_meta, next(iter(counts), None)
+
+
+def _merged_shard_metadata(
+    shard_meta: list[dict[str, Any]], count: int | None, project_level: bool
+) -> dict[str, Any]:
+    merged_indexes = sorted(m["index"] for m in shard_meta if "index" in m)
+    return {
+        "count": count,
+        "merged": merged_indexes,
+        # One run of a project-level analyzer covers the whole project
+        "missing": []
+        if project_level
+        else sorted(set(range(1, (count or 0) + 1)) - set(merged_indexes)),
+        "strategy": shard_meta[0].get("strategy"),
+        "project_level": project_level,
+    }
+
+
+def merge_shard_results(results: list[AnalysisResult]) -> AnalysisResult:
+    """
+    Combine one analyzer's per-shard results into a single result.
+
+    Shards are identified by ``metadata["shard"]``; a repeated shard index
+    is counted once. Results of non-shardable analyzers are identical on
+    every shard, so only the first is kept.
+    """
+    if not results:
+        raise ValueError("no shard results to merge")
+
+    shards, shard_meta, shard_count = _unique_shards(results)
+    project_level = any(meta.get("shardable") is False for meta in shard_meta)
+    if project_level:
+        shards = shards[:1]
+
+    first = shards[0]
+    merged = AnalysisResult(first.analysis_type, first.script_name, first.target_path)
+    merged.timestamp = min(r.timestamp for r in shards)
+    merged.execution_time = max(r.execution_time for r in shards)
+
+    seen: set[tuple] = set()
+    totals = {severity.value: 0 for severity in Severity}
+    truncated = False
+    for result in shards:
+        for severity, count in result.get_summary().items():
+            totals[severity] = totals.get(severity, 0) + count
+        truncated = truncated or result.severity_counts is not None
+        if not result.success:
+            merged.set_error(
+                "; ".join(filter(None, [merged.error_message, result.error_message]))
+            )
+        for finding in result.findings:
+            key = _finding_key(finding)
+            if key in seen:
+                totals[finding.severity.value] -= 1
+                continue
+            seen.add(key)
+            merged.add_finding(finding)
+
+    for number, finding in enumerate(merged.findings, 1):
+        prefix = re.sub(r"\d+$", "", finding.finding_id) or "F"
+        finding.finding_id = f"{prefix}{number:03d}"
+    if truncated:
+        merged.set_severity_counts(totals)
+
+    merged.metadata = {
+        **first.metadata,
+        "shard": _merged_shard_metadata(shard_meta, shard_count, project_level),
+        "files_processed": sum(
+            r.metadata.get("files_processed", 0) or 0 for r in shards
+        ),
+        "total_findings": sum(totals.values()),
+        "severity_breakdown": totals,
+    }
+    return merged
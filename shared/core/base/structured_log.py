@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Structured, Lazily Evaluated Logging for Continuous Improvement Framework.
+
+PURPOSE: Let hot loops (per-file skips, per-batch progress) log operational
+events as key/value fields at near zero cost when nothing will record them,
+and give debug runs a machine-parseable JSONL event stream.
+
+APPROACH:
+- Callers check the level before any message or field is formatted; an
+  event nobody records returns after one level lookup
+- Fields are plain keyword arguments (or a zero-argument callable returning
+  a dict for expensive details) and are converted to strings only on emit
+- An optional JSONL sink (`CI_LOG_JSONL=<path>`, level `CI_LOG_JSONL_LEVEL`,
+  default DEBUG) receives every event at or above its level, independent of
+  the console logger's level
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Mapping
+from pathlib import Path
+from typing import Any, TextIO
+
+JSONL_PATH_ENV_VAR = "CI_LOG_JSONL"
+JSONL_LEVEL_ENV_VAR = "CI_LOG_JSONL_LEVEL"
+
+Fields = Mapping[str, Any] | Callable[[], Mapping[str, Any]] | None
+
+
+def format_event(event: str, fields: Mapping[str, Any]) -> str:
+    """Render an event for a text log line: ``event (k=v, ...)``."""
+    if not fields:
+        return event
+    detail = ", ".join(f"{key}={value}" for key, value in fields.items())
+    return f"{event} ({detail})"
+
+
+def _json_default(value: Any) -> str:
+    return str(value)
+
+
+class JsonlLogSink:
+    """Append structured events, one JSON object per line, thread-safely."""
+
+    def __init__(self, path: Path | str, level: int = logging.DEBUG):
+        self.path = Path(path)
+        self.level = level
+        self._lock = threading.Lock()
+        self._handle: TextIO | None = None
+
+    def enabled_for(self, level: int) -> bool:
+        return level >= self.level
+
+    def write(
+        self, module: str, level: int, event: str, fields: Mapping[str, Any]
+    ) -> None:
+        record = {
+            "ts": round(time.time(), 6),
+            "module": module,
+            "level": logging.getLevelName(level),
+            "event": event,
+            **fields,
+        }
+        line = json.dumps(record, default=_json_default, ensure_ascii=False)
+        with self._lock:
+            if self._handle is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._handle = self.path.open("a", encoding="utf-8")
+            self._handle.write(line + "\n")
+            self._handle.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+
+
+_sink: JsonlLogSink | None = None
+_sink_resolved = False
+_sink_lock = threading.Lock()
+
+
+def get_log_sink() -> JsonlLogSink | None:
+    """Return the process-wide JSONL sink, configured from the environment once."""
+    global _sink, _sink_resolved
+    if _sink_resolved:
+        return _sink
+    with _sink_lock:
+        if not _sink_resolved:
+            path = os.environ.get(JSONL_PATH_ENV_VAR, "").strip()
+            if path:
+                level_name = os.environ.get(JSONL_LEVEL_ENV_VAR, "DEBUG").upper()
+                level = getattr(logging, level_name, logging.DEBUG)
+                _sink = JsonlLogSink(path, level)
+            _sink_resolved = True
+    return _sink
+
+
+def set_log_sink(sink: JsonlLogSink | None) -> None:
+    """Install (or remove) the JSONL sink, overriding the environment."""
+    global _sink, _sink_resolved
+    with _sink_lock:
+        if _sink is not None and _sink is not sink:
+            _sink.close()
+        _sink = sink
+        _sink_resolved = True
+
+
+class StructuredLogger:
+    """Level-checked key/value event logging over a stdlib logger."""
+
+    __slots__ = ("logger", "module")
+
+    def __init__(self, logger: logging.Logger, module: str):
+        self.logger = logger
+        self.module = module
+
+    def enabled_for(self, level: int) -> bool:
+        """Return True if an event at ``level`` would be recorded anywhere."""
+        if self.logger.isEnabledFor(level):
+            return True
+        sink = get_log_sink()
+        return sink is not None and sink.enabled_for(level)
+
+    def log(
+        self, level: int, event: str, details: Fields = None, **fields: Any
+    ) -> None:
+        """
+        Record ``event`` with key/value fields if anything listens at ``level``.
+
+        ``details`` may be a mapping or a zero-argument callable returning
+        one; it is only called (and fields only formatted) once the level
+        check has passed.
+        """
+        to_logger = self.logger.isEnabledFor(level)
+        sink = get_log_sink()
+        if sink is not None and not sink.enabled_for(level):
+            sink = None
+        if not to_logger and sink is None:
+            return
+
+        if callable(details):
+            details = details()
+        merged: dict[str, Any] = dict(details or {})
+        merged.update(fields)
+        if to_logger:
+            self.logger.log(level, format_event(event, merged))
+        if sink is not None:
+            sink.write(self.module, level, event, merged)
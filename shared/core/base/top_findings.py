@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Bounded Top-K Finding Collection for Continuous Improvement Framework.
+
+PURPOSE: Keep only the most important findings of a summary-mode run while
+still reporting exact per-severity counts, so memory stays bounded no matter
+how many findings analyzers produce.
+
+APPROACH:
+- Findings are ranked by severity, then confidence, then the order they
+  were produced in (earlier wins, matching a stable sort)
+- A heap of size K holds the current best findings; its root is the worst
+  retained finding, so each new finding costs O(log K) at most
+- Severity counts are tallied for every finding seen, kept or not
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+from collections.abc import Iterable
+from typing import Any
+
+# Severity rank, most severe first (matches AnalysisResult.to_dict filtering)
+SEVERITY_ORDER = {"critical": 0, "high": 1, "medium": 2, "low": 3, "info": 4}
+CONFIDENCE_RANK = {"high": 0, "medium": 1, "low": 2}
+# Findings shown by AnalysisResult.to_dict in summary mode
+SUMMARY_TOP_N = 10
+
+# (negated rank, negated arrival sequence, finding); the sequence is unique,
+# so findings themselves are never compared
+_HeapEntry = tuple[tuple[int, int, int], int, dict[str, Any]]
+
+
+def finding_rank(finding: dict[str, Any], order: int = 0) -> tuple[int, int, int]:
+    """Return the sort key of a raw finding (smaller is more important)."""
+    metadata = finding.get("metadata") or {}
+    confidence = metadata.get("confidence") if isinstance(metadata, dict) else ""
+    return (
+        SEVERITY_ORDER.get(finding.get("severity", ""), len(SEVERITY_ORDER)),
+        CONFIDENCE_RANK.get(str(confidence), len(CONFIDENCE_RANK)),
+        order,
+    )
+
+
+class TopFindingsCollector:
+    """Keep the K most important raw findings plus exact severity counts."""
+
+    def __init__(self, k: int):
+        if k <= 0:
+            raise ValueError("k must be positive")
+        self.k = k
+        self.total = 0
+        self.counts = dict.fromkeys(SEVERITY_ORDER, 0)
+        # Entries are negated keys so heap[0] is the worst retained finding
+        self._heap: list[_HeapEntry] = []
+        self._sequence = itertools.count()
+
+    def add(self, finding: dict[str, Any], order: int = 0) -> None:
+        """Count a finding and keep it if it ranks in the current top K."""
+        self.total += 1
+        severity = finding.get("severity", "")
+        if severity in self.counts:
+            self.counts[severity] += 1
+
+        severity_rank, confidence_rank, position = finding_rank(finding, order)
+        entry: _HeapEntry = (
+            (-severity_rank, -confidence_rank, -position),
+            -next(self._sequence),
+            finding,
+        )
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif entry > self._heap[0]:
+            heapq.heapreplace(self._heap, entry)
+
+    def add_all(self, findings: Iterable[dict[str, Any]], order: int = 0) -> None:
+        """Add several findings that share the same production order."""
+        for finding in findings:
+            self.add(finding, order)
+
+    def top(self) -> list[dict[str, Any]]:
+        """Return the retained findings, most important first."""
+        return [entry[2] for entry in sorted(self._heap, reverse=True)]
@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""
+Watch Mode for Continuous Improvement Framework.
+
+PURPOSE: Keep analyzers warm while a developer edits code and report how the
+findings change after every save, without re-running whole analyses.
+
+APPROACH:
+- Discovery runs once; the per-analyzer file set and findings (bucketed by
+  file) stay in memory for the life of the session
+- Change detection uses watchdog (inotify/FSEvents) when installed, else a
+  stat poller that rescans a directory only when its mtime changes, so an
+  idle tick costs one stat per known file and directory
+- Per-file analyzers re-analyze only the changed files; project-level
+  analyzers that support it (``supports_incremental``) update their state
+  for the changed files via ``analyze_incremental``
+- Each update is reported as a diff of findings (added / removed), with the
+  latency from the newest save to the refreshed result
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .workspace_partitions import DEFAULT_SKIP_DIRS
+
+PROJECT_BUCKET = "<project>"
+DEFAULT_INTERVAL_SECONDS = 0.2
+# Editors often write a file in several steps; coalesce them into one update
+DEBOUNCE_SECONDS = 0.05
+
+
+class PollingChangeSource:
+    """Detect added, modified and deleted files by polling ``os.stat``."""
+
+    def __init__(self, root: Path, skip_dirs: Iterable[str] = DEFAULT_SKIP_DIRS):
+        self.root = Path(root)
+        self.skip_dirs = frozenset(skip_dirs)
+        self._dirs: dict[Path, int] = {}
+        self._files: dict[Path, tuple[int, int]] = {}
+        self._walk(self.root, set())
+
+    def _walk(self, top: Path, added: set[Path]) -> None:
+        for dirpath, dirnames, filenames in os.walk(top):
+            dirnames[:] = [d for d in dirnames if d not in self.skip_dirs]
+            directory = Path(dirpath)
+            with contextlib.suppress(OSError):
+                self._dirs[directory] = os.stat(directory).st_mtime_ns
+            for filename in filenames:
+                path = directory / filename
+                if path not in self._files and self._track(path):
+                    added.add(path)
+
+    def _track(self, path: Path) -> bool:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        self._files[path] = (stat.st_mtime_ns, stat.st_size)
+        return True
+
+    def _forget_dir(self, directory: Path, removed: set[Path]) -> None:
+        for path in [d for d in self._dirs if d == directory or directory in d.parents]:
+            del self._dirs[path]
+        for path in [f for f in self._files if directory in f.parents]:
+            del self._files[path]
+            removed.add(path)
+
+    def poll(self) -> tuple[set[Path], set[Path]]:
+        """Return ``(changed, removed)`` files since the previous poll."""
+        changed: set[Path] = set()
+        removed: set[Path] = set()
+        self._rescan_dirs(changed, removed)
+        self._restat_files(changed, removed)
+        return changed, removed
+
+    def _rescan_dirs(self, changed: set[Path], removed: set[Path]) -> None:
+        """Pick up new entries of directories whose mtime moved."""
+        for directory, mtime in list(self._dirs.items()):
+            if directory not in self._dirs:
+                continue
+            try:
+                dir_mtime = os.stat(directory).st_mtime_ns
+            except OSError:
+                self._forget_dir(directory, removed)
+                continue
+            if dir_mtime != mtime:
+                # Entries were added, removed or renamed in this directory
+                self._dirs[directory] = dir_mtime
+                self._scan_entries(directory, changed)
+
+    def _scan_entries(self, directory: Path, changed: set[Path]) -> None:
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            return
+        for entry in entries:
+            path = Path(entry.path)
+            if entry.is_dir(follow_symlinks=False):
+                if path not in self._dirs and entry.name not in self.skip_dirs:
+                    self._walk(path, changed)
+            elif path not in self._files and self._track(path):
+                changed.add(path)
+
+    def _restat_files(self, changed: set[Path], removed: set[Path]) -> None:
+        """Report known files that were modified or deleted."""
+        for path, previous in list(self._files.items()):
+            if path in changed:
+                continue
+            try:
+                stat = os.stat(path)
+            except OSError:
+                del self._files[path]
+                removed.add(path)
+                continue
+            signature = (stat.st_mtime_ns, stat.st_size)
+            if signature != previous:
+                self._files[path] = signature
+                changed.add(path)
+
+    def close(self) -> None:
+        pass
+
+
+class WatchdogChangeSource:
+    """Collect file system events from watchdog (inotify, FSEvents, ...)."""
+
+    def __init__(self, root: Path, skip_dirs: Iterable[str] = DEFAULT_SKIP_DIRS):
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+
+        self.root = Path(root)
+        self.skip_dirs = frozenset(skip_dirs)
+        self._lock = threading.Lock()
+        self._touched: set[Path] = set()
+        source: WatchdogChangeSource = self
+
+        class _Handler(FileSystemEventHandler):
+            def on_any_event(self, event: Any) -> None:
+                if event.is_directory:
+                    return
+                paths = [event.src_path, getattr(event, "dest_path", "")]
+                with source._lock:
+                    for raw in filter(None, paths):
+                        path = Path(os.fsdecode(raw))
+                        if not source.skip_dirs.intersection(path.parts):
+                            source._touched.add(path)
+
+        self._observer: Any = Observer()
+        self._observer.schedule(_Handler(), str(self.root), recursive=True)
+        self._observer.start()
+
+    def poll(self) -> tuple[set[Path], set[Path]]:
+        with self._lock:
+            touched, self._touched = self._touched, set()
+        # Classify by what is on disk now; events may arrive out of order
+        changed = {path for path in touched if path.is_file()}
+        return changed, touched - changed
+
+    def close(self) -> None:
+        self._observer.stop()
+        self._observer.join(timeout=2)
+
+
+def create_change_source(
+    root: Path, use_polling: bool = False
+) -> PollingChangeSource | WatchdogChangeSource:
+    """Return a watchdog-backed source when available, else a stat poller."""
+    if not use_polling:
+        try:
+            return WatchdogChangeSource(root)
+        except (ImportError, OSError):
+            pass
+    return PollingChangeSource(root)
+
+
+def finding_key(tool: str, finding: dict[str, Any]) -> tuple:
+    return (
+        tool,
+        str(finding.get("file_path") or ""),
+        finding.get("line_number"),
+        finding.get("title", ""),
+        finding.get("severity", ""),
+    )
+
+
+@dataclass
+class WatchUpdate:
+    """Files that changed and how the findings moved as a result."""
+
+    changed: list[str]
+    removed: list[str]
+    added_findings: list[tuple[str, dict[str, Any]]] = field(default_factory=list)
+    removed_findings: list[tuple[str, dict[str, Any]]] = field(default_factory=list)
+    analysis_seconds: float = 0.0
+    latency_seconds: float | None = None
+    total_findings: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        def entries(pairs: list[tuple[str, dict[str, Any]]]) -> list[dict[str, Any]]:
+            return [{"tool": tool, **finding} for tool, finding in pairs]
+
+        return {
+            "changed": self.changed,
+            "removed": self.removed,
+            "added_findings": entries(self.added_findings),
+            "removed_findings": entries(self.removed_findings),
+            "analysis_ms": round(self.analysis_seconds * 1000, 1),
+            "latency_ms": None
+            if self.latency_seconds is None
+            else round(self.latency_seconds * 1000, 1),
+            "total_findings": self.total_findings,
+        }
+
+
+class WatchSession:
+    """
+    In-memory analysis state for a watched target.
+
+    ``analyzers`` maps registry keys to configured analyzer instances. Each
+    must be per-file (``shardable``) or support incremental updates.
+    """
+
+    def __init__(self, target: Path | str, analyzers: dict[str, Any]):
+        self.root = Path(target)
+        unsupported = [key for key, a in analyzers.items() if not watchable(a)]
+        if unsupported:
+            raise ValueError(
+                f"analyzers cannot run in watch mode: {', '.join(unsupported)}"
+            )
+        self.analyzers = analyzers
+        self._files: dict[str, set[Path]] = {key: set() for key in analyzers}
+        self._findings: dict[str, dict[str, list[dict[str, Any]]]] = {
+            key: {} for key in analyzers
+        }
+
+    def start(self) -> list[tuple[str, dict[str, Any]]]:
+        """Discover files, run the initial analysis and return all findings."""
+        for key, analyzer in self.analyzers.items():
+            if analyzer.supports_incremental:
+                self._findings[key] = {
+                    PROJECT_BUCKET: analyzer.analyze_incremental(
+                        self.root, set(), set()
+                    )
+                }
+                continue
+            files = analyzer.scan_directory(str(self.root))
+            self._files[key] = set(files)
+            self._findings[key] = {str(path): [] for path in files}
+            self._store(key, files, analyzer.analyze_files(files))
+        return self.findings()
+
+    def findings(self) -> list[tuple[str, dict[str, Any]]]:
+        return [
+            (key, finding)
+            for key, buckets in self._findings.items()
+            for bucket in buckets.values()
+            for finding in bucket
+        ]
+
+    def _store(
+        self, key: str, files: Iterable[Path], findings: list[dict[str, Any]]
+    ) -> None:
+        buckets = self._findings[key]
+        for path in files:
+            buckets[str(path)] = []
+        for finding in findings:
+            buckets.setdefault(str(finding.get("file_path") or ""), []).append(finding)
+
+    def apply(self, changed: set[Path], removed: set[Path]) -> WatchUpdate:
+        """Re-analyze what ``changed``/``removed`` affect and diff the findings."""
+        started = time.perf_counter()
+        before = Counter(finding_key(k, f) for k, f in self.findings())
+        previous = {finding_key(k, f): (k, f) for k, f in self.findings()}
+
+        for key, analyzer in self.analyzers.items():
+            for path in changed | removed:
+                analyzer.forget_file(path)
+            if analyzer.supports_incremental:
+                self._findings[key] = {
+                    PROJECT_BUCKET: analyzer.analyze_incremental(
+                        self.root, changed, removed
+                    )
+                }
+                continue
+
+            known = self._files[key]
+            buckets = self._findings[key]
+            for path in removed | {p for p in changed if p in known}:
+                buckets.pop(str(path), None)
+                known.discard(path)
+            targets = [path for path in changed if analyzer.should_scan_file(path)]
+            if targets:
+                known.update(targets)
+                self._store(key, targets, analyzer.analyze_files(targets))
+
+        after_pairs = self.findings()
+        after = Counter(finding_key(k, f) for k, f in after_pairs)
+        current = {finding_key(k, f): (k, f) for k, f in after_pairs}
+        update = WatchUpdate(
+            changed=sorted(map(str, changed)),
+            removed=sorted(map(str, removed)),
+            added_findings=[current[k] for k in (after - before).elements()],
+            removed_findings=[previous[k] for k in (before - after).elements()],
+            analysis_seconds=time.perf_counter() - started,
+            total_findings=len(after_pairs),
+        )
+        saved = [mtime for mtime in map(_mtime, changed) if mtime is not None]
+        if saved:
+            update.latency_seconds = max(0.0, time.time() - max(saved))
+        return update
+
+
+def watchable(analyzer: Any) -> bool:
+    """Return True if ``analyzer`` can be kept up to date file by file."""
+    return bool(
+        getattr(analyzer, "supports_incremental", False)
+        or getattr(analyzer, "shardable", True)
+    )
+
+
+def _mtime(path: Path) -> float | None:
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return None
+
+
+def run_watch(
+    session: WatchSession,
+    source: Any,
+    on_update: Callable[[WatchUpdate], None],
+    interval: float = DEFAULT_INTERVAL_SECONDS,
+    should_stop: Callable[[], bool] = lambda: False,
+) -> None:
+    """Poll ``source`` until ``should_stop`` and report each non-empty update."""
+    while not should_stop():
+        changed, removed = source.poll()
+        if changed or removed:
+            time.sleep(DEBOUNCE_SECONDS)
+            more_changed, more_removed = source.poll()
+            changed = (changed | more_changed) - more_removed
+            removed = (removed | more_removed) - more_changed
+            on_update(session.apply(changed, removed))
+        else:
+            time.sleep(interval)
+
+
+def format_update(update: WatchUpdate) -> list[str]:
+    """Render an update as a findings diff for the console."""
+    touched = len(update.changed) + len(update.removed)
+    latency = (
+        f", {update.latency_seconds * 1000:.0f} ms after save"
+        if update.latency_seconds is not None
+        else ""
+    )
+    lines = [
+        f"[{time.strftime('%H:%M:%S')}] {touched} file(s) changed: "
+        f"+{len(update.added_findings)} -{len(update.removed_findings)} findings "
+        f"({update.total_findings} total; analyzed in "
+        f"{update.analysis_seconds * 1000:.0f} ms{latency})"
+    ]
+    for sign, pairs in (("+", update.added_findings), ("-", update.removed_findings)):
+        for tool, finding in pairs:
+            location = finding.get("file_path") or ""
+            if finding.get("line_number"):
+                location = f"{location}:{finding['line_number']}"
+            lines.append(
+                f"  {sign} {finding.get('severity', 'info'):<8} {location}  "
+                f"{finding.get('title', '')} [{tool}]"
+            )
+    return lines
@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+Workspace Partitioning for Continuous Improvement Framework.
+
+PURPOSE: Split a monorepo into subprojects so analyzers run per package in
+parallel, each package's result is cached on its own, and a change in one
+package only re-analyzes that package.
+
+APPROACH:
+- A directory holding a manifest marker (package.json, pyproject.toml,
+  Cargo.toml, go.mod, ...) is a partition root; the workspace root is always
+  a partition and owns files outside every subproject
+- Each partition excludes the partitions nested inside it, so every file
+  belongs to exactly one partition
+- A partition's fingerprint hashes the path, size and mtime of its files;
+  its cached result is reused while the fingerprint, the analyzer source
+  and the analyzer config are unchanged
+- Partitions run on a thread pool (analyzers are independent objects and
+  the heavy ones shell out to external tools), and results merge into one
+  result with every finding tagged by partition
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import hashlib
+import inspect
+import json
+import os
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from core.utils.output_formatter import AnalysisResult, AnalysisType, Severity
+
+from .content_cache import resolve_cache_root
+from .fs_utils import atomic_write
+
+MANIFEST_MARKERS = (
+    "package.json",
+    "pyproject.toml",
+    "setup.py",
+    "Cargo.toml",
+    "go.mod",
+    "pom.xml",
+    "build.gradle",
+    "build.gradle.kts",
+    "composer.json",
+    "Gemfile",
+    "*.csproj",
+)
+
+DEFAULT_SKIP_DIRS = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".svn",
+        ".cache",
+        ".venv",
+        "venv",
+        "env",
+        "node_modules",
+        "__pycache__",
+        ".pytest_cache",
+        ".mypy_cache",
+        ".tox",
+        "dist",
+        "build",
+        "target",
+        "vendor",
+        "coverage",
+        ".next",
+        ".nuxt",
+    }
+)
+
+ROOT_PARTITION = "."
+PARTITION_CACHE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class Partition:
+    """A subproject: its path relative to the workspace root and nested partitions."""
+
+    name: str
+    root: Path
+    markers: tuple[str, ...] = ()
+    children: tuple[str, ...] = ()
+
+    def exclude_globs(self) -> set[str]:
+        """Globs (relative to this partition's root) covering nested partitions."""
+        return {f"{child}/*" for child in self.children}
+
+
+def _walk(root: Path, skip_dirs: frozenset[str]) -> Iterator[tuple[str, list, list]]:
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in skip_dirs)
+        yield dirpath, dirnames, filenames
+
+
+def _matching_markers(
+    filenames: Iterable[str], markers: Iterable[str]
+) -> tuple[str, ...]:
+    names = set(filenames)
+    found = []
+    for marker in markers:
+        if any(c in marker for c in "*?["):
+            found.extend(sorted(fnmatch.filter(names, marker)))
+        elif marker in names:
+            found.append(marker)
+    return tuple(found)
+
+
+def detect_partitions(
+    workspace_root: Path | str,
+    markers: Iterable[str] = MANIFEST_MARKERS,
+    skip_dirs: Iterable[str] = DEFAULT_SKIP_DIRS,
+) -> list[Partition]:
+    """
+    Return the workspace partitions, root first, then by path.
+
+    Every directory below ``workspace_root`` holding a manifest marker is a
+    partition; ``skip_dirs`` are never descended into.
+    """
+    root = Path(workspace_root)
+    markers = tuple(markers)
+    skip = frozenset(skip_dirs)
+
+    found: dict[str, tuple[str, ...]] = {}
+    for dirpath, _dirnames, filenames in _walk(root, skip):
+        relative = Path(dirpath).relative_to(root).as_posix()
+        matched = _matching_markers(filenames, markers)
+        if matched or relative == ROOT_PARTITION:
+            found[relative] = matched
+
+    names = sorted(found, key=lambda name: (name != ROOT_PARTITION, name))
+    children: dict[str, list[str]] = {name: [] for name in names}
+    for name in names[1:]:
+        parent = _nearest_parent(name, found)
+        prefix = "" if parent == ROOT_PARTITION else f"{parent}/"
+        children[parent].append(name[len(prefix) :])
+
+    return [
+        Partition(
+            name=name,
+            root=root if name == ROOT_PARTITION else root / name,
+            markers=found[name],
+            children=tuple(children[name]),
+        )
+        for name in names
+    ]
+
+
+def _nearest_parent(name: str, partitions: dict[str, Any]) -> str:
+    parent = Path(name).parent
+    while parent.as_posix() != ROOT_PARTITION:
+        if parent.as_posix() in partitions:
+            return parent.as_posix()
+        parent = parent.parent
+    return ROOT_PARTITION
+
+
+def partition_fingerprint(
+    partition: Partition, skip_dirs: Iterable[str] = DEFAULT_SKIP_DIRS
+) -> str:
+    """Hash the path, size and mtime of every file the partition owns."""
+    skip = frozenset(skip_dirs)
+    nested = {partition.root / child for child in partition.children}
+    digest = hashlib.sha1(usedforsecurity=False)
+    for dirpath, dirnames, filenames in _walk(partition.root, skip):
+        current = Path(dirpath)
+        dirnames[:] = [d for d in dirnames if current / d not in nested]
+        for filename in sorted(filenames):
+            path = current / filename
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            relative = path.relative_to(partition.root).as_posix()
+            digest.update(f"{relative}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def config_signature(config: Any) -> dict[str, Any]:
+    """Return the analyzer config fields that change what a run reports."""
+    return {
+        "min_severity": config.min_severity,
+        "severity_pushdown": config.severity_pushdown,
+        "summary_mode": config.summary_mode,
+        "max_files": config.max_files,
+        "max_file_size_mb": config.max_file_size_mb,
+        "chunked_scan": config.chunked_scan,
+        "code_extensions": sorted(config.code_extensions),
+        "skip_patterns": sorted(config.skip_patterns),
+        "exclude_globs": sorted(config.exclude_globs),
+        "gitignore_patterns": list(config.gitignore_patterns),
+    }
+
+
+def _source_stamp(analyzer_cls: type) -> str:
+    try:
+        source = Path(inspect.getfile(analyzer_cls))
+        stat = source.stat()
+    except (OSError, TypeError):
+        return analyzer_cls.__qualname__
+    return f"{analyzer_cls.__module__}.{analyzer_cls.__qualname__}:{stat.st_mtime_ns}"
+
+
+class PartitionResultCache:
+    """Per-partition analyzer results on disk, keyed by tool, partition and config."""
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+        self.stats = {"hits": 0, "misses": 0}
+
+    @classmethod
+    def for_workspace(
+        cls, workspace_root: Path | str, cache_dir: Path | str | None = None
+    ) -> PartitionResultCache:
+        """Use ``partitions/`` under the shared cache root (see resolve_cache_root)."""
+        return cls(resolve_cache_root(workspace_root, cache_dir) / "partitions")
+
+    @staticmethod
+    def cache_key(
+        tool: str, partition: Partition, analyzer_cls: type, config: Any
+    ) -> str:
+        material = json.dumps(
+            [
+                PARTITION_CACHE_VERSION,
+                tool,
+                partition.name,
+                _source_stamp(analyzer_cls),
+                config_signature(config),
+            ],
+            sort_keys=True,
+        )
+        return hashlib.sha1(material.encode(), usedforsecurity=False).hexdigest()
+
+    def get(self, key: str, fingerprint: str) -> AnalysisResult | None:
+        path = self.cache_dir / f"{key}.json"
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+            if entry.get("fingerprint") == fingerprint:
+                self.stats["hits"] += 1
+                return AnalysisResult.from_dict(entry["result"])
+        except (OSError, ValueError, KeyError):
+            pass
+        self.stats["misses"] += 1
+        return None
+
+    def put(self, key: str, fingerprint: str, result: AnalysisResult) -> None:
+        entry = {"fingerprint": fingerprint, "result": result.to_dict()}
+        try:
+            with atomic_write(self.cache_dir / f"{key}.json") as handle:
+                handle.write(json.dumps(entry))
+        except OSError:
+            # Best effort: the partition is simply re-analyzed next time
+            pass
+
+
+@dataclass
+class PartitionOutcome:
+    """One partition's result and whether it came from the cache."""
+
+    partition: Partition
+    result: AnalysisResult
+    cached: bool = False
+    duration: float = 0.0
+    fingerprint: str = field(default="", repr=False)
+
+
+def run_partitioned(
+    tool: str,
+    partitions: list[Partition],
+    make_config: Callable[[Partition], Any],
+    registry: Any,
+    jobs: int = 0,
+    cache: PartitionResultCache | None = None,
+) -> list[PartitionOutcome]:
+    """
+    Run ``tool`` once per partition on a thread pool, reusing cached results.
+
+    ``make_config`` builds the AnalyzerConfig for a partition (target path,
+    exclusions); ``registry`` creates analyzers by key. Outcomes keep the
+    order of ``partitions``. An analyzer exception fails only its partition.
+    """
+    analyzer_cls = registry.get(tool)
+
+    def run_one(partition: Partition) -> PartitionOutcome:
+        started = time.time()
+        config = make_config(partition)
+        key = fingerprint = ""
+        if cache is not None:
+            key = cache.cache_key(tool, partition, analyzer_cls, config)
+            fingerprint = partition_fingerprint(partition)
+            cached = cache.get(key, fingerprint)
+            if cached is not None:
+                return PartitionOutcome(partition, cached, True, 0.0, fingerprint)
+
+        try:
+            result = registry.create(tool, config=config).analyze(str(partition.root))
+        except Exception as exc:
+            result = AnalysisResult(
+                AnalysisType.CODE_QUALITY, f"{tool}.py", str(partition.root)
+            )
+            result.set_error(f"Analyzer failed: {exc}")
+        if cache is not None and result.success:
+            cache.put(key, fingerprint, result)
+        return PartitionOutcome(
+            partition, result, False, time.time() - started, fingerprint
+        )
+
+    workers = jobs if jobs > 0 else min(8, os.cpu_count() or 1)
+    if workers == 1 or len(partitions) == 1:
+        return [run_one(partition) for partition in partitions]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(run_one, partitions))
+
+
+def merge_partition_results(
+    outcomes: list[PartitionOutcome], target_path: str
+) -> AnalysisResult:
+    """
+    Combine per-partition results into one, tagging findings with their partition.
+
+    Finding ids outside the root partition are prefixed with the partition
+    name so they stay unique; severity counts are summed across partitions.
+    """
+    template = next(
+        (o.result for o in outcomes if o.result.success),
+        outcomes[0].result if outcomes else None,
+    )
+    merged = AnalysisResult(
+        template.analysis_type if template else AnalysisType.CODE_QUALITY,
+        template.script_name if template else "partitioned",
+        target_path,
+    )
+
+    counts = {severity.value: 0 for severity in Severity}
+    truncated = False
+    errors: list[str] = []
+    files_processed = 0
+    summaries: list[dict[str, Any]] = []
+    for outcome in outcomes:
+        name = outcome.partition.name
+        result = outcome.result
+        for finding in result.findings:
+            finding.evidence = {**finding.evidence, "partition": name}
+            if name != ROOT_PARTITION:
+                finding.finding_id = f"{name}:{finding.finding_id}"
+            merged.add_finding(finding)
+
+        summary = result.get_summary()
+        for severity, count in summary.items():
+            counts[severity] = counts.get(severity, 0) + count
+        truncated = truncated or result.severity_counts is not None
+        if not result.success:
+            errors.append(f"{name}: {result.error_message}")
+        partition_files = result.metadata.get("files_processed", 0) or 0
+        files_processed += partition_files
+        summaries.append(
+            {
+                "name": name,
+                "markers": list(outcome.partition.markers),
+                "cached": outcome.cached,
+                "success": result.success,
+                "findings": sum(summary.values()),
+                "files_processed": partition_files,
+                "execution_time": round(result.execution_time, 3),
+            }
+        )
+
+    if truncated:
+        merged.set_severity_counts(counts)
+    if errors:
+        merged.set_error("; ".join(errors))
+    merged.metadata = {
+        "partitioned": True,
+        "partition_count": len(outcomes),
+        "partitions_cached": sum(1 for o in outcomes if o.cached),
+        "partitions_analyzed": sum(1 for o in outcomes if not o.cached),
+        "files_processed": files_processed,
+        "total_findings": sum(counts.values()),
+        "severity_breakdown": counts,
+        "partitions": summaries,
+    }
+    return merged
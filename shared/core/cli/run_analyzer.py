@@ -55,6 +55,41 @@ def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         action="store_true",
         help="Summary mode (limit output to most important findings)",
     )
+    parser.add_argument(
+        "--chunked-scan",
+        action="store_true",
+        help="Scan files over the size cap in windows instead of skipping them",
+    )
+    parser.add_argument(
+        "--shard",
+        metavar="I/N",
+        help="Analyze only shard I of N (1-based); merge shard outputs afterwards",
+    )
+    parser.add_argument(
+        "--shard-strategy",
+        choices=["hash", "size"],
+        default="hash",
+        help="Assign files to shards by path hash or by balanced file size",
+    )
+    parser.add_argument(
+        "--result-cache",
+        action="store_true",
+        help="Reuse per-file results from the content-addressed cache",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="Shared cache directory (default: $CI_CACHE_DIR or .cache/ci-framework)",
+    )
+    parser.add_argument(
+        "--resource-usage",
+        action="store_true",
+        help="Record peak RSS and files/bytes processed in result metadata",
+    )
+    parser.add_argument(
+        "--memory-profile",
+        action="store_true",
+        help="Also record tracemalloc peak and top allocation sites (slower)",
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -73,6 +108,15 @@ def main(argv: list[str] | None = None) -> int:
             min_severity=args.min_severity,
             summary_mode=args.summary,
             output_format=args.output_format,
+            # Output is filtered to min_severity anyway; let analyzers skip the rest
+            severity_pushdown=True,
+            chunked_scan=args.chunked_scan,
+            shard=args.shard,
+            shard_strategy=args.shard_strategy,
+            result_cache=args.result_cache,
+            cache_dir=args.cache_dir,
+            resource_accounting=args.resource_usage,
+            memory_profile=args.memory_profile,
         )
 
         analyzer = AnalyzerRegistry.create(args.analyzer, config=cfg)
@@ -12,6 +12,8 @@ from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
+from core.config.pattern_packs import load_config_json
+
 
 class ConfigError(Exception):
     """Raised when configuration files are invalid."""
@@ -31,7 +33,7 @@ def load_json_config(path: Path, required_top_keys: Iterable[str]) -> dict[str,
     if not path.exists():
         raise ConfigError(f"Config file not found: {path}")
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = load_config_json(path)
     except json.JSONDecodeError as e:
         raise ConfigError(f"Invalid JSON in {path}: {e}") from e
 
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+Pattern Pack Build Step for Continuous Improvement Framework.
+
+PURPOSE: Validate, normalize and precompile every shipped config pack once,
+then let analyzers load the result at startup instead of re-reading,
+re-validating and re-compiling the same JSON/regex sources per run.
+
+APPROACH:
+- The config tree (error, scalability, security, tech stack and formatter
+  packs) is hashed together with the pack format version; the artifact
+  under the user cache dir records that digest plus a stat manifest (path,
+  size, mtime) of every source
+- Building parses every source, checks `schema_version`, compiles every
+  regex-bearing field and fails with the offending file and pattern
+- Loading stats the sources and reads the artifact, memoized per process;
+  sources are only re-hashed when the manifest differs, and the artifact is
+  rebuilt only when the digest differs too
+- Compiled regex objects are memoized per process via `compiled_regex`
+  since `re.Pattern` objects cannot be persisted
+
+USAGE:
+    python -m core.config.pattern_packs --build
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import hashlib
+import json
+import logging
+import os
+import re
+import sys
+import tomllib
+from collections.abc import Iterator
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from core.base.fs_utils import atomic_write
+
+logger = logging.getLogger(__name__)
+
+PATTERN_PACK_FORMAT_VERSION = 1
+DEFAULT_CONFIG_ROOT = Path(__file__).resolve().parents[2] / "config"
+
+# pack name -> (directory relative to the config root, glob)
+PACK_SOURCES: dict[str, tuple[str, str]] = {
+    "error": ("patterns/error", "*.json"),
+    "scalability": ("patterns/scalability", "*.json"),
+    "security": ("security", "*.json"),
+    "tech_stacks": ("tech_stacks", "*.json"),
+    "formatters": ("formatters", "*"),
+}
+
+# Packs whose sources are framework configs (and so carry a schema_version)
+_VERSIONED_PACKS = {"error", "scalability", "security", "tech_stacks"}
+
+# List fields holding regular expressions, per pack
+_REGEX_FIELDS: dict[str, frozenset[str]] = {
+    "error": frozenset({"patterns"}),
+    "scalability": frozenset({"indicators"}),
+}
+
+
+# Keys every artifact payload carries (see build_pattern_packs)
+_PAYLOAD_KEYS = frozenset({"digest", "packs", "files", "regex_count"})
+
+
+class PatternPackError(RuntimeError):
+    """Raised when a config pack fails validation during the build step."""
+
+
+@dataclass(frozen=True)
+class PatternPacks:
+    """Validated, normalized config packs for one config root."""
+
+    digest: str
+    config_root: Path
+    packs: dict[str, list[str]]
+    files: dict[str, Any]
+    regex_count: int
+
+    def get(self, relative_path: str) -> Any:
+        """Return a copy of the parsed config stored at a config-root-relative path."""
+        return copy.deepcopy(self.files[relative_path])
+
+    def for_path(self, path: Path) -> Any | None:
+        """Return a copy of the parsed config for an absolute path, or None if not packed."""
+        try:
+            relative = Path(path).resolve().relative_to(self.config_root).as_posix()
+        except ValueError:
+            return None
+        if relative not in self.files:
+            return None
+        return self.get(relative)
+
+
+def default_pack_cache_dir() -> Path:
+    """Return the directory where pattern pack artifacts are stored."""
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "ci-framework" / "pattern-packs"
+
+
+def _source_files(config_root: Path) -> Iterator[tuple[str, str, Path]]:
+    """Yield (pack, relative path, absolute path) for every pack source, sorted."""
+    for pack, (directory, glob) in PACK_SOURCES.items():
+        for path in sorted((config_root / directory).glob(glob)):
+            if path.is_file():
+                yield pack, path.relative_to(config_root).as_posix(), path
+
+
+def config_digest(config_root: Path = DEFAULT_CONFIG_ROOT) -> str:
+    """Hash the pack format version plus every pack source path and content."""
+    digest = hashlib.sha256(f"pattern-packs:{PATTERN_PACK_FORMAT_VERSION}".encode())
+    for _, relative, path in _source_files(config_root):
+        digest.update(relative.encode("utf-8") + b"\0")
+        digest.update(path.read_bytes() + b"\0")
+    return digest.hexdigest()
+
+
+def stat_manifest(config_root: Path = DEFAULT_CONFIG_ROOT) -> list[list[Any]]:
+    """Return ``[relative path, size, mtime_ns]`` for every pack source, sorted."""
+    manifest: list[list[Any]] = []
+    for _, relative, path in _source_files(config_root):
+        stat = path.stat()
+        manifest.append([relative, stat.st_size, stat.st_mtime_ns])
+    return manifest
+
+
+def _artifact_path(config_root: Path, cache_dir: Path | None) -> Path:
+    root_key = hashlib.sha256(str(config_root).encode("utf-8")).hexdigest()[:16]
+    return (cache_dir or default_pack_cache_dir()) / (
+        f"pattern-packs-v{PATTERN_PACK_FORMAT_VERSION}-{root_key}.json"
+    )
+
+
+def _read_artifact(artifact: Path) -> dict[str, Any] | None:
+    try:
+        payload = json.loads(artifact.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict):
+        return None
+    if payload.get("format_version") != PATTERN_PACK_FORMAT_VERSION:
+        return None
+    if not payload.keys() >= _PAYLOAD_KEYS:
+        return None
+    return payload
+
+
+def _write_artifact(artifact: Path, payload: dict[str, Any]) -> None:
+    try:
+        with atomic_write(artifact) as handle:
+            handle.write(json.dumps(payload, default=str))
+    except OSError as e:
+        logger.debug("Pattern pack artifact not persisted (%s)", e)
+
+
+def _parse_source(relative: str, path: Path) -> Any:
+    text = path.read_text(encoding="utf-8")
+    try:
+        if path.suffix == ".json":
+            return json.loads(text)
+        if path.suffix == ".toml":
+            return tomllib.loads(text)
+    except (ValueError, tomllib.TOMLDecodeError) as e:
+        raise PatternPackError(f"Invalid config {relative}: {e}") from e
+    return text
+
+
+def _iter_regex_fields(data: Any, fields: frozenset[str]) -> Iterator[str]:
+    """Yield every string in a list stored under one of ``fields``, at any depth."""
+    if isinstance(data, dict):
+        for key, value in data.items():
+            if key in fields and isinstance(value, list):
+                yield from (item for item in value if isinstance(item, str))
+            else:
+                yield from _iter_regex_fields(value, fields)
+    elif isinstance(data, list):
+        for item in data:
+            yield from _iter_regex_fields(item, fields)
+
+
+def build_pattern_packs(config_root: Path = DEFAULT_CONFIG_ROOT) -> dict[str, Any]:
+    """
+    Validate and normalize every pack source under ``config_root``.
+
+    Returns
+    -------
+        JSON-serializable artifact payload (format version, digest, pack
+        membership, parsed files and regex count).
+
+    Raises
+    ------
+        PatternPackError: if a source does not parse, lacks a schema_version,
+        or contains a regex that does not compile.
+    """
+    config_root = Path(config_root).resolve()
+    packs: dict[str, list[str]] = {pack: [] for pack in PACK_SOURCES}
+    files: dict[str, Any] = {}
+    regex_count = 0
+
+    for pack, relative, path in _source_files(config_root):
+        data = _parse_source(relative, path)
+        if pack in _VERSIONED_PACKS and (
+            not isinstance(data, dict) or "schema_version" not in data
+        ):
+            raise PatternPackError(f"Config {relative} is missing schema_version")
+
+        for pattern in _iter_regex_fields(data, _REGEX_FIELDS.get(pack, frozenset())):
+            try:
+                compiled_regex(pattern, re.MULTILINE | re.IGNORECASE)
+            except re.error as e:
+                raise PatternPackError(
+                    f"Invalid regex in {relative}: {pattern!r}: {e}"
+                ) from e
+            regex_count += 1
+
+        packs[pack].append(relative)
+        files[relative] = data
+
+    return {
+        "format_version": PATTERN_PACK_FORMAT_VERSION,
+        "digest": config_digest(config_root),
+        "packs": packs,
+        "files": files,
+        "regex_count": regex_count,
+    }
+
+
+def _from_payload(payload: dict[str, Any], config_root: Path) -> PatternPacks:
+    return PatternPacks(
+        digest=payload["digest"],
+        config_root=config_root,
+        packs=payload["packs"],
+        files=payload["files"],
+        regex_count=payload["regex_count"],
+    )
+
+
+def load_pattern_packs(
+    config_root: Path = DEFAULT_CONFIG_ROOT, cache_dir: Path | None = None
+) -> PatternPacks:
+    """
+    Load the pack artifact for ``config_root``, building it when stale.
+
+    An artifact whose stat manifest matches the sources is used as is; on a
+    manifest mismatch the sources are re-hashed, and only a digest change
+    triggers a rebuild. The artifact is written atomically; an unwritable
+    cache dir only costs a rebuild on the next process start.
+    """
+    config_root = Path(config_root).resolve()
+    artifact = _artifact_path(config_root, cache_dir)
+    manifest = stat_manifest(config_root)
+    payload = _read_artifact(artifact)
+    if payload is not None:
+        if payload.get("manifest") == manifest:
+            return _from_payload(payload, config_root)
+        # Touched but possibly unchanged sources (e.g. a fresh checkout)
+        if payload["digest"] == config_digest(config_root):
+            payload["manifest"] = manifest
+            _write_artifact(artifact, payload)
+            return _from_payload(payload, config_root)
+
+    payload = build_pattern_packs(config_root)
+    payload["manifest"] = manifest
+    _write_artifact(artifact, payload)
+    return _from_payload(payload, config_root)
+
+
+@lru_cache(maxsize=1)
+def default_pattern_packs() -> PatternPacks | None:
+    """
+    Return the packs for the shipped config root, loaded once per process.
+
+    Returns None (after logging) when the packs fail validation so that each
+    analyzer's own loader reports the problem in its usual terms.
+    """
+    try:
+        return load_pattern_packs()
+    except (OSError, PatternPackError) as e:
+        logger.warning("Pattern packs unavailable, reading configs directly: %s", e)
+        return None
+
+
+def load_config_json(path: Path) -> Any:
+    """
+    Return parsed JSON for a config file.
+
+    Files under the shipped config root are served from the pattern pack;
+    anything else (including paths redirected by tests) is read from disk.
+
+    Raises
+    ------
+        FileNotFoundError, json.JSONDecodeError: as for reading the file directly.
+    """
+    path = Path(path)
+    packs = default_pattern_packs()
+    if packs is not None:
+        data = packs.for_path(path)
+        if data is not None:
+            return data
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+@lru_cache(maxsize=4096)
+def compiled_regex(pattern: str, flags: int = 0) -> re.Pattern:
+    """Compile a regex once per process (raises re.error like re.compile)."""
+    return re.compile(pattern, flags)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Validate and precompile config pattern packs"
+    )
+    parser.add_argument(
+        "--build", action="store_true", help="Build (or refresh) the pack artifact"
+    )
+    parser.add_argument("--config-root", type=Path, default=DEFAULT_CONFIG_ROOT)
+    parser.add_argument("--cache-dir", type=Path, default=None)
+    args = parser.parse_args(argv)
+
+    try:
+        if args.build:
+            packs = load_pattern_packs(args.config_root, args.cache_dir)
+        else:
+            payload = build_pattern_packs(args.config_root)
+            packs = _from_payload(payload, Path(args.config_root).resolve())
+    except PatternPackError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+
+    print(
+        f"pattern packs {packs.digest[:12]}: {len(packs.files)} files,"
+        f" {packs.regex_count} regexes"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
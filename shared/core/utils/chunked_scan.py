@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Chunked File Scanning for Continuous Improvement Framework.
+
+PURPOSE: Let regex-based analyzers cover files above the size cap (logs, SQL
+dumps, generated bundles) with constant memory instead of skipping them.
+
+APPROACH:
+- The file is memory-mapped and read in line-aligned windows of roughly
+  ``window_bytes``; only the current window is decoded
+- Each window extends ``overlap_bytes`` (rounded to a line end) past the
+  lines it owns, so a match that starts on an owned line and runs into the
+  next window is still seen whole
+- Findings are produced per window with window-local line numbers, then
+  kept only if they start on an owned line and shifted to global lines, so
+  every match is reported exactly once
+- A line longer than a window is split mid-line without overlap; matches
+  straddling that cut are missed (minified one-line blobs), never duplicated
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+DEFAULT_WINDOW_BYTES = 1024 * 1024
+DEFAULT_OVERLAP_BYTES = 16 * 1024
+
+
+@dataclass(frozen=True)
+class FileWindow:
+    """Decoded slice of a file; local lines 1..owned_lines belong to this window."""
+
+    text: str
+    line_offset: int
+    owned_lines: int
+
+    def owns(self, local_line: int) -> bool:
+        return 1 <= local_line <= self.owned_lines
+
+
+def iter_file_windows(
+    path: Path | str,
+    window_bytes: int = DEFAULT_WINDOW_BYTES,
+    overlap_bytes: int = DEFAULT_OVERLAP_BYTES,
+) -> Iterator[FileWindow]:
+    """
+    Yield line-aligned, overlapping windows over ``path`` via a memory map.
+
+    Memory use is bounded by ``window_bytes`` plus ``overlap_bytes`` (plus
+    the rest of the line at each boundary, up to another window) regardless
+    of file size.
+    """
+    if window_bytes <= 0:
+        raise ValueError("window_bytes must be positive")
+    with open(path, "rb") as handle:
+        size = os.fstat(handle.fileno()).st_size
+        if size == 0:
+            return
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            start = 0
+            line_offset = 0
+            while start < size:
+                cut = min(size, start + window_bytes)
+                owned_end = _line_start_after(data, cut, size, window_bytes)
+                if owned_end is None:
+                    # One line longer than two windows: split it, no overlap
+                    owned_end = end = cut
+                else:
+                    overlap_cut = min(size, owned_end + overlap_bytes)
+                    end = _line_start_after(data, overlap_cut, size, window_bytes)
+                    if end is None:
+                        end = overlap_cut
+
+                raw = data[start:end]
+                owned_newlines = raw.count(b"\n", 0, owned_end - start)
+                ends_mid_line = owned_end < size and data[owned_end - 1] != 0x0A
+                ends_unterminated = owned_end == size and data[size - 1] != 0x0A
+                yield FileWindow(
+                    text=raw.decode("utf-8", errors="ignore"),
+                    line_offset=line_offset,
+                    owned_lines=owned_newlines + (ends_mid_line or ends_unterminated),
+                )
+                # A mid-line cut continues the same line in the next window
+                line_offset += owned_newlines
+                start = owned_end
+
+
+def _line_start_after(
+    data: mmap.mmap, position: int, size: int, search_bytes: int
+) -> int | None:
+    """Return the first line start at or after ``position`` within the search bound."""
+    if position >= size or data[position - 1] == 0x0A:
+        return position
+    newline = data.find(b"\n", position, min(size, position + search_bytes))
+    return None if newline == -1 else newline + 1
+
+
+def scan_file_windows(
+    path: Path | str,
+    check: Callable[[FileWindow], list[dict[str, Any]]],
+    window_bytes: int = DEFAULT_WINDOW_BYTES,
+    overlap_bytes: int = DEFAULT_OVERLAP_BYTES,
+) -> list[dict[str, Any]]:
+    """
+    Run ``check`` on each window and return its findings with global lines.
+
+    ``check`` reports ``line_number`` relative to ``window.text``; findings
+    on lines the window does not own (its overlap) or without a line are
+    dropped.
+    """
+    findings: list[dict[str, Any]] = []
+    for window in iter_file_windows(path, window_bytes, overlap_bytes):
+        for finding in check(window):
+            local_line = finding.get("line_number") or 0
+            if not window.owns(local_line):
+                continue
+            finding["line_number"] = local_line + window.line_offset
+            findings.append(finding)
+    return findings
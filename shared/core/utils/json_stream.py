@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Streaming Access to Analyzer Result Files for Continuous Improvement Framework.
+
+PURPOSE: Let CI converters read large analyzer JSON outputs without loading
+every finding into memory at once.
+
+APPROACH:
+- The file is memory-mapped and a C-level regex walks its structural tokens
+  (strings, brackets, commas, colons), skipping string contents whole, so
+  brackets inside strings never confuse the nesting depth; below the top
+  level, values nested up to ``NESTED_LEVELS`` deep (a whole finding, in
+  practice) are matched as one token. Scalars and the contents of those
+  values are only validated when the value holding them is decoded
+- One walk records the byte span of each top-level value and the start and
+  end offsets of each element of the top-level ``findings`` array (two
+  integers per finding); a file that is not a single, balanced JSON object,
+  or leaves a value or finding empty between separators, is rejected before
+  anything is decoded
+- Top-level values and findings are decoded on demand from their spans, one
+  at a time, so memory holds one finding plus the offset table
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import re
+from array import array
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+_STRING = rb'"[^"\\]*+(?:\\.[^"\\]*+)*+"'
+_TOKEN = re.compile(_STRING + rb"|[][{},:]")
+
+
+def _nested(inner: bytes = b"") -> bytes:
+    # Possessive runs never backtrack, so a failed match costs one pass
+    alternatives = rb'[^\]\[{}"]++|' + _STRING + (rb"|" + inner if inner else b"")
+    return rb"[\[{](?:" + alternatives + rb")*+[\]}]"
+
+
+# Below the top level, whole values nested up to NESTED_LEVELS deep are one token
+NESTED_LEVELS = 5
+_composite = b""
+for _ in range(NESTED_LEVELS):
+    _composite = _nested(_composite)
+_NESTED_TOKEN = re.compile(_composite + rb"|" + _STRING + rb"|[][{},:]")
+_QUOTE, _COLON, _COMMA = ord('"'), ord(":"), ord(",")
+_OPENERS, _CLOSERS = frozenset(b"{["), frozenset(b"}]")
+_ARRAY_OPEN = ord("[")
+_MATCHING = {ord("}"): ord("{"), ord("]"): ord("[")}
+# Elements sit inside a UTF-8 document, so skip json.loads' encoding sniffing
+_decode = json.JSONDecoder().decode
+
+
+class ResultStream:
+    """
+    Top-level fields and lazily decoded findings of one result JSON file.
+
+    Raises ``ValueError`` when the file is not a single JSON object.
+    """
+
+    def __init__(self, path: Path | str, array_key: str = "findings"):
+        self.path = Path(path)
+        self.array_key = array_key
+        with open(self.path, "rb") as handle:
+            try:
+                self._data = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as exc:  # empty file
+                raise ValueError(f"{self.path}: empty file") from exc
+        try:
+            self._values: dict[str, tuple[int, int]] = {}
+            self._elements = array("q")
+            self._scan()
+        except ValueError:
+            self.close()
+            raise
+
+    def __enter__(self) -> ResultStream:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._data.close()
+
+    def _scan(self) -> None:
+        data = self._data
+        self._depth = 0
+        self._openers = bytearray()
+        self._key = ""
+        self._value_start = self._element_start = self._array_start = -1
+        closed_at = -1
+        handlers = {_QUOTE: self._on_string, _COMMA: self._on_comma}
+        handlers.update(dict.fromkeys(_OPENERS, self._on_open))
+        handlers.update(dict.fromkeys(_CLOSERS, self._on_close))
+        search, search_nested = _TOKEN.search, _NESTED_TOKEN.search
+        end = 0
+        while True:
+            match = (search_nested if self._depth >= 2 else search)(data, end)
+            if match is None:
+                break
+            start, end = match.span()
+            if closed_at >= 0 or (self._depth == 0 and data[:start].strip()):
+                raise ValueError(f"{self.path}: not a single JSON object")
+            char = data[start]
+            if char in _OPENERS and end - start > 1:
+                continue  # a complete nested value
+            if char == _COLON:
+                if self._depth == 1:
+                    self._value_start = end
+                continue
+            handlers[char](char, start, end)
+            if self._depth == 0 and char in _CLOSERS:
+                closed_at = end
+        if closed_at < 0 or data[closed_at:].strip():
+            raise ValueError(f"{self.path}: not a complete JSON object")
+
+    def _on_string(self, char: int, start: int, end: int) -> None:
+        if self._depth == 1 and self._value_start < 0:
+            self._key = json.loads(self._data[start:end])
+        elif self._depth == 0:
+            raise ValueError(f"{self.path}: not a JSON object")
+
+    def _on_open(self, char: int, start: int, end: int) -> None:
+        if self._depth == 0 and char == _ARRAY_OPEN:
+            raise ValueError(f"{self.path}: not a JSON object")
+        self._depth += 1
+        self._openers.append(char)
+        if self._depth == 1:
+            self._value_start = -1
+        elif (
+            self._depth == 2
+            and char == _ARRAY_OPEN
+            and self._key == self.array_key
+            and self._value_start >= 0
+            and not self._data[self._value_start : start].strip()
+        ):
+            self._element_start = self._array_start = end
+
+    def _on_close(self, char: int, start: int, end: int) -> None:
+        if not self._openers or _MATCHING[char] != self._openers.pop():
+            raise ValueError(f"{self.path}: unbalanced brackets")
+        if self._depth == 2 and self._element_start >= 0:
+            # Only an empty array may close on a blank element
+            if (
+                self._element_start != self._array_start
+                or self._data[self._element_start : start].strip()
+            ):
+                self._add_element(self._element_start, start)
+            self._element_start = -1
+        elif self._depth == 1 and self._value_start >= 0:
+            self._add_value(start)
+        self._depth -= 1
+
+    def _on_comma(self, char: int, start: int, end: int) -> None:
+        if self._depth == 1 and self._value_start >= 0:
+            self._add_value(start)
+            self._value_start = -1
+        elif self._depth == 2 and self._element_start >= 0:
+            self._add_element(self._element_start, start)
+            self._element_start = end
+
+    def _add_value(self, end: int) -> None:
+        if not self._data[self._value_start : end].strip():
+            raise ValueError(f"{self.path}: missing value for {self._key!r}")
+        self._values[self._key] = (self._value_start, end)
+
+    def _add_element(self, start: int, end: int) -> None:
+        if not self._data[start:end].strip():
+            raise ValueError(f"{self.path}: empty element in {self.array_key!r}")
+        self._elements.append(start)
+        self._elements.append(end)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Decode a top-level value."""
+        span = self._values.get(key)
+        if span is None:
+            return default
+        return json.loads(self._data[span[0] : span[1]])
+
+    def __len__(self) -> int:
+        return len(self._elements) // 2
+
+    def findings(self) -> Iterator[Any]:
+        """Decode the ``array_key`` array one element at a time."""
+        data, elements = self._data, self._elements
+        for index in range(0, len(elements), 2):
+            yield _decode(str(data[elements[index] : elements[index + 1]], "utf-8"))
@@ -12,6 +12,8 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
+from core.base.top_findings import SUMMARY_TOP_N
+
 
 class Severity(Enum):
     """Severity levels for findings."""
@@ -55,10 +57,12 @@ class Finding:
         self.line_number = line_number
         self.recommendation = recommendation
         self.evidence = evidence or {}
+        # Line-independent identity across runs (see core.base.baseline)
+        self.fingerprint: str | None = None
 
     def to_dict(self) -> dict[str, Any]:
         """Convert finding to dictionary."""
-        return {
+        data = {
             "id": self.finding_id,
             "title": self.title,
             "description": self.description,
@@ -68,6 +72,25 @@ class Finding:
             "recommendation": self.recommendation,
             "evidence": self.evidence,
         }
+        if self.fingerprint:
+            data["fingerprint"] = self.fingerprint
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Finding":
+        """Rebuild a finding from ``to_dict`` output."""
+        finding = cls(
+            data.get("id", ""),
+            data.get("title", ""),
+            data.get("description", ""),
+            Severity(data.get("severity", "info")),
+            data.get("file_path"),
+            data.get("line_number"),
+            data.get("recommendation"),
+            data.get("evidence"),
+        )
+        finding.fingerprint = data.get("fingerprint")
+        return finding
 
 
 class AnalysisResult:
@@ -90,6 +113,32 @@ class AnalysisResult:
         self.execution_time = 0.0
         self.success = True
         self.error_message = None
+        # Exact counts when findings were truncated while collecting (summary mode)
+        self.severity_counts: dict[str, int] | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "AnalysisResult":
+        """
+        Rebuild a result from ``to_dict`` output (e.g. a cached run).
+
+        Severity counts are kept when the findings were truncated, so the
+        summary still reflects every finding the run produced.
+        """
+        result = cls(
+            AnalysisType(data["analysis_type"]),
+            data.get("script_name", ""),
+            data.get("target_path", ""),
+            [Finding.from_dict(item) for item in data.get("findings", [])],
+            data.get("metadata") or {},
+        )
+        result.timestamp = data.get("timestamp", result.timestamp)
+        result.execution_time = data.get("execution_time", 0.0)
+        result.success = data.get("success", True)
+        result.error_message = data.get("error_message")
+        summary = data.get("summary") or {}
+        if sum(summary.values()) != len(result.findings):
+            result.set_severity_counts(summary)
+        return result
 
     def add_finding(self, finding: Finding):
         """Add a finding to the result."""
@@ -104,9 +153,16 @@ class AnalysisResult:
         """Set execution time based on start time."""
         self.execution_time = time.time() - start_time
 
+    def set_severity_counts(self, counts: dict[str, int]) -> None:
+        """Record exact severity counts for findings not all kept in memory."""
+        self.severity_counts = dict(counts)
+
     def get_summary(self) -> dict[str, int]:
         """Get summary of findings by severity."""
         summary = {severity.value: 0 for severity in Severity}
+        if self.severity_counts is not None:
+            summary.update(self.severity_counts)
+            return summary
         for finding in self.findings:
             summary[finding.severity.value] += 1
         return summary
@@ -118,7 +174,7 @@ class AnalysisResult:
         Convert result to dictionary.
 
         Args:
-            summary_mode: If True, limit findings to top 10 critical/high severity
+            summary_mode: If True, limit findings to the top SUMMARY_TOP_N by severity
             min_severity: Minimum severity level to include (critical|high|medium|low)
         """
         # Filter by minimum severity
@@ -132,8 +188,16 @@ class AnalysisResult:
         ]
 
         findings_to_include = filtered_findings
+        # Counts come from the summary so they stay exact when only the top
+        # findings were collected
+        summary = self.get_summary()
+        total_filtered = sum(
+            count
+            for severity, count in summary.items()
+            if severity_order.get(severity, 4) <= min_severity_level
+        )
 
-        if summary_mode and len(filtered_findings) > 10:
+        if summary_mode and len(filtered_findings) > SUMMARY_TOP_N:
             # Sort by severity priority and take top 10
             severity_priority = {
                 Severity.CRITICAL: 0,
@@ -146,7 +210,7 @@ class AnalysisResult:
             sorted_findings = sorted(
                 filtered_findings, key=lambda f: severity_priority.get(f.severity, 5)
             )
-            findings_to_include = sorted_findings[:10]
+            findings_to_include = sorted_findings[:SUMMARY_TOP_N]
 
         result = {
             "analysis_type": self.analysis_type.value,
@@ -156,7 +220,7 @@ class AnalysisResult:
             "execution_time": round(self.execution_time, 3),
             "success": self.success,
             "error_message": self.error_message,
-            "summary": self.get_summary(),
+            "summary": summary,
             "findings": [finding.to_dict() for finding in findings_to_include],
             "metadata": self.metadata,
         }
@@ -164,14 +228,16 @@ class AnalysisResult:
         # Add filtering/truncation info
         if min_severity != "low":
             result["min_severity_filter"] = min_severity
-            result["total_findings_before_filter"] = len(self.findings)
-            result["total_findings_after_filter"] = len(filtered_findings)
+            # A pushed-down run never produced the findings below its threshold
+            if "severity_pushdown" not in self.metadata:
+                result["total_findings_before_filter"] = sum(summary.values())
+            result["total_findings_after_filter"] = total_filtered
 
-        if summary_mode and len(filtered_findings) > 10:
+        if summary_mode and total_filtered > len(findings_to_include):
             result["summary_mode"] = True
             result["showing_top"] = len(findings_to_include)
             result["truncated_note"] = (
-                f"Showing top {len(findings_to_include)} findings out of {len(filtered_findings)} filtered results"
+                f"Showing top {len(findings_to_include)} findings out of {total_filtered} filtered results"
             )
 
         return result
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Budgeted Regex Evaluation for Continuous Improvement Framework.
+
+PURPOSE: Run untrusted or pathological regular expressions against file
+content with a hard per-pattern wall-clock budget that works from any thread.
+
+APPROACH:
+- Patterns run in a long-lived worker process (this module re-executed in
+  isolated mode, stdlib only) that streams one JSON line per pattern back;
+  the caller waits on each reply with a timeout
+- A pattern that exceeds its budget gets the worker killed and respawned,
+  and only that pattern is reported as timed out
+- Large text is evaluated in bounded, line-aligned, overlapping windows;
+  a match belongs to the window whose owned region contains its start
+- Falls back to in-process evaluation (no budget) if worker processes
+  cannot be started in the current environment
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import queue
+import re
+import subprocess
+import sys
+import threading
+import weakref
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from typing import TextIO
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PATTERN_TIMEOUT_SECONDS = 2.0
+DEFAULT_CHUNK_CHARS = 10_000
+DEFAULT_CHUNK_OVERLAP = 1_000
+
+# (pattern, flags)
+RegexSpec = tuple[str, int]
+
+
+@dataclass(frozen=True)
+class TextWindow:
+    """A slice of text scanned as one unit; matches starting in [start, owned_end) belong to it."""
+
+    start: int
+    owned_end: int
+    end: int
+
+
+def iter_text_windows(
+    text: str,
+    chunk_chars: int = DEFAULT_CHUNK_CHARS,
+    overlap_chars: int = DEFAULT_CHUNK_OVERLAP,
+) -> Iterator[TextWindow]:
+    """
+    Split text into line-aligned windows of roughly ``chunk_chars`` characters.
+
+    Each window extends ``overlap_chars`` (rounded to a line end) past its
+    owned region so matches straddling a boundary are still found once.
+    """
+    length = len(text)
+    if length <= chunk_chars:
+        yield TextWindow(0, length, length)
+        return
+
+    start = 0
+    while start < length:
+        owned_end = _next_line_start(text, min(length, start + chunk_chars))
+        if owned_end <= start:
+            owned_end = min(length, start + chunk_chars)
+        end = _next_line_start(text, min(length, owned_end + overlap_chars))
+        yield TextWindow(start, owned_end, end)
+        start = owned_end
+
+
+def _next_line_start(text: str, position: int) -> int:
+    if position >= len(text) or position == 0 or text[position - 1] == "\n":
+        return position
+    newline = text.find("\n", position)
+    return len(text) if newline == -1 else newline + 1
+
+
+def _evaluate(
+    compiled: dict[RegexSpec, re.Pattern | None],
+    spec: RegexSpec,
+    text: str,
+    max_matches: int,
+) -> list[int] | None:
+    pattern = compiled.get(spec)
+    if spec not in compiled:
+        try:
+            pattern = re.compile(*spec)
+        except re.error:
+            pattern = None
+        compiled[spec] = pattern
+    if pattern is None:
+        return None
+
+    starts: list[int] = []
+    for match in pattern.finditer(text):
+        starts.append(match.start())
+        if len(starts) >= max_matches:
+            break
+    return starts
+
+
+def _regex_worker(stdin: TextIO, stdout: TextIO) -> int:
+    """Worker loop: one JSON request per line in, one JSON reply per spec out."""
+    compiled: dict[RegexSpec, re.Pattern | None] = {}
+    for line in stdin:
+        specs, text, max_matches = json.loads(line)
+        for index, (pattern, flags) in enumerate(specs):
+            starts = _evaluate(compiled, (pattern, flags), text, max_matches)
+            stdout.write(json.dumps([index, starts]) + "\n")
+            stdout.flush()
+    return 0
+
+
+def _pump_replies(stream: TextIO, replies: queue.Queue) -> None:
+    for line in stream:
+        replies.put(json.loads(line))
+    replies.put(None)
+
+
+def _stop_process(process: subprocess.Popen) -> None:
+    if process.poll() is None:
+        process.kill()
+    with contextlib.suppress(subprocess.TimeoutExpired):
+        process.wait(timeout=5)
+    for stream in (process.stdin, process.stdout):
+        with contextlib.suppress(OSError):
+            stream.close()
+
+
+class RegexTimeBudget:
+    """
+    Evaluate regex batches in a killable worker process under a per-pattern budget.
+
+    Thread safe: concurrent callers are serialized on the worker pipe. Create
+    one instance per thread for parallel evaluation.
+    """
+
+    _inline_warning_emitted = False
+
+    def __init__(self, timeout_seconds: float = DEFAULT_PATTERN_TIMEOUT_SECONDS):
+        self.timeout_seconds = timeout_seconds
+        self._lock = threading.Lock()
+        self._process: subprocess.Popen | None = None
+        self._replies: queue.Queue = queue.Queue()
+        self._finalizer: weakref.finalize | None = None
+        self._inline = False
+        self._inline_cache: dict[RegexSpec, re.Pattern | None] = {}
+        self.stats = {"evaluations": 0, "timeouts": 0, "restarts": 0}
+
+    def __enter__(self) -> RegexTimeBudget:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the worker process, if any."""
+        with self._lock:
+            self._stop_worker()
+
+    def find_starts(
+        self, specs: Sequence[RegexSpec], text: str, max_matches: int = 10
+    ) -> list[list[int] | None]:
+        """
+        Return match start offsets for each pattern (None if invalid or timed out).
+
+        At most ``max_matches`` starts are reported per pattern.
+        """
+        results: list[list[int] | None] = [None] * len(specs)
+        if not specs:
+            return results
+
+        with self._lock:
+            self.stats["evaluations"] += len(specs)
+            if self._inline or not self._ensure_worker():
+                for index, spec in enumerate(specs):
+                    results[index] = _evaluate(
+                        self._inline_cache, spec, text, max_matches
+                    )
+                return results
+
+            pending = list(range(len(specs)))
+            while pending and not self._inline:
+                pending = self._run_batch(specs, pending, text, max_matches, results)
+            for index in pending:
+                results[index] = _evaluate(
+                    self._inline_cache, specs[index], text, max_matches
+                )
+        return results
+
+    def find_starts_windowed(
+        self,
+        specs: Sequence[RegexSpec],
+        text: str,
+        max_matches: int = 10,
+        chunk_chars: int = DEFAULT_CHUNK_CHARS,
+        overlap_chars: int = DEFAULT_CHUNK_OVERLAP,
+    ) -> list[list[int] | None]:
+        """
+        Like ``find_starts`` but scans large text in bounded overlapping windows.
+
+        Offsets are global to ``text``. A pattern that is invalid or exceeds
+        its budget is dropped for the remaining windows; matches it found in
+        earlier windows are kept (None if it found nothing).
+        """
+        starts: list[list[int]] = [[] for _ in specs]
+        failed = [False] * len(specs)
+        for window in iter_text_windows(text, chunk_chars, overlap_chars):
+            active = [
+                i
+                for i in range(len(specs))
+                if not failed[i] and len(starts[i]) < max_matches
+            ]
+            if not active:
+                break
+            window_text = text[window.start : window.end]
+            found = self.find_starts(
+                [specs[i] for i in active], window_text, max_matches
+            )
+            for index, offsets in zip(active, found, strict=True):
+                if offsets is None:
+                    failed[index] = True
+                    continue
+                for offset in offsets:
+                    position = window.start + offset
+                    if position >= window.owned_end:
+                        break
+                    starts[index].append(position)
+                    if len(starts[index]) >= max_matches:
+                        break
+        return [
+            None if failed[i] and not offsets else offsets
+            for i, offsets in enumerate(starts)
+        ]
+
+    # ------------------------------------------------------------------ #
+    # Worker management
+    # ------------------------------------------------------------------ #
+
+    def _run_batch(
+        self,
+        specs: Sequence[RegexSpec],
+        pending: list[int],
+        text: str,
+        max_matches: int,
+        results: list[list[int] | None],
+    ) -> list[int]:
+        """Send pending specs to the worker; return specs still to run after a kill."""
+        batch = [list(specs[i]) for i in pending]
+        received = 0
+        try:
+            self._process.stdin.write(json.dumps([batch, text, max_matches]) + "\n")
+            self._process.stdin.flush()
+            while received < len(batch):
+                reply = self._replies.get(timeout=self.timeout_seconds)
+                if reply is None:
+                    raise EOFError
+                position, starts = reply
+                results[pending[position]] = starts
+                received += 1
+            return []
+        except queue.Empty:
+            pass
+        except (EOFError, OSError, ValueError):
+            # Worker died mid-batch; remaining specs are reported as failed
+            self._restart_worker()
+            return []
+
+        # Replies arrive in order, so the first unanswered spec is the slow one
+        self.stats["timeouts"] += 1
+        logger.warning(
+            "Regex exceeded %.1fs budget and was skipped: %s",
+            self.timeout_seconds,
+            specs[pending[received]][0],
+        )
+        self._restart_worker()
+        return pending[received + 1 :]
+
+    def _ensure_worker(self) -> bool:
+        if self._process is not None and self._process.poll() is None:
+            return True
+        try:
+            process = subprocess.Popen(
+                [sys.executable, "-I", "-u", __file__],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                encoding="utf-8",
+            )
+        except OSError as e:
+            if not RegexTimeBudget._inline_warning_emitted:
+                logger.warning(
+                    "Regex worker unavailable (%s); evaluating without a time budget",
+                    e,
+                )
+                RegexTimeBudget._inline_warning_emitted = True
+            self._inline = True
+            return False
+
+        self._replies = queue.Queue()
+        threading.Thread(
+            target=_pump_replies, args=(process.stdout, self._replies), daemon=True
+        ).start()
+        self._process = process
+        self._finalizer = weakref.finalize(self, _stop_process, process)
+        return True
+
+    def _restart_worker(self) -> None:
+        self._stop_worker()
+        self.stats["restarts"] += 1
+        self._ensure_worker()
+
+    def _stop_worker(self) -> None:
+        if self._finalizer is not None:
+            self._finalizer()
+            self._finalizer = None
+        self._process = None
+
+
+if __name__ == "__main__":
+    raise SystemExit(_regex_worker(sys.stdin, sys.stdout))
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Streaming SARIF Export for Continuous Improvement Framework.
+
+PURPOSE: Feed analyzer results to code-scanning viewers that speak SARIF
+2.1.0 without first building (or re-reading) the whole log in memory.
+
+APPROACH:
+- Each ``AnalysisResult`` becomes one SARIF run; its findings are written to
+  the stream one result at a time as the run is emitted
+- A run's ``results`` are written before its ``tool`` object, so rule
+  metadata can be collected while streaming and written once at the end of
+  the run; results refer to rules by id and index, so rule metadata is
+  written once per run and memory holds only the current run's rules
+- Severities map to SARIF levels (critical/high -> error, medium ->
+  warning, low/info -> note); paths are written relative to the analysis
+  root under ``%SRCROOT%`` (absolute file URIs outside it); finding
+  fingerprints become partial fingerprints
+- Writes are serialized, so analyzers finishing on different threads can
+  share one writer
+
+USAGE:
+    enaible analyzers run quality:* --sarif results.sarif
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+from pathlib import Path
+from typing import Any, TextIO
+
+from core.base.baseline import finding_rule
+
+SARIF_VERSION = "2.1.0"
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+SRCROOT = "%SRCROOT%"
+FINGERPRINT_KEY = "enaibleFingerprint/v1"
+SEVERITY_LEVELS = {
+    "critical": "error",
+    "high": "error",
+    "medium": "warning",
+    "low": "note",
+    "info": "note",
+}
+_SEVERITY_ORDER = {"critical": 0, "high": 1, "medium": 2, "low": 3, "info": 4}
+_RULE_ID_UNSAFE = re.compile(r"[^A-Za-z0-9_.:/-]+")
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+class SarifWriter:
+    """
+    Write a SARIF log to ``stream``, one run per analysis result.
+
+    ``root`` is the analysis root that artifact URIs are made relative to.
+    Findings below ``min_severity`` are left out, matching the JSON output.
+    """
+
+    def __init__(
+        self,
+        stream: TextIO,
+        root: Path | str | None = None,
+        min_severity: str = "low",
+    ):
+        self.stream = stream
+        self.root = Path(root or ".").resolve()
+        self.min_level = _SEVERITY_ORDER.get(min_severity, 3)
+        self._lock = threading.Lock()
+        self._runs = 0
+        self._closed = False
+        self.stream.write(
+            f'{{"$schema":{_dumps(SARIF_SCHEMA)},"version":"{SARIF_VERSION}","runs":['
+        )
+
+    def __enter__(self) -> SarifWriter:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _artifact(self, file_path: str) -> dict[str, str]:
+        """Return the artifact location, relative to %SRCROOT% when inside it."""
+        path = Path(file_path).resolve()
+        try:
+            relative = path.relative_to(self.root).as_posix()
+        except ValueError:
+            # Outside the root: an absolute URI with no base to resolve against
+            return {"uri": path.as_uri()}
+        return {"uri": relative, "uriBaseId": SRCROOT}
+
+    def write_result(self, result: Any, tool: str | None = None) -> None:
+        """Stream ``result`` as one run named ``tool`` (default: script name)."""
+        with self._lock:
+            if self._closed:
+                raise ValueError("SARIF log is already closed")
+            name = tool or getattr(result, "script_name", "") or "analyzer"
+            rules: dict[str, tuple[int, dict[str, Any]]] = {}
+            write = self.stream.write
+            write(("," if self._runs else "") + '{"results":[')
+            count = 0
+            for finding in result.findings:
+                severity = finding.severity.value
+                if _SEVERITY_ORDER.get(severity, 4) > self.min_level:
+                    continue
+                rule_id, index = self._rule(rules, finding)
+                write(
+                    ("," if count else "")
+                    + _dumps(self._result(finding, rule_id, index))
+                )
+                count += 1
+            invocation: dict[str, Any] = {"executionSuccessful": bool(result.success)}
+            if not result.success and result.error_message:
+                invocation["toolExecutionNotifications"] = [
+                    {"level": "error", "message": {"text": str(result.error_message)}}
+                ]
+            rest = {
+                "tool": {
+                    "driver": {
+                        "name": name,
+                        "rules": [metadata for _, metadata in rules.values()],
+                    }
+                },
+                "invocations": [invocation],
+                "originalUriBaseIds": {SRCROOT: {"uri": self.root.as_uri() + "/"}},
+                "properties": {"analysisType": result.analysis_type.value},
+            }
+            # Close the results array and continue the run object
+            write("]," + _dumps(rest)[1:])
+            self._runs += 1
+
+    def _rule(
+        self, rules: dict[str, tuple[int, dict[str, Any]]], finding: Any
+    ) -> tuple[str, int]:
+        """Return the id and index of the finding's rule, adding it on first use."""
+        rule = finding_rule(finding.title, finding.evidence)
+        rule_id = _RULE_ID_UNSAFE.sub("-", rule).strip("-") or "finding"
+        entry = rules.get(rule_id)
+        if entry is None:
+            level = SEVERITY_LEVELS.get(finding.severity.value, "note")
+            metadata: dict[str, Any] = {
+                "id": rule_id,
+                "shortDescription": {"text": rule},
+                "fullDescription": {"text": finding.description or rule},
+                "defaultConfiguration": {"level": level},
+            }
+            if finding.recommendation:
+                metadata["help"] = {"text": finding.recommendation}
+            entry = rules[rule_id] = (len(rules), metadata)
+        return rule_id, entry[0]
+
+    def _result(self, finding: Any, rule_id: str, rule_index: int) -> dict[str, Any]:
+        severity = finding.severity.value
+        sarif: dict[str, Any] = {
+            "ruleId": rule_id,
+            "ruleIndex": rule_index,
+            "level": SEVERITY_LEVELS.get(severity, "note"),
+            "message": {"text": finding.description or finding.title},
+        }
+        if finding.file_path:
+            location: dict[str, Any] = {
+                "artifactLocation": self._artifact(str(finding.file_path))
+            }
+            if isinstance(finding.line_number, int) and finding.line_number > 0:
+                location["region"] = {"startLine": finding.line_number}
+            sarif["locations"] = [{"physicalLocation": location}]
+        fingerprint = getattr(finding, "fingerprint", None)
+        if fingerprint:
+            sarif["partialFingerprints"] = {FINGERPRINT_KEY: fingerprint}
+        sarif["properties"] = {"severity": severity, "title": finding.title}
+        return sarif
+
+    def close(self) -> None:
+        """Finish the log; the stream itself is left open."""
+        with self._lock:
+            if not self._closed:
+                self._closed = True
+                self.stream.write("]}\n")
@@ -3,14 +3,20 @@
 Tech Stack Detection and Filtering Utility.
 
 Automatically detects project technology stack and provides appropriate filtering rules.
+
+Detected stacks and the resulting exclusion matcher are cached per
+(config, project root) for the life of the process; call
+`TechStackDetector.invalidate_cache()` after marker files change.
 """
 
 import json
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 from core.config.loader import ConfigError, load_tech_stacks
+from core.config.pattern_packs import load_config_json
 
 
 @dataclass
@@ -31,9 +37,59 @@ class TechStackConfig:
             self.boilerplate_patterns = set()
 
 
+@dataclass(frozen=True)
+class ExclusionMatcher:
+    """Precomputed, case-normalized exclusion lists for one project root."""
+
+    directory_parts: frozenset[str]
+    directory_paths: tuple[str, ...]
+    file_names: frozenset[str]
+    extensions: frozenset[str]
+
+    @classmethod
+    def from_exclusions(cls, exclusions: dict[str, set[str]]) -> "ExclusionMatcher":
+        lowered = [d.lower() for d in exclusions["directories"]]
+        return cls(
+            directory_parts=frozenset(d for d in lowered if "/" not in d),
+            directory_paths=tuple(sorted(d for d in lowered if "/" in d)),
+            file_names=frozenset(f.lower() for f in exclusions["files"]),
+            extensions=frozenset(exclusions["extensions"]),
+        )
+
+    def excludes(
+        self, rel_parts_lower: set[str], rel_path_str: str, path: Path
+    ) -> bool:
+        """Return True if a path is excluded by directory, file name or extension."""
+        # - Single-segment directories must match a path part exactly
+        # - Multi-segment patterns (e.g. 'ios/Pods') match as a substring of the path
+        if not self.directory_parts.isdisjoint(rel_parts_lower):
+            return True
+        if any(d in rel_path_str for d in self.directory_paths):
+            return True
+        if path.name.lower() in self.file_names:
+            return True
+        return path.suffix.lower() in self.extensions
+
+
+@dataclass
+class _ProjectProfile:
+    """Cached detection results for one project root."""
+
+    stacks: list[str]
+    exclusions: dict[str, set[str]]
+    matcher: ExclusionMatcher = field(init=False)
+
+    def __post_init__(self):
+        self.matcher = ExclusionMatcher.from_exclusions(self.exclusions)
+
+
 class TechStackDetector:
     """Detects project technology stack and provides filtering rules."""
 
+    # (config key, resolved project root) -> profile, shared across instances
+    _profiles: ClassVar[dict[tuple[str, str], _ProjectProfile]] = {}
+    _profiles_lock = threading.Lock()
+
     def __init__(self, config_path: Path | None = None):
         # Default to repo config if not provided
         if config_path is None:
@@ -65,11 +121,40 @@ class TechStackDetector:
             )
 
         self._exclusion_rules = self._load_exclusion_rules(config_path)
+        try:
+            config_stamp = config_path.stat().st_mtime_ns
+        except OSError:
+            config_stamp = 0
+        self._config_key = f"{config_path.resolve()}:{config_stamp}"
 
     @classmethod
     def from_config(cls, config_path: Path) -> "TechStackDetector":
         return cls(config_path=config_path)
 
+    @classmethod
+    def invalidate_cache(cls, project_path: str | None = None) -> None:
+        """Drop cached detection results for one project root, or for all roots."""
+        with cls._profiles_lock:
+            if project_path is None:
+                cls._profiles.clear()
+                return
+            root = str(Path(project_path).resolve())
+            for key in [k for k in cls._profiles if k[1] == root]:
+                del cls._profiles[key]
+
+    def _profile(self, project_path: str) -> _ProjectProfile:
+        """Return the cached detection results for a project root, detecting once."""
+        key = (self._config_key, str(Path(project_path).resolve()))
+        with self._profiles_lock:
+            profile = self._profiles.get(key)
+        if profile is not None:
+            return profile
+
+        stacks = self._detect_stacks(Path(key[1]))
+        profile = _ProjectProfile(stacks, self._build_exclusions(stacks))
+        with self._profiles_lock:
+            return self._profiles.setdefault(key, profile)
+
     def detect_tech_stack(self, project_path: str) -> list[str]:
         """
         Detect technology stacks in the project.
@@ -81,35 +166,28 @@ class TechStackDetector:
         -------
             List of detected technology stack names
         """
-        detected_stacks = []
-        project_root = Path(project_path)
+        return list(self._profile(project_path).stacks)
 
-        # Check for each tech stack
-        for stack_id, config in self.tech_stacks.items():
-            if self._matches_tech_stack(project_root, config):
-                detected_stacks.append(stack_id)
-
-        return detected_stacks
+    def _detect_stacks(self, project_root: Path) -> list[str]:
+        return [
+            stack_id
+            for stack_id, config in self.tech_stacks.items()
+            if self._matches_tech_stack(project_root, config)
+        ]
 
     def _matches_tech_stack(self, project_root: Path, config: TechStackConfig) -> bool:
-        """Check if project matches a specific tech stack."""
-        config_file_matches = 0
-
-        # Check for config files
-        for config_file in config.config_files:
-            if self._file_exists_pattern(project_root, config_file):
-                config_file_matches += 1
-
-        # If multiple config files match, it's likely this tech stack
-        return config_file_matches > 0
+        """Check if project matches a specific tech stack (first marker found wins)."""
+        return any(
+            self._file_exists_pattern(project_root, config_file)
+            for config_file in config.config_files
+        )
 
     def _file_exists_pattern(self, project_root: Path, pattern: str) -> bool:
         """Check if files matching pattern exist."""
         if "*" in pattern:
-            # Handle glob patterns
+            # Handle glob patterns; stop at the first match
             try:
-                matches = list(project_root.glob(pattern))
-                return len(matches) > 0
+                return next(project_root.glob(pattern), None) is not None
             except Exception:  # pragma: no cover - filesystem errors are rare
                 return False
         else:
@@ -124,8 +202,14 @@ class TechStackDetector:
         -------
             dict with 'directories' and 'files' to exclude
         """
-        detected_stacks = self.detect_tech_stack(project_path)
+        exclusions = self._profile(project_path).exclusions
+        return {kind: set(values) for kind, values in exclusions.items()}
 
+    def get_exclusion_matcher(self, project_path: str) -> ExclusionMatcher:
+        """Return the cached exclusion matcher for a project root."""
+        return self._profile(project_path).matcher
+
+    def _build_exclusions(self, detected_stacks: list[str]) -> dict[str, set[str]]:
         universal = self._exclusion_rules["universal"]
         excluded_dirs = set(universal["directories"])
         excluded_files = set(universal["files"])
@@ -149,7 +233,7 @@ class TechStackDetector:
     @staticmethod
     def _load_exclusion_rules(config_path: Path) -> dict[str, dict[str, set[str]]]:
         try:
-            raw_data = json.loads(config_path.read_text(encoding="utf-8"))
+            raw_data = load_config_json(config_path)
         except FileNotFoundError:
             return {
                 "universal": {
@@ -205,9 +289,9 @@ class TechStackDetector:
         import os
         from pathlib import Path
 
-        # Get exclusion lists (based on detected stacks at project root)
+        # Get exclusion matcher (based on detected stacks at project root)
         project_root = Path(project_path or os.path.dirname(file_path)).resolve()
-        exclusions = self.get_simple_exclusions(str(project_root))
+        matcher = self.get_exclusion_matcher(str(project_root))
 
         # Convert to Path object for easier manipulation
         path_obj = Path(file_path).resolve()
@@ -221,24 +305,8 @@ class TechStackDetector:
             rel_parts_lower = {p.lower() for p in path_obj.parts}
             rel_path_str = str(path_obj).lower()
 
-        # Check if file is in an excluded directory
-        # - Single-segment directories must match a path part exactly
-        # - Multi-segment patterns (e.g. 'ios/Pods') match as a substring of the path
-        for d in exclusions["directories"]:
-            d_low = d.lower()
-            if "/" in d_low:
-                if d_low in rel_path_str:
-                    return False
-            else:
-                if d_low in rel_parts_lower:
-                    return False
-
-        # Check excluded files by name
-        if path_obj.name.lower() in {f.lower() for f in exclusions["files"]}:
-            return False
-
-        # Check excluded extensions
-        if path_obj.suffix.lower() in exclusions["extensions"]:
+        # Check excluded directories, file names and extensions
+        if matcher.excludes(rel_parts_lower, rel_path_str, path_obj):
             return False
 
         # Content-based detection for remaining files
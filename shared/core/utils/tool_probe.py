@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Persisted External Tool Probe Cache for Continuous Improvement Framework.
+
+PURPOSE: Resolve external tool availability and versions (`--version`
+calls, `shutil.which`, `npx` resolution) once and reuse the answer across
+analyzer runs and `enaible doctor` until something relevant changes.
+
+APPROACH:
+- Each probe is stored with a fingerprint of PATH, the resolved executable
+  and its mtime, and the mtimes of package-manager lockfiles in the working
+  directory (which decide what `npx` resolves)
+- A probe is reused while its fingerprint matches; otherwise the tool is
+  re-probed through the shared tool runner
+- Results live in memory and in `tool-probes.json` under the framework
+  cache root (`--cache-dir` / `CI_CACHE_DIR`, else `.cache/ci-framework` in
+  the working directory)
+- `CI_REFRESH_TOOLS=1` (set by `--refresh-tools`) forces a re-probe
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import threading
+import time
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from core.base.content_cache import resolve_cache_root
+from core.base.fs_utils import atomic_write
+
+REFRESH_ENV_VAR = "CI_REFRESH_TOOLS"
+PROBE_TIMEOUT_SECONDS = 10
+
+# Version commands for the tools analyzers shell out to
+KNOWN_TOOL_PROBES: dict[str, list[str]] = {
+    "semgrep": ["semgrep", "--version"],
+    "detect-secrets": ["detect-secrets", "--version"],
+    "ruff": ["ruff", "--version"],
+    "lizard": ["lizard", "--version"],
+    "eslint": ["npx", "eslint", "--version"],
+    "jscpd": ["npx", "jscpd", "--version"],
+    "osv-scanner": ["osv-scanner", "--version"],
+    "cargo-clippy": ["cargo", "clippy", "--version"],
+    "golangci-lint": ["golangci-lint", "--version"],
+    "dotnet": ["dotnet", "--version"],
+}
+
+_LOCKFILES = (
+    "package-lock.json",
+    "npm-shrinkwrap.json",
+    "pnpm-lock.yaml",
+    "yarn.lock",
+    "bun.lockb",
+    "Cargo.lock",
+    "go.sum",
+    "uv.lock",
+    "poetry.lock",
+)
+
+
+@dataclass
+class ToolProbe:
+    """Availability and version of one external tool."""
+
+    name: str
+    available: bool
+    path: str | None
+    version: str | None
+    probed_at: float
+    cached: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def _mtime(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def probe_fingerprint(command: Sequence[str], cwd: Path | None = None) -> str:
+    """Hash everything that can change a probe's answer."""
+    cwd = cwd or Path.cwd()
+    executable = shutil.which(command[0]) if command else None
+    parts = [
+        os.environ.get("PATH", ""),
+        json.dumps(list(command)),
+        executable or "",
+        str(_mtime(Path(executable))) if executable else "",
+        *(f"{name}:{_mtime(cwd / name)}" for name in _LOCKFILES),
+        os.environ.get("AAW_NODE_TOOLS_DIR", ""),
+    ]
+    encoded = "\0".join(parts).encode("utf-8")
+    return hashlib.sha1(encoded, usedforsecurity=False).hexdigest()
+
+
+def refresh_requested() -> bool:
+    """Return True when a forced re-probe was requested for this process."""
+    return os.environ.get(REFRESH_ENV_VAR, "").lower() in {"1", "true", "yes"}
+
+
+class ToolProbeCache:
+    """Fingerprint-validated probe results, persisted as JSON."""
+
+    def __init__(self, cache_path: Path | None = None, cwd: Path | None = None):
+        self.cwd = Path(cwd) if cwd else Path.cwd()
+        self.cache_path = cache_path or (
+            resolve_cache_root(self.cwd) / "tool-probes.json"
+        )
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict[str, Any]] | None = None
+        # Tools already re-probed for CI_REFRESH_TOOLS in this process
+        self._refreshed: set[str] = set()
+        self.stats = {"hits": 0, "probes": 0}
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        if self._entries is None:
+            try:
+                data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+                self._entries = data if isinstance(data, dict) else {}
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def _save(self) -> None:
+        try:
+            with atomic_write(self.cache_path) as handle:
+                handle.write(json.dumps(self._entries, indent=2, sort_keys=True))
+        except OSError:
+            # Persistence is best effort; the in-memory answer stays valid
+            pass
+
+    def probe(
+        self,
+        name: str,
+        command: Sequence[str] | None = None,
+        *,
+        refresh: bool = False,
+        timeout: float = PROBE_TIMEOUT_SECONDS,
+    ) -> ToolProbe:
+        """
+        Return the tool's availability and version, probing only when stale.
+
+        ``command`` defaults to the entry in KNOWN_TOOL_PROBES, else
+        ``[name, "--version"]``. A tool whose executable is not on PATH is
+        reported unavailable without spawning anything.
+        """
+        command = list(command or KNOWN_TOOL_PROBES.get(name, [name, "--version"]))
+        fingerprint = probe_fingerprint(command, self.cwd)
+        refresh = refresh or (refresh_requested() and name not in self._refreshed)
+
+        with self._lock:
+            entry = self._load().get(name)
+            if (
+                not refresh
+                and entry is not None
+                and entry.get("fingerprint") == fingerprint
+            ):
+                self.stats["hits"] += 1
+                return ToolProbe(
+                    name=name,
+                    available=bool(entry.get("available")),
+                    path=entry.get("path"),
+                    version=entry.get("version"),
+                    probed_at=float(entry.get("probed_at", 0.0)),
+                    cached=True,
+                )
+
+        result = self._run_probe(name, command, timeout)
+        with self._lock:
+            self.stats["probes"] += 1
+            self._refreshed.add(name)
+            self._load()[name] = {"fingerprint": fingerprint, **result.to_dict()}
+            self._entries[name].pop("cached", None)
+            self._save()
+        return result
+
+    @staticmethod
+    def _run_probe(name: str, command: list[str], timeout: float) -> ToolProbe:
+        from core.utils.tool_runner import get_tool_runner
+
+        runner = get_tool_runner()
+        executable = shutil.which(command[0])
+        probe = ToolProbe(name, False, executable, None, time.time())
+        if executable is None and runner.replay is None:
+            return probe
+        try:
+            completed = runner.run(command, tool=name, timeout=timeout)
+        except (subprocess.TimeoutExpired, OSError):
+            return probe
+        if completed.returncode == 0:
+            probe.available = True
+            output = next(
+                (
+                    stream.strip()
+                    for stream in (completed.stdout, completed.stderr)
+                    if isinstance(stream, str) and stream.strip()
+                ),
+                "",
+            )
+            probe.version = output.splitlines()[0] if output else None
+        return probe
+
+    def invalidate(self, name: str | None = None) -> None:
+        """Forget one probe (or all of them), in memory and on disk."""
+        with self._lock:
+            entries = self._load()
+            if name is None:
+                entries.clear()
+            else:
+                entries.pop(name, None)
+            self._save()
+
+
+_default_caches: dict[Path, ToolProbeCache] = {}
+_default_caches_lock = threading.Lock()
+
+
+def get_tool_probe_cache() -> ToolProbeCache:
+    """Return the probe cache for the current working directory."""
+    cwd = Path.cwd()
+    with _default_caches_lock:
+        cache = _default_caches.get(cwd)
+        if cache is None:
+            cache = _default_caches[cwd] = ToolProbeCache(cwd=cwd)
+        return cache
+
+
+def probe_tool(
+    name: str, command: Sequence[str] | None = None, *, refresh: bool = False
+) -> ToolProbe:
+    """Probe a tool through the default cache (see ToolProbeCache.probe)."""
+    return get_tool_probe_cache().probe(name, command, refresh=refresh)
@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+Shared External Tool Runner for Continuous Improvement Framework.
+
+PURPOSE: Run external analysis CLIs (semgrep, eslint, ruff, jscpd, lizard,
+detect-secrets, osv-scanner, cargo clippy, golangci-lint, dotnet) through one
+coordinated service instead of ad-hoc `subprocess.run` calls, so concurrent
+analyzer runs do not oversubscribe the machine.
+
+APPROACH:
+- A global and a per-tool concurrency limit (semaphores, per-tool acquired
+  first so ordering is consistent)
+- Admission waits while system load per CPU or available memory is past a
+  threshold, but never blocks when this runner has nothing in flight and
+  gives up waiting after a bounded delay
+- Uniform default timeout; a timed-out tool is killed and reaped by
+  `subprocess.run` and `subprocess.TimeoutExpired` is re-raised as before
+- Every invocation's timing and exit status is recorded as a `ToolInvocation`
+- Replay mode serves recorded outputs instead of spawning processes, and
+  record mode writes them, for tests and offline reproduction
+
+CONFIGURATION (environment):
+    CI_TOOL_MAX_CONCURRENCY   global limit (default: CPU count)
+    CI_TOOL_CONCURRENCY       per-tool limits, e.g. "semgrep=1,eslint=2"
+    CI_TOOL_REPLAY_DIR        replay recorded outputs from this directory
+    CI_TOOL_RECORD_DIR        record real outputs into this directory
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import subprocess
+import threading
+import time
+from collections import deque
+from collections.abc import Mapping, Sequence
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from core.base.fs_utils import atomic_write
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOOL_TIMEOUT_SECONDS = 600
+DEFAULT_MAX_LOAD_PER_CPU = 1.5
+DEFAULT_MIN_AVAILABLE_MEMORY_MB = 256
+DEFAULT_ADMISSION_WAIT_SECONDS = 30.0
+_ADMISSION_POLL_SECONDS = 0.25
+_HISTORY_LIMIT = 1000
+# Leading arguments kept when an invocation is reported
+_RECORDED_ARGV_LIMIT = 8
+
+# Launchers whose first argument names the actual tool
+_LAUNCHERS = {"npx", "pnpx", "bunx", "uvx", "pipx", "cargo", "dotnet", "go"}
+
+
+@dataclass
+class ToolInvocation:
+    """Timing and outcome of one external tool run."""
+
+    tool: str
+    argv: list[str]
+    returncode: int | None
+    duration_seconds: float
+    queued_seconds: float
+    timed_out: bool = False
+    replayed: bool = False
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Report fields; per-file tools can have huge argv, so it is truncated."""
+        data = asdict(self)
+        data["argv"] = self.argv[:_RECORDED_ARGV_LIMIT]
+        if len(self.argv) > _RECORDED_ARGV_LIMIT:
+            data["argv_truncated"] = len(self.argv) - _RECORDED_ARGV_LIMIT
+        data["duration_seconds"] = round(self.duration_seconds, 3)
+        data["queued_seconds"] = round(self.queued_seconds, 3)
+        return data
+
+
+def tool_name(argv: Sequence[str]) -> str:
+    """Derive a tool name from a command line (``npx eslint`` -> ``eslint``)."""
+    if not argv:
+        return ""
+    name = Path(str(argv[0])).name
+    if name.startswith("python") and len(argv) > 2 and argv[1] == "-m":
+        return str(argv[2])
+    if name in _LAUNCHERS and len(argv) > 1 and not str(argv[1]).startswith("-"):
+        return name if name in {"cargo", "dotnet", "go"} else Path(argv[1]).name
+    return name
+
+
+def _available_memory_mb() -> float | None:
+    try:
+        with open("/proc/meminfo", encoding="ascii") as meminfo:
+            for line in meminfo:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) / 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def _load_per_cpu() -> float | None:
+    try:
+        return os.getloadavg()[0] / (os.cpu_count() or 1)
+    except (AttributeError, OSError):
+        return None
+
+
+def _parse_tool_limits(spec: str) -> dict[str, int]:
+    limits: dict[str, int] = {}
+    for item in spec.split(","):
+        name, _, value = item.partition("=")
+        if name.strip() and value.strip().isdigit():
+            limits[name.strip()] = max(1, int(value))
+    return limits
+
+
+class ToolReplay:
+    """
+    Recorded tool outputs keyed by tool and exact argv.
+
+    Layout: ``<root>/<tool>/<argv digest>.json``; ``<root>/<tool>/default.json``
+    answers any invocation of that tool without an exact recording.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    @staticmethod
+    def _digest(argv: Sequence[str]) -> str:
+        encoded = json.dumps([str(a) for a in argv]).encode("utf-8")
+        return hashlib.sha1(encoded, usedforsecurity=False).hexdigest()[:16]
+
+    def lookup(self, tool: str, argv: Sequence[str]) -> dict[str, Any] | None:
+        for name in (f"{self._digest(argv)}.json", "default.json"):
+            try:
+                return json.loads((self.root / tool / name).read_text("utf-8"))
+            except (OSError, ValueError):
+                continue
+        return None
+
+    def record(
+        self, tool: str, argv: Sequence[str], completed: subprocess.CompletedProcess
+    ) -> None:
+        entry = {
+            "tool": tool,
+            "argv": [str(a) for a in argv],
+            "returncode": completed.returncode,
+            "stdout": completed.stdout,
+            "stderr": completed.stderr,
+        }
+        try:
+            with atomic_write(self.root / tool / f"{self._digest(argv)}.json") as out:
+                out.write(json.dumps(entry, indent=2, default=str))
+        except OSError as e:
+            logger.debug("Could not record %s output: %s", tool, e)
+
+
+class ToolRunner:
+    """Coordinated, observable execution of external analysis tools."""
+
+    def __init__(
+        self,
+        max_concurrency: int | None = None,
+        tool_limits: Mapping[str, int] | None = None,
+        default_tool_limit: int | None = None,
+        max_load_per_cpu: float | None = DEFAULT_MAX_LOAD_PER_CPU,
+        min_available_memory_mb: float | None = DEFAULT_MIN_AVAILABLE_MEMORY_MB,
+        admission_wait_seconds: float = DEFAULT_ADMISSION_WAIT_SECONDS,
+        replay: ToolReplay | None = None,
+        recorder: ToolReplay | None = None,
+    ):
+        cpus = os.cpu_count() or 1
+        self.max_concurrency = max(1, max_concurrency or cpus)
+        self.default_tool_limit = max(
+            1, default_tool_limit or max(1, self.max_concurrency // 2)
+        )
+        self.max_load_per_cpu = max_load_per_cpu
+        self.min_available_memory_mb = min_available_memory_mb
+        self.admission_wait_seconds = admission_wait_seconds
+        self.replay = replay
+        self.recorder = recorder
+
+        self._global = threading.BoundedSemaphore(self.max_concurrency)
+        self._tool_limits = dict(tool_limits or {})
+        self._tool_semaphores: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+        self._active = 0
+        self.invocations: deque[ToolInvocation] = deque(maxlen=_HISTORY_LIMIT)
+
+    @classmethod
+    def from_environment(cls) -> ToolRunner:
+        """Build a runner configured from CI_TOOL_* environment variables."""
+        max_concurrency = os.environ.get("CI_TOOL_MAX_CONCURRENCY", "")
+        replay_dir = os.environ.get("CI_TOOL_REPLAY_DIR")
+        record_dir = os.environ.get("CI_TOOL_RECORD_DIR")
+        return cls(
+            max_concurrency=int(max_concurrency) if max_concurrency.isdigit() else None,
+            tool_limits=_parse_tool_limits(os.environ.get("CI_TOOL_CONCURRENCY", "")),
+            replay=ToolReplay(Path(replay_dir)) if replay_dir else None,
+            recorder=ToolReplay(Path(record_dir)) if record_dir else None,
+        )
+
+    @property
+    def active(self) -> int:
+        """Number of invocations currently running."""
+        return self._active
+
+    def tool_limit(self, tool: str) -> int:
+        return self._tool_limits.get(tool, self.default_tool_limit)
+
+    def _tool_semaphore(self, tool: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            semaphore = self._tool_semaphores.get(tool)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.tool_limit(tool))
+                self._tool_semaphores[tool] = semaphore
+            return semaphore
+
+    def _has_headroom(self) -> bool:
+        if self.max_load_per_cpu is not None:
+            load = _load_per_cpu()
+            if load is not None and load > self.max_load_per_cpu:
+                return False
+        if self.min_available_memory_mb is not None:
+            available = _available_memory_mb()
+            if available is not None and available < self.min_available_memory_mb:
+                return False
+        return True
+
+    def _await_admission(self) -> None:
+        deadline = time.monotonic() + self.admission_wait_seconds
+        while self._active > 0 and not self._has_headroom():
+            if time.monotonic() >= deadline:
+                logger.debug("Admitting tool run despite system pressure")
+                return
+            time.sleep(_ADMISSION_POLL_SECONDS)
+
+    def run(
+        self,
+        cmd: Sequence[str],
+        *,
+        tool: str | None = None,
+        timeout: float | None = None,
+        cwd: str | Path | None = None,
+        env: Mapping[str, str] | None = None,
+        stdin_text: str | None = None,
+        check: bool = False,
+        sink: list[ToolInvocation] | None = None,
+    ) -> subprocess.CompletedProcess:
+        """
+        Run a tool with captured text output, like ``subprocess.run``.
+
+        ``stdin_text`` is passed to the tool's stdin. The invocation record is
+        also appended to ``sink`` when given, so callers can attribute runs to
+        themselves.
+
+        Raises
+        ------
+            FileNotFoundError, subprocess.TimeoutExpired,
+            subprocess.CalledProcessError: as ``subprocess.run`` would.
+        """
+        argv = [str(part) for part in cmd]
+        name = tool or tool_name(argv)
+        timeout = DEFAULT_TOOL_TIMEOUT_SECONDS if timeout is None else timeout
+        invocation = ToolInvocation(name, argv, None, 0.0, 0.0)
+        if sink is not None:
+            sink.append(invocation)
+
+        if self.replay is not None:
+            return self._replayed(invocation, check)
+
+        queued = time.perf_counter()
+        semaphore = self._tool_semaphore(name)
+        with semaphore, self._global:
+            self._await_admission()
+            with self._lock:
+                self._active += 1
+            started = time.perf_counter()
+            invocation.queued_seconds = started - queued
+            try:
+                completed = subprocess.run(
+                    argv,
+                    capture_output=True,
+                    text=True,
+                    timeout=timeout,
+                    cwd=cwd,
+                    env=dict(env) if env is not None else None,
+                    input=stdin_text,
+                )
+            except subprocess.TimeoutExpired:
+                invocation.timed_out = True
+                invocation.error = f"timed out after {timeout}s"
+                raise
+            except OSError as e:
+                invocation.error = str(e)
+                raise
+            finally:
+                invocation.duration_seconds = time.perf_counter() - started
+                with self._lock:
+                    self._active -= 1
+                self._record(invocation)
+
+        invocation.returncode = completed.returncode
+        if self.recorder is not None:
+            self.recorder.record(name, argv, completed)
+        if check:
+            completed.check_returncode()
+        return completed
+
+    def _replayed(
+        self, invocation: ToolInvocation, check: bool
+    ) -> subprocess.CompletedProcess:
+        invocation.replayed = True
+        entry = self.replay.lookup(invocation.tool, invocation.argv)
+        if entry is None:
+            invocation.error = "no recorded output"
+            self._record(invocation)
+            raise FileNotFoundError(
+                f"No recorded output for {invocation.tool}: {invocation.argv}"
+            )
+        invocation.returncode = int(entry.get("returncode", 0))
+        self._record(invocation)
+        completed = subprocess.CompletedProcess(
+            invocation.argv,
+            invocation.returncode,
+            entry.get("stdout", ""),
+            entry.get("stderr", ""),
+        )
+        if check:
+            completed.check_returncode()
+        return completed
+
+    def _record(self, invocation: ToolInvocation) -> None:
+        # The runner history is for aggregate reporting; per-analyzer
+        # attribution lives in BaseAnalyzer.run_tool.
+        with self._lock:
+            self.invocations.append(invocation)
+        logger.debug(
+            "tool=%s rc=%s duration=%.3fs queued=%.3fs",
+            invocation.tool,
+            invocation.returncode,
+            invocation.duration_seconds,
+            invocation.queued_seconds,
+        )
+
+
+_default_runner: ToolRunner | None = None
+_default_runner_lock = threading.Lock()
+
+
+def get_tool_runner() -> ToolRunner:
+    """Return the process-wide tool runner (configured from the environment)."""
+    global _default_runner
+    with _default_runner_lock:
+        if _default_runner is None:
+            _default_runner = ToolRunner.from_environment()
+        return _default_runner
+
+
+def set_tool_runner(runner: ToolRunner | None) -> None:
+    """Replace the process-wide runner (None rebuilds it from the environment)."""
+    global _default_runner
+    with _default_runner_lock:
+        _default_runner = runner
@@ -11,6 +11,12 @@ Minimal fields per item (compatible with GitLab and generic consumers):
 - fingerprint (str)
 - severity (info|minor|major|critical|blocker)
 - location: { path: <repo-relative>, lines: { begin: <int> } }
+
+Conversion streams: each input file is memory-mapped and its findings are
+decoded one at a time (core.utils.json_stream), files are converted in
+parallel worker processes that spool items to temporary files, and the
+spools are merged in file order - skipping repeated fingerprints - while
+the output array is written incrementally. Unparsable files are skipped.
 """
 
 from __future__ import annotations
@@ -18,8 +24,16 @@ from __future__ import annotations
 import argparse
 import hashlib
 import json
+import os
+import sys
+import tempfile
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
+
+from core.utils.json_stream import ResultStream
 
 SEVERITY_MAP = {
     "critical": "blocker",
@@ -33,24 +47,23 @@ SEVERITY_MAP = {
 def _repo_relative(path: str) -> str | None:
     if not path:
         return None
-    p = Path(path)
-    try:
-        return str(p.resolve().relative_to(Path.cwd().resolve()))
-    except Exception:
-        return str(p)
+    return _relative_to(path, os.getcwd())
 
 
-def _load_json_files(root: Path) -> list[dict[str, Any]]:
-    results: list[dict[str, Any]] = []
-    for fp in sorted(root.glob("*.json")):
-        try:
-            data = json.loads(fp.read_text(encoding="utf-8"))
-        except Exception:
-            continue
-        if not isinstance(data, dict):
-            continue
-        results.append(data)
-    return results
+@lru_cache(maxsize=65536)
+def _relative_to(path: str, cwd: str) -> str:
+    # String form of Path(path).resolve().relative_to(cwd), without pathlib
+    real, base = os.path.realpath(path), _resolved(cwd)
+    if real == base:
+        return "."
+    if real.startswith(base.rstrip(os.sep) + os.sep):
+        return real[len(base.rstrip(os.sep)) + 1 :]
+    return str(Path(path))
+
+
+@lru_cache(maxsize=8)
+def _resolved(cwd: str) -> str:
+    return os.path.realpath(cwd)
 
 
 def _source_name(source: dict[str, Any], fallback: str) -> str:
@@ -84,22 +97,94 @@ def _cc_item(check_name: str, finding: dict[str, Any]) -> dict[str, Any] | None:
     }
 
 
-def convert(root: Path) -> list[dict[str, Any]]:
-    out: list[dict[str, Any]] = []
+def _convert_file(path: Path, spool_dir: str) -> str | None:
+    """
+    Convert one analyzer JSON into a spool of ``fingerprint<TAB>item`` lines.
+
+    Returns
+    -------
+        Spool path, or None when the file is not a parsable analyzer result
+    """
+    with tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=spool_dir, suffix=".spool", delete=False
+    ) as spool:
+        try:
+            with ResultStream(path) as source:
+                fallback = source.get("script_name") or "analyzer"
+                check_name = _source_name(
+                    {"metadata": source.get("metadata")}, fallback
+                )
+                for finding in source.findings():
+                    item = _cc_item(check_name, finding)
+                    if item:
+                        rendered = json.dumps(item, ensure_ascii=False)
+                        spool.write(f"{item['fingerprint']}\t{rendered}\n")
+        except (OSError, ValueError, TypeError, AttributeError):
+            spool.close()
+            os.unlink(spool.name)
+            return None
+    return spool.name
+
+
+def _default_jobs(file_count: int) -> int:
+    return max(1, min(file_count, os.cpu_count() or 1))
+
+
+def iter_items(root: Path, jobs: int = 0) -> Iterator[str]:
+    """
+    Yield serialized CodeClimate items for every JSON file in ``root``.
+
+    Files are converted by ``jobs`` processes (0 = one per CPU, up to the
+    number of files) and merged in file order; the first item with a given
+    fingerprint wins.
+    """
+    files = sorted(root.glob("*.json"))
+    jobs = jobs or _default_jobs(len(files))
     seen_fp: set[str] = set()
-    for payload in _load_json_files(root):
-        fallback = payload.get("script_name") or "analyzer"
-        check_name = _source_name(payload, fallback)
-        for f in payload.get("findings", []) or []:
-            item = _cc_item(check_name, f)
-            if not item:
-                continue
-            fp = item["fingerprint"]
-            if fp in seen_fp:
-                continue
-            seen_fp.add(fp)
-            out.append(item)
-    return out
+    with tempfile.TemporaryDirectory(prefix="codeclimate-") as spool_dir:
+        if jobs > 1 and len(files) > 1:
+            pool = ProcessPoolExecutor(max_workers=jobs)
+            spools = pool.map(_convert_file, files, [spool_dir] * len(files))
+        else:
+            pool = None
+            spools = (_convert_file(path, spool_dir) for path in files)
+        try:
+            for spool in spools:
+                if spool is None:
+                    continue
+                with open(spool, encoding="utf-8") as lines:
+                    for line in lines:
+                        fp, _, rendered = line.partition("\t")
+                        if fp in seen_fp:
+                            continue
+                        seen_fp.add(fp)
+                        yield rendered.rstrip("\n")
+                os.unlink(spool)
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+
+def write_codeclimate(root: Path, stream: TextIO, jobs: int = 0) -> int:
+    """
+    Write the CodeClimate array for ``root`` to ``stream`` item by item.
+
+    Returns
+    -------
+        Number of items written
+    """
+    count = 0
+    stream.write("[")
+    for rendered in iter_items(root, jobs):
+        stream.write(", " + rendered if count else rendered)
+        count += 1
+    stream.write("]")
+    return count
+
+
+def convert(root: Path) -> list[dict[str, Any]]:
+    """Return the CodeClimate items for ``root`` as a list (small inputs)."""
+    return [json.loads(rendered) for rendered in iter_items(root)]
 
 
 def main() -> int:
@@ -112,6 +197,13 @@ def main() -> int:
         default="artifacts",
         help="Directory with analyzer JSONs",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=0,
+        help="Parallel conversion processes (0 = one per CPU)",
+    )
     args = parser.parse_args()
 
     root = Path(args.artifacts)
@@ -119,8 +211,8 @@ def main() -> int:
         print("[]")
         return 0
 
-    items = convert(root)
-    print(json.dumps(items, ensure_ascii=False))
+    write_codeclimate(root, sys.stdout, args.jobs)
+    sys.stdout.write("\n")
     return 0
 
 
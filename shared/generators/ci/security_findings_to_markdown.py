@@ -7,100 +7,231 @@ Output: Markdown between markers on stdout:
 === BEGIN_SECURITY_MD ===
 ... content ...
 === END_SECURITY_MD ===
+
+Rendering streams: findings are decoded one at a time (core.utils.json_stream)
+and folded into per-rule aggregates (severity, distinct location count,
+example, and the first locations in sort order, up to a per-rule budget) in
+a single pass, and the Markdown is written line by line to the output
+stream. Detailed sections are capped by a budget, so output size follows the
+number of rules rather than findings; memory holds one (path, line) key per
+distinct location, so repeated findings at one location cost nothing extra.
 """
 
 from __future__ import annotations
 
 import argparse
-import json
+import sys
+from bisect import bisect_left
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
+
+from core.utils.json_stream import ResultStream
 
 SEV_ORDER = {"critical": 0, "high": 1, "medium": 2, "low": 3, "info": 4}
+INPUT_FILES = ("security_semgrep.json", "security_secrets.json")
+BEGIN_MARKER = "=== BEGIN_SECURITY_MD ==="
+END_MARKER = "=== END_SECURITY_MD ==="
+NO_FINDINGS = (
+    f"{BEGIN_MARKER}\nNo parsable SAST/security findings detected.\n{END_MARKER}"
+)
+TOP_ACTIONS = 5
+# Budgets for the detailed sections (rules shown, locations listed per rule)
+DEFAULT_MAX_DETAILS = 100
+DEFAULT_MAX_LOCATIONS = 50
 
 
-def _load_findings(root: Path) -> list[dict[str, Any]]:
-    findings: list[dict[str, Any]] = []
-    for name in ("security_semgrep.json", "security_secrets.json"):
-        fp = root / name
-        if not fp.exists():
-            continue
-        try:
-            data = json.loads(fp.read_text(encoding="utf-8"))
-        except Exception:
-            continue
-        for f in data.get("findings", []) or []:
-            findings.append(f)
-    return findings
-
-
-def _group(findings: list[dict[str, Any]]):
-    groups: dict[str, dict[str, Any]] = {}
-    for f in findings:
-        title = str(f.get("title") or "Security finding")
-        file_path = str(f.get("file_path") or "")
-        line = int(f.get("line_number") or 1)
-        meta = f.get("evidence") or {}
+@dataclass
+class _Group:
+    """Aggregate of one rule/title pair."""
+
+    title: str
+    check: str
+    severity: str
+    example: tuple[str, int]
+    location_keys: set[tuple[str, int]] = field(default_factory=set)
+    # Keys of findings without a file path (listed as n/a, never shown)
+    unlocated_keys: set[tuple[str, int]] = field(default_factory=set)
+    # First locations in sort order, at most the per-rule budget
+    locations: list[str] = field(default_factory=list)
+
+    @property
+    def affected(self) -> int:
+        return len(self.location_keys)
+
+    @property
+    def located(self) -> int:
+        return len(self.location_keys) - len(self.unlocated_keys)
+
+    def add_location(self, file_path: str, line: int, budget: int) -> None:
+        key = (file_path, line)
+        if key in self.location_keys:
+            return
+        self.location_keys.add(key)
+        if file_path:
+            self._keep(f"{file_path}:{line}", budget)
+        else:
+            self.unlocated_keys.add(key)
+
+    def _keep(self, location: str, budget: int) -> None:
+        shown = self.locations
+        if len(shown) >= budget and (not shown or location >= shown[-1]):
+            return
+        index = bisect_left(shown, location)
+        if index < len(shown) and shown[index] == location:
+            return
+        shown.insert(index, location)
+        if len(shown) > budget:
+            shown.pop()
+
+    def merge(self, other: _Group, budget: int) -> None:
+        if SEV_ORDER.get(other.severity, 2) < SEV_ORDER.get(self.severity, 2):
+            self.severity = other.severity
+        self.location_keys |= other.location_keys
+        self.unlocated_keys |= other.unlocated_keys
+        for location in other.locations:
+            self._keep(location, budget)
+
+
+class SecurityDigest:
+    """Per-rule aggregates built in one pass over security findings."""
+
+    def __init__(self, max_locations: int = DEFAULT_MAX_LOCATIONS):
+        if max_locations < 0:
+            raise ValueError("max_locations must be >= 0")
+        self.max_locations = max_locations
+        self.groups: dict[str, _Group] = {}
+        self.total = 0
+
+    def add(self, finding: dict[str, Any]) -> None:
+        title = str(finding.get("title") or "Security finding")
+        file_path = str(finding.get("file_path") or "")
+        line = int(finding.get("line_number") or 1)
+        severity = str(finding.get("severity") or "medium").lower()
+        meta = finding.get("evidence") or {}
         check = meta.get("check_id") or meta.get("rule_id") or title
         key = f"{check}::{title}"
-        g = groups.setdefault(
-            key,
-            {
-                "title": title,
-                "check": str(check),
-                "severity": str(f.get("severity") or "medium").lower(),
-                "locations": set(),
-                "example": (file_path, line),
-            },
+        group = self.groups.get(key)
+        if group is None:
+            group = self.groups[key] = _Group(
+                title, str(check), severity, (file_path, line)
+            )
+        elif SEV_ORDER.get(severity, 2) < SEV_ORDER.get(group.severity, 2):
+            # keep the most severe
+            group.severity = severity
+        group.add_location(file_path, line, self.max_locations)
+        self.total += 1
+
+    def merge(self, other: SecurityDigest) -> None:
+        for key, group in other.groups.items():
+            mine = self.groups.get(key)
+            if mine is None:
+                self.groups[key] = group
+            else:
+                mine.merge(group, self.max_locations)
+        self.total += other.total
+
+    def add_file(self, path: Path) -> bool:
+        """Fold in one analyzer JSON; an unparsable file adds nothing."""
+        partial = SecurityDigest(self.max_locations)
+        try:
+            with ResultStream(path) as source:
+                for finding in source.findings():
+                    partial.add(finding)
+        except (OSError, ValueError, TypeError, AttributeError):
+            return False
+        self.merge(partial)
+        return True
+
+    def ranked(self) -> list[_Group]:
+        return sorted(
+            self.groups.values(),
+            key=lambda g: (SEV_ORDER.get(g.severity, 9), -g.affected),
         )
-        g["locations"].add((file_path, line))
-        # keep the most severe
-        if SEV_ORDER.get(str(f.get("severity") or "medium").lower(), 2) < SEV_ORDER.get(
-            g["severity"], 2
-        ):
-            g["severity"] = str(f.get("severity") or "medium").lower()
-    return list(groups.values())
-
-
-def _rank(groups: list[dict[str, Any]]):
-    return sorted(
-        groups, key=lambda g: (SEV_ORDER.get(g["severity"], 9), -len(g["locations"]))
-    )
 
 
-def _md(groups: list[dict[str, Any]], total: int) -> str:
-    dedup = len(groups)
-    lines: list[str] = []
-    lines.append("=== BEGIN_SECURITY_MD ===")
-    lines.append("# Security Findings – Prioritized Plan")
-    lines.append("")
-    lines.append(f"Total raw findings: {total} → Consolidated entries: {dedup}")
-    lines.append("")
+def load_digest(
+    root: Path, max_locations: int = DEFAULT_MAX_LOCATIONS
+) -> SecurityDigest:
+    digest = SecurityDigest(max_locations)
+    for name in INPUT_FILES:
+        path = root / name
+        if path.exists():
+            digest.add_file(path)
+    return digest
+
+
+def write_markdown(
+    digest: SecurityDigest, stream: TextIO, max_details: int = DEFAULT_MAX_DETAILS
+) -> None:
+    """Write the prioritized plan for ``digest`` to ``stream`` line by line."""
+    if max_details < 0:
+        raise ValueError("max_details must be >= 0")
+    if not digest.total:
+        stream.write(NO_FINDINGS)
+        return
+    ranked = digest.ranked()
+
+    def emit(line: str = "") -> None:
+        stream.write(line + "\n")
+
+    emit(BEGIN_MARKER)
+    emit("# Security Findings – Prioritized Plan")
+    emit()
+    emit(f"Total raw findings: {digest.total} → Consolidated entries: {len(ranked)}")
+    emit()
     # Summary table
-    lines.append("| Rank | Rule/CWE | Title | Affected | Risk | Example |")
-    lines.append("| ---: | :-- | :-- | --: | :-- | :-- |")
-    for i, g in enumerate(_rank(groups), start=1):
-        example = f"{g['example'][0]}:{g['example'][1]}" if g["example"][0] else "n/a"
-        lines.append(
-            f"| {i} | {g['check']} | {g['title']} | {len(g['locations'])} | {g['severity']} | {example} |"
+    emit("| Rank | Rule/CWE | Title | Affected | Risk | Example |")
+    emit("| ---: | :-- | :-- | --: | :-- | :-- |")
+    for i, g in enumerate(ranked, start=1):
+        example = f"{g.example[0]}:{g.example[1]}" if g.example[0] else "n/a"
+        emit(
+            f"| {i} | {g.check} | {g.title} | {g.affected} | {g.severity} | {example} |"
         )
-    lines.append("")
+    emit()
     # Top 5 actions
-    lines.append("## Top 5 Immediate Actions")
-    for i, g in enumerate(_rank(groups)[:5], start=1):
-        lines.append(
-            f"- [{i}] Address {g['severity']} risk: {g['title']} ({g['check']}) – start at {g['example'][0]}:{g['example'][1]}"
+    emit(f"## Top {TOP_ACTIONS} Immediate Actions")
+    for i, g in enumerate(ranked[:TOP_ACTIONS], start=1):
+        emit(
+            f"- [{i}] Address {g.severity} risk: {g.title} ({g.check})"
+            f" – start at {g.example[0]}:{g.example[1]}"
         )
-    lines.append("")
+    emit()
     # Details
-    lines.append("## Deduplicated Findings (Full Details)")
-    for g in _rank(groups):
-        lines.append(f"### {g['title']} – {g['check']} ({g['severity']})")
-        locs = sorted({f"{p}:{n}" for p, n in g["locations"] if p})
-        lines.append(f"Affected locations: {', '.join(locs) if locs else 'n/a'}")
-        lines.append("")
-    lines.append("=== END_SECURITY_MD ===")
-    return "\n".join(lines)
+    emit("## Deduplicated Findings (Full Details)")
+    for g in ranked[:max_details]:
+        emit(f"### {g.title} – {g.check} ({g.severity})")
+        locations = ", ".join(g.locations) if g.locations else "n/a"
+        hidden = g.located - len(g.locations)
+        if hidden > 0:
+            locations += f", … (+{hidden} more)"
+        emit(f"Affected locations: {locations}")
+        emit()
+    if len(ranked) > max_details:
+        emit(
+            f"_{len(ranked) - max_details} more entries not detailed "
+            "(detail budget reached); see the summary table and artifacts._"
+        )
+        emit()
+    stream.write(END_MARKER)
+
+
+def render(
+    root: Path,
+    stream: TextIO,
+    max_details: int = DEFAULT_MAX_DETAILS,
+    max_locations: int = DEFAULT_MAX_LOCATIONS,
+) -> int:
+    """
+    Aggregate the security JSONs in ``root`` and write the plan to ``stream``.
+
+    Returns
+    -------
+        Number of raw findings rendered
+    """
+    digest = load_digest(root, max_locations)
+    write_markdown(digest, stream, max_details)
+    return digest.total
 
 
 def main() -> int:
@@ -113,18 +244,22 @@ def main() -> int:
         default="artifacts",
         help="Directory with analyzer JSONs",
     )
+    parser.add_argument(
+        "--max-details",
+        type=int,
+        default=DEFAULT_MAX_DETAILS,
+        help="Rules given a detailed section (highest ranked first)",
+    )
+    parser.add_argument(
+        "--max-locations",
+        type=int,
+        default=DEFAULT_MAX_LOCATIONS,
+        help="Locations listed per detailed section",
+    )
     args = parser.parse_args()
 
-    root = Path(args.artifacts)
-    findings = _load_findings(root)
-    if not findings:
-        print(
-            "=== BEGIN_SECURITY_MD ===\nNo parsable SAST/security findings detected.\n=== END_SECURITY_MD ==="
-        )
-        return 0
-
-    groups = _group(findings)
-    print(_md(groups, len(findings)))
+    render(Path(args.artifacts), sys.stdout, args.max_details, args.max_locations)
+    sys.stdout.write("\n")
     return 0
 
 
@@ -13,12 +13,22 @@ import json
 import os
 import sys
 import time
+from collections.abc import Callable
 from typing import Any
 
 # Python version check
 try:
     import core.base.registry_bootstrap  # noqa: F401 - side-effect import registers analyzers
     from core.base import AnalyzerRegistry, create_analyzer_config
+    from core.base.priority_schedule import (
+        RuntimeHistory,
+        plan_priority,
+        run_prioritized,
+        severity_signal,
+        tool_queue_seconds,
+    )
+    from core.base.sharding import ShardSpec, merge_shard_results, owner_shard
+    from core.utils.output_formatter import AnalysisResult
 except ImportError as e:
     print(f"Import error: {e}", file=sys.stderr)
     sys.exit(1)
@@ -27,7 +37,23 @@ except ImportError as e:
 class AnalysisRunner:
     """Run all analysis scripts and combine results."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        resource_usage: bool = False,
+        memory_profile: bool = False,
+        shard: str | None = None,
+        shard_strategy: str = "hash",
+        result_cache: bool = False,
+        cache_dir: str | None = None,
+    ):
+        # Opt-in per-analyzer memory/file accounting (see core.base.resource_usage)
+        self.resource_usage = resource_usage or memory_profile
+        self.memory_profile = memory_profile
+        # Run only this shard of the files (see core.base.sharding)
+        self.shard = ShardSpec.parse(shard, shard_strategy) if shard else None
+        # Share per-file results across runs (see core.base.content_cache)
+        self.result_cache = result_cache
+        self.cache_dir = cache_dir
         # Map logical names to registry keys
         self.analyzers = {
             # Security (may rely on external tools)
@@ -69,6 +95,14 @@ class AnalysisRunner:
             min_severity=min_severity,
             summary_mode=summary_mode,
             output_format="json",
+            # Output is filtered to min_severity anyway; let analyzers skip the rest
+            severity_pushdown=True,
+            resource_accounting=self.resource_usage,
+            memory_profile=self.memory_profile,
+            shard=str(self.shard) if self.shard else None,
+            shard_strategy=self.shard.strategy if self.shard else "hash",
+            result_cache=self.result_cache,
+            cache_dir=self.cache_dir,
         )
         start = time.time()
         analyzer = AnalyzerRegistry.create(key, config=cfg)
@@ -87,8 +121,16 @@ class AnalysisRunner:
         summary_mode: bool = True,
         min_severity: str = "high",
         max_files: int = None,
+        priority: bool = False,
+        on_result: Callable[[str, str, dict[str, Any]], None] | None = None,
     ) -> dict[str, Any]:
-        """Run all analysis scripts and combine results."""
+        """
+        Run all analysis scripts and combine results.
+
+        With ``priority``, cheap high-signal analyzers run first, expensive
+        ones run in the background (see core.base.priority_schedule), and
+        ``on_result(name, key, data)`` is called as each analyzer completes.
+        """
         print(
             "🚀 AI-Assisted Workflows Analysis - Running All Scripts", file=sys.stderr
         )
@@ -96,17 +138,55 @@ class AnalysisRunner:
 
         start_time = time.time()
         results = {}
+        runnable = []
 
         for logical_name, key in self.analyzers.items():
-            if self.skip_external and logical_name.startswith(
-                ("security_", "performance_")
-            ):
-                results[logical_name] = {"skipped": True, "reason": "NO_EXTERNAL=true"}
-                continue
-            results[logical_name] = self.run_analyzer(
-                key, target_path, summary_mode, min_severity, max_files
+            reason = self._skip_reason(logical_name, key)
+            if reason is not None:
+                results[logical_name] = {"skipped": True, "reason": reason}
+            else:
+                runnable.append((logical_name, key))
+
+        if priority:
+            history = RuntimeHistory.for_workspace(target_path, self.cache_dir)
+            schedule = plan_priority(
+                ((name, key, self._is_expensive(key)) for name, key in runnable),
+                history,
             )
 
+            def finish(entry: Any, data: dict[str, Any], seconds: float) -> None:
+                results[entry.name] = data
+                if "error" not in data:
+                    # Time spent queued behind a background tool (probes in
+                    # setup, runs in analyze) is not this analyzer's cost
+                    busy = float(data.get("execution_time") or seconds)
+                    busy -= tool_queue_seconds(data.get("metadata", {}))
+                    history.record(
+                        entry.key, busy, severity_signal(data.get("summary", {}))
+                    )
+                if on_result is not None:
+                    on_result(entry.name, entry.key, data)
+
+            run_prioritized(
+                schedule,
+                lambda entry: self.run_analyzer(
+                    entry.key, target_path, summary_mode, min_severity, max_files
+                ),
+                finish,
+                # tracemalloc and peak RSS are process-wide: measure one at a time
+                background_workers=0 if self.resource_usage else 2,
+            )
+            history.save()
+            # Report sections keep the usual analyzer order
+            results = {name: results[name] for name in self.analyzers}
+        else:
+            for logical_name, key in runnable:
+                results[logical_name] = self.run_analyzer(
+                    key, target_path, summary_mode, min_severity, max_files
+                )
+                if on_result is not None:
+                    on_result(logical_name, key, results[logical_name])
+
         total_duration = time.time() - start_time
 
         # Generate combined report
@@ -118,6 +198,85 @@ class AnalysisRunner:
 
         return combined_report
 
+    def _skip_reason(self, logical_name: str, key: str) -> str | None:
+        """Return why an analyzer does not run in this invocation, if it doesn't."""
+        if self.skip_external and logical_name.startswith(
+            ("security_", "performance_")
+        ):
+            return "NO_EXTERNAL=true"
+        owner = self._non_shardable_owner(key)
+        if owner is not None and owner != self.shard.index:
+            return f"project-level analyzer runs on shard {owner}/{self.shard.count}"
+        return None
+
+    def _is_expensive(self, key: str) -> bool:
+        try:
+            return bool(getattr(AnalyzerRegistry.get(key), "expensive", False))
+        except KeyError:
+            return False
+
+    def _non_shardable_owner(self, key: str) -> int | None:
+        """Return the shard that runs a cross-file analyzer, or None if shardable."""
+        if self.shard is None:
+            return None
+        try:
+            shardable = getattr(AnalyzerRegistry.get(key), "shardable", True)
+        except KeyError:
+            return None
+        return None if shardable else owner_shard(key, self.shard.count)
+
+    def merge_shard_reports(self, reports: list[dict[str, Any]]) -> dict[str, Any]:
+        """
+        Combine per-shard combined reports into one report.
+
+        Each analyzer's shard results are merged with ``merge_shard_results``;
+        an analyzer skipped on every shard stays skipped, and the executive
+        summary is regenerated from the merged results.
+        """
+        if not reports:
+            raise ValueError("no shard reports to merge")
+        shard_info = [
+            r.get("combined_analysis", {}).get("shard") or {} for r in reports
+        ]
+
+        results: dict[str, Any] = {}
+        names = dict.fromkeys(
+            name for report in reports for name in report.get("detailed_results", {})
+        )
+        for name in names:
+            entries = [
+                report["detailed_results"][name]
+                for report in reports
+                if name in report.get("detailed_results", {})
+            ]
+            ran = [entry for entry in entries if not entry.get("skipped")]
+            failed = [entry for entry in ran if entry.get("error")]
+            if not ran or failed:
+                results[name] = (failed or entries)[0]
+                continue
+            merged = merge_shard_results([AnalysisResult.from_dict(e) for e in ran])
+            results[name] = merged.to_dict()
+            results[name]["runner_duration"] = max(
+                entry.get("runner_duration", 0) for entry in ran
+            )
+
+        first = reports[0].get("combined_analysis", {})
+        count = next((info["count"] for info in shard_info if info.get("count")), None)
+        merged_indexes = sorted({info["index"] for info in shard_info if info})
+        report = self.generate_combined_report(
+            results,
+            first.get("target_path", ""),
+            max(
+                r.get("combined_analysis", {}).get("total_duration", 0) for r in reports
+            ),
+        )
+        report["combined_analysis"]["shard"] = {
+            "count": count,
+            "merged": merged_indexes,
+            "missing": sorted(set(range(1, (count or 0) + 1)) - set(merged_indexes)),
+        }
+        return report
+
     def generate_combined_report(
         self, results: dict[str, Any], target_path: str, total_duration: float
     ) -> dict[str, Any]:
@@ -132,6 +291,7 @@ class AnalysisRunner:
                 "overall_success": all(
                     not result.get("error") for result in results.values()
                 ),
+                **({"shard": self.shard.to_dict()} if self.shard else {}),
             },
             "executive_summary": self.generate_executive_summary(results),
             "detailed_results": results,
@@ -203,8 +363,60 @@ class AnalysisRunner:
         # Generate recommendations
         summary["recommendations"] = self.generate_recommendations(summary)
 
+        resource_usage = self.summarize_resource_usage(results)
+        if resource_usage:
+            summary["resource_usage"] = resource_usage
+
         return summary
 
+    def summarize_resource_usage(self, results: dict[str, Any]) -> dict[str, Any]:
+        """Collect per-analyzer memory and file accounting, if it was recorded."""
+        by_analyzer: dict[str, Any] = {}
+        for script_name, result in results.items():
+            usage = (result.get("metadata") or {}).get("resource_usage")
+            if not usage:
+                continue
+            entry = {
+                "peak_rss_mb": usage.get("peak_rss_mb"),
+                "peak_rss_delta_mb": usage.get("peak_rss_delta_mb"),
+                "child_peak_rss_mb": usage.get("child_peak_rss_mb"),
+                "child_peak_rss_delta_mb": usage.get("child_peak_rss_delta_mb"),
+                "files_processed": usage.get("files_processed", 0),
+                "bytes_processed": usage.get("bytes_processed", 0),
+                "duration": result.get("runner_duration"),
+            }
+            traced = usage.get("tracemalloc")
+            if traced:
+                entry["traced_peak_mb"] = traced.get("peak_mb")
+                top = traced.get("top_allocations") or []
+                if top:
+                    entry["top_allocation"] = top[0]
+            by_analyzer[script_name] = entry
+
+        if not by_analyzer:
+            return {}
+
+        peaks = _recorded(by_analyzer, "peak_rss_mb")
+        deltas = _recorded(by_analyzer, "peak_rss_delta_mb")
+        # External tools run as child processes; attribute their peaks too
+        child_peaks = _recorded(by_analyzer, "child_peak_rss_mb")
+        child_deltas = _recorded(by_analyzer, "child_peak_rss_delta_mb")
+        return {
+            "max_peak_rss_mb": max(peaks.values()) if peaks else None,
+            "largest_memory_growth": max(deltas, key=deltas.get) if deltas else None,
+            "max_child_peak_rss_mb": max(child_peaks.values()) if child_peaks else None,
+            "largest_child_memory_growth": (
+                max(child_deltas, key=child_deltas.get) if child_deltas else None
+            ),
+            "total_files_processed": sum(
+                entry["files_processed"] for entry in by_analyzer.values()
+            ),
+            "total_bytes_processed": sum(
+                entry["bytes_processed"] for entry in by_analyzer.values()
+            ),
+            "by_analyzer": by_analyzer,
+        }
+
     def generate_recommendations(self, summary: dict[str, Any]) -> list[str]:
         """Generate high-level recommendations based on findings."""
         recommendations = []
@@ -350,6 +562,92 @@ class AnalysisRunner:
             print("   This might indicate missing tools or plugins", file=sys.stderr)
 
 
+def _recorded(by_analyzer: dict[str, Any], field: str) -> dict[str, float]:
+    """Map analyzers to ``field`` for those that recorded it."""
+    return {
+        name: entry[field]
+        for name, entry in by_analyzer.items()
+        if entry.get(field) is not None
+    }
+
+
+def _stream_result(output_format: str) -> Callable[[str, str, dict[str, Any]], None]:
+    """Return a callback that flushes each analyzer's result as it completes."""
+
+    def emit(name: str, key: str, data: dict[str, Any]) -> None:
+        if output_format == "console":
+            findings = sum(
+                v for v in data.get("summary", {}).values() if isinstance(v, int)
+            )
+            status = "failed" if "error" in data else f"{findings} findings"
+            print(f"{name} ({key}): {status}", flush=True)
+            return
+        line = {"event": "analyzer_result", "analyzer": name, "key": key, **data}
+        print(json.dumps(line), flush=True)
+
+    return emit
+
+
+def _build_report(args: Any) -> dict[str, Any]:
+    """Run the analyzers, or merge per-shard reports when ``--merge`` is given."""
+    runner = AnalysisRunner(
+        resource_usage=args.resource_usage,
+        memory_profile=args.memory_profile,
+        shard=args.shard,
+        shard_strategy=args.shard_strategy,
+        result_cache=args.result_cache,
+        cache_dir=args.cache_dir,
+    )
+    if args.merge:
+        reports = []
+        for path in args.merge:
+            with open(path, encoding="utf-8") as handle:
+                reports.append(json.load(handle))
+        return runner.merge_shard_reports(reports)
+    return runner.run_all_analyses(
+        args.target_path,
+        not args.verbose,  # Inverse logic: verbose=False means summary_mode=True
+        args.min_severity,
+        args.max_files,
+        priority=args.priority,
+        on_result=_stream_result(args.output_format) if args.priority else None,
+    )
+
+
+def _print_report(args: Any, report: dict[str, Any]) -> None:
+    """Print the combined report in the requested output format."""
+    if args.output_format == "console":
+        # Simple console output for the combined report
+        print("=== COMPREHENSIVE ANALYSIS REPORT ===")
+        print(f"Target: {args.target_path}")
+        print(f"Timestamp: {report.get('timestamp', 'unknown')}")
+        print(f"Scripts run: {report.get('scripts_run', 0)}")
+        print(f"Success: {report.get('overall_success', False)}")
+
+        # Show combined summary
+        summary = report.get("combined_summary", {})
+        total_findings = sum(summary.values())
+        print(f"Total findings: {total_findings}")
+        for severity in ["critical", "high", "medium", "low", "info"]:
+            count = summary.get(severity, 0)
+            if count > 0:
+                print(f"  {severity.upper()}: {count}")
+    elif args.priority:
+        # Sections were streamed already; close the stream with the report
+        print(json.dumps({"event": "report", "report": report}), flush=True)
+    elif not args.out:  # json (default); --out already holds the report
+        # Output combined report with proper error handling for broken pipe
+        try:
+            print(json.dumps(report, indent=2))
+            sys.stdout.flush()
+        except BrokenPipeError:
+            # Handle broken pipe gracefully (e.g., when output is piped to head)
+            with contextlib.suppress(OSError, ValueError):
+                sys.stdout.close()
+            with contextlib.suppress(OSError, ValueError):
+                sys.stderr.close()
+
+
 def main():
     """Run command-line integration of all analyzers."""
     import argparse
@@ -361,7 +659,7 @@ def main():
     parser = argparse.ArgumentParser(
         description="Run comprehensive code analysis across multiple dimensions"
     )
-    parser.add_argument("target_path", help="Path to analyze")
+    parser.add_argument("target_path", nargs="?", help="Path to analyze")
     parser.add_argument(
         "--output-format",
         choices=["json", "console"],
@@ -384,46 +682,69 @@ def main():
         type=int,
         help="Maximum number of files to analyze per script (optional, for testing/debugging)",
     )
+    parser.add_argument(
+        "--resource-usage",
+        action="store_true",
+        help="Report peak RSS and files/bytes processed per analyzer",
+    )
+    parser.add_argument(
+        "--memory-profile",
+        action="store_true",
+        help="Also report tracemalloc peak and top allocation sites (slower)",
+    )
+    parser.add_argument(
+        "--shard",
+        metavar="I/N",
+        help="Run only shard I of N (1-based); cross-file analyzers run on one shard",
+    )
+    parser.add_argument(
+        "--shard-strategy",
+        choices=["hash", "size"],
+        default="hash",
+        help="Assign files to shards by path hash or by balanced file size",
+    )
+    parser.add_argument(
+        "--result-cache",
+        action="store_true",
+        help="Reuse per-file results from the content-addressed cache",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="Shared cache directory (default: $CI_CACHE_DIR or .cache/ci-framework)",
+    )
+    parser.add_argument(
+        "--priority",
+        action="store_true",
+        help="Run cheap, high-signal analyzers first (by runtime history), keep "
+        "expensive ones in the background, and stream each analyzer's result "
+        "as a JSON line as soon as it completes",
+    )
+    parser.add_argument(
+        "--merge",
+        nargs="+",
+        metavar="REPORT",
+        help="Merge per-shard JSON reports instead of running analyzers",
+    )
+    parser.add_argument(
+        "--out",
+        help="Write the JSON report to this file (e.g. a per-shard CI artifact)",
+    )
 
     args = parser.parse_args()
+    if not args.merge and not args.target_path:
+        parser.error("target_path is required unless --merge is given")
 
-    summary_mode = (
-        not args.verbose
-    )  # Inverse logic: verbose=False means summary_mode=True
+    try:
+        report = _build_report(args)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(2)
 
-    runner = AnalysisRunner()
-    report = runner.run_all_analyses(
-        args.target_path, summary_mode, args.min_severity, args.max_files
-    )
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
 
-    # Output based on format choice
-    if args.output_format == "console":
-        # Simple console output for the combined report
-        print("=== COMPREHENSIVE ANALYSIS REPORT ===")
-        print(f"Target: {args.target_path}")
-        print(f"Timestamp: {report.get('timestamp', 'unknown')}")
-        print(f"Scripts run: {report.get('scripts_run', 0)}")
-        print(f"Success: {report.get('overall_success', False)}")
-
-        # Show combined summary
-        summary = report.get("combined_summary", {})
-        total_findings = sum(summary.values())
-        print(f"Total findings: {total_findings}")
-        for severity in ["critical", "high", "medium", "low", "info"]:
-            count = summary.get(severity, 0)
-            if count > 0:
-                print(f"  {severity.upper()}: {count}")
-    else:  # json (default)
-        # Output combined report with proper error handling for broken pipe
-        try:
-            print(json.dumps(report, indent=2))
-            sys.stdout.flush()
-        except BrokenPipeError:
-            # Handle broken pipe gracefully (e.g., when output is piped to head)
-            with contextlib.suppress(OSError, ValueError):
-                sys.stdout.close()
-            with contextlib.suppress(OSError, ValueError):
-                sys.stderr.close()
+    _print_report(args, report)
 
 
 if __name__ == "__main__":
@@ -20,3 +20,17 @@ def tech_stacks_config_path() -> Path:
         / "tech_stacks"
         / "tech_stacks.json"
     )
+
+
+@pytest.fixture(autouse=True)
+def isolated_tool_probe_cache(
+    tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch
+):
+    """Keep (often mocked) probe verdicts out of the checkout's real probe cache."""
+    from core.utils import tool_probe
+
+    cwd = Path.cwd()
+    cache_path = tmp_path_factory.mktemp("tool-probes") / "tool-probes.json"
+    cache = tool_probe.ToolProbeCache(cache_path, cwd=cwd)
+    monkeypatch.setattr(tool_probe, "_default_caches", {cwd: cache})
+    return cache
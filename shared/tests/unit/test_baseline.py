@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Unit tests for finding fingerprints and baseline comparison."""
+
+import json
+from pathlib import Path
+
+import pytest
+from core.base.baseline import Baseline, Fingerprinter, enclosing_symbols
+from core.utils.output_formatter import Finding, Severity
+
+SOURCE = """\
+class Orders:
+    def total(self):
+        rows = db.execute("SELECT * FROM orders")
+        return sum(rows)
+
+
+def helper():
+    return db.execute("SELECT * FROM orders")
+"""
+
+
+def _finding(line: int, title: str = "Select star") -> Finding:
+    return Finding("X001", title, "desc", Severity.HIGH, "app.py", line, "fix")
+
+
+def _stamped(root: Path, findings: list[Finding]) -> list[str]:
+    Fingerprinter(root).stamp("performance:sql", findings)
+    return [finding.fingerprint for finding in findings]
+
+
+def test_enclosing_symbols_follow_indentation():
+    symbols = enclosing_symbols(SOURCE.splitlines())
+    assert symbols[0] == ""
+    assert symbols[2] == "Orders.total"
+    assert symbols[7] == "helper"
+
+
+def test_fingerprints_survive_line_shifts_but_not_symbol_changes(tmp_path: Path):
+    (tmp_path / "app.py").write_text(SOURCE, encoding="utf-8")
+    before = _stamped(tmp_path, [_finding(3, "Select star at line 3"), _finding(8)])
+    assert before[0] != before[1]
+
+    (tmp_path / "app.py").write_text("import db\n\n\n" + SOURCE, encoding="utf-8")
+    after = _stamped(tmp_path, [_finding(6, "Select star at line 6"), _finding(11)])
+    assert after == before
+
+
+def test_repeated_findings_get_ordinals_in_line_order(tmp_path: Path):
+    (tmp_path / "app.py").write_text("x = 1\nx = 1\n", encoding="utf-8")
+    fingerprints = _stamped(tmp_path, [_finding(2), _finding(1)])
+    assert fingerprints[1] + ":1" == fingerprints[0]
+
+
+def test_baseline_labels_new_existing_and_fixed(tmp_path: Path):
+    (tmp_path / "app.py").write_text(SOURCE, encoding="utf-8")
+    old = [_finding(3), _finding(8)]
+    Fingerprinter(tmp_path).stamp("performance:sql", old)
+    path = tmp_path / "baseline.json"
+    payload = {"tool": "performance:sql", "findings": [f.to_dict() for f in old]}
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+    baseline = Baseline.load(path)
+    assert baseline.status(old[0].fingerprint) == "existing"
+    assert baseline.status("not-in-baseline") == "new"
+    summary = baseline.summary()
+    assert (summary["new"], summary["existing"], summary["fixed"]) == (1, 1, 1)
+    assert summary["fixed_findings"][0]["line_number"] == 8
+    assert summary["fixed_findings"][0]["tool"] == "performance:sql"
+
+
+def test_baseline_without_fingerprints_is_rejected(tmp_path: Path):
+    path = tmp_path / "old.json"
+    path.write_text(json.dumps({"findings": [{"title": "x"}]}), encoding="utf-8")
+    with pytest.raises(ValueError, match="regenerate"):
+        Baseline.load(path)
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Unit tests for adaptive, cost-based analyzer batch planning."""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+from core.base.analyzer_base import AnalyzerConfig, BaseAnalyzer
+from core.base.batch_planner import (
+    REFERENCE_FILE_BYTES,
+    ThroughputEstimate,
+    file_cost_units,
+    iter_adaptive_batches,
+)
+
+
+def _write_files(root: Path, sizes: list[int]) -> list[Path]:
+    files = []
+    for index, size in enumerate(sizes):
+        path = root / f"f{index}.py"
+        path.write_text("x" * size, encoding="utf-8")
+        files.append(path)
+    return files
+
+
+def test_probe_batch_then_budgeted_batches_largest_first(tmp_path: Path):
+    sizes = [10, REFERENCE_FILE_BYTES * 9, 10, REFERENCE_FILE_BYTES * 3, 10, 10]
+    files = _write_files(tmp_path, sizes)
+    estimate = ThroughputEstimate()
+
+    batches = iter_adaptive_batches(
+        files, estimate, target_seconds=5.0, max_batch_files=100, probe_batch_files=1
+    )
+    probe = next(batches)
+    assert probe.files == [files[1]]
+    assert probe.cost_units == pytest.approx(file_cost_units(sizes[1]))
+
+    # One second per unit: a 5 unit budget fits the ~4 unit file alone, then
+    # the four ~1 unit files together
+    estimate.observe(probe.cost_units, probe.cost_units)
+    remaining = [batch.files for batch in batches]
+    assert remaining[0] == [files[3]]
+    assert remaining[1] == [files[0], files[2], files[4], files[5]]
+
+
+def test_oversized_file_still_gets_its_own_batch(tmp_path: Path):
+    files = _write_files(tmp_path, [REFERENCE_FILE_BYTES * 50, 10])
+    estimate = ThroughputEstimate()
+    estimate.observe(1.0, 1.0)
+    batches = list(iter_adaptive_batches(files, estimate, 2.0, max_batch_files=10))
+    assert [b.files for b in batches] == [[files[0]], [files[1]]]
+
+
+def test_max_batch_files_caps_cheap_batches(tmp_path: Path):
+    files = _write_files(tmp_path, [1] * 10)
+    estimate = ThroughputEstimate()
+    estimate.observe(1.0, 0.0001)
+    batches = list(iter_adaptive_batches(files, estimate, 10.0, max_batch_files=4))
+    assert [len(b.files) for b in batches] == [4, 4, 2]
+
+
+def test_estimate_smoothing():
+    estimate = ThroughputEstimate(smoothing=0.5)
+    assert estimate.predict(10) is None
+    estimate.observe(10, 1.0)
+    estimate.observe(10, 3.0)
+    assert estimate.seconds_per_unit == pytest.approx(0.2)
+    assert estimate.predict(5) == pytest.approx(1.0)
+
+
+class _RecordingAnalyzer(BaseAnalyzer):
+    def __init__(self, config: AnalyzerConfig):
+        super().__init__("batch_planner_test", config)
+        self.batches: list[list[Path]] = []
+
+    def _process_batch(self, batch: list[Path]) -> list[dict[str, Any]]:
+        self.batches.append(list(batch))
+        return super()._process_batch(batch)
+
+    def analyze_target(self, target_path: str) -> list[dict[str, Any]]:
+        return [{"file_path": target_path, "line_number": n} for n in (1, 2)]
+
+    def get_analyzer_metadata(self) -> dict[str, Any]:
+        return {}
+
+
+def test_analyzer_schedules_large_first_and_keeps_file_order(tmp_path: Path):
+    files = _write_files(tmp_path, [10, REFERENCE_FILE_BYTES * 20, 10, 10])
+    analyzer = _RecordingAnalyzer(AnalyzerConfig(target_path=str(tmp_path)))
+    findings = analyzer.process_files_batch(files)
+
+    assert analyzer.batches[0][0] == files[1]
+    assert sum(len(batch) for batch in analyzer.batches) == len(files)
+    assert [(f["file_path"], f["line_number"]) for f in findings] == [
+        (str(path), n) for path in files for n in (1, 2)
+    ]
+
+
+def test_fixed_batching_still_available(tmp_path: Path):
+    files = _write_files(tmp_path, [10, 20, 30])
+    analyzer = _RecordingAnalyzer(
+        AnalyzerConfig(target_path=str(tmp_path), adaptive_batching=False, batch_size=2)
+    )
+    analyzer.process_files_batch(files)
+    assert analyzer.batches == [files[:2], files[2:]]
+
+
+def test_target_batch_seconds_validated():
+    with pytest.raises(ValueError, match="target_batch_seconds"):
+        AnalyzerConfig(target_batch_seconds=0)
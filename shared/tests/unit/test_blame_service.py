@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""Unit tests for the range-restricted, cached blame service."""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+from analyzers.root_cause.blame_service import (
+    BlameService,
+    git_blob_sha,
+    normalize_ranges,
+    parse_incremental_blame,
+)
+from analyzers.root_cause.recent_changes import RecentChangesAnalyzer
+
+
+def _git(repo: Path, *args: str, author: str = "Alice") -> str:
+    return subprocess.run(
+        [
+            "git",
+            "-c",
+            f"user.name={author}",
+            "-c",
+            f"user.email={author.lower()}@example.com",
+            *args,
+        ],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    repo_path = tmp_path / "repo"
+    repo_path.mkdir()
+    _git(repo_path, "init", "-q")
+    (repo_path / "app.py").write_text(
+        "".join(f"line {i}\n" for i in range(1, 21)), encoding="utf-8"
+    )
+    (repo_path / "util.py").write_text("a = 1\nb = 2\n", encoding="utf-8")
+    _git(repo_path, "add", "-A")
+    _git(repo_path, "commit", "-q", "-m", "initial")
+
+    lines = (repo_path / "app.py").read_text(encoding="utf-8").splitlines()
+    lines[9] = "line 10 changed by bob"
+    (repo_path / "app.py").write_text("\n".join(lines) + "\n", encoding="utf-8")
+    _git(repo_path, "commit", "-q", "-am", "bob edit", author="Bob")
+    return repo_path
+
+
+def test_git_blob_sha_matches_git(repo: Path):
+    expected = _git(repo, "hash-object", "app.py").strip()
+    assert git_blob_sha((repo / "app.py").read_bytes()) == expected
+
+
+def test_normalize_ranges_merges_and_clamps():
+    assert normalize_ranges([(8, 12), (-2, 1), (11, 14), (30, 40)], 20) == [
+        (1, 1),
+        (8, 14),
+    ]
+
+
+def test_blame_restricted_to_ranges(repo: Path, tmp_path: Path):
+    service = BlameService(repo, cache_dir=tmp_path / "cache")
+    result = service.blame("app.py", [(9, 11)])
+    assert result is not None
+    assert sorted(result.lines) == [9, 10, 11]
+    assert result.line_info(10)["author"] == "Bob"
+    assert result.line_info(10)["code"] == "line 10 changed by bob"
+    assert result.line_info(9)["author"] == "Alice"
+
+
+def test_cache_reuses_attributed_lines(repo: Path, tmp_path: Path):
+    service = BlameService(repo, cache_dir=tmp_path / "cache")
+    service.blame("app.py", [(1, 5)])
+    service.blame("app.py", [(2, 4)])
+    assert service.stats == {"cache_hits": 1, "blame_runs": 1, "lines_blamed": 5}
+
+    # Only the uncovered tail is blamed on an overlapping request
+    service.blame("app.py", [(4, 8)])
+    assert service.stats["blame_runs"] == 2
+    assert service.stats["lines_blamed"] == 8
+
+    # A fresh service instance picks up the persisted entry
+    fresh = BlameService(repo, cache_dir=tmp_path / "cache")
+    fresh.blame("app.py", [(1, 8)])
+    assert fresh.stats["blame_runs"] == 0
+
+
+def test_cache_invalidated_by_content_change(repo: Path, tmp_path: Path):
+    service = BlameService(repo, cache_dir=tmp_path / "cache")
+    service.blame("util.py")
+    (repo / "util.py").write_text("a = 1\nb = 3\n", encoding="utf-8")
+    result = service.blame("util.py")
+    assert service.stats["blame_runs"] == 2
+    assert result.line_info(2)["uncommitted"] is True
+
+
+def test_blame_many_runs_concurrently(repo: Path, tmp_path: Path):
+    service = BlameService(repo, max_workers=2, cache_dir=tmp_path / "cache")
+    results = service.blame_many(
+        {"app.py": [(10, 10)], "util.py": None, "missing.py": [(1, 1)]}
+    )
+    assert set(results) == {"app.py", "util.py"}
+    assert sorted(results["util.py"].lines) == [1, 2]
+
+
+def test_parse_incremental_blame_headers_once():
+    sha = "a" * 40
+    output = "\n".join(
+        [
+            f"{sha} 1 1 2",
+            "author Alice",
+            "author-time 1700000000",
+            "summary initial",
+            "boundary",
+            "filename app.py",
+            f"{sha} 5 7 1",
+            "filename app.py",
+        ]
+    )
+    commits, lines = parse_incremental_blame(output)
+    assert lines == {1: sha, 2: sha, 7: sha}
+    assert commits[sha]["author"] == "Alice"
+    assert commits[sha]["boundary"] is True
+
+
+def test_recent_changes_blame_for_locations(repo: Path):
+    analyzer = RecentChangesAnalyzer(error_info="boom")
+    info = analyzer.get_blame_info_for_locations(
+        {"app.py": [10]}, repo, context_lines=1
+    )
+    summary = info["app.py"]
+    assert dict(summary["authors"]) == {"Alice": 2, "Bob": 1}
+    assert len(summary["recent_changes"]) == 3
+
+    file_info = analyzer.get_file_blame_info(repo / "util.py", repo)
+    assert dict(file_info["authors"]) == {"Alice": 2}
+
+
+def test_error_location_blame_reported_by_analysis(repo: Path):
+    error = 'File "app.py", line 10, in main\n    ValueError: boom'
+    analyzer = RecentChangesAnalyzer(error_info=error)
+    findings = analyzer.analyze_target(str(repo))
+    (finding,) = [
+        f for f in findings if f["title"] == "Recently Changed Error Location"
+    ]
+    assert finding["line_number"] == 10
+    assert len(finding["metadata"]["commits"]) == 2
+    assert finding["metadata"]["authors"] == ["Alice", "Bob"]
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Unit tests for windowed scanning of files above the size cap."""
+
+import re
+from pathlib import Path
+from typing import Any
+
+from analyzers.performance.sqlglot_analyzer import SQLGlotAnalyzer
+from core.base.analyzer_base import AnalyzerConfig
+from core.utils.chunked_scan import FileWindow, iter_file_windows, scan_file_windows
+
+MARKER = re.compile(r"needle-\d+ spans\nnext line")
+
+
+def _marker_check(window: FileWindow) -> list[dict[str, Any]]:
+    return [
+        {"line_number": window.text[: match.start()].count("\n") + 1}
+        for match in MARKER.finditer(window.text)
+    ]
+
+
+def _write_lines(path: Path, lines: list[str]) -> None:
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def test_windows_cover_every_line_once(tmp_path: Path):
+    source = tmp_path / "big.log"
+    _write_lines(source, [f"line {n:05d}" for n in range(1, 2001)])
+
+    seen: list[int] = []
+    windows = list(iter_file_windows(source, window_bytes=1000, overlap_bytes=50))
+    for window in windows:
+        local = window.text.split("\n")
+        for index in range(window.owned_lines):
+            assert local[index] == f"line {window.line_offset + index + 1:05d}"
+            seen.append(window.line_offset + index + 1)
+
+    assert len(windows) > 10
+    assert seen == list(range(1, 2001))
+
+
+def test_matches_across_boundaries_reported_once_with_global_lines(tmp_path: Path):
+    lines = [f"filler {n}" for n in range(1, 3001)]
+    expected = []
+    for line_number in (1, 777, 1500, 2999):
+        lines[line_number - 1] = f"needle-{line_number} spans"
+        lines[line_number] = "next line"
+        expected.append(line_number)
+    source = tmp_path / "dump.sql"
+    _write_lines(source, lines)
+
+    for window_bytes in (64, 333, 4096, 1 << 20):
+        findings = scan_file_windows(
+            source, _marker_check, window_bytes=window_bytes, overlap_bytes=40
+        )
+        assert [f["line_number"] for f in findings] == expected
+
+
+def test_overlong_lines_are_split_without_duplicates(tmp_path: Path):
+    source = tmp_path / "bundle.min.js"
+    source.write_text("a" * 5000 + "\nshort\n" + "b" * 3000, encoding="utf-8")
+
+    windows = list(iter_file_windows(source, window_bytes=1000, overlap_bytes=100))
+    assert sum(len(w.text) for w in windows) < 5000 + 7 + 3000 + 2 * 1000
+    assert windows[0].line_offset == windows[1].line_offset == 0
+    assert windows[-1].line_offset == 2
+    assert windows[-1].owned_lines == 1
+    (whole,) = iter_file_windows(source, window_bytes=10**6)
+    assert whole.owned_lines == 3
+
+
+def test_empty_file_has_no_windows(tmp_path: Path):
+    source = tmp_path / "empty.sql"
+    source.write_bytes(b"")
+    assert list(iter_file_windows(source)) == []
+
+
+def _sql_dump(path: Path) -> list[int]:
+    lines = [f"INSERT INTO audit VALUES ({n}, 'x');" for n in range(1, 45001)]
+    hits = [3, 20000, 45000]
+    for line_number in hits:
+        lines[line_number - 1] = "SELECT * FROM users;"
+    _write_lines(path, lines)
+    return hits
+
+
+def test_size_cap_skips_unless_chunked(tmp_path: Path):
+    source = tmp_path / "dump.sql"
+    _sql_dump(source)
+    assert source.stat().st_size > 1024 * 1024
+
+    capped = SQLGlotAnalyzer(
+        AnalyzerConfig(code_extensions={".sql"}, max_file_size_mb=1)
+    )
+    assert not capped._within_size_limit(source)
+    assert not capped.uses_chunked_scan(source)
+
+    chunked = SQLGlotAnalyzer(
+        AnalyzerConfig(code_extensions={".sql"}, max_file_size_mb=1, chunked_scan=True)
+    )
+    assert chunked._within_size_limit(source)
+    assert chunked.uses_chunked_scan(source)
+
+
+def test_chunked_sql_scan_matches_whole_file_scan(tmp_path: Path):
+    source = tmp_path / "dump.sql"
+    hits = _sql_dump(source)
+
+    def indicator_lines(config: AnalyzerConfig) -> dict[str, list[int]]:
+        findings = SQLGlotAnalyzer(config).analyze_target(str(source))
+        by_pattern: dict[str, list[int]] = {}
+        for finding in findings:
+            pattern = finding["metadata"].get("pattern")
+            if pattern:
+                by_pattern.setdefault(pattern, []).append(finding["line_number"])
+        return by_pattern
+
+    whole = indicator_lines(AnalyzerConfig(code_extensions={".sql"}))
+    analyzer_config = AnalyzerConfig(
+        code_extensions={".sql"}, max_file_size_mb=1, chunked_scan=True
+    )
+    chunked = indicator_lines(analyzer_config)
+
+    assert whole["large_result_sets"] == hits
+    assert chunked == whole
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""Unit tests for the streaming CodeClimate converter."""
+
+import io
+import json
+from pathlib import Path
+
+import pytest
+from generators.ci.convert_analyzers_to_codeclimate import convert, write_codeclimate
+
+
+def _artifacts(root: Path) -> Path:
+    artifacts = root / "artifacts"
+    artifacts.mkdir()
+    finding = {"title": "Slow loop", "severity": "high", "file_path": "src/a.py"}
+    for index, name in enumerate(("a", "b")):
+        payload = {
+            "findings": [{**finding, "line_number": index + 1}, {**finding}],
+            "metadata": {"name": f"tool-{name}"},
+        }
+        (artifacts / f"{name}.json").write_text(json.dumps(payload), "utf-8")
+    (artifacts / "broken.json").write_text('{"findings": [', "utf-8")
+    return artifacts
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_streams_items_in_file_order_and_skips_duplicates(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, jobs: int
+):
+    monkeypatch.chdir(tmp_path)
+    artifacts = _artifacts(tmp_path)
+    stream = io.StringIO()
+
+    assert write_codeclimate(artifacts, stream, jobs) == 3
+    items = json.loads(stream.getvalue())
+    assert [item["check_name"] for item in items] == ["tool-a", "tool-b", "tool-b"]
+    assert items[0]["severity"] == "critical"
+    assert items[0]["location"] == {"path": "src/a.py", "lines": {"begin": 1}}
+    assert convert(artifacts) == items
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Unit tests for the persistent commit index used by root cause analysis."""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+from analyzers.root_cause.commit_index import CommitIndex, find_git_root
+from analyzers.root_cause.recent_changes import RecentChangesAnalyzer
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        [
+            "git",
+            "-c",
+            "user.name=Test Author",
+            "-c",
+            "user.email=test@example.com",
+            *args,
+        ],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+
+def _commit(repo: Path, files: dict[str, str], message: str) -> None:
+    for name, content in files.items():
+        path = repo / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", message)
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    repo_path = tmp_path / "repo"
+    repo_path.mkdir()
+    _git(repo_path, "init", "-q")
+    _commit(repo_path, {"app.py": "a\n", "lib/util.py": "x\n"}, "initial | setup")
+    _commit(repo_path, {"app.py": "a\nb\n"}, "hotfix: urgent login fix")
+    _commit(repo_path, {"app.py": "b\n", "README.md": "docs\n"}, "docs and cleanup")
+    return repo_path
+
+
+def test_full_build_records_commits_and_churn(repo: Path, tmp_path: Path):
+    with CommitIndex(repo, tmp_path / "index.sqlite3") as index:
+        assert index.update() == 3
+        assert index.commit_count() == 3
+
+        commits = index.recent_commits()
+        assert [c["message"] for c in commits][0] == "docs and cleanup"
+        assert commits[-1]["message"] == "initial | setup"
+        assert commits[-1]["files_changed"] == ["app.py", "lib/util.py"]
+        assert commits[0]["author"] == "Test Author"
+
+        hotspots = index.hotspots(min_changes=2)
+        assert hotspots[0]["file_path"] == "app.py"
+        assert hotspots[0]["change_count"] == 3
+        # +1 (add), +1 (append "b"), -1 (drop "a")
+        assert hotspots[0]["churn"] == 3
+
+        churn = index.churn("lib/util.py")
+        assert churn["change_count"] == 1
+        assert churn["authors"] == {"Test Author": 1}
+
+
+def test_update_is_incremental(repo: Path, tmp_path: Path):
+    db_path = tmp_path / "index.sqlite3"
+    with CommitIndex(repo, db_path) as index:
+        index.update()
+
+    _commit(repo, {"lib/util.py": "y\n"}, "refactor util")
+
+    with CommitIndex(repo, db_path) as index:
+        assert index.update() == 1
+        assert index.update() == 0
+        assert index.commit_count() == 4
+        head = _git(repo, "rev-parse", "HEAD").strip()
+        assert index.indexed_head == head
+        assert index.file_touch_counts()["lib/util.py"] == 2
+
+
+def test_rewritten_history_triggers_rebuild(repo: Path, tmp_path: Path):
+    db_path = tmp_path / "index.sqlite3"
+    with CommitIndex(repo, db_path) as index:
+        index.update()
+
+    _git(repo, "reset", "-q", "--hard", "HEAD~1")
+    _commit(repo, {"other.py": "z\n"}, "replacement commit")
+
+    with CommitIndex(repo, db_path) as index:
+        assert index.update() == 3
+        messages = {c["message"] for c in index.recent_commits()}
+        assert "docs and cleanup" not in messages
+        assert "replacement commit" in messages
+
+
+def test_path_filter_matches_suffix(repo: Path, tmp_path: Path):
+    with CommitIndex(repo, tmp_path / "index.sqlite3") as index:
+        index.update()
+        by_relative = index.recent_commits(path="lib/util.py")
+        by_absolute = index.recent_commits(path=str(repo / "lib" / "util.py"))
+        assert len(by_relative) == 1
+        assert by_absolute == by_relative
+
+
+def test_path_filter_treats_paths_literally(repo: Path, tmp_path: Path):
+    _commit(repo, {"lib/a_b.py": "x\n"}, "underscore module")
+    with CommitIndex(repo, tmp_path / "index.sqlite3") as index:
+        index.update()
+        assert len(index.recent_commits(path="/elsewhere/lib/a_b.py")) == 1
+        assert index.recent_commits(path="/elsewhere/lib/axb.py") == []
+
+
+def test_find_git_root(repo: Path, tmp_path: Path):
+    assert find_git_root(repo / "lib") == repo.resolve()
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    assert find_git_root(outside) in (None, find_git_root(tmp_path))
+
+
+def test_recent_changes_analyzer_uses_index(repo: Path):
+    analyzer = RecentChangesAnalyzer(error_info="login failure")
+    commits = analyzer.get_recent_commits(repo)
+    assert analyzer.get_commit_index(repo) is not None
+    assert len(commits) == 3
+    assert "app.py" in commits[0]["files_changed"]
+
+    changed = analyzer.get_changed_files(repo)
+    assert len(changed["app.py"]) == 3
+    assert changed["app.py"][0]["change_type"] == "M"
+
+
+def test_recent_changes_analyzer_git_fallback_matches_index(repo: Path):
+    indexed = RecentChangesAnalyzer(error_info="x").get_changed_files(repo)
+    direct = RecentChangesAnalyzer(
+        error_info="x", use_commit_index=False
+    ).get_changed_files(repo)
+    assert indexed == direct
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""Unit tests for the shareable content-addressed result cache."""
+
+import os
+import subprocess
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+from analyzers.architecture.scalability_check import ScalabilityAnalyzer
+from analyzers.performance.sqlglot_analyzer import SQLGlotAnalyzer
+from core.base.analyzer_base import AnalyzerConfig
+from core.base.content_cache import ContentAddressedCache, make_key
+from core.base.priority_schedule import HISTORY_FILE, RuntimeHistory
+from core.base.workspace_partitions import PartitionResultCache
+from core.utils.tool_probe import ToolProbeCache
+
+QUERY = "SELECT * FROM users;\nSELECT id FROM orders WHERE note LIKE '%x%';\n"
+
+
+def _checkout(root: Path) -> list[Path]:
+    paths = []
+    for name in ("a.sql", "nested/b.sql"):
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(QUERY, encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def _analyze(root: Path, files: list[Path], cache_dir: Path) -> tuple[list, dict]:
+    analyzer = SQLGlotAnalyzer(
+        AnalyzerConfig(
+            target_path=str(root),
+            code_extensions={".sql"},
+            result_cache=True,
+            cache_dir=str(cache_dir),
+        )
+    )
+    findings = analyzer._process_batch(files)
+    return findings, dict(analyzer._result_cache.stats)
+
+
+def test_second_checkout_reuses_results_with_its_own_paths(tmp_path: Path):
+    cache_dir = tmp_path / "shared-cache"
+    first, first_stats = _analyze(
+        tmp_path / "alice", _checkout(tmp_path / "alice"), cache_dir
+    )
+    second_files = _checkout(tmp_path / "ci-job")
+    second, second_stats = _analyze(tmp_path / "ci-job", second_files, cache_dir)
+
+    assert first
+    assert first_stats == {"hits": 0, "misses": 2, "writes": 2}
+    assert second_stats == {"hits": 2, "misses": 0, "writes": 0}
+    assert {f["file_path"] for f in second} == {str(p) for p in second_files}
+    assert [f["title"] for f in second] == [f["title"] for f in first]
+    for entry in cache_dir.rglob("*.json"):
+        assert str(tmp_path) not in entry.read_text(encoding="utf-8")
+
+
+def test_changed_content_misses(tmp_path: Path):
+    cache_dir = tmp_path / "cache"
+    files = _checkout(tmp_path / "repo")
+    _analyze(tmp_path / "repo", files, cache_dir)
+
+    files[0].write_text("SELECT id FROM users;\n", encoding="utf-8")
+    _, stats = _analyze(tmp_path / "repo", files, cache_dir)
+    assert stats == {"hits": 1, "misses": 1, "writes": 1}
+
+
+def test_failed_lizard_results_are_not_cached(tmp_path: Path):
+    source = tmp_path / "repo" / "loops.py"
+    source.parent.mkdir()
+    source.write_text("for a in x:\n    for b in a:\n        print(b)\n")
+    config = AnalyzerConfig(
+        target_path=str(source.parent),
+        result_cache=True,
+        cache_dir=str(tmp_path / "cache"),
+    )
+    failed = subprocess.TimeoutExpired("lizard", 10)
+    empty = subprocess.CompletedProcess(["lizard"], 0, "", "")
+
+    for outcome, writes in ((failed, 0), (empty, 1)):
+        analyzer = ScalabilityAnalyzer(config)
+        with patch.object(analyzer, "run_tool", side_effect=[outcome]):
+            analyzer._process_batch([source])
+        assert analyzer._result_cache.stats["writes"] == writes
+
+
+def test_workspace_caches_follow_the_cache_root(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("CI_CACHE_DIR", str(tmp_path / "ci-cache"))
+    history = RuntimeHistory.for_workspace(tmp_path / "repo")
+    assert history.path == tmp_path / "ci-cache" / HISTORY_FILE
+    assert (
+        ToolProbeCache(cwd=tmp_path / "repo").cache_path.parent == tmp_path / "ci-cache"
+    )
+
+    explicit = PartitionResultCache.for_workspace(tmp_path / "repo", tmp_path / "nfs")
+    assert explicit.cache_dir == tmp_path / "nfs" / "partitions"
+
+
+def test_corrupt_entry_is_a_miss(tmp_path: Path):
+    cache = ContentAddressedCache(tmp_path)
+    key = make_key("corrupt")
+    cache.put(key, [1, 2])
+    entry = next(tmp_path.rglob(f"{key}.json"))
+    entry.write_text('{"key": "', encoding="utf-8")
+
+    assert cache.get(key) is None
+    assert not entry.exists()
+    assert cache.put(key, [3])
+    assert cache.get(key) == [3]
+
+
+def _hammer(args: tuple[str, int]) -> int:
+    root, worker = args
+    cache = ContentAddressedCache(root)
+    for round_number in range(50):
+        cache.put(make_key("shared"), {"worker": worker, "payload": "x" * 5000})
+        value = cache.get(make_key("shared"))
+        assert value is None or len(value["payload"]) == 5000
+        cache.put(make_key(worker, round_number), [worker])
+    return worker
+
+
+def test_concurrent_processes_never_see_partial_entries(tmp_path: Path):
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        finished = list(pool.map(_hammer, [(str(tmp_path), n) for n in range(4)]))
+    assert sorted(finished) == [0, 1, 2, 3]
+
+    cache = ContentAddressedCache(tmp_path)
+    assert cache.get(make_key("shared"))["worker"] in range(4)
+    assert cache.usage()["entries"] == 1 + 4 * 50
+    assert not list(tmp_path.rglob(".tmp-*"))
+
+
+def test_gc_evicts_least_recently_used_to_budget(tmp_path: Path):
+    cache = ContentAddressedCache(tmp_path)
+    keys = [make_key("entry", n) for n in range(10)]
+    now = time.time()
+    for age, key in enumerate(reversed(keys)):
+        cache.put(key, "x" * 1000)
+        path = next(tmp_path.rglob(f"{key}.json"))
+        os.utime(path, (now - age * 60, now - age * 60))
+    entry_size = cache.usage()["bytes"] // len(keys)
+    stale = cache.entries_dir / "ab" / ".tmp-abandoned.json"
+    stale.parent.mkdir(parents=True, exist_ok=True)
+    stale.write_text("{", encoding="utf-8")
+    os.utime(stale, (now - 7200, now - 7200))
+
+    # Reading the oldest entry makes it the most recently used
+    assert cache.get(keys[0]) is not None
+    report = cache.gc(max_bytes=entry_size * 5)
+
+    survivors = [key for key in keys if cache.get(key) is not None]
+    assert report["remaining_bytes"] <= entry_size * 4
+    assert keys[0] in survivors
+    assert set(survivors) <= {keys[0], *keys[-4:]}
+    assert not stale.exists()
+
+
+def test_maybe_gc_runs_once_per_interval(tmp_path: Path):
+    cache = ContentAddressedCache(tmp_path, max_bytes=1)
+    cache.put(make_key("a"), "value")
+
+    assert cache.maybe_gc()["removed"] == 1
+    cache.put(make_key("b"), "value")
+    assert cache.maybe_gc() is None
+    assert cache.get(make_key("b")) == "value"
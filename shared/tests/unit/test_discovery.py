@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Unit tests for the discovery pass shared by multi-analyzer runs."""
+
+from pathlib import Path
+
+import pytest
+from analyzers.performance.sqlglot_analyzer import SQLGlotAnalyzer
+from analyzers.quality.complexity_lizard import LizardComplexityAnalyzer
+from core.base.analyzer_base import AnalyzerConfig
+from core.base.discovery import SharedDiscovery
+
+
+def _tree(root: Path) -> None:
+    for name, text in {
+        "app/query.sql": "SELECT * FROM users;\n",
+        "app/service.py": "def f(x):\n    return x\n",
+        "vendor/lib.min.js": "!function(){}();\n",
+        "notes.txt": "not code\n",
+    }.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+
+
+def _analyzers() -> list:
+    return [
+        SQLGlotAnalyzer(AnalyzerConfig(target_path=".")),
+        LizardComplexityAnalyzer(AnalyzerConfig(target_path=".")),
+    ]
+
+
+def test_shared_walk_selects_the_same_files_as_separate_scans(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.chdir(tmp_path)
+    _tree(tmp_path)
+    separate = [analyzer.scan_directory(".") for analyzer in _analyzers()]
+
+    discovery = SharedDiscovery(".")
+    shared = []
+    for analyzer in _analyzers():
+        analyzer.use_discovery(discovery)
+        shared.append(analyzer.scan_directory("."))
+
+    assert shared == separate
+    assert Path("app/query.sql") in separate[0]
+    assert Path("notes.txt") not in separate[0]
+    assert discovery.stats["walks"] == 1
+    assert discovery.stats["vendor_reuses"] >= 1
+
+
+def test_other_targets_fall_back_to_their_own_walk(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.chdir(tmp_path)
+    _tree(tmp_path)
+    expected = SQLGlotAnalyzer(AnalyzerConfig(target_path=".")).scan_directory("app")
+    analyzer = SQLGlotAnalyzer(AnalyzerConfig(target_path="."))
+    discovery = SharedDiscovery("vendor")
+    analyzer.use_discovery(discovery)
+
+    assert analyzer.scan_directory("app") == expected
+    assert discovery.stats["walks"] == 0
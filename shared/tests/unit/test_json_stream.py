@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Unit tests for streaming access to analyzer result files."""
+
+import json
+from pathlib import Path
+
+import pytest
+from core.utils.json_stream import ResultStream
+
+
+def _write(tmp_path: Path, text: str) -> Path:
+    path = tmp_path / "result.json"
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def test_findings_and_fields_match_json_loads(tmp_path: Path):
+    deep = {"a": [{"b": [{"c": [{"d": ["]}"]}]}]}]}
+    payload = {
+        "tool": "demo",
+        "findings": [
+            {"title": 'brackets ] } in "strings" \\', "evidence": deep},
+            {"title": "second", "line_number": 3},
+            7,
+        ],
+        "metadata": {"name": "demo", "nested": {"findings": [1]}},
+        "raw": {"findings": [{"x": 1}]},
+    }
+    for indent in (None, 2):
+        path = _write(tmp_path, json.dumps(payload, indent=indent))
+        with ResultStream(path) as stream:
+            assert len(stream) == 3
+            assert list(stream.findings()) == payload["findings"]
+            assert stream.get("metadata") == payload["metadata"]
+            assert stream.get("missing", "default") == "default"
+
+
+@pytest.mark.parametrize(
+    ("text", "message"),
+    [
+        ("", "empty file"),
+        ("[1, 2]", "not a JSON object"),
+        ('"x"', "not a JSON object"),
+        ('{"a": [1}', "unbalanced brackets"),
+        ('{"a": 1} {"b": 2}', "not a single JSON object"),
+        ('{"findings": [{"t": 1}', "not a complete JSON object"),
+        ('{"a": , "b": 1}', "missing value for 'a'"),
+    ],
+)
+def test_rejects_anything_but_one_json_object(tmp_path: Path, text: str, message: str):
+    with pytest.raises(ValueError, match=message):
+        ResultStream(_write(tmp_path, text))
+
+
+@pytest.mark.parametrize("text", ["[1,]", "[,1]", "[1,,2]", "[,]"])
+def test_rejects_empty_elements_between_separators(tmp_path: Path, text: str):
+    with pytest.raises(ValueError, match="empty element in 'findings'"):
+        ResultStream(_write(tmp_path, f'{{"findings": {text}}}'))
+
+
+def test_empty_findings_array(tmp_path: Path):
+    with ResultStream(_write(tmp_path, '{"findings": [ ]}')) as stream:
+        assert len(stream) == 0
+
+
+def test_non_array_findings_yield_nothing(tmp_path: Path):
+    with ResultStream(_write(tmp_path, '{"findings": null}')) as stream:
+        assert list(stream.findings()) == []
@@ -8,11 +8,14 @@ and overall pattern classification capabilities.
 
 import ast
 import tempfile
+import time
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from analyzers.quality.pattern_classifier import (
     AntiPatternDetector,
+    ASTDispatcher,
     CodeSmellDetector,
     CompositePatternClassifier,
     PatternMatch,
@@ -659,3 +662,129 @@ class TestLegacyFunction:
         # Should handle errors gracefully
         assert "success" in results
         assert "error" in results or results["findings"] == []
+
+
+def _synthetic_module(classes: int = 40) -> str:
+    """Build a module mixing classes, methods, calls and branches."""
+    lines = ["import random", ""]
+    for c in range(classes):
+        lines.append(f"class Service{c}:")
+        lines.append("    def __init__(self, repo, cache, clock):")
+        lines.append("        self.repo = repo")
+        lines.append("        self.cache = cache")
+        for m in range(6):
+            lines.append(f"    def handle_{m}(self, repo, cache, clock):")
+            lines.append("        if clock.now > 1:")
+            lines.append("            return repo.load(cache.key, clock.now)")
+            lines.append("        elif clock.later:")
+            lines.append("            cursor.execute('SELECT ' + repo.name)")
+            lines.append("        value = random.random()")
+            lines.append("        return value")
+        lines.append("")
+    return "\n".join(lines)
+
+
+class TestSinglePassDispatch:
+    """Test the shared single-parse, single-traversal detector dispatch."""
+
+    def test_dispatcher_tracks_scope(self):
+        """Callbacks see the enclosing class/function scope."""
+        code = """
+class Outer:
+    def method(self):
+        def helper():
+            return 1
+        return helper()
+
+def free():
+    pass
+"""
+        seen = {}
+        dispatcher = ASTDispatcher()
+        dispatcher.on(
+            ast.FunctionDef,
+            lambda node, scope: seen.setdefault(
+                node.name, (scope.qualname, scope.class_scope is not None)
+            ),
+        )
+        dispatcher.walk(ast.parse(code))
+
+        assert seen == {
+            "method": ("Outer.method", True),
+            "helper": ("Outer.method.helper", True),
+            "free": ("free", False),
+        }
+
+    def test_classifier_parses_and_walks_once(self):
+        """All default detectors share one ast.parse and one traversal."""
+        classifier = CompositePatternClassifier()
+        code = _synthetic_module(3)
+
+        with (
+            patch(
+                "analyzers.quality.pattern_classifier.ast.parse", wraps=ast.parse
+            ) as parse_spy,
+            patch(
+                "analyzers.quality.pattern_classifier.ast.walk", wraps=ast.walk
+            ) as walk_spy,
+            patch.object(
+                ASTDispatcher, "walk", autospec=True, side_effect=ASTDispatcher.walk
+            ) as dispatch_spy,
+        ):
+            matches = classifier.classify_patterns(code, "synthetic.py")
+
+        assert matches
+        assert parse_spy.call_count == 1
+        assert dispatch_spy.call_count == 1
+        assert walk_spy.call_count == 0
+
+    def test_shared_walk_matches_standalone_detectors(self):
+        """The shared traversal reports exactly what each detector finds alone."""
+        code = _synthetic_module(5)
+        detectors = [
+            AntiPatternDetector(),
+            CodeSmellDetector(),
+            SecurityPatternDetector(),
+        ]
+
+        def keys(matches):
+            return sorted(
+                (m.pattern_name, m.start_line, m.end_line, m.description)
+                for m in matches
+            )
+
+        standalone = [m for d in detectors for m in d.detect_patterns(code, "s.py")]
+        shared = CompositePatternClassifier(detectors=detectors).classify_patterns(
+            code, "s.py"
+        )
+        assert keys(shared) == keys(standalone)
+
+    def test_benchmark_cost_flat_as_detectors_added(self):
+        """Per-file cost grows far slower than the number of detectors."""
+        code = _synthetic_module()
+
+        def best_time(copies: int) -> float:
+            classifier = CompositePatternClassifier(
+                detectors=[
+                    detector_cls()
+                    for _ in range(copies)
+                    for detector_cls in (
+                        AntiPatternDetector,
+                        CodeSmellDetector,
+                        SecurityPatternDetector,
+                    )
+                ]
+            )
+            best = float("inf")
+            for _ in range(5):
+                start = time.perf_counter()
+                classifier.classify_patterns(code, "bench.py")
+                best = min(best, time.perf_counter() - start)
+            return best
+
+        baseline = best_time(1)
+        eightfold = best_time(8)
+
+        # Separate parse-and-walk passes would scale ~8x; one shared traversal
+        # only adds the callbacks themselves.
+        assert eightfold < baseline * 4
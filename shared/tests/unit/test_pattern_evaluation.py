@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Unit tests for pattern_evaluation.py - Architecture Pattern Evaluation."""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from analyzers.architecture.pattern_evaluation import PatternEvaluationAnalyzer
+
+_EMPTY_LIZARD = {"functions": [], "avg_ccn": 0, "max_ccn": 0, "total_functions": 0}
+
+
+@pytest.fixture
+def analyzer():
+    with patch.object(
+        PatternEvaluationAnalyzer, "_get_lizard_metrics", return_value=_EMPTY_LIZARD
+    ):
+        yield PatternEvaluationAnalyzer()
+
+
+def _pattern_lines(findings):
+    return sorted(
+        (f["metadata"]["pattern_name"], f["line_number"])
+        for f in findings
+        if "pattern_name" in f["metadata"]
+    )
+
+
+def test_large_file_is_chunked_not_skipped(analyzer, tmp_path: Path):
+    filler = "".join(f"value_{i} = {i}\n" for i in range(3000))
+    source = tmp_path / "big.py"
+    source.write_text(
+        filler + "class OrderRepository:\n    def save(self):\n        pass\n",
+        encoding="utf-8",
+    )
+    assert len(source.read_text(encoding="utf-8")) > 50_000
+
+    findings = analyzer.analyze_target(str(source))
+
+    assert ("repository", 3001) in _pattern_lines(findings)
+    assert ("repository", 3002) in _pattern_lines(findings)
+
+
+def test_analyzer_runs_in_thread_pool(analyzer, tmp_path: Path):
+    paths = []
+    for i in range(4):
+        path = tmp_path / f"service_{i}.py"
+        path.write_text(f"class Billing{i}Service:\n    pass\n", encoding="utf-8")
+        paths.append(str(path))
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(analyzer.analyze_target, paths))
+
+    for findings in results:
+        assert ("service", 1) in _pattern_lines(findings)
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Unit tests for the pattern pack build step and artifact cache."""
+
+import json
+import os
+import re
+import shutil
+from pathlib import Path
+
+import pytest
+from core.config.pattern_packs import (
+    DEFAULT_CONFIG_ROOT,
+    PatternPackError,
+    build_pattern_packs,
+    compiled_regex,
+    config_digest,
+    default_pattern_packs,
+    load_config_json,
+    load_pattern_packs,
+)
+
+
+@pytest.fixture
+def config_root(tmp_path: Path) -> Path:
+    root = tmp_path / "config"
+    shutil.copytree(DEFAULT_CONFIG_ROOT, root)
+    return root
+
+
+def test_shipped_packs_build_and_compile():
+    payload = build_pattern_packs()
+    assert payload["regex_count"] > 0
+    assert "patterns/scalability/database.json" in payload["packs"]["scalability"]
+    assert "tech_stacks/tech_stacks.json" in payload["packs"]["tech_stacks"]
+    assert "formatters/ruff.toml" in payload["packs"]["formatters"]
+
+
+def test_digest_tracks_content(config_root: Path):
+    before = config_digest(config_root)
+    assert config_digest(config_root) == before
+
+    target = config_root / "patterns" / "scalability" / "database.json"
+    data = json.loads(target.read_text(encoding="utf-8"))
+    data["patterns"]["large_result_sets"]["severity"] = "low"
+    target.write_text(json.dumps(data), encoding="utf-8")
+    assert config_digest(config_root) != before
+
+
+def test_artifact_reused_until_config_changes(
+    config_root: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    cache_dir = tmp_path / "cache"
+    first = load_pattern_packs(config_root, cache_dir)
+    artifacts = list(cache_dir.glob("pattern-packs-v*.json"))
+    assert len(artifacts) == 1
+    assert json.loads(artifacts[0].read_text())["digest"] == first.digest
+
+    # A second load checks the stat manifest without re-hashing any source
+    mtime = artifacts[0].stat().st_mtime_ns
+    with monkeypatch.context() as patched:
+        patched.setattr(
+            "core.config.pattern_packs.config_digest",
+            lambda root: pytest.fail("sources re-hashed"),
+        )
+        second = load_pattern_packs(config_root, cache_dir)
+    assert second.digest == first.digest
+    assert artifacts[0].stat().st_mtime_ns == mtime
+
+    (config_root / "security" / "detect_secrets.json").write_text(
+        json.dumps({"schema_version": 1, "code_extensions": []}), encoding="utf-8"
+    )
+    third = load_pattern_packs(config_root, cache_dir)
+    assert third.digest != first.digest
+    assert third.get("security/detect_secrets.json")["code_extensions"] == []
+
+
+def test_touched_sources_rehashed_but_not_rebuilt(
+    config_root: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    cache_dir = tmp_path / "cache"
+    first = load_pattern_packs(config_root, cache_dir)
+    target = config_root / "security" / "detect_secrets.json"
+    target.write_bytes(target.read_bytes())
+    os.utime(target, ns=(1, 1))
+
+    monkeypatch.setattr(
+        "core.config.pattern_packs.build_pattern_packs",
+        lambda root: pytest.fail("artifact rebuilt"),
+    )
+    assert load_pattern_packs(config_root, cache_dir).digest == first.digest
+    # The refreshed manifest makes the next load stat-only again
+    assert load_pattern_packs(config_root, cache_dir).digest == first.digest
+
+
+def test_invalid_regex_fails_build(config_root: Path):
+    target = config_root / "patterns" / "error" / "patterns.json"
+    data = json.loads(target.read_text(encoding="utf-8"))
+    first_pattern = next(iter(data["patterns"]))
+    data["patterns"][first_pattern]["patterns"].append("(unclosed")
+    target.write_text(json.dumps(data), encoding="utf-8")
+
+    with pytest.raises(PatternPackError, match="patterns/error/patterns.json"):
+        build_pattern_packs(config_root)
+
+
+def test_missing_schema_version_fails_build(config_root: Path):
+    (config_root / "tech_stacks" / "extra.json").write_text("{}", encoding="utf-8")
+    with pytest.raises(PatternPackError, match="schema_version"):
+        build_pattern_packs(config_root)
+
+
+def test_load_config_json_serves_packed_copies(tmp_path: Path):
+    if default_pattern_packs() is None:
+        pytest.skip("pattern packs unavailable in this environment")
+
+    path = DEFAULT_CONFIG_ROOT / "patterns" / "error" / "error_type_map.json"
+    packed = load_config_json(path)
+    assert packed == json.loads(path.read_text(encoding="utf-8"))
+    packed["mutated"] = True
+    assert "mutated" not in load_config_json(path)
+
+    # Paths outside the shipped config root are read from disk
+    outside = tmp_path / "custom.json"
+    outside.write_text('{"schema_version": 1}', encoding="utf-8")
+    assert load_config_json(outside) == {"schema_version": 1}
+    with pytest.raises(FileNotFoundError):
+        load_config_json(tmp_path / "missing.json")
+
+
+def test_compiled_regex_is_memoized():
+    flags = re.MULTILINE | re.IGNORECASE
+    assert compiled_regex(r"select\s+\*", flags) is compiled_regex(
+        r"select\s+\*", flags
+    )
+    with pytest.raises(re.error):
+        compiled_regex("(unclosed")
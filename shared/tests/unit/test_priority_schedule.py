@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Unit tests for priority scheduling of interactive analyzer runs."""
+
+import threading
+from pathlib import Path
+
+import pytest
+from core.base.priority_schedule import (
+    BACKGROUND_SECONDS,
+    RuntimeHistory,
+    plan_priority,
+    run_prioritized,
+    severity_signal,
+    tool_queue_seconds,
+)
+
+
+def test_history_round_trips_and_smooths(tmp_path: Path):
+    history = RuntimeHistory.for_workspace(tmp_path)
+    history.record("quality:lizard", 10.0, 4)
+    history.record("quality:lizard", 20.0, 0)
+    history.save()
+
+    reloaded = RuntimeHistory.for_workspace(tmp_path)
+    assert reloaded.predict("quality:lizard") == pytest.approx(13.0)
+    assert reloaded.signal("quality:lizard") == pytest.approx(2.8)
+    assert reloaded.entries["quality:lizard"]["runs"] == 2
+
+
+def test_corrupt_history_falls_back_to_priors(tmp_path: Path):
+    path = tmp_path / "history.json"
+    path.write_text("{not json", encoding="utf-8")
+    history = RuntimeHistory(path)
+
+    assert history.predict("security:semgrep", expensive=True) >= BACKGROUND_SECONDS
+    assert history.predict("quality:lizard") < BACKGROUND_SECONDS
+
+
+def test_plan_orders_by_cost_per_signal_and_backgrounds_slow_analyzers():
+    history = RuntimeHistory(None)
+    history.record("slow:signal", 4.0, 9)
+    history.record("fast:quiet", 1.0, 0)
+    history.record("fast:signal", 1.0, 3)
+
+    plan = plan_priority(
+        [
+            ("coupling", "architecture:coupling", True),
+            ("slow", "slow:signal", False),
+            ("quiet", "fast:quiet", False),
+            ("signal", "fast:signal", False),
+        ],
+        history,
+    )
+
+    assert [entry.name for entry in plan] == ["signal", "slow", "quiet", "coupling"]
+    assert [entry.background for entry in plan] == [False, False, False, True]
+
+
+def test_foreground_results_flush_while_background_runs():
+    history = RuntimeHistory(None)
+    history.record("fast:a", 0.1, 1)
+    history.record("fast:b", 0.2, 1)
+    plan = plan_priority(
+        [("slow", "slow:x", True), ("a", "fast:a", False), ("b", "fast:b", False)],
+        history,
+    )
+    foreground_done = threading.Event()
+    flushed: list[str] = []
+
+    def run_one(entry):
+        if entry.background:
+            # Only finishes if the foreground was flushed without waiting for it
+            assert foreground_done.wait(timeout=5)
+        return entry.name
+
+    def on_result(entry, result, seconds):
+        flushed.append(result)
+        if result == "b":
+            foreground_done.set()
+
+    run_prioritized(plan, run_one, on_result)
+
+    assert flushed == ["a", "b", "slow"]
+
+
+def test_background_failure_is_raised_after_the_rest_finish():
+    plan = plan_priority(
+        [("slow", "slow:x", True), ("a", "fast:a", False)], RuntimeHistory(None)
+    )
+    flushed: list[str] = []
+
+    def run_one(entry):
+        if entry.background:
+            raise RuntimeError("tool crashed")
+        return entry.name
+
+    with pytest.raises(RuntimeError, match="tool crashed"):
+        run_prioritized(plan, run_one, lambda e, r, s: flushed.append(r))
+    assert flushed == ["a"]
+
+
+def test_signal_and_queue_helpers():
+    assert severity_signal({"critical": 1, "high": 2, "low": 5}) == 3
+    metadata = {"tool_invocations": [{"queued_seconds": 1.5}, {}]}
+    assert tool_queue_seconds(metadata) == 1.5
+    assert tool_queue_seconds({}) == 0.0
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Unit tests for budgeted regex evaluation and chunked text windows."""
+
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import pairwise
+
+import pytest
+from core.utils.regex_budget import RegexTimeBudget, iter_text_windows
+
+
+@pytest.fixture
+def budget():
+    with RegexTimeBudget(timeout_seconds=1.0) as runner:
+        yield runner
+
+
+def test_windows_are_line_aligned_and_cover_text():
+    text = "".join(f"line {i}\n" for i in range(1000))
+    windows = list(iter_text_windows(text, chunk_chars=500, overlap_chars=50))
+
+    assert windows[0].start == 0
+    assert windows[-1].owned_end == len(text)
+    for previous, current in pairwise(windows):
+        assert current.start == previous.owned_end
+        assert previous.end >= previous.owned_end
+    for window in windows:
+        assert window.start == 0 or text[window.start - 1] == "\n"
+
+
+def test_find_starts_reports_invalid_patterns(budget):
+    results = budget.find_starts([(r"b+", 0), (r"(", 0)], "abbcb")
+    assert results == [[1, 4], None]
+
+
+def test_catastrophic_pattern_is_killed_and_others_still_run(budget):
+    start = time.perf_counter()
+    results = budget.find_starts([(r"a", 0), (r"(a+)+$", 0), (r"!", 0)], "a" * 40 + "!")
+    elapsed = time.perf_counter() - start
+
+    assert results[0][:1] == [0]
+    assert results[1] is None
+    assert results[2] == [40]
+    assert budget.stats["timeouts"] == 1
+    assert elapsed < 10
+
+
+def test_windowed_offsets_match_whole_text_scan(budget):
+    text = "".join(f"item {i} = value\n" for i in range(3000))
+    pattern = r"^item (\d+)"
+    expected = [m.start() for m in re.finditer(pattern, text, re.MULTILINE)]
+
+    (starts,) = budget.find_starts_windowed(
+        [(pattern, re.MULTILINE)],
+        text,
+        max_matches=len(expected),
+        chunk_chars=2_000,
+        overlap_chars=100,
+    )
+    assert starts == expected
+
+
+def test_budget_works_off_main_thread():
+    def scan(_):
+        assert threading.current_thread() is not threading.main_thread()
+        with RegexTimeBudget(timeout_seconds=1.0) as runner:
+            return runner.find_starts([(r"x", 0)], "axbx")
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        assert list(pool.map(scan, range(2))) == [[[1, 3]], [[1, 3]]]
+
+
+def test_windowed_drops_pattern_after_timeout():
+    with RegexTimeBudget(timeout_seconds=0.5) as runner:
+        text = ("a" * 30 + "!\n") * 400
+        results = runner.find_starts_windowed(
+            [(r"(a+)+$", re.MULTILINE), (r"!", 0)],
+            text,
+            max_matches=5,
+            chunk_chars=1_000,
+            overlap_chars=50,
+        )
+        assert results[0] is None
+        assert results[1] == [30, 62, 94, 126, 158]
+        assert runner.stats["timeouts"] == 1
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""Unit tests for opt-in resource accounting in analyzer results."""
+
+import subprocess
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+import pytest
+from core.base.analyzer_base import AnalyzerConfig, BaseAnalyzer
+from core.base.resource_usage import ResourceTracker, peak_rss_mb
+from integration.cli.run_all_analyzers import AnalysisRunner
+
+
+class _AllocatingAnalyzer(BaseAnalyzer):
+    def __init__(self, config: AnalyzerConfig):
+        super().__init__("resource_usage_test", config)
+        self.retained: list[bytes] = []
+
+    def analyze_target(self, target_path: str) -> list[dict[str, Any]]:
+        self.retained.append(bytes(256 * 1024))
+        return []
+
+    def get_analyzer_metadata(self) -> dict[str, Any]:
+        return {}
+
+
+def _write_sources(root: Path, count: int) -> list[Path]:
+    paths = []
+    for index in range(count):
+        path = root / f"m{index}.py"
+        path.write_text(f"value = {index}\n", encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def _run(analyzer: BaseAnalyzer, files: list[Path]) -> Any:
+    # Drive the analyze() lifecycle directly: scan_directory skips tmp paths
+    analyzer.start_analysis()
+    analyzer._process_batch(files)
+    return analyzer.complete_analysis(analyzer.create_result("analysis"))
+
+
+def test_tracker_reports_peak_rss_and_stops_tracing():
+    assert not tracemalloc.is_tracing()
+    tracker = ResourceTracker(memory_profile=True, top_n=3)
+    tracker.start()
+    held = [bytes(64 * 1024) for _ in range(4)]
+    usage = tracker.stop()
+
+    assert not tracemalloc.is_tracing()
+    assert usage["peak_rss_mb"] == peak_rss_mb()
+    assert usage["peak_rss_delta_mb"] >= 0
+    assert usage["child_peak_rss_mb"] == peak_rss_mb(children=True)
+    assert usage["tracemalloc"]["peak_mb"] >= 0.25
+    assert 0 < len(usage["tracemalloc"]["top_allocations"]) <= 3
+    assert __file__ in usage["tracemalloc"]["top_allocations"][0]["location"]
+    del held
+
+
+def test_accounting_is_off_by_default(tmp_path: Path):
+    files = _write_sources(tmp_path, 2)
+    analyzer = _AllocatingAnalyzer(AnalyzerConfig(target_path=str(tmp_path)))
+    result = _run(analyzer, files)
+
+    assert "resource_usage" not in result.metadata
+    assert analyzer.bytes_processed == 0
+
+
+def test_memory_profile_records_usage_in_metadata(tmp_path: Path):
+    files = _write_sources(tmp_path, 3)
+    config = AnalyzerConfig(target_path=str(tmp_path), memory_profile=True)
+    result = _run(_AllocatingAnalyzer(config), files)
+
+    usage = result.metadata["resource_usage"]
+    assert usage["files_processed"] == 3
+    assert usage["bytes_processed"] == sum(f.stat().st_size for f in files)
+    assert usage["tracemalloc"]["current_mb"] >= 0.75
+    assert not tracemalloc.is_tracing()
+
+
+def test_executive_summary_includes_resource_usage():
+    runner = AnalysisRunner()
+    results = {
+        "quality_lizard": {
+            "findings": [],
+            "runner_duration": 1.5,
+            "metadata": {
+                "resource_usage": {
+                    "peak_rss_mb": 120.0,
+                    "peak_rss_delta_mb": 4.0,
+                    "child_peak_rss_mb": 900.0,
+                    "child_peak_rss_delta_mb": 850.0,
+                    "files_processed": 10,
+                    "bytes_processed": 2048,
+                }
+            },
+        },
+        "architecture_coupling": {
+            "findings": [],
+            "metadata": {
+                "resource_usage": {
+                    "peak_rss_mb": 180.0,
+                    "peak_rss_delta_mb": 60.0,
+                    "files_processed": 5,
+                    "bytes_processed": 1024,
+                    "tracemalloc": {
+                        "peak_mb": 55.0,
+                        "top_allocations": [{"location": "a.py:1", "size_kb": 9.0}],
+                    },
+                }
+            },
+        },
+        "root_cause_trace": {"findings": [], "metadata": {}},
+    }
+
+    usage = runner.generate_executive_summary(results)["resource_usage"]
+    assert usage["max_peak_rss_mb"] == 180.0
+    assert usage["largest_memory_growth"] == "architecture_coupling"
+    assert usage["max_child_peak_rss_mb"] == 900.0
+    assert usage["largest_child_memory_growth"] == "quality_lizard"
+    assert usage["total_files_processed"] == 15
+    assert usage["total_bytes_processed"] == 3072
+    assert set(usage["by_analyzer"]) == {"quality_lizard", "architecture_coupling"}
+    coupling = usage["by_analyzer"]["architecture_coupling"]
+    assert coupling["traced_peak_mb"] == 55.0
+    assert coupling["top_allocation"]["location"] == "a.py:1"
+
+    assert "resource_usage" not in runner.generate_executive_summary(
+        {"root_cause_trace": {"findings": []}}
+    )
+
+
+def test_tracker_attributes_child_process_memory():
+    tracker = ResourceTracker()
+    tracker.start()
+    subprocess.run(
+        [sys.executable, "-c", "block = bytearray(64 * 1024 * 1024)"], check=True
+    )
+    usage = tracker.stop()
+
+    if usage["child_peak_rss_mb"] is None:
+        pytest.skip("resource module unavailable")
+    assert usage["child_peak_rss_mb"] >= 64
+    assert usage["child_peak_rss_delta_mb"] >= 0
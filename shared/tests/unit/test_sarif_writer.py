@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Unit tests for the streaming SARIF writer."""
+
+import io
+import json
+from pathlib import Path
+
+import pytest
+from core.utils.output_formatter import AnalysisResult, AnalysisType, Finding, Severity
+from core.utils.sarif_writer import SarifWriter
+
+
+def _result(findings: list[Finding]) -> AnalysisResult:
+    return AnalysisResult(AnalysisType.PERFORMANCE, "demo", ".", findings)
+
+
+def test_runs_share_rules_and_map_levels_and_locations(tmp_path: Path):
+    source = tmp_path / "src" / "app.py"
+    findings = [
+        Finding("P1", "Loop at line 4", "slow", Severity.HIGH, str(source), 4, "fix"),
+        Finding("P2", "Loop at line 9", "slow", Severity.HIGH, str(source), 9, "fix"),
+        Finding("P3", "Big file", "large", Severity.MEDIUM, str(source), None),
+        Finding("P4", "Noise", "n", Severity.INFO, None, None),
+    ]
+    findings[0].fingerprint = "abc"
+    failed = _result([])
+    failed.set_error("tool crashed")
+
+    stream = io.StringIO()
+    with SarifWriter(stream, tmp_path) as writer:
+        writer.write_result(_result(findings), "performance:demo")
+        writer.write_result(failed, "quality:broken")
+    log = json.loads(stream.getvalue())
+
+    assert log["version"] == "2.1.0"
+    run, broken = log["runs"]
+    rules = run["tool"]["driver"]["rules"]
+    assert [rule["id"] for rule in rules] == ["Loop-at-line", "Big-file"]
+    results = run["results"]
+    assert [r["ruleIndex"] for r in results] == [0, 0, 1]
+    assert [r["level"] for r in results] == ["error", "error", "warning"]
+    location = results[0]["locations"][0]["physicalLocation"]
+    assert location["artifactLocation"] == {
+        "uri": "src/app.py",
+        "uriBaseId": "%SRCROOT%",
+    }
+    assert location["region"] == {"startLine": 4}
+    assert "region" not in results[2]["locations"][0]["physicalLocation"]
+    assert results[0]["partialFingerprints"] == {"enaibleFingerprint/v1": "abc"}
+    assert broken["results"] == []
+    assert broken["invocations"][0]["executionSuccessful"] is False
+
+
+def test_closed_writer_rejects_results():
+    writer = SarifWriter(io.StringIO())
+    writer.close()
+    with pytest.raises(ValueError, match="already closed"):
+        writer.write_result(_result([]))
+
+
+def test_paths_outside_root_are_absolute_without_base(tmp_path: Path):
+    outside = tmp_path / "vendor" / "lib.py"
+    finding = Finding("P1", "Loop", "slow", Severity.HIGH, str(outside), 2)
+    stream = io.StringIO()
+    with SarifWriter(stream, tmp_path / "project") as writer:
+        writer.write_result(_result([finding]))
+    (result,) = json.loads(stream.getvalue())["runs"][0]["results"]
+    artifact = result["locations"][0]["physicalLocation"]["artifactLocation"]
+    assert artifact == {"uri": outside.resolve().as_uri()}
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Unit tests for the streaming security findings Markdown renderer."""
+
+import io
+import json
+from pathlib import Path
+
+import pytest
+from generators.ci.security_findings_to_markdown import (
+    NO_FINDINGS,
+    SecurityDigest,
+    load_digest,
+    render,
+)
+
+
+def _finding(check: str, path: str, line: int, severity: str = "medium") -> dict:
+    return {
+        "title": f"{check} issue",
+        "severity": severity,
+        "file_path": path,
+        "line_number": line,
+        "evidence": {"check_id": check},
+    }
+
+
+def _artifacts(root: Path) -> Path:
+    semgrep = [
+        _finding("sqli", "b.py", 3),
+        _finding("sqli", "a.py", 9),
+        _finding("sqli", "a.py", 9),
+        _finding("xss", "c.py", 1, "low"),
+    ]
+    secrets = [_finding("sqli", "c.py", 2, "critical")]
+    (root / "security_semgrep.json").write_text(json.dumps({"findings": semgrep}))
+    (root / "security_secrets.json").write_text(json.dumps({"findings": secrets}))
+    return root
+
+
+def test_digest_aggregates_rules_across_files(tmp_path: Path):
+    digest = load_digest(_artifacts(tmp_path))
+    assert digest.total == 5
+    sqli, xss = digest.ranked()
+    assert (sqli.check, sqli.severity, sqli.affected) == ("sqli", "critical", 3)
+    assert sqli.example == ("b.py", 3)
+    assert sqli.locations == ["a.py:9", "b.py:3", "c.py:2"]
+    assert (xss.severity, xss.affected) == ("low", 1)
+
+
+def test_unparsable_file_contributes_nothing(tmp_path: Path):
+    _artifacts(tmp_path)
+    (tmp_path / "security_secrets.json").write_text('{"findings": [{"title": "x"},')
+    digest = load_digest(tmp_path)
+    assert digest.total == 4
+    assert digest.ranked()[0].severity == "medium"
+
+
+def test_budgets_cap_detailed_sections(tmp_path: Path):
+    stream = io.StringIO()
+    total = render(_artifacts(tmp_path), stream, max_details=1, max_locations=2)
+    markdown = stream.getvalue()
+    assert total == 5
+    assert markdown.startswith("=== BEGIN_SECURITY_MD ===\n")
+    assert markdown.endswith("=== END_SECURITY_MD ===")
+    assert "| 2 | xss | xss issue | 1 | low | c.py:1 |" in markdown
+    assert "Affected locations: a.py:9, b.py:3, … (+1 more)" in markdown
+    assert "### xss issue" not in markdown
+    assert "_1 more entries not detailed" in markdown
+
+
+def test_location_budget_keeps_first_locations_in_sort_order():
+    digest = SecurityDigest(max_locations=2)
+    for path in ("d.py", "b.py", "c.py", "a.py", "b.py"):
+        digest.add(_finding("sqli", path, 1))
+    (group,) = digest.ranked()
+    assert group.locations == ["a.py:1", "b.py:1"]
+    assert (group.affected, group.located) == (4, 4)
+
+
+def test_no_findings_and_negative_budgets(tmp_path: Path):
+    stream = io.StringIO()
+    assert render(tmp_path, stream) == 0
+    assert stream.getvalue() == NO_FINDINGS
+    with pytest.raises(ValueError, match="max_details"):
+        render(tmp_path, io.StringIO(), max_details=-1)
+    with pytest.raises(ValueError, match="max_locations"):
+        SecurityDigest(max_locations=-1)
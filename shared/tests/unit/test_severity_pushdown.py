@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Unit tests for applying min_severity during analysis (severity pushdown)."""
+
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from analyzers.architecture.scalability_check import (
+    ScalabilityAnalyzer,
+    _load_scalability_pattern_bundle,
+)
+from analyzers.security.semgrep_analyzer import SemgrepAnalyzer
+from core.base.analyzer_base import AnalyzerConfig, BaseAnalyzer
+
+NESTED_LOOPS = """
+def cube(data):
+    total = [x for a in data for b in a for x in b]
+    for i in data:
+        for j in data:
+            for k in data:
+                for m in data:
+                    total.append(i + j + k + m)
+    return total
+"""
+
+
+class _MixedSeverityAnalyzer(BaseAnalyzer):
+    def __init__(self, config: AnalyzerConfig):
+        super().__init__("pushdown_test", config)
+
+    def analyze_target(self, target_path: str) -> list[dict[str, Any]]:
+        return [
+            {"file_path": target_path, "severity": severity}
+            for severity in ("critical", "high", "medium", "low", "info")
+        ]
+
+    def get_analyzer_metadata(self) -> dict[str, Any]:
+        return {}
+
+
+def test_pushdown_is_off_by_default(tmp_path: Path):
+    analyzer = _MixedSeverityAnalyzer(AnalyzerConfig(target_path=str(tmp_path)))
+    assert analyzer.severity_enabled("low")
+    assert len(analyzer._process_batch([tmp_path / "a.py"])) == 5
+
+
+def test_batches_drop_findings_below_threshold(tmp_path: Path):
+    config = AnalyzerConfig(
+        target_path=str(tmp_path), min_severity="high", severity_pushdown=True
+    )
+    analyzer = _MixedSeverityAnalyzer(config)
+
+    assert analyzer.severity_enabled("critical")
+    assert not analyzer.severity_enabled("medium")
+    findings = analyzer._process_batch([tmp_path / "a.py"])
+    assert [f["severity"] for f in findings] == ["critical", "high"]
+
+
+def _scalability(tmp_path: Path, min_severity: str) -> ScalabilityAnalyzer:
+    # Other tests leave a temp-config bundle cached; use the shipped patterns
+    _load_scalability_pattern_bundle.cache_clear()
+    analyzer = ScalabilityAnalyzer()
+    analyzer.config.min_severity = min_severity
+    analyzer.config.severity_pushdown = True
+    return analyzer
+
+
+def test_scalability_skips_medium_rules_and_checks(tmp_path: Path):
+    source = tmp_path / "loops.py"
+    source.write_text(NESTED_LOOPS, encoding="utf-8")
+    analyzer = _scalability(tmp_path, "high")
+
+    active = analyzer._active_pattern_sets()
+    assert active
+    assert all(
+        spec["severity"] == "high"
+        for patterns in active.values()
+        for spec in patterns.values()
+    )
+
+    with patch.object(
+        ScalabilityAnalyzer, "_get_lizard_metrics", return_value={"max_ccn": 20}
+    ):
+        findings = analyzer.analyze_target(str(source))
+    titles = {f["title"] for f in findings}
+    assert "High Algorithmic Complexity (O(n^3))" in titles
+    assert "Complex List Comprehension" not in titles
+
+
+def test_scalability_skips_lizard_when_no_rule_can_report(tmp_path: Path):
+    source = tmp_path / "loops.py"
+    source.write_text(NESTED_LOOPS, encoding="utf-8")
+    analyzer = _scalability(tmp_path, "critical")
+
+    with patch.object(ScalabilityAnalyzer, "_get_lizard_metrics") as lizard:
+        assert analyzer.analyze_target(str(source)) == []
+    lizard.assert_not_called()
+
+
+def _semgrep(min_severity: str) -> SemgrepAnalyzer:
+    with patch.object(SemgrepAnalyzer, "_check_semgrep_availability"):
+        analyzer = SemgrepAnalyzer()
+    analyzer.config.min_severity = min_severity
+    analyzer.config.severity_pushdown = True
+    return analyzer
+
+
+def test_semgrep_severity_flags_only_when_they_prune():
+    # Every level enabled: rules with other severity names must still run
+    cmd: list[str] = []
+    _semgrep("low")._add_severity_filter(cmd)
+    assert cmd == []
+
+    _semgrep("high")._add_severity_filter(cmd)
+    assert cmd == ["--severity", "ERROR", "--severity", "WARNING"]
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""Unit tests for deterministic file sharding and shard result merging."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from core.base.sharding import ShardSpec, merge_shard_results, select_shard
+from core.utils.output_formatter import AnalysisResult, AnalysisType, Finding, Severity
+
+SHARED_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _files(root: Path, sizes: list[int]) -> list[Path]:
+    paths = []
+    for number, size in enumerate(sizes):
+        path = root / f"pkg{number % 3}" / f"module_{number}.py"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"x" * size)
+        paths.append(path)
+    return paths
+
+
+@pytest.mark.parametrize(
+    ("text", "message"),
+    [
+        ("", "look like"),
+        ("1", "look like"),
+        ("a/b", "look like"),
+        ("0/3", "index must be"),
+        ("4/3", "index must be"),
+        ("1/0", "index must be"),
+    ],
+)
+def test_parse_rejects_malformed_specs(text: str, message: str):
+    with pytest.raises(ValueError, match=message):
+        ShardSpec.parse(text)
+
+
+def test_parse_rejects_unknown_strategy():
+    with pytest.raises(ValueError, match="strategy"):
+        ShardSpec.parse("1/2", "random")
+
+
+@pytest.mark.parametrize("strategy", ["hash", "size"])
+def test_shards_partition_files_exactly_once(tmp_path: Path, strategy: str):
+    files = _files(tmp_path, [37 * (n % 11) + n for n in range(60)])
+
+    shards = [
+        select_shard(files, ShardSpec(index, 4, strategy), tmp_path)
+        for index in range(1, 5)
+    ]
+
+    assigned = [path for shard in shards for path in shard]
+    assert sorted(assigned) == sorted(files)
+    assert len(set(assigned)) == len(files)
+    assert all(shard == sorted(shard, key=files.index) for shard in shards)
+    # Independent of the order files were discovered in
+    reversed_first = select_shard(files[::-1], ShardSpec(1, 4, strategy), tmp_path)
+    assert sorted(reversed_first) == sorted(shards[0])
+
+
+def test_hash_assignment_ignores_checkout_location(tmp_path: Path):
+    first = _files(tmp_path / "runner-a", [10] * 20)
+    second = _files(tmp_path / "runner-b", [10] * 20)
+    spec = ShardSpec(2, 3)
+
+    names_a = [p.name for p in select_shard(first, spec, tmp_path / "runner-a")]
+    names_b = [p.name for p in select_shard(second, spec, tmp_path / "runner-b")]
+    assert names_a == names_b
+
+
+def test_size_strategy_balances_bytes(tmp_path: Path):
+    files = _files(tmp_path, [1000, 900, 800, 700, 600, 500, 400, 300, 200, 100])
+
+    loads = [
+        sum(
+            p.stat().st_size
+            for p in select_shard(files, ShardSpec(i, 3, "size"), tmp_path)
+        )
+        for i in range(1, 4)
+    ]
+    assert sum(loads) == 5500
+    assert max(loads) - min(loads) <= 200
+
+
+def _shard_result(
+    index: int, count: int, files: list[str], shardable: bool = True
+) -> AnalysisResult:
+    result = AnalysisResult(AnalysisType.PERFORMANCE, "sqlglot_analyzer.py", "/repo")
+    for number, file_path in enumerate(files, 1):
+        result.add_finding(
+            Finding(
+                finding_id=f"PERF{number:03d}",
+                title="Select star",
+                description="d",
+                severity=Severity.MEDIUM,
+                file_path=file_path,
+                line_number=1,
+                recommendation="r",
+            )
+        )
+    result.metadata = {
+        "files_processed": len(files),
+        "shard": {
+            "index": index,
+            "count": count,
+            "strategy": "hash",
+            "shardable": shardable,
+        },
+    }
+    return result
+
+
+def test_merge_sums_shards_and_renumbers_ids():
+    merged = merge_shard_results(
+        [
+            _shard_result(2, 3, ["b.sql", "c.sql"]),
+            _shard_result(1, 3, ["a.sql"]),
+            _shard_result(1, 3, ["a.sql"]),  # retried shard uploaded twice
+        ]
+    )
+
+    assert [f.file_path for f in merged.findings] == ["b.sql", "c.sql", "a.sql"]
+    assert [f.finding_id for f in merged.findings] == ["PERF001", "PERF002", "PERF003"]
+    assert merged.get_summary()["medium"] == 3
+    assert merged.metadata["files_processed"] == 3
+    assert merged.metadata["shard"]["merged"] == [1, 2]
+    assert merged.metadata["shard"]["missing"] == [3]
+
+
+def test_merge_keeps_one_copy_of_project_level_results():
+    merged = merge_shard_results(
+        [_shard_result(i, 2, ["a.sql", "b.sql"], shardable=False) for i in (1, 2)]
+    )
+
+    assert len(merged.findings) == 2
+    assert merged.metadata["total_findings"] == 2
+    assert merged.metadata["shard"]["project_level"] is True
+    assert merged.metadata["shard"]["missing"] == []
+
+
+def test_merge_rejects_mixed_shard_counts():
+    with pytest.raises(ValueError, match="different shard counts"):
+        merge_shard_results([_shard_result(1, 2, []), _shard_result(2, 3, [])])
+
+
+def _run_analyzer(cwd: Path, *extra: str) -> AnalysisResult:
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "core.cli.run_analyzer",
+            "--analyzer",
+            "performance:sqlglot",
+            "--target",
+            ".",
+            *extra,
+        ],
+        cwd=cwd,
+        env={**os.environ, "PYTHONPATH": str(SHARED_ROOT)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return AnalysisResult.from_dict(json.loads(completed.stdout))
+
+
+def test_sharded_processes_merge_to_unsharded_result(tmp_path: Path):
+    for number in range(9):
+        (tmp_path / f"query_{number}.sql").write_text(
+            "SELECT * FROM users;\n" * (number + 1), encoding="utf-8"
+        )
+
+    full = _run_analyzer(tmp_path)
+    shards = [
+        _run_analyzer(tmp_path, "--shard", f"{i}/3", "--shard-strategy", "size")
+        for i in (1, 2, 3)
+    ]
+    merged = merge_shard_results(shards)
+
+    def key(finding: Finding) -> tuple:
+        return (finding.file_path, finding.line_number, finding.title)
+
+    assert full.findings
+    assert sum(r.metadata["shard"]["files_assigned"] for r in shards) == 9
+    assert sorted(map(key, merged.findings)) == sorted(map(key, full.findings))
+    assert merged.get_summary() == full.get_summary()
+    assert merged.metadata["files_processed"] == full.metadata["files_processed"]
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Unit tests for lazy structured logging and the JSONL event sink."""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+import pytest
+from core.base.analyzer_base import AnalyzerConfig, BaseAnalyzer
+from core.base.structured_log import (
+    JsonlLogSink,
+    StructuredLogger,
+    get_log_sink,
+    set_log_sink,
+)
+
+
+@pytest.fixture(autouse=True)
+def _no_sink():
+    set_log_sink(None)
+    yield
+    set_log_sink(None)
+
+
+def _logger(level: int) -> StructuredLogger:
+    logger = logging.getLogger("ci.structured_log_test")
+    logger.setLevel(level)
+    return StructuredLogger(logger, "structured_log_test")
+
+
+def test_disabled_events_do_not_evaluate_details():
+    events = _logger(logging.WARNING)
+    calls: list[int] = []
+
+    def details() -> dict[str, Any]:
+        calls.append(1)
+        return {"expensive": True}
+
+    events.log(logging.DEBUG, "file_skipped_vendor", details)
+    assert not events.enabled_for(logging.DEBUG)
+    assert calls == []
+
+
+def test_enabled_events_keep_text_format(caplog: pytest.LogCaptureFixture):
+    events = _logger(logging.INFO)
+    with caplog.at_level(logging.INFO, logger="ci.structured_log_test"):
+        events.log(logging.INFO, "config_loaded", {"config": "a.json"}, keys=3)
+    assert caplog.messages == ["config_loaded (config=a.json, keys=3)"]
+
+
+def test_jsonl_sink_records_events_below_console_level(tmp_path: Path):
+    path = tmp_path / "events.jsonl"
+    set_log_sink(JsonlLogSink(path))
+    events = _logger(logging.WARNING)
+
+    events.log(logging.DEBUG, "file_skipped_size", file=Path("a.py"), size_mb=7.5)
+    events.log(logging.DEBUG, "file_skipped_size", lambda: {"file": "b.py"})
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [r["file"] for r in records] == ["a.py", "b.py"]
+    assert records[0]["event"] == "file_skipped_size"
+    assert records[0]["level"] == "DEBUG"
+    assert records[0]["module"] == "structured_log_test"
+    assert records[0]["size_mb"] == 7.5
+
+
+def test_sink_configured_from_environment(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    import core.base.structured_log as structured_log
+
+    monkeypatch.setenv("CI_LOG_JSONL", str(tmp_path / "env.jsonl"))
+    monkeypatch.setenv("CI_LOG_JSONL_LEVEL", "info")
+    monkeypatch.setattr(structured_log, "_sink_resolved", False)
+
+    sink = get_log_sink()
+    assert sink is not None
+    assert sink.path == tmp_path / "env.jsonl"
+    assert not sink.enabled_for(logging.DEBUG)
+
+
+class _QuietAnalyzer(BaseAnalyzer):
+    def __init__(self, config: AnalyzerConfig):
+        super().__init__("structured_log_test", config)
+
+    def analyze_target(self, target_path: str) -> list[dict[str, Any]]:
+        return [{"file_path": target_path, "severity": "low"}]
+
+    def get_analyzer_metadata(self) -> dict[str, Any]:
+        return {}
+
+
+def test_debug_sink_gets_per_file_events(tmp_path: Path):
+    path = tmp_path / "events.jsonl"
+    source = tmp_path / "a.py"
+    source.write_text("x = 1\n", encoding="utf-8")
+    analyzer = _QuietAnalyzer(AnalyzerConfig(target_path=str(tmp_path)))
+
+    analyzer._process_batch([source])
+    assert not path.exists()
+
+    set_log_sink(JsonlLogSink(path))
+    analyzer._process_batch([source])
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    analyzed = [r for r in records if r["event"] == "file_analyzed"]
+    assert analyzed[0]["file"] == str(source)
+    assert analyzed[0]["findings"] == 1
+    assert analyzed[0]["seconds"] >= 0
@@ -314,3 +314,41 @@ def test_should_analyze_file_multi_segment_directory_exclusion(
     assert det.should_analyze_file(str(excluded_file), str(tmp_path)) is False
     # File in src should be allowed
     assert det.should_analyze_file(str(allowed_file), str(tmp_path)) is True
+
+
+def test_detection_cached_per_root_until_invalidated(
+    tmp_path: Path, tech_stacks_config_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    (tmp_path / "package.json").write_text("{}", encoding="utf-8")
+    det = TechStackDetector.from_config(tech_stacks_config_path)
+    calls = []
+    original = det._detect_stacks  # type: ignore[attr-defined]
+    monkeypatch.setattr(
+        det, "_detect_stacks", lambda root: calls.append(root) or original(root)
+    )
+
+    for name in ("a.js", "b.js", "c.py"):
+        (tmp_path / name).write_text("x = 1\n", encoding="utf-8")
+        det.should_analyze_file(str(tmp_path / name), str(tmp_path))
+    assert "node_js" in det.detect_tech_stack(str(tmp_path))
+    assert len(calls) == 1
+
+    # Returned exclusions are copies; mutating them does not poison the cache
+    det.get_simple_exclusions(str(tmp_path))["directories"].clear()
+    assert "node_modules" in det.get_simple_exclusions(str(tmp_path))["directories"]
+
+    (tmp_path / "Cargo.toml").write_text("[package]", encoding="utf-8")
+    assert "rust" not in det.detect_tech_stack(str(tmp_path))
+    TechStackDetector.invalidate_cache(str(tmp_path))
+    assert "rust" in det.detect_tech_stack(str(tmp_path))
+    assert len(calls) == 2
+
+
+def test_exclusion_matcher_directory_forms(
+    tmp_path: Path, tech_stacks_config_path: Path
+):
+    det = TechStackDetector.from_config(tech_stacks_config_path)
+    matcher = det.get_exclusion_matcher(str(tmp_path))
+    assert "node_modules" in matcher.directory_parts
+    assert matcher.excludes({"node_modules", "x.js"}, "node_modules/x.js", Path("x.js"))
+    assert not matcher.excludes({"src", "x.py"}, "src/x.py", Path("x.py"))
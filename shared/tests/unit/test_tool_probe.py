@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Unit tests for the persisted external tool probe cache."""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from core.utils.tool_probe import REFRESH_ENV_VAR, ToolProbeCache, probe_fingerprint
+
+VERSION_COMMAND = [sys.executable, "--version"]
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> ToolProbeCache:
+    return ToolProbeCache(cache_path=tmp_path / "probes.json", cwd=tmp_path)
+
+
+def test_second_probe_is_a_cache_hit(cache: ToolProbeCache):
+    first = cache.probe("python", VERSION_COMMAND)
+    second = cache.probe("python", VERSION_COMMAND)
+
+    assert first.available is True
+    assert first.version
+    assert first.version.startswith("Python")
+    assert first.cached is False
+    assert second.cached is True
+    assert second.version == first.version
+    assert cache.stats == {"hits": 1, "probes": 1}
+
+
+def test_probes_persist_across_instances(cache: ToolProbeCache, tmp_path: Path):
+    cache.probe("python", VERSION_COMMAND)
+    reloaded = ToolProbeCache(cache_path=cache.cache_path, cwd=tmp_path)
+
+    assert reloaded.probe("python", VERSION_COMMAND).cached is True
+    assert reloaded.stats["probes"] == 0
+
+
+def test_lockfile_change_invalidates_probe(cache: ToolProbeCache, tmp_path: Path):
+    before = probe_fingerprint(VERSION_COMMAND, tmp_path)
+    cache.probe("python", VERSION_COMMAND)
+
+    lockfile = tmp_path / "package-lock.json"
+    lockfile.write_text("{}", encoding="utf-8")
+    os.utime(lockfile, (time.time() + 5, time.time() + 5))
+
+    assert probe_fingerprint(VERSION_COMMAND, tmp_path) != before
+    assert cache.probe("python", VERSION_COMMAND).cached is False
+
+
+def test_refresh_forces_reprobe_once_per_process(
+    cache: ToolProbeCache, monkeypatch: pytest.MonkeyPatch
+):
+    cache.probe("python", VERSION_COMMAND)
+    assert cache.probe("python", VERSION_COMMAND, refresh=True).cached is False
+
+    monkeypatch.setenv(REFRESH_ENV_VAR, "1")
+    other = ToolProbeCache(cache_path=cache.cache_path, cwd=cache.cwd)
+    assert other.probe("python", VERSION_COMMAND).cached is False
+    assert other.probe("python", VERSION_COMMAND).cached is True
+
+
+def test_missing_executable_is_unavailable_without_running(cache: ToolProbeCache):
+    probe = cache.probe("nope", ["definitely-not-a-real-tool-xyz", "--version"])
+
+    assert probe.available is False
+    assert probe.path is None
+    assert probe.version is None
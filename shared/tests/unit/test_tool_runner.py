@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""Unit tests for the shared external tool runner."""
+
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+from core.base.analyzer_base import AnalyzerConfig, BaseAnalyzer
+from core.utils.tool_runner import (
+    ToolInvocation,
+    ToolReplay,
+    ToolRunner,
+    set_tool_runner,
+    tool_name,
+)
+
+
+def _python(code: str) -> list[str]:
+    return [sys.executable, "-c", code]
+
+
+@pytest.fixture
+def runner():
+    runner = ToolRunner(max_concurrency=4, max_load_per_cpu=None)
+    set_tool_runner(runner)
+    yield runner
+    set_tool_runner(None)
+
+
+def test_tool_name_from_command_lines():
+    assert tool_name(["npx", "eslint", "--format", "json"]) == "eslint"
+    assert tool_name(["/usr/bin/semgrep", "--json"]) == "semgrep"
+    assert tool_name(["python3", "-m", "lizard", "x.py"]) == "lizard"
+    assert tool_name(["cargo", "clippy"]) == "cargo"
+
+
+def test_run_passes_stdin_text(runner: ToolRunner):
+    code = "import sys; print(sys.stdin.read().upper())"
+    assert runner.run(_python(code), stdin_text="abc").stdout.strip() == "ABC"
+
+
+def test_run_records_timing_and_exit_status(runner: ToolRunner):
+    records: list = []
+    completed = runner.run(
+        _python("import sys; print('ok'); sys.exit(3)"), tool="probe", sink=records
+    )
+    assert completed.returncode == 3
+    assert completed.stdout.strip() == "ok"
+    assert records[0].tool == "probe"
+    assert records[0].returncode == 3
+    assert records[0].duration_seconds > 0
+    assert runner.invocations[-1] is records[0]
+
+
+def test_timeout_is_recorded_and_raised(runner: ToolRunner):
+    records: list = []
+    with pytest.raises(subprocess.TimeoutExpired):
+        runner.run(
+            _python("import time; time.sleep(10)"),
+            tool="slow",
+            timeout=0.5,
+            sink=records,
+        )
+    assert records[0].timed_out is True
+    assert records[0].returncode is None
+    assert runner.active == 0
+
+
+def test_per_tool_limit_serializes_runs(tmp_path: Path):
+    runner = ToolRunner(
+        max_concurrency=4, tool_limits={"serial": 1}, max_load_per_cpu=None
+    )
+    marker = tmp_path / "running"
+    # Each run fails if another run of the same tool is in flight
+    code = (
+        "import os, sys, time\n"
+        f"p = {str(marker)!r}\n"
+        "if os.path.exists(p): sys.exit(9)\n"
+        "open(p, 'w').close(); time.sleep(0.2); os.remove(p)\n"
+    )
+    codes: list[int] = []
+    threads = [
+        threading.Thread(
+            target=lambda: codes.append(
+                runner.run(_python(code), tool="serial").returncode
+            )
+        )
+        for _ in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert codes == [0, 0, 0]
+    assert max(i.queued_seconds for i in runner.invocations) > 0.1
+
+
+def test_record_then_replay(tmp_path: Path):
+    argv = _python("print('recorded output')")
+    recorder = ToolRunner(recorder=ToolReplay(tmp_path), max_load_per_cpu=None)
+    recorder.run(argv, tool="echo")
+
+    replaying = ToolRunner(replay=ToolReplay(tmp_path))
+    completed = replaying.run(argv, tool="echo")
+    assert completed.stdout.strip() == "recorded output"
+    assert replaying.invocations[-1].replayed is True
+
+    with pytest.raises(FileNotFoundError):
+        replaying.run(_python("print('other')"), tool="echo")
+
+    (tmp_path / "echo" / "default.json").write_text(
+        '{"returncode": 1, "stdout": "fallback"}', encoding="utf-8"
+    )
+    assert replaying.run(["echo", "anything"]).stdout == "fallback"
+
+
+class _ToolAnalyzer(BaseAnalyzer):
+    def __init__(self, config: AnalyzerConfig):
+        super().__init__("tool_runner_test", config)
+
+    def analyze_target(self, target_path: str) -> list[dict[str, Any]]:
+        completed = self.run_tool(_python("print('[]')"), tool="fake-tool")
+        assert completed.stdout.strip() == "[]"
+        return []
+
+    def get_analyzer_metadata(self) -> dict[str, Any]:
+        return {}
+
+
+def test_analyzer_result_metadata_lists_invocations(runner: ToolRunner, tmp_path):
+    source = tmp_path / "a.py"
+    source.write_text("x = 1\n", encoding="utf-8")
+    analyzer = _ToolAnalyzer(AnalyzerConfig(target_path=str(tmp_path)))
+    analyzer.process_files_batch([source])
+    result = analyzer.complete_analysis(analyzer.create_result("analysis"))
+
+    invocations = result.metadata["tool_invocations"]
+    assert [i["tool"] for i in invocations] == ["fake-tool"]
+    assert invocations[0]["returncode"] == 0
+    assert invocations[0]["timed_out"] is False
+
+    # A second run on the same analyzer reports only its own invocation
+    analyzer.start_analysis()
+    analyzer.process_files_batch([source])
+    result = analyzer.complete_analysis(analyzer.create_result("analysis"))
+    assert len(result.metadata["tool_invocations"]) == 1
+
+
+def test_invocation_report_truncates_argv():
+    files = [f"src/file_{i}.py" for i in range(500)]
+    report = ToolInvocation("lizard", ["lizard", *files], 0, 1.0, 0.0).to_dict()
+    assert report["argv"] == ["lizard", *files[:7]]
+    assert report["argv_truncated"] == 493
+    assert report["returncode"] == 0
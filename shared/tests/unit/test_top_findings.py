@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Unit tests for bounded top-K finding collection in summary mode."""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+from core.base.analyzer_base import AnalyzerConfig, BaseAnalyzer
+from core.base.top_findings import SUMMARY_TOP_N, TopFindingsCollector
+
+
+def _finding(severity: str, name: str, confidence: str | None = None) -> dict:
+    metadata = {"confidence": confidence} if confidence else {}
+    return {"title": name, "severity": severity, "metadata": metadata}
+
+
+def test_collector_keeps_most_severe_with_exact_counts():
+    collector = TopFindingsCollector(3)
+    severities = ["low", "critical", "medium", "high", "low", "high", "info"]
+    for index, severity in enumerate(severities):
+        collector.add(_finding(severity, f"f{index}"))
+
+    assert [f["title"] for f in collector.top()] == ["f1", "f3", "f5"]
+    assert collector.total == len(severities)
+    assert collector.counts == {
+        "critical": 1,
+        "high": 2,
+        "medium": 1,
+        "low": 2,
+        "info": 1,
+    }
+
+
+def test_collector_ranks_confidence_then_order():
+    collector = TopFindingsCollector(2)
+    collector.add(_finding("high", "late-file"), order=5)
+    collector.add(_finding("high", "early-file"), order=1)
+    collector.add(_finding("high", "confident", "high"), order=9)
+    collector.add(_finding("high", "same-order-later"), order=1)
+
+    assert [f["title"] for f in collector.top()] == ["confident", "early-file"]
+
+
+def test_collector_rejects_non_positive_k():
+    with pytest.raises(ValueError, match="k must be positive"):
+        TopFindingsCollector(0)
+
+
+class _ManyFindingsAnalyzer(BaseAnalyzer):
+    def __init__(self, config: AnalyzerConfig):
+        super().__init__("top_findings_test", config)
+
+    def analyze_target(self, target_path: str) -> list[dict[str, Any]]:
+        severities = ["low"] * 8 + ["medium", "high"]
+        return [
+            {
+                "title": f"{Path(target_path).name}:{n}",
+                "description": "d",
+                "severity": severity,
+                "file_path": target_path,
+                "line_number": n,
+                "recommendation": "r",
+            }
+            for n, severity in enumerate(severities, 1)
+        ]
+
+    def get_analyzer_metadata(self) -> dict[str, Any]:
+        return {}
+
+
+def test_summary_mode_analysis_keeps_top_findings(tmp_path: Path):
+    files = []
+    for index in range(5):
+        path = tmp_path / f"m{index}.py"
+        path.write_text("x = 1\n", encoding="utf-8")
+        files.append(path)
+    analyzer = _ManyFindingsAnalyzer(
+        AnalyzerConfig(target_path=str(tmp_path), summary_mode=True)
+    )
+
+    collector = analyzer._collect_top_findings(files)
+    result = analyzer.create_result("analysis")
+    analyzer._add_findings_to_result(result, collector.top())
+    result.set_severity_counts(collector.counts)
+
+    assert len(result.findings) == SUMMARY_TOP_N
+    assert [f.title for f in result.findings[:2]] == ["m0.py:10", "m1.py:10"]
+    payload = result.to_dict(summary_mode=True, min_severity="medium")
+    assert payload["summary"]["low"] == 40
+    assert payload["total_findings_before_filter"] == 50
+    assert payload["total_findings_after_filter"] == 10
+    assert "summary_mode" not in payload
+    assert [f["severity"] for f in payload["findings"]] == ["high"] * 5 + ["medium"] * 5
+
+    result.metadata["severity_pushdown"] = "medium"
+    payload = result.to_dict(summary_mode=True, min_severity="medium")
+    assert "total_findings_before_filter" not in payload
+    assert payload["total_findings_after_filter"] == 10
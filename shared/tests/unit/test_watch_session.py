@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Unit tests for watch mode change detection and incremental re-analysis."""
+
+import os
+from pathlib import Path
+
+import pytest
+from analyzers.architecture.coupling_analysis import CouplingAnalyzer
+from analyzers.performance.sqlglot_analyzer import SQLGlotAnalyzer
+from core.base.analyzer_base import AnalyzerConfig
+from core.base.watch_session import PollingChangeSource, WatchSession
+
+
+def _bump(path: Path, text: str) -> None:
+    """Write ``text`` and move the mtime forward so coarse clocks see a change."""
+    path.write_text(text, encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+
+
+def test_poller_reports_added_modified_and_deleted_files(tmp_path: Path):
+    (tmp_path / "pkg").mkdir()
+    kept = tmp_path / "pkg" / "kept.py"
+    gone = tmp_path / "gone.py"
+    kept.write_text("x = 1\n", encoding="utf-8")
+    gone.write_text("y = 1\n", encoding="utf-8")
+    (tmp_path / "node_modules").mkdir()
+    source = PollingChangeSource(tmp_path)
+
+    assert source.poll() == (set(), set())
+
+    _bump(kept, "x = 2\n")
+    gone.unlink()
+    (tmp_path / "new").mkdir()
+    (tmp_path / "new" / "added.py").write_text("z = 1\n", encoding="utf-8")
+    (tmp_path / "node_modules" / "dep.js").write_text("", encoding="utf-8")
+
+    changed, removed = source.poll()
+    assert changed == {kept, tmp_path / "new" / "added.py"}
+    assert removed == {gone}
+    assert source.poll() == (set(), set())
+
+
+def test_session_reports_findings_diff_for_changed_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "clean.sql").write_text("SELECT id FROM t LIMIT 5;\n", "utf-8")
+    (tmp_path / "star.sql").write_text("SELECT * FROM users;\n", "utf-8")
+    analyzer = SQLGlotAnalyzer(
+        AnalyzerConfig(target_path=".", code_extensions={".sql"}, min_severity="low")
+    )
+    session = WatchSession(Path("."), {"performance:sqlglot": analyzer})
+    initial = session.start()
+    analyzed: list[list[Path]] = []
+    original = analyzer.analyze_files
+    monkeypatch.setattr(
+        analyzer,
+        "analyze_files",
+        lambda files: analyzed.append(list(files)) or original(files),
+    )
+
+    assert {f["file_path"] for _, f in initial} == {"star.sql"}
+
+    (tmp_path / "clean.sql").write_text("SELECT * FROM orders;\n", "utf-8")
+    Path("star.sql").unlink()
+    update = session.apply({Path("clean.sql")}, {Path("star.sql")})
+
+    assert analyzed == [[Path("clean.sql")]]
+    assert {f["file_path"] for _, f in update.added_findings} == {"clean.sql"}
+    assert {f["file_path"] for _, f in update.removed_findings} == {"star.sql"}
+    assert update.total_findings == len(update.added_findings)
+    assert update.latency_seconds is not None
+
+    unchanged = session.apply({Path("clean.sql")}, set())
+    assert unchanged.added_findings == unchanged.removed_findings == []
+
+
+def test_coupling_updates_edges_for_changed_modules_only(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "a.js").write_text("import b from 'pkg/b';\n", "utf-8")
+    (tmp_path / "pkg" / "b.js").write_text("export const b = 1;\n", "utf-8")
+    analyzer = CouplingAnalyzer(AnalyzerConfig(target_path=".", min_severity="low"))
+    session = WatchSession(Path("."), {"architecture:coupling": analyzer})
+    assert session.start() == []
+
+    read: list[Path] = []
+    original = analyzer._extract_dependencies
+    monkeypatch.setattr(
+        analyzer,
+        "_extract_dependencies",
+        lambda path: read.append(path) or original(path),
+    )
+    (tmp_path / "pkg" / "b.js").write_text("import a from 'pkg/a';\n", "utf-8")
+    cycle = session.apply({Path("pkg/b.js")}, set())
+
+    assert read == [Path("pkg/b.js")]
+    assert [f["metadata"]["pattern_type"] for _, f in cycle.added_findings] == [
+        "circular_dependency"
+    ]
+
+    Path("pkg/b.js").unlink()
+    broken = session.apply(set(), {Path("pkg/b.js")})
+    assert broken.removed_findings == cycle.added_findings
+    assert broken.total_findings == 0
+
+
+def test_session_rejects_project_level_analyzers_without_incremental_support():
+    class ProjectOnly:
+        shardable = False
+        supports_incremental = False
+
+    with pytest.raises(ValueError, match="jscpd"):
+        WatchSession(Path("."), {"quality:jscpd": ProjectOnly()})
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""Unit tests for monorepo partitioning, per-partition caching and merging."""
+
+from dataclasses import replace
+from pathlib import Path
+from typing import Any
+
+from core.base.analyzer_base import AnalyzerConfig, BaseAnalyzer
+from core.base.workspace_partitions import (
+    PartitionResultCache,
+    detect_partitions,
+    merge_partition_results,
+    partition_fingerprint,
+    run_partitioned,
+)
+from core.utils.output_formatter import AnalysisResult
+
+
+def _touch(root: Path, relative: str, content: str = "x = 1\n") -> Path:
+    path = root / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+def _workspace(root: Path) -> Path:
+    _touch(root, "package.json", "{}")
+    _touch(root, "tools/release.py")
+    _touch(root, "packages/a/package.json", "{}")
+    _touch(root, "packages/a/index.py")
+    _touch(root, "packages/b/pyproject.toml", "")
+    _touch(root, "packages/b/b.py")
+    _touch(root, "packages/b/plugins/c/Cargo.toml", "")
+    _touch(root, "packages/b/plugins/c/c.py")
+    _touch(root, "services/api/Api.csproj", "")
+    _touch(root, "node_modules/left-pad/package.json", "{}")
+    return root
+
+
+def test_detects_partitions_and_nesting(tmp_path: Path):
+    partitions = {p.name: p for p in detect_partitions(_workspace(tmp_path))}
+
+    assert list(partitions) == [
+        ".",
+        "packages/a",
+        "packages/b",
+        "packages/b/plugins/c",
+        "services/api",
+    ]
+    assert partitions["."].markers == ("package.json",)
+    assert partitions["services/api"].markers == ("Api.csproj",)
+    assert partitions["."].exclude_globs() == {
+        "packages/a/*",
+        "packages/b/*",
+        "services/api/*",
+    }
+    assert partitions["packages/b"].children == ("plugins/c",)
+
+
+def test_fingerprint_changes_only_for_owning_partition(tmp_path: Path):
+    root = _workspace(tmp_path)
+    before = {p.name: partition_fingerprint(p) for p in detect_partitions(root)}
+
+    _touch(root, "packages/b/plugins/c/c.py", "x = 2  # edited\n")
+    after = {p.name: partition_fingerprint(p) for p in detect_partitions(root)}
+
+    changed = {name for name in before if before[name] != after[name]}
+    assert changed == {"packages/b/plugins/c"}
+
+
+class _PerFileAnalyzer(BaseAnalyzer):
+    runs: list[str] = []
+
+    def __init__(self, config: AnalyzerConfig):
+        super().__init__("partition_test", config)
+
+    def analyze(self, target_path: str | None = None) -> Any:
+        self.start_analysis()
+        _PerFileAnalyzer.runs.append(target_path)
+        files = [
+            path
+            for path in sorted(Path(target_path).rglob("*.py"))
+            if not self._matches_exclude_globs(path)
+        ]
+        findings = [
+            {
+                "title": f"Module {path.name}",
+                "description": "d",
+                "severity": "high" if path.name == "c.py" else "low",
+                "file_path": str(path),
+                "line_number": 1,
+                "recommendation": "r",
+            }
+            for path in files
+        ]
+        result = self.create_result("analysis")
+        self._add_findings_to_result(result, findings)
+        result.metadata = {"files_processed": len(files)}
+        return self.complete_analysis(result)
+
+    def analyze_target(self, target_path: str) -> list[dict[str, Any]]:
+        return []
+
+    def get_analyzer_metadata(self) -> dict[str, Any]:
+        return {}
+
+
+class _Registry:
+    @staticmethod
+    def get(name: str) -> type:
+        return _PerFileAnalyzer
+
+    @staticmethod
+    def create(name: str, config: AnalyzerConfig) -> BaseAnalyzer:
+        return _PerFileAnalyzer(config)
+
+
+def _run(root: Path, cache: PartitionResultCache) -> AnalysisResult:
+    base = AnalyzerConfig(target_path=str(root))
+
+    def make_config(partition: Any) -> AnalyzerConfig:
+        return replace(
+            base,
+            target_path=str(partition.root),
+            exclude_globs=partition.exclude_globs(),
+        )
+
+    outcomes = run_partitioned(
+        "test:per_file", detect_partitions(root), make_config, _Registry, 4, cache
+    )
+    return merge_partition_results(outcomes, str(root))
+
+
+def test_partitioned_run_merges_tags_and_caches(tmp_path: Path):
+    root = _workspace(tmp_path / "repo")
+    cache = PartitionResultCache(tmp_path / "cache")
+    _PerFileAnalyzer.runs = []
+
+    merged = _run(root, cache)
+    by_file = {Path(f.file_path).name: f for f in merged.findings}
+    assert set(by_file) == {"release.py", "index.py", "b.py", "c.py"}
+    assert by_file["c.py"].evidence["partition"] == "packages/b/plugins/c"
+    assert by_file["c.py"].finding_id.startswith("packages/b/plugins/c:")
+    assert by_file["release.py"].evidence["partition"] == "."
+    assert merged.metadata["partition_count"] == 5
+    assert merged.metadata["files_processed"] == 4
+    assert merged.get_summary()["high"] == 1
+    assert len(_PerFileAnalyzer.runs) == 5
+
+    _PerFileAnalyzer.runs = []
+    _touch(root, "packages/a/index.py", "x = 3  # edited\n")
+    again = _run(root, cache)
+    assert _PerFileAnalyzer.runs == [str(root / "packages/a")]
+    assert again.metadata["partitions_cached"] == 4
+    assert len(again.findings) == 4
+    assert again.to_dict()["summary"] == merged.to_dict()["summary"]
+
+
+def test_result_round_trips_through_dict():
+    result = AnalysisResult.from_dict(
+        {
+            "analysis_type": "security",
+            "script_name": "s.py",
+            "target_path": "/repo",
+            "success": True,
+            "execution_time": 1.5,
+            "summary": {"critical": 0, "high": 3, "medium": 0, "low": 0, "info": 0},
+            "findings": [
+                {
+                    "id": "S1",
+                    "title": "t",
+                    "description": "d",
+                    "severity": "high",
+                    "file_path": "a.py",
+                    "line_number": 4,
+                    "recommendation": "r",
+                    "evidence": {"k": 1},
+                }
+            ],
+            "metadata": {"files_processed": 2},
+        }
+    )
+
+    assert result.findings[0].line_number == 4
+    assert result.get_summary()["high"] == 3
+    assert result.to_dict()["findings"][0]["evidence"] == {"k": 1}
@@ -2,17 +2,24 @@
 
 from __future__ import annotations
 
+import contextlib
+import fnmatch
 import json
 import os
 import time
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
+from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import typer
 
 from ..app import app
-from ..models.results import AnalysisResultContext, AnalyzerRunResponse
+from ..models.results import (
+    AnalysisResultContext,
+    AnalyzerRunResponse,
+    MultiAnalyzerRunResponse,
+)
 from ..runtime.context import WorkspaceContext, load_workspace
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -50,6 +57,13 @@ def _create_config(
     max_files: int | None,
     output_format: str,
     exclude_globs: Iterable[str],
+    resource_usage: bool = False,
+    memory_profile: bool = False,
+    chunked_scan: bool = False,
+    shard: str | None = None,
+    shard_strategy: str = "hash",
+    result_cache: bool = False,
+    cache_dir: Path | None = None,
 ) -> Any:
     from core.base import create_analyzer_config
 
@@ -58,6 +72,15 @@ def _create_config(
         min_severity=min_severity,
         summary_mode=summary_mode,
         output_format=output_format,
+        # Output is filtered to min_severity anyway; let analyzers skip the rest
+        severity_pushdown=True,
+        resource_accounting=resource_usage,
+        memory_profile=memory_profile,
+        chunked_scan=chunked_scan,
+        shard=shard,
+        shard_strategy=shard_strategy,
+        result_cache=result_cache,
+        cache_dir=str(cache_dir) if cache_dir else None,
     )
 
     if max_files is not None:
@@ -98,6 +121,46 @@ def _collect_gitignore_patterns(search_root: Path) -> list[str]:
     return patterns
 
 
+def _run_partitioned(
+    tool: str,
+    target: Path,
+    registry: Any,
+    base_config: Any,
+    *,
+    jobs: int,
+    use_cache: bool,
+) -> Any:
+    """Analyze each workspace partition under ``target`` and merge the results."""
+    from dataclasses import replace
+
+    from core.base.workspace_partitions import (
+        PartitionResultCache,
+        detect_partitions,
+        merge_partition_results,
+        run_partitioned,
+    )
+
+    partitions = detect_partitions(target)
+
+    def make_config(partition: Any) -> Any:
+        return replace(
+            base_config,
+            target_path=str(partition.root),
+            exclude_globs={*base_config.exclude_globs, *partition.exclude_globs()},
+            gitignore_patterns=_collect_gitignore_patterns(partition.root),
+        )
+
+    cache = (
+        PartitionResultCache.for_workspace(target, base_config.cache_dir)
+        if use_cache
+        else None
+    )
+    outcomes = run_partitioned(
+        tool, partitions, make_config, registry, jobs=jobs, cache=cache
+    )
+    return merge_partition_results(outcomes, str(target))
+
+
 def _emit_json(payload: dict[str, Any], out: Path | None) -> None:
     rendered = json.dumps(payload, indent=2)
     if out is not None:
@@ -109,8 +172,9 @@ def _emit_json(payload: dict[str, Any], out: Path | None) -> None:
 
 @_analyzers_app.command("run")
 def analyzers_run(
-    tool: str = typer.Argument(
-        ..., help="Analyzer registry key (e.g. quality:lizard)."
+    tools: list[str] = typer.Argument(
+        ...,
+        help="Analyzer registry keys or category wildcards (e.g. quality:lizard security:*).",
     ),
     target: Path = typer.Option(Path("."), "--target", "-t", help="Path to analyze."),
     json_output: bool = typer.Option(
@@ -159,8 +223,84 @@ def analyzers_run(
         "-x",
         help="Additional glob patterns to exclude (repeatable).",
     ),
+    refresh_tools: bool = typer.Option(
+        False,
+        "--refresh-tools",
+        help="Re-probe external tools instead of using cached availability/versions (sets CI_REFRESH_TOOLS=1).",
+    ),
+    chunked_scan: bool = typer.Option(
+        False,
+        "--chunked-scan",
+        help="Scan files over the size cap in memory-mapped windows instead of skipping them (pattern analyzers only).",
+    ),
+    partition: bool = typer.Option(
+        False,
+        "--partition",
+        help="Split the target into subprojects by manifest (package.json, pyproject.toml, Cargo.toml, ...) and analyze them in parallel.",
+    ),
+    jobs: int = typer.Option(
+        0,
+        "--jobs",
+        "-j",
+        help="Parallel partitions with --partition (0 = up to 8, by CPU count).",
+    ),
+    partition_cache: bool = typer.Option(
+        True,
+        "--partition-cache/--no-partition-cache",
+        help="Reuse cached results for partitions whose files are unchanged.",
+    ),
+    shard: str | None = typer.Option(
+        None,
+        "--shard",
+        metavar="I/N",
+        help="Analyze only shard I of N (1-based); combine shard outputs with `enaible analyzers merge`.",
+    ),
+    shard_strategy: str = typer.Option(
+        "hash",
+        "--shard-strategy",
+        help="Assign files to shards by stable path hash ('hash') or balanced file size ('size').",
+    ),
+    result_cache: bool = typer.Option(
+        False,
+        "--result-cache",
+        help="Reuse per-file results from the content-addressed cache (keys hash analyzer, config and file content).",
+    ),
+    cache_dir: Path | None = typer.Option(
+        None,
+        "--cache-dir",
+        help="Shared cache directory, e.g. an NFS mount or CI cache volume (default: $CI_CACHE_DIR or .cache/ci-framework).",
+    ),
+    resource_usage: bool = typer.Option(
+        False,
+        "--resource-usage",
+        help="Record peak RSS and files/bytes processed in metadata.resource_usage.",
+    ),
+    memory_profile: bool = typer.Option(
+        False,
+        "--memory-profile",
+        help="Also record tracemalloc peak and top allocation sites (slower; implies --resource-usage).",
+    ),
+    priority: bool = typer.Option(
+        False,
+        "--priority",
+        help="With several analyzers: run cheap, high-signal ones first (by runtime history), keep expensive ones in the background, and stream each result as a JSON line when it completes.",
+    ),
+    baseline: Path | None = typer.Option(
+        None,
+        "--baseline",
+        help="Previous run output (--out) to compare against: findings are labelled new or existing by fingerprint, and fixed ones are listed under 'baseline'.",
+    ),
+    sarif: Path | None = typer.Option(
+        None,
+        "--sarif",
+        help="Also stream results to a SARIF 2.1.0 log (one run per analyzer) for code-scanning viewers.",
+    ),
 ) -> None:
-    """Run a registered analyzer and emit normalized results."""
+    """Run registered analyzers and emit normalized results.
+
+    Several keys (or wildcards) run in one process over one shared discovery
+    pass and emit one payload with a section per analyzer.
+    """
     context = load_workspace()
     _ensure_registry_loaded(context)
 
@@ -168,70 +308,641 @@ def analyzers_run(
 
     if no_external:
         os.environ.setdefault("ENAIBLE_DISABLE_EXTERNAL", "1")
+    if refresh_tools:
+        os.environ["CI_REFRESH_TOOLS"] = "1"
 
     min_severity = min_severity.lower()
-    normalized_excludes = [
-        pattern.strip() for pattern in exclude_glob if pattern.strip()
-    ]
-
-    gitignore_patterns = _collect_gitignore_patterns(target)
-
-    config = _create_config(
+    selected, previous = _validate_run_options(
+        registry,
+        tools,
+        shard=shard,
+        partition=partition,
+        baseline=baseline,
+        summary_mode=summary_mode,
+    )
+    make_config = _config_factory(
         target=target,
         min_severity=min_severity,
         summary_mode=summary_mode,
         max_files=max_files,
         output_format="json" if json_output else "console",
-        exclude_globs=normalized_excludes,
+        exclude_globs=[pattern.strip() for pattern in exclude_glob if pattern.strip()],
+        resource_usage=resource_usage,
+        memory_profile=memory_profile,
+        chunked_scan=chunked_scan,
+        shard=shard,
+        shard_strategy=shard_strategy,
+        result_cache=result_cache,
+        cache_dir=cache_dir,
     )
+    prioritized = priority and len(selected) > 1
+
+    # The SARIF log is finished and closed even when an analyzer fails
+    with contextlib.ExitStack() as stack:
+        finalize = _finalizer(target, _open_sarif(stack, sarif, target, min_severity))
+        responses, discovery = _execute_run(
+            registry,
+            selected,
+            target,
+            make_config,
+            partition=partition,
+            jobs=jobs,
+            partition_cache=partition_cache,
+            prioritized=prioritized,
+            verbose=verbose,
+            summary_mode=summary_mode,
+            min_severity=min_severity,
+            concurrent=not (resource_usage or memory_profile),
+            finalize=finalize,
+            previous=previous,
+            # Streamed sections replace the pretty payload on stdout
+            stream=json_output and out is None,
+            cache_dir=cache_dir,
+        )
 
-    config.gitignore_patterns = gitignore_patterns
+    payload, summary_payload = _build_payloads(
+        responses, selected, target, discovery, previous, baseline
+    )
+    if json_output and prioritized and out is None:
+        typer.echo(json.dumps({"event": "report", "report": payload}))
+    elif json_output or out is not None:
+        # Without --json the analyzer handles console output; only write --out
+        _emit_json(payload, out)
+    if summary_out is not None:
+        _emit_json(summary_payload, summary_out)
+
+    if sum(len(response.findings) for response in responses) >= 200:
+        tip = (
+            "Hint: If some findings look third-party or generated, rerun with "
+            "`--exclude <glob>` to filter those directories."
+        )
+        typer.secho(tip, err=True)
 
+    raise typer.Exit(code=max(response.exit_code for response in responses))
+
+
+def _validate_run_options(
+    registry: Any,
+    tools: list[str],
+    *,
+    shard: str | None,
+    partition: bool,
+    baseline: Path | None,
+    summary_mode: bool,
+) -> tuple[list[str], Any]:
+    """Resolve the selected analyzers and load the baseline, or fail the command."""
     try:
-        analyzer = registry.create(tool, config=config)
+        selected = _expand_tool_patterns(registry, tools)
     except KeyError as exc:
         raise typer.BadParameter(str(exc)) from exc
+    if shard is not None and partition:
+        raise typer.BadParameter("--shard cannot be combined with --partition.")
+    if partition and len(selected) > 1:
+        raise typer.BadParameter("--partition runs a single analyzer.")
+    if baseline is None:
+        return selected, None
+    if summary_mode:
+        raise typer.BadParameter("--baseline needs every finding; drop --summary.")
+
+    from core.base.baseline import Baseline
+
+    try:
+        return selected, Baseline.load(baseline)
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+
+
+def _config_factory(**options: Any) -> Callable[[], Any]:
+    """Return a function building a fresh analyzer config per analyzer."""
+    gitignore_patterns = _collect_gitignore_patterns(options["target"])
+
+    def make_config() -> Any:
+        try:
+            config = _create_config(**options)
+        except ValueError as exc:
+            raise typer.BadParameter(str(exc)) from exc
+        config.gitignore_patterns = gitignore_patterns
+        return config
+
+    return make_config
+
+
+def _open_sarif(
+    stack: contextlib.ExitStack, sarif: Path | None, target: Path, min_severity: str
+) -> Any:
+    """Open the SARIF writer (if requested) on ``stack``."""
+    if sarif is None:
+        return None
+    from core.utils.sarif_writer import SarifWriter
+
+    sarif.parent.mkdir(parents=True, exist_ok=True)
+    handle = stack.enter_context(sarif.open("w", encoding="utf-8"))
+    return stack.enter_context(SarifWriter(handle, target, min_severity))
+
+
+def _finalizer(target: Path, sarif_writer: Any) -> Callable[[str, Any], None]:
+    from core.base.baseline import Fingerprinter
+
+    fingerprinter = Fingerprinter(target)
+
+    def finalize(tool: str, result: Any) -> None:
+        """Fingerprint a finished result and stream it to the SARIF log."""
+        if not isinstance(getattr(result, "findings", None), list):
+            return
+        fingerprinter.stamp(tool, result.findings)
+        if sarif_writer is not None:
+            sarif_writer.write_result(result, tool)
+
+    return finalize
+
+
+def _create_analyzers(
+    registry: Any,
+    selected: list[str],
+    make_config: Callable[[], Any],
+    discovery: Any,
+    verbose: bool,
+) -> dict[str, Any]:
+    """Instantiate the selected analyzers over one shared discovery pass."""
+    analyzers: dict[str, Any] = {}
+    for tool in selected:
+        try:
+            analyzer = registry.create(tool, config=make_config())
+        except KeyError as exc:
+            raise typer.BadParameter(str(exc)) from exc
+        if hasattr(analyzer, "verbose"):
+            analyzer.verbose = bool(verbose)
+        if hasattr(analyzer, "use_discovery"):
+            analyzer.use_discovery(discovery)
+        analyzers[tool] = analyzer
+    return analyzers
+
+
+def _execute_run(
+    registry: Any,
+    selected: list[str],
+    target: Path,
+    make_config: Callable[[], Any],
+    *,
+    partition: bool,
+    jobs: int,
+    partition_cache: bool,
+    prioritized: bool,
+    verbose: bool,
+    summary_mode: bool,
+    min_severity: str,
+    concurrent: bool,
+    finalize: Callable[[str, Any], None],
+    previous: Any,
+    stream: bool,
+    cache_dir: Path | None,
+) -> tuple[list[AnalyzerRunResponse], Any]:
+    """
+    Run the selected analyzers partitioned, prioritized or one after another.
+
+    Returns
+    -------
+        (responses in selection order, the shared discovery or None)
+    """
+    if partition:
+        response = _run_partition_response(
+            selected[0],
+            target,
+            registry,
+            make_config(),
+            jobs=jobs,
+            use_cache=partition_cache,
+            summary_mode=summary_mode,
+            min_severity=min_severity,
+            finalize=finalize,
+        )
+        responses, discovery = [response], None
+    else:
+        from core.base.discovery import SharedDiscovery
 
-    if hasattr(analyzer, "verbose"):
-        analyzer.verbose = bool(verbose)
+        discovery = SharedDiscovery(target)
+        analyzers = _create_analyzers(
+            registry, selected, make_config, discovery, verbose
+        )
+        if prioritized:
+            # Findings are labelled as each result streams
+            return _run_prioritized(
+                analyzers,
+                registry,
+                target,
+                discovery,
+                summary_mode=summary_mode,
+                min_severity=min_severity,
+                concurrent=concurrent,
+                finalize=finalize,
+                baseline=previous,
+                on_response=_echo_event if stream else None,
+                cache_dir=cache_dir,
+            ), discovery
+        responses = _run_sequential(
+            analyzers, target, summary_mode, min_severity, finalize
+        )
+    if previous is not None:
+        for response in responses:
+            _label_findings(response, previous)
+    return responses, discovery
 
+
+def _run_partition_response(
+    tool: str,
+    target: Path,
+    registry: Any,
+    config: Any,
+    *,
+    jobs: int,
+    use_cache: bool,
+    summary_mode: bool,
+    min_severity: str,
+    finalize: Callable[[str, Any], None],
+) -> AnalyzerRunResponse:
+    try:
+        registry.get(tool)
+    except KeyError as exc:
+        raise typer.BadParameter(str(exc)) from exc
     started = time.time()
-    result = analyzer.analyze(str(target))
+    result = _run_partitioned(
+        tool, target, registry, config, jobs=jobs, use_cache=use_cache
+    )
     finished = time.time()
+    result.execution_time = finished - started
+    return _to_response(
+        tool, result, started, finished, summary_mode, min_severity, finalize
+    )
+
+
+def _run_sequential(
+    analyzers: dict[str, Any],
+    target: Path,
+    summary_mode: bool,
+    min_severity: str,
+    finalize: Callable[[str, Any], None],
+) -> list[AnalyzerRunResponse]:
+    responses = []
+    for tool, analyzer in analyzers.items():
+        started = time.time()
+        result = analyzer.analyze(str(target))
+        finished = time.time()
+        responses.append(
+            _to_response(
+                tool, result, started, finished, summary_mode, min_severity, finalize
+            )
+        )
+    return responses
+
+
+def _build_payloads(
+    responses: list[AnalyzerRunResponse],
+    selected: list[str],
+    target: Path,
+    discovery: Any,
+    previous: Any,
+    baseline: Path | None,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Return the full and the summary-only payload of a run."""
+    if len(responses) == 1:
+        payload = responses[0].to_dict()
+        summary_payload = _summary_only(payload)
+    else:
+        combined = MultiAnalyzerRunResponse(
+            tools=selected,
+            target=str(target),
+            results=responses,
+            discovery={"files": len(discovery.files), **discovery.stats},
+        )
+        payload = combined.to_dict()
+        summary_payload = {
+            **payload,
+            "results": [_summary_only(section) for section in payload["results"]],
+        }
+    if previous is not None:
+        payload["baseline"] = {"path": str(baseline), **previous.summary()}
+        summary_payload["baseline"] = payload["baseline"]
+    return payload, summary_payload
+
+
+def _run_prioritized(
+    analyzers: dict[str, Any],
+    registry: Any,
+    target: Path,
+    discovery: Any,
+    *,
+    summary_mode: bool,
+    min_severity: str,
+    concurrent: bool,
+    finalize: Any = None,
+    baseline: Any = None,
+    on_response: Any = None,
+    cache_dir: Path | None = None,
+) -> list[AnalyzerRunResponse]:
+    """Run analyzers cheapest-first and return responses in selection order."""
+    from core.base.priority_schedule import (
+        RuntimeHistory,
+        plan_priority,
+        run_prioritized,
+        severity_signal,
+        tool_queue_seconds,
+    )
+
+    # Analyzers share the walk across threads: take it before they start
+    _ = discovery.files
+    history = RuntimeHistory.for_workspace(target, cache_dir)
+    schedule = plan_priority(
+        (
+            (tool, tool, bool(getattr(registry.get(tool), "expensive", 0)))
+            for tool in analyzers
+        ),
+        history,
+    )
+    responses: dict[str, AnalyzerRunResponse] = {}
+
+    def run_one(entry: Any) -> AnalyzerRunResponse:
+        started = time.time()
+        result = analyzers[entry.key].analyze(str(target))
+        return _to_response(
+            entry.key,
+            result,
+            started,
+            time.time(),
+            summary_mode,
+            min_severity,
+            finalize,
+        )
+
+    def finish(entry: Any, response: AnalyzerRunResponse, seconds: float) -> None:
+        responses[entry.key] = response
+        if baseline is not None:
+            _label_findings(response, baseline)
+        if response.success:
+            busy = response.stats.get("execution_time_seconds") or seconds
+            history.record(
+                entry.key,
+                busy - tool_queue_seconds(response.metadata),
+                severity_signal(response.summary),
+            )
+        if on_response is not None:
+            on_response(response)
+
+    run_prioritized(
+        schedule, run_one, finish, background_workers=2 if concurrent else 0
+    )
+    history.save()
+    return [responses[tool] for tool in analyzers]
+
+
+def _echo_event(response: AnalyzerRunResponse) -> None:
+    typer.echo(json.dumps({"event": "analyzer_result", **response.to_dict()}))
+
+
+def _expand_tool_patterns(registry: Any, patterns: Iterable[str]) -> list[str]:
+    """Resolve keys and wildcards (``quality:*``) to registry keys, in order."""
+    available = sorted(registry._registry)  # type: ignore[attr-defined]
+    selected: list[str] = []
+    for pattern in patterns:
+        pattern = pattern.strip()
+        if any(char in pattern for char in "*?["):
+            matches = fnmatch.filter(available, pattern)
+            if not matches:
+                raise KeyError(f"No analyzers match '{pattern}'")
+        else:
+            matches = [pattern]
+        selected.extend(key for key in matches if key not in selected)
+    return selected
+
+
+def _to_response(
+    tool: str,
+    result: Any,
+    started: float,
+    finished: float,
+    summary_mode: bool,
+    min_severity: str,
+    finalize: Any = None,
+) -> AnalyzerRunResponse:
+    if finalize is not None:
+        finalize(tool, result)
+    return AnalyzerRunResponse.from_analysis_result(
+        AnalysisResultContext(
+            tool=tool,
+            result=result,
+            started_at=started,
+            finished_at=finished,
+            summary_mode=summary_mode,
+            min_severity=min_severity,
+        )
+    )
+
+
+def _label_findings(response: AnalyzerRunResponse, baseline: Any) -> None:
+    for finding in response.findings:
+        finding.baseline = baseline.status(finding.fingerprint)
+
+
+def _summary_only(payload: dict[str, Any]) -> dict[str, Any]:
+    summary_payload = dict(payload)
+    summary_payload["findings"] = []
+    summary_payload["raw"] = {"summary": summary_payload.get("summary", {})}
+    return summary_payload
+
+
+@_analyzers_app.command("merge")
+def analyzers_merge(
+    artifacts: list[Path] = typer.Argument(
+        ..., help="Per-shard JSON outputs of `enaible analyzers run --shard`."
+    ),
+    out: Path | None = typer.Option(
+        None,
+        "--out",
+        "-o",
+        help="Optional file to write the merged result JSON to.",
+    ),
+) -> None:
+    """Merge per-shard analyzer outputs into one result."""
+    context = load_workspace()
+    _ensure_registry_loaded(context)
+
+    from core.base.sharding import merge_shard_results
+    from core.utils.output_formatter import AnalysisResult
+
+    payloads = []
+    for artifact in artifacts:
+        try:
+            payloads.append(json.loads(artifact.read_text(encoding="utf-8")))
+        except (OSError, ValueError) as exc:
+            raise typer.BadParameter(f"{artifact}: {exc}") from exc
+    tools = {payload.get("tool") for payload in payloads}
+    if len(tools) != 1:
+        raise typer.BadParameter(
+            f"Shard outputs come from different analyzers: {sorted(map(str, tools))}"
+        )
+
+    try:
+        result = merge_shard_results(
+            [AnalysisResult.from_dict(payload["raw"]) for payload in payloads]
+        )
+    except (KeyError, ValueError) as exc:
+        raise typer.BadParameter(str(exc)) from exc
 
     ctx = AnalysisResultContext(
-        tool=tool,
+        tool=tools.pop(),
         result=result,
-        started_at=started,
-        finished_at=finished,
-        summary_mode=summary_mode,
-        min_severity=min_severity,
+        started_at=min(_iso_timestamp(p["started_at"]) for p in payloads),
+        finished_at=max(_iso_timestamp(p["completed_at"]) for p in payloads),
+        summary_mode=False,
+        # Shard outputs are already filtered to their min severity
+        min_severity="info",
     )
     response = AnalyzerRunResponse.from_analysis_result(ctx)
+    _emit_json(response.to_dict(), out)
 
-    payload = response.to_dict()
+    missing = result.metadata.get("shard", {}).get("missing")
+    if missing:
+        typer.secho(f"Warning: shards missing from merge: {missing}", err=True)
+    raise typer.Exit(code=response.exit_code)
 
-    if json_output:
-        _emit_json(payload, out)
-    else:
-        # Analyzer handles console output internally; only write JSON when requested.
-        if out is not None:
-            _emit_json(payload, out)
 
-    if summary_out is not None:
-        summary_payload = dict(payload)
-        summary_payload["findings"] = []
-        summary_payload["raw"] = {"summary": summary_payload.get("summary", {})}
-        _emit_json(summary_payload, summary_out)
+def _iso_timestamp(value: str) -> float:
+    return datetime.fromisoformat(value).timestamp()
 
-    if len(response.findings) >= 200:
-        tip = (
-            "Hint: If some findings look third-party or generated, rerun with "
-            "`--exclude <glob>` to filter those directories."
+
+@_analyzers_app.command("cache")
+def analyzers_cache(
+    cache_dir: Path | None = typer.Option(
+        None,
+        "--cache-dir",
+        help="Cache directory (default: $CI_CACHE_DIR or .cache/ci-framework).",
+    ),
+    gc: bool = typer.Option(
+        False, "--gc", help="Evict least recently used entries to fit --max-mb."
+    ),
+    max_mb: int = typer.Option(512, "--max-mb", help="Cache size budget in MiB."),
+) -> None:
+    """Show or garbage-collect the content-addressed result cache."""
+    if max_mb <= 0:
+        raise typer.BadParameter("--max-mb must be positive.")
+
+    from core.base.content_cache import ContentAddressedCache, resolve_cache_root
+
+    cache = ContentAddressedCache(
+        resolve_cache_root(Path.cwd(), cache_dir), max_mb << 20
+    )
+    payload: dict[str, Any] = {"cache_dir": str(cache.root)}
+    if gc:
+        payload["gc"] = cache.gc()
+    payload.update(cache.usage())
+    _emit_json(payload, None)
+
+
+@_analyzers_app.command("watch")
+def analyzers_watch(
+    target: Path = typer.Argument(Path("."), help="Path to watch."),
+    tools: list[str] = typer.Option(
+        ...,
+        "--analyzer",
+        "-a",
+        help="Analyzer registry key to keep up to date (repeatable).",
+    ),
+    min_severity: str = typer.Option(
+        "high",
+        "--min-severity",
+        help="Minimum severity to include in findings.",
+        show_default=True,
+    ),
+    exclude_glob: list[str] = typer.Option(
+        [],
+        "--exclude",
+        "-x",
+        help="Additional glob patterns to exclude (repeatable).",
+    ),
+    interval: float = typer.Option(
+        0.2, "--interval", help="Seconds between change checks when idle."
+    ),
+    poll: bool = typer.Option(
+        False,
+        "--poll",
+        help="Detect changes by polling file stats even if watchdog is installed.",
+    ),
+    json_output: bool = typer.Option(
+        False, "--json", help="Emit one JSON object per update (JSON Lines)."
+    ),
+) -> None:
+    """Re-analyze changed files as they are saved and print the findings diff."""
+    if interval <= 0:
+        raise typer.BadParameter("--interval must be positive.")
+    context = load_workspace()
+    _ensure_registry_loaded(context)
+    registry = _resolve_analyzer_registry()
+
+    from core.base.watch_session import (
+        WatchSession,
+        create_change_source,
+        format_update,
+        run_watch,
+    )
+
+    normalized_excludes = [
+        pattern.strip() for pattern in exclude_glob if pattern.strip()
+    ]
+    gitignore_patterns = _collect_gitignore_patterns(target)
+    analyzers = {}
+    for tool in tools:
+        try:
+            config = _create_config(
+                target=target,
+                min_severity=min_severity.lower(),
+                summary_mode=False,
+                max_files=None,
+                output_format="json",
+                exclude_globs=normalized_excludes,
+            )
+            config.gitignore_patterns = gitignore_patterns
+            analyzers[tool] = registry.create(tool, config=config)
+        except (KeyError, ValueError) as exc:
+            raise typer.BadParameter(str(exc)) from exc
+
+    try:
+        session = WatchSession(target, analyzers)
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+    source = create_change_source(target, use_polling=poll)
+
+    started = time.time()
+    findings = session.start()
+    if json_output:
+        typer.echo(
+            json.dumps(
+                {
+                    "event": "ready",
+                    "watcher": type(source).__name__,
+                    "total_findings": len(findings),
+                    "elapsed_ms": round((time.time() - started) * 1000, 1),
+                }
+            )
+        )
+    else:
+        typer.secho(
+            f"Watching {target} with {', '.join(tools)}: {len(findings)} findings "
+            f"({type(source).__name__}); Ctrl+C to stop.",
+            err=True,
         )
-        typer.secho(tip, err=True)
 
-    raise typer.Exit(code=response.exit_code)
+    def emit(update: Any) -> None:
+        if json_output:
+            typer.echo(json.dumps({"event": "update", **update.to_dict()}))
+        else:
+            for line in format_update(update):
+                typer.echo(line)
+
+    try:
+        run_watch(session, source, emit, interval=interval)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        source.close()
 
 
 @_analyzers_app.command("list")
@@ -6,9 +6,8 @@ do not import Python modules directly.
 
 from __future__ import annotations
 
-import json
+import sys
 from pathlib import Path
-from typing import Any
 
 import typer
 
@@ -18,17 +17,6 @@ _ci_app = typer.Typer(help="CI utilities: format converters and renderers")
 app.add_typer(_ci_app, name="ci")
 
 
-def _emit(payload: Any, out: Path | None) -> None:
-    rendered = (
-        payload if isinstance(payload, str) else json.dumps(payload, ensure_ascii=False)
-    )
-    if out is None:
-        typer.echo(rendered)
-    else:
-        out.parent.mkdir(parents=True, exist_ok=True)
-        out.write_text(rendered)
-
-
 @_ci_app.command("convert-codeclimate")
 def convert_codeclimate(
     artifacts: Path = typer.Argument(
@@ -37,15 +25,24 @@ def convert_codeclimate(
     out: Path | None = typer.Option(
         None, "--out", "-o", help="Optional output path for CodeClimate JSON array."
     ),
+    jobs: int = typer.Option(
+        0, "--jobs", "-j", help="Parallel conversion processes (0 = one per CPU)."
+    ),
 ) -> None:
     """Convert analyzer JSONs to a CodeClimate-compatible array."""
     # PYTHONPATH must include repo's shared/ root (workflow does this)
     from generators.ci.convert_analyzers_to_codeclimate import (
-        convert as cc_convert,  # type: ignore[import, attr-defined]
+        write_codeclimate,  # type: ignore[import, attr-defined]
     )
 
-    items = cc_convert(artifacts)
-    _emit(items, out)
+    # Items are written as they are converted instead of built up in memory
+    if out is None:
+        write_codeclimate(artifacts, sys.stdout, jobs)
+        sys.stdout.write("\n")
+    else:
+        out.parent.mkdir(parents=True, exist_ok=True)
+        with out.open("w", encoding="utf-8") as handle:
+            write_codeclimate(artifacts, handle, jobs)
 
 
 @_ci_app.command("security-markdown")
@@ -56,22 +53,23 @@ def security_markdown(
     out: Path | None = typer.Option(
         None, "--out", "-o", help="Optional output path for Markdown."
     ),
+    max_details: int = typer.Option(
+        100, "--max-details", min=0, help="Rules given a detailed section."
+    ),
+    max_locations: int = typer.Option(
+        50, "--max-locations", min=0, help="Locations listed per detailed section."
+    ),
 ) -> None:
     """Render prioritized security plan in Markdown with strict markers."""
-    from generators.ci.security_findings_to_markdown import (  # type: ignore[import, attr-defined]
-        _group,
-        _load_findings,
-        _md,
+    from generators.ci.security_findings_to_markdown import (
+        render,  # type: ignore[import, attr-defined]
     )
 
-    findings = _load_findings(artifacts)
-    if not findings:
-        _emit(
-            "=== BEGIN_SECURITY_MD ===\nNo parsable SAST/security findings detected.\n=== END_SECURITY_MD ===",
-            out,
-        )
-        raise typer.Exit(code=0)
-
-    groups = _group(findings)
-    content = _md(groups, len(findings))
-    _emit(content, out)
+    # Findings are aggregated in one streaming pass and written line by line
+    if out is None:
+        render(artifacts, sys.stdout, max_details, max_locations)
+        sys.stdout.write("\n")
+    else:
+        out.parent.mkdir(parents=True, exist_ok=True)
+        with out.open("w", encoding="utf-8") as handle:
+            render(artifacts, handle, max_details, max_locations)
@@ -125,6 +125,16 @@ def doctor(
         "--json/--no-json",
         help="Emit diagnostics as JSON instead of human-readable text.",
     ),
+    tools: bool = typer.Option(
+        False,
+        "--tools",
+        help="Also report external analyzer tools (cached probes).",
+    ),
+    refresh_tools: bool = typer.Option(
+        False,
+        "--refresh-tools",
+        help="Re-probe external tools instead of using cached results (implies --tools).",
+    ),
 ) -> None:
     """Run basic environment diagnostics."""
     from importlib import metadata
@@ -142,6 +152,8 @@ def doctor(
     exit_code = _check_shared_workspace(checks, errors, report)
     context = _check_workspace_context(checks, errors, report)
     _check_schema(checks, context)
+    if tools or refresh_tools:
+        _probe_tools(report, refresh_tools)
 
     _output_report(report, checks, json_output)
     raise typer.Exit(code=exit_code)
@@ -194,6 +206,20 @@ def _check_schema(checks: dict[str, bool], context: object | None) -> None:
     checks["schema_exists"] = schema_path.exists()
 
 
+def _probe_tools(report: dict[str, object], refresh: bool) -> None:
+    """Report external tool availability through the shared probe cache."""
+    shared_root = find_shared_root()
+    if shared_root is None:
+        return
+    if str(shared_root) not in sys.path:
+        sys.path.insert(0, str(shared_root))
+    from core.utils.tool_probe import KNOWN_TOOL_PROBES, probe_tool
+
+    report["tools"] = {
+        name: probe_tool(name, refresh=refresh).to_dict() for name in KNOWN_TOOL_PROBES
+    }
+
+
 def _output_report(
     report: dict[str, object], checks: dict[str, bool], json_output: bool
 ) -> None:
@@ -209,6 +235,17 @@ def _output_report(
     for name, passed in checks.items():
         status = "OK" if passed else "FAIL"
         typer.echo(f"  {name.replace('_', ' ').title()}: {status}")
+    tool_probes: dict[str, dict[str, object]] = report.get("tools", {})  # type: ignore[assignment]
+    if tool_probes:
+        typer.echo("Tools:")
+        for name, probe in tool_probes.items():
+            status = (
+                (probe.get("version") or "available")
+                if probe.get("available")
+                else "missing"
+            )
+            suffix = " (cached)" if probe.get("cached") else ""
+            typer.echo(f"  {name}: {status}{suffix}")
     if report.get("errors"):
         typer.echo("Errors:")
         for err in report["errors"]:  # type: ignore[union-attr]
@@ -19,6 +19,9 @@ class FindingPayload:
     file_path: str | None = None
     line_number: int | None = None
     evidence: dict[str, Any] = field(default_factory=dict)
+    fingerprint: str | None = None
+    # "new" or "existing" when the run is compared against a baseline
+    baseline: str | None = None
 
     @classmethod
     def from_core(cls, payload: dict[str, Any]) -> FindingPayload:
@@ -31,6 +34,7 @@ class FindingPayload:
             file_path=payload.get("file_path"),
             line_number=payload.get("line_number"),
             evidence=payload.get("evidence", {}) or {},
+            fingerprint=payload.get("fingerprint"),
         )
 
 
@@ -139,3 +143,36 @@ class AnalyzerRunResponse:
             errors=errors,
             raw=raw_dict,
         )
+
+
+@dataclass(slots=True)
+class MultiAnalyzerRunResponse:
+    """Combined payload when `enaible analyzers run` selects several analyzers."""
+
+    tools: list[str]
+    target: str
+    results: list[AnalyzerRunResponse] = field(default_factory=list)
+    discovery: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def exit_code(self) -> int:
+        return max((result.exit_code for result in self.results), default=0)
+
+    def to_dict(self) -> dict[str, Any]:
+        summary: dict[str, int] = {}
+        for result in self.results:
+            for severity, count in result.summary.items():
+                if isinstance(count, int):
+                    summary[severity] = summary.get(severity, 0) + count
+        return {
+            "tools": self.tools,
+            "success": all(result.success for result in self.results),
+            "exit_code": self.exit_code,
+            "started_at": min((r.started_at for r in self.results), default=""),
+            "completed_at": max((r.completed_at for r in self.results), default=""),
+            "duration_ms": sum(result.duration_ms for result in self.results),
+            "target": self.target,
+            "summary": summary,
+            "discovery": self.discovery,
+            "results": [result.to_dict() for result in self.results],
+        }
@@ -81,6 +81,10 @@ class _StubRegistry:
         )
     }
 
+    @classmethod
+    def get(cls, name: str) -> type:
+        return cls._registry[name]
+
     @staticmethod
     def create(name: str, config: Any) -> _StubAnalyzer:
         if name != "demo:stub":
@@ -248,3 +252,94 @@ def test_from_analysis_result_summary_mode() -> None:
 
     assert response.tool == "demo:stub"
     assert response.summary == {"low": 1}
+
+
+class _StubMultiRegistry:
+    _registry = {"demo:stub": object, "demo:other": object, "lint:stub": object}
+    created: list[str] = []
+
+    @classmethod
+    def get(cls, name: str) -> type:
+        return cls._registry[name]
+
+    @classmethod
+    def create(cls, name: str, config: Any) -> _StubAnalyzer:
+        if name not in cls._registry:
+            raise KeyError(name)
+        cls.created.append(name)
+        return _StubAnalyzer(config)
+
+
+def test_analyzers_run_multiple_keys_and_wildcards(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _StubMultiRegistry.created = []
+    monkeypatch.setattr(
+        "enaible.commands.analyzers._resolve_analyzer_registry",
+        lambda: _StubMultiRegistry,
+    )
+    result = runner.invoke(
+        app,
+        ["analyzers", "run", "demo:*", "lint:stub", "demo:stub", "-t", str(tmp_path)],
+    )
+    assert result.exit_code == 0
+    payload = json.loads(result.stdout)
+    assert payload["tools"] == ["demo:other", "demo:stub", "lint:stub"]
+    assert [section["tool"] for section in payload["results"]] == payload["tools"]
+    assert payload["summary"] == {"low": 3}
+    assert _StubMultiRegistry.created == payload["tools"]
+
+
+def test_analyzers_run_rejects_unmatched_wildcard(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(
+        "enaible.commands.analyzers._resolve_analyzer_registry",
+        lambda: _StubMultiRegistry,
+    )
+    result = runner.invoke(app, ["analyzers", "run", "nope:*", "-t", str(tmp_path)])
+    assert result.exit_code != 0
+
+
+def test_analyzers_run_priority_streams_each_result(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(
+        "enaible.commands.analyzers._resolve_analyzer_registry",
+        lambda: _StubMultiRegistry,
+    )
+    result = runner.invoke(
+        app, ["analyzers", "run", "demo:*", "--priority", "-t", str(tmp_path)]
+    )
+    assert result.exit_code == 0
+    events = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [event["event"] for event in events] == [
+        "analyzer_result",
+        "analyzer_result",
+        "report",
+    ]
+    assert events[-1]["report"]["tools"] == ["demo:other", "demo:stub"]
+    assert (tmp_path / ".cache" / "ci-framework" / "runtime-history.json").exists()
+
+
+def test_analyzers_run_baseline_labels_findings(tmp_path: Path) -> None:
+    baseline = tmp_path / "baseline.json"
+    previous = {"tool": "demo:stub", "findings": [{"id": "OLD", "fingerprint": "f"}]}
+    baseline.write_text(json.dumps(previous))
+    result = runner.invoke(
+        app,
+        [
+            "analyzers",
+            "run",
+            "demo:stub",
+            "-t",
+            str(tmp_path),
+            "--baseline",
+            str(baseline),
+        ],
+    )
+    assert result.exit_code == 0
+    payload = json.loads(result.stdout)
+    assert payload["findings"][0]["baseline"] == "new"
+    assert payload["baseline"]["fixed"] == 1
+    assert payload["baseline"]["fixed_findings"][0]["id"] == "OLD"